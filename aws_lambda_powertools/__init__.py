@@ -1,13 +1,17 @@
 """Top-level package for Lambda Python Powertools."""
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from aws_lambda_powertools.logging import Logger
-from aws_lambda_powertools.metrics import Metrics, single_metric
 from aws_lambda_powertools.package_logger import set_package_logger_handler
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
 from aws_lambda_powertools.shared.user_agent import inject_user_agent
 from aws_lambda_powertools.shared.version import VERSION
-from aws_lambda_powertools.tracing import Tracer
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.logging import Logger
+    from aws_lambda_powertools.metrics import Metrics, single_metric
+    from aws_lambda_powertools.tracing import Tracer
 
 __version__ = VERSION
 __author__ = """Amazon Web Services"""
@@ -20,6 +24,18 @@ __all__ = [
 
 PACKAGE_PATH = Path(__file__).parent
 
+# core utilities are imported on first access, so importing any other utility doesn't load them
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_exports(
+        globals(),
+        {
+            "Logger": "aws_lambda_powertools.logging",
+            "Metrics": "aws_lambda_powertools.metrics",
+            "single_metric": "aws_lambda_powertools.metrics",
+            "Tracer": "aws_lambda_powertools.tracing",
+        },
+    )
+
 set_package_logger_handler()
 
 inject_user_agent()
@@ -2,20 +2,25 @@
 Event handler decorators for common Lambda events
 """
 
-from aws_lambda_powertools.event_handler.api_gateway import (
-    ALBResolver,
-    APIGatewayHttpResolver,
-    ApiGatewayResolver,
-    APIGatewayRestResolver,
-    CORSConfig,
-    Response,
-)
-from aws_lambda_powertools.event_handler.appsync import AppSyncResolver
-from aws_lambda_powertools.event_handler.bedrock_agent import BedrockAgentResolver
-from aws_lambda_powertools.event_handler.lambda_function_url import (
-    LambdaFunctionUrlResolver,
-)
-from aws_lambda_powertools.event_handler.vpc_lattice import VPCLatticeResolver, VPCLatticeV2Resolver
+from typing import TYPE_CHECKING
+
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.event_handler.api_gateway import (
+        ALBResolver,
+        APIGatewayHttpResolver,
+        ApiGatewayResolver,
+        APIGatewayRestResolver,
+        CORSConfig,
+        Response,
+    )
+    from aws_lambda_powertools.event_handler.appsync import AppSyncResolver
+    from aws_lambda_powertools.event_handler.bedrock_agent import BedrockAgentResolver
+    from aws_lambda_powertools.event_handler.lambda_function_url import (
+        LambdaFunctionUrlResolver,
+    )
+    from aws_lambda_powertools.event_handler.vpc_lattice import VPCLatticeResolver, VPCLatticeV2Resolver
 
 __all__ = [
     "AppSyncResolver",
@@ -30,3 +35,22 @@ __all__ = [
     "VPCLatticeResolver",
     "VPCLatticeV2Resolver",
 ]
+
+# exports are imported on first access, so importing the package doesn't load every module
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_exports(
+        globals(),
+        {
+            "ALBResolver": "aws_lambda_powertools.event_handler.api_gateway",
+            "APIGatewayHttpResolver": "aws_lambda_powertools.event_handler.api_gateway",
+            "ApiGatewayResolver": "aws_lambda_powertools.event_handler.api_gateway",
+            "APIGatewayRestResolver": "aws_lambda_powertools.event_handler.api_gateway",
+            "CORSConfig": "aws_lambda_powertools.event_handler.api_gateway",
+            "Response": "aws_lambda_powertools.event_handler.api_gateway",
+            "AppSyncResolver": "aws_lambda_powertools.event_handler.appsync",
+            "BedrockAgentResolver": "aws_lambda_powertools.event_handler.bedrock_agent",
+            "LambdaFunctionUrlResolver": "aws_lambda_powertools.event_handler.lambda_function_url",
+            "VPCLatticeResolver": "aws_lambda_powertools.event_handler.vpc_lattice",
+            "VPCLatticeV2Resolver": "aws_lambda_powertools.event_handler.vpc_lattice",
+        },
+    )
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import base64
-import json
 import logging
 import re
 import traceback
@@ -9,9 +8,7 @@ import warnings
 import zlib
 from abc import ABC, abstractmethod
 from enum import Enum
-from functools import partial
 from http import HTTPStatus
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, Mapping, Match, Pattern, Sequence, TypeVar, cast
 
 from typing_extensions import override
@@ -35,9 +32,9 @@ from aws_lambda_powertools.event_handler.util import (
     _validate_openapi_security_parameters,
     extract_origin_header,
 )
+from aws_lambda_powertools.shared import json_backend
 from aws_lambda_powertools.shared.cookies import Cookie
 from aws_lambda_powertools.shared.functions import powertools_dev_is_set
-from aws_lambda_powertools.shared.json_encoder import Encoder
 from aws_lambda_powertools.utilities.data_classes import (
     ALBEvent,
     APIGatewayProxyEvent,
@@ -76,6 +73,7 @@ if TYPE_CHECKING:
         Tag,
     )
     from aws_lambda_powertools.event_handler.openapi.params import Dependant
+    from aws_lambda_powertools.event_handler.openapi.swagger_ui.cache import CachedContent
     from aws_lambda_powertools.event_handler.openapi.swagger_ui.oauth2 import (
         OAuth2Config,
     )
@@ -798,7 +796,7 @@ class ResponseBuilder(Generic[ResponseEventT]):
     def __init__(
         self,
         response: Response,
-        serializer: Callable[[Any], str] = partial(json.dumps, separators=(",", ":"), cls=Encoder),
+        serializer: Callable[[Any], str] = json_backend.dumps,
         route: Route | None = None,
     ):
         self.response = response
@@ -1486,7 +1484,7 @@ class ApiGatewayResolver(BaseRouter):
             Enables debug mode, by default False. Can be also be enabled by "POWERTOOLS_DEV"
             environment variable
         serializer: Callable, optional
-            function to serialize `obj` to a JSON formatted `str`, by default json.dumps
+            function to serialize `obj` to a JSON formatted `str`, by default `shared.json_backend.dumps`
         strip_prefixes: list[str | Pattern], optional
             optional list of prefixes to be removed from the request path before doing the routing.
             This is often used with api gateways with multiple custom mappings.
@@ -1509,8 +1507,11 @@ class ApiGatewayResolver(BaseRouter):
         self.processed_stack_frames = []
         self._response_builder_class = ResponseBuilder[BaseProxyEvent]
 
+        # Swagger UI content by (swagger path, base path, format), cleared when new routes are registered
+        self._swagger_cache: dict[tuple[str, str, str], CachedContent] = {}
+
         # Allow for a custom serializer or a concise json serialization
-        self._serializer = serializer or partial(json.dumps, separators=(",", ":"), cls=Encoder)
+        self._serializer = serializer or json_backend.dumps
 
         if self._enable_validation:
             from aws_lambda_powertools.event_handler.middlewares.openapi_validation import OpenAPIValidationMiddleware
@@ -1835,7 +1836,7 @@ class ApiGatewayResolver(BaseRouter):
         middlewares: list[Callable[..., Response]], optional
             List of middlewares to be used for the swagger route.
         compress: bool, default = False
-            Whether or not to enable gzip compression swagger route.
+            Whether or not to enable gzip compression swagger route. Compressed content is generated once and reused.
         security_schemes: dict[str, "SecurityScheme"], optional
             A declaration of the security schemes available to be used in the specification.
         security: list[dict[str, list[str]]], optional
@@ -1853,84 +1854,110 @@ class ApiGatewayResolver(BaseRouter):
             generate_oauth2_redirect_html,
             generate_swagger_html,
         )
+        from aws_lambda_powertools.event_handler.openapi.swagger_ui.cache import (
+            CachedContent,
+            etag_matches,
+            load_swagger_assets,
+        )
 
-        @self.get(path, middlewares=middlewares, include_in_schema=False, compress=compress)
-        def swagger_handler():
-            query_params = self.current_event.query_string_parameters or {}
-
+        def generate_content(view: str, base_path: str) -> CachedContent:
             # Check for query parameters; if "format" is specified as "oauth2-redirect",
             # send the oauth2-redirect HTML stanza so OAuth2 can be used
             # Source: https://github.com/swagger-api/swagger-ui/blob/master/dist/oauth2-redirect.html
-            if query_params.get("format") == "oauth2-redirect":
-                return Response(
-                    status_code=200,
-                    content_type="text/html",
-                    body=generate_oauth2_redirect_html(),
+            if view == "oauth2-redirect":
+                return CachedContent(body=generate_oauth2_redirect_html(), content_type="text/html")
+
+            # Check for query parameters; if "format" is specified as "json",
+            # respond with the JSON used in the OpenAPI spec
+            # Example: https://www.example.com/swagger?format=json
+            if view == "json":
+                openapi_servers = servers or [Server(url=(base_path or "/"))]
+
+                spec = self.get_openapi_schema(
+                    title=title,
+                    version=version,
+                    openapi_version=openapi_version,
+                    summary=summary,
+                    description=description,
+                    tags=tags,
+                    servers=openapi_servers,
+                    terms_of_service=terms_of_service,
+                    contact=contact,
+                    license_info=license_info,
+                    security_schemes=security_schemes,
+                    security=security,
+                    openapi_extensions=openapi_extensions,
                 )
 
-            base_path = self._get_base_path()
+                # The .replace('</', '<\\/') part is necessary to prevent a potential issue where the JSON string
+                # contains </script> or similar tags. Escaping the forward slash in </ as <\/ ensures that the JSON
+                # does not inadvertently close the script tag, and the JSON remains a valid string within the
+                # JavaScript code.
+                escaped_spec = model_json(
+                    spec,
+                    by_alias=True,
+                    exclude_none=True,
+                    indent=2,
+                ).replace("</", "<\\/")
+
+                return CachedContent(body=escaped_spec, content_type="application/json")
 
             if swagger_base_url:
                 swagger_js = f"{swagger_base_url}/swagger-ui-bundle.min.js"
                 swagger_css = f"{swagger_base_url}/swagger-ui.min.css"
             else:
                 # We now inject CSS and JS into the SwaggerUI file
-                swagger_js = Path.open(
-                    Path(__file__).parent / "openapi" / "swagger_ui" / "swagger-ui-bundle.min.js",
-                ).read()
-                swagger_css = Path.open(Path(__file__).parent / "openapi" / "swagger_ui" / "swagger-ui.min.css").read()
-
-            openapi_servers = servers or [Server(url=(base_path or "/"))]
-
-            spec = self.get_openapi_schema(
-                title=title,
-                version=version,
-                openapi_version=openapi_version,
-                summary=summary,
-                description=description,
-                tags=tags,
-                servers=openapi_servers,
-                terms_of_service=terms_of_service,
-                contact=contact,
-                license_info=license_info,
-                security_schemes=security_schemes,
-                security=security,
-                openapi_extensions=openapi_extensions,
-            )
-
-            # The .replace('</', '<\\/') part is necessary to prevent a potential issue where the JSON string contains
-            # </script> or similar tags. Escaping the forward slash in </ as <\/ ensures that the JSON does not
-            # inadvertently close the script tag, and the JSON remains a valid string within the JavaScript code.
-            escaped_spec = model_json(
-                spec,
-                by_alias=True,
-                exclude_none=True,
-                indent=2,
-            ).replace("</", "<\\/")
-
-            # Check for query parameters; if "format" is specified as "json",
-            # respond with the JSON used in the OpenAPI spec
-            # Example: https://www.example.com/swagger?format=json
-            if query_params.get("format") == "json":
-                return Response(
-                    status_code=200,
-                    content_type="application/json",
-                    body=escaped_spec,
-                )
+                swagger_js, swagger_css = load_swagger_assets()
 
             body = generate_swagger_html(
-                escaped_spec,
+                get_content("json", base_path).body,
                 swagger_js,
                 swagger_css,
-                swagger_base_url,
+                swagger_base_url or "",
                 oauth2_config,
                 persist_authorization,
             )
 
+            return CachedContent(body=body, content_type="text/html")
+
+        def get_content(view: str, base_path: str) -> CachedContent:
+            # Base path depends on the stage in the request, and with it the default OpenAPI servers
+            cache_key = (path, base_path, view)
+            content = self._swagger_cache.get(cache_key)
+            if content is None:
+                logger.debug(f"Generating Swagger UI content for {path} in {view} format")
+                content = self._swagger_cache[cache_key] = generate_content(view, base_path)
+            return content
+
+        @self.get(path, middlewares=middlewares, include_in_schema=False, compress=compress)
+        def swagger_handler():
+            query_params = self.current_event.query_string_parameters or {}
+            view = query_params.get("format")
+            if view not in ("oauth2-redirect", "json"):
+                view = "html"
+
+            content = get_content(view, self._get_base_path())
+
+            body: str | bytes = content.body
+            headers = {"ETag": content.etag}
+            if compress:
+                # Compressed once and reused, instead of compressing the embedded Swagger UI on every request
+                headers["Vary"] = "Accept-Encoding"
+                if "gzip" in self.current_event.headers.get("accept-encoding", ""):
+                    body = content.compressed_body
+                    headers["ETag"] = content.compressed_etag
+                    headers["Content-Encoding"] = "gzip"
+
+            if etag_matches(self.current_event.headers.get("if-none-match"), headers["ETag"]):
+                headers.pop("Content-Encoding", None)
+                return Response(status_code=304, body="", headers=headers, compress=False)
+
             return Response(
                 status_code=200,
-                content_type="text/html",
+                content_type=content.content_type,
                 body=body,
+                headers=headers,
+                compress=False,
             )
 
     def route(
@@ -1995,6 +2022,9 @@ class ApiGatewayResolver(BaseRouter):
                     logger.debug(f"Registering method {item.upper()} to Allow Methods in CORS")
                     self._cors_methods.add(item.upper())
 
+            # New routes change the OpenAPI schema, so Swagger UI content needs to be generated again
+            self._swagger_cache.clear()
+
             return func
 
         return register_resolver
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import zlib
+from pathlib import Path
+
+SWAGGER_UI_PATH = Path(__file__).parent
+
+
+@functools.lru_cache(maxsize=1)
+def load_swagger_assets() -> tuple[str, str]:
+    """
+    Read the embedded Swagger UI JavaScript and CSS, once per execution environment
+
+    Returns
+    -------
+    tuple[str, str]
+        Swagger UI JavaScript and CSS source code
+    """
+    swagger_js = (SWAGGER_UI_PATH / "swagger-ui-bundle.min.js").read_text()
+    swagger_css = (SWAGGER_UI_PATH / "swagger-ui.min.css").read_text()
+    return swagger_js, swagger_css
+
+
+class CachedContent:
+    """
+    Content served by the Swagger UI route, generated once and reused until new routes are registered
+
+    Parameters
+    ----------
+    body: str
+        The Swagger UI HTML, OpenAPI schema JSON, or OAuth2 redirect HTML
+    content_type: str
+        The content type of the body
+    """
+
+    __slots__ = ("body", "content_type", "etag", "_compressed_body")
+
+    def __init__(self, body: str, content_type: str):
+        self.body = body
+        self.content_type = content_type
+        # Strong validator: any change to the schema or Swagger UI configuration changes the body
+        self.etag = f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+        self._compressed_body: bytes | None = None
+
+    @property
+    def compressed_etag(self) -> str:
+        """Strong ETag of the gzip representation, which must differ from the uncompressed one"""
+        return f'{self.etag[:-1]}-gzip"'
+
+    @property
+    def compressed_body(self) -> bytes:
+        """Body compressed with gzip, on first use"""
+        if self._compressed_body is None:
+            gzip = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+            self._compressed_body = gzip.compress(self.body.encode()) + gzip.flush()
+        return self._compressed_body
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check whether an `If-None-Match` header matches an ETag, using weak comparison as defined in RFC 9110
+
+    Parameters
+    ----------
+    if_none_match: str, optional
+        The `If-None-Match` request header, e.g. `"abc", W/"def"` or `*`
+    etag: str
+        The ETag of the current representation
+
+    Returns
+    -------
+    bool
+        True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # Weak comparison ignores the W/ prefix, e.g. when a CDN weakened the ETag after compressing the response
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag[2:] == etag if tag.startswith("W/") else tag == etag for tag in tags)
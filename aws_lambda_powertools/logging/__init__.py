@@ -1,6 +1,6 @@
 """Logging utility
 """
 
-from .logger import Logger
+from .logger import LazyValue, Logger
 
-__all__ = ["Logger"]
+__all__ = ["LazyValue", "Logger"]
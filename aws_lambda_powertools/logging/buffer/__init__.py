@@ -0,0 +1,5 @@
+"""Log buffering: keep low-level records in memory and emit them only when needed"""
+
+from aws_lambda_powertools.logging.buffer.config import LoggerBufferConfig
+
+__all__ = ["LoggerBufferConfig"]
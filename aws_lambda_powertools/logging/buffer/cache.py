@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any
+
+
+class KeyBufferCache:
+    """Bounded FIFO buffer of items for a single key, tracking its total size in bytes"""
+
+    def __init__(self) -> None:
+        self.cache: deque[tuple[Any, int]] = deque()
+        self.current_size: int = 0
+        self.has_evicted: bool = False
+
+    def add(self, item: Any, item_size: int) -> None:
+        self.cache.append((item, item_size))
+        self.current_size += item_size
+
+    def remove_oldest(self) -> None:
+        _, item_size = self.cache.popleft()
+        self.current_size -= item_size
+        self.has_evicted = True
+
+    def get(self) -> list[Any]:
+        return [item for item, _ in self.cache]
+
+
+class LoggerBufferCache:
+    """Thread-safe buffer of log records keyed by invocation (X-Ray trace id or request id).
+
+    Each key holds at most `max_size_bytes`; when a new item doesn't fit, the oldest items are evicted.
+    Lambda runs one invocation at a time, so a new key means previous invocations ended:
+    their buffers are never flushed and are dropped, keeping a single key in memory.
+    """
+
+    def __init__(self, max_size_bytes: int) -> None:
+        self.max_size_bytes = max_size_bytes
+        self.cache: dict[str, KeyBufferCache] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: str, item: Any, item_size: int) -> bool:
+        """Add an item to the buffer of `key`.
+
+        Returns
+        -------
+        bool
+            False when the item alone is bigger than the buffer and was not added, True otherwise
+        """
+        if item_size > self.max_size_bytes:
+            return False
+
+        with self._lock:
+            key_cache = self.cache.get(key)
+            if key_cache is None:
+                self.cache.clear()
+                key_cache = self.cache[key] = KeyBufferCache()
+
+            while key_cache.current_size + item_size > self.max_size_bytes:
+                key_cache.remove_oldest()
+
+            key_cache.add(item, item_size)
+
+        return True
+
+    def get(self, key: str) -> list[Any]:
+        with self._lock:
+            key_cache = self.cache.get(key)
+            return key_cache.get() if key_cache else []
+
+    def pop(self, key: str) -> tuple[list[Any], bool]:
+        """Remove and return all items for `key`, along with whether any item had been evicted"""
+        with self._lock:
+            key_cache = self.cache.pop(key, None)
+
+        if key_cache is None:
+            return [], False
+
+        return key_cache.get(), key_cache.has_evicted
+
+    def clear(self, key: str | None = None) -> None:
+        """Clear items for `key`, or the whole buffer when no key is given"""
+        with self._lock:
+            if key is None:
+                self.cache.clear()
+            else:
+                self.cache.pop(key, None)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Literal
+
+LOG_LEVEL_BUFFER_VALUES = Literal["DEBUG", "INFO", "WARNING"]
+
+
+class LoggerBufferConfig:
+    """Configuration for Logger log buffering.
+
+    Records at `buffer_at_verbosity` level and below are kept in memory for the current invocation,
+    and only written when an error is logged, an exception escapes `inject_lambda_context`,
+    or `Logger.flush_buffer()` is called. Otherwise, they are discarded when the invocation ends.
+    """
+
+    VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING")
+
+    def __init__(
+        self,
+        max_bytes: int = 20480,
+        buffer_at_verbosity: LOG_LEVEL_BUFFER_VALUES = "DEBUG",
+        flush_on_error_log: bool = True,
+    ):
+        """
+        Initialize log buffering configuration
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Maximum size in UTF-8 bytes of buffered log messages, arguments and extra keys per invocation,
+            by default 20480 (20KB).
+            Oldest records are evicted first when the limit is reached.
+        buffer_at_verbosity : str, optional
+            Highest log level to buffer (DEBUG, INFO or WARNING), by default DEBUG
+        flush_on_error_log : bool, optional
+            Whether to flush the buffer when an error or critical log is emitted, by default True
+
+        Raises
+        ------
+        ValueError
+            When `max_bytes` is not a positive integer or `buffer_at_verbosity` is not a valid level
+        """
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError(f"max_bytes must be a positive integer, received {max_bytes}")
+
+        buffer_at_verbosity = buffer_at_verbosity.upper()  # type: ignore[assignment]
+        if buffer_at_verbosity not in self.VALID_LOG_LEVELS:
+            raise ValueError(
+                f"Invalid buffer_at_verbosity '{buffer_at_verbosity}'. Must be one of {self.VALID_LOG_LEVELS}",
+            )
+
+        self.max_bytes = max_bytes
+        self.buffer_at_verbosity = buffer_at_verbosity
+        self.flush_on_error_log = flush_on_error_log
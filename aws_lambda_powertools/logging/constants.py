@@ -3,3 +3,5 @@ LOGGER_ATTRIBUTE_POWERTOOLS_HANDLER = "powertools_handler"
 # logger.init attribute is set when Logger has been configured
 LOGGER_ATTRIBUTE_PRECONFIGURED = "init"
 LOGGER_ATTRIBUTE_HANDLER = "logger_handler"
+# logger.powertools_buffer is set with the (buffer config, buffer cache) pair when log buffering is enabled
+LOGGER_ATTRIBUTE_BUFFER = "powertools_buffer"
@@ -12,7 +12,7 @@ from datetime import datetime, timezone
 from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Iterable
 
-from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared import constants, json_backend
 from aws_lambda_powertools.shared.functions import powertools_dev_is_set
 
 if TYPE_CHECKING:
@@ -113,10 +113,11 @@ class LambdaPowertoolsFormatter(BasePowertoolsFormatter):
         Parameters
         ----------
         json_serializer : Callable, optional
-            function to serialize `obj` to a JSON formatted `str`, by default json.dumps
+            function to serialize `obj` to a JSON formatted `str`, by default `shared.json_backend.dumps`
+            (json.dumps, or the library set in POWERTOOLS_JSON_BACKEND env var)
         json_deserializer : Callable, optional
             function to deserialize `str`, `bytes`, bytearray` containing a JSON document to a Python `obj`,
-            by default json.loads
+            by default `shared.json_backend.loads`
         json_default : Callable, optional
             function to coerce unserializable values, by default str
 
@@ -144,17 +145,17 @@ class LambdaPowertoolsFormatter(BasePowertoolsFormatter):
 
         """
 
-        self.json_deserializer = json_deserializer or json.loads
+        self.json_deserializer = json_deserializer or json_backend.loads
         self.json_default = json_default or str
         self.json_indent = (
             constants.PRETTY_INDENT if powertools_dev_is_set() else constants.COMPACT_INDENT
         )  # indented json serialization when in AWS SAM Local
+        # compact and non-ASCII friendly (see #3474) serialization, using the POWERTOOLS_JSON_BACKEND library
         self.json_serializer = json_serializer or partial(
-            json.dumps,
+            json_backend.dumps,
             default=self.json_default,
-            separators=(",", ":"),
             indent=self.json_indent,
-            ensure_ascii=False,  # see #3474
+            ensure_ascii=False,
         )
 
         self.datefmt = datefmt
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import logging
+import queue
+import sys
+import threading
+import traceback
+from typing import IO
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()  # sentinel to stop the background writer
+
+
+class BatchStreamHandler(logging.StreamHandler):
+    """Stream handler that writes formatted log lines in batches from a background thread.
+
+    Log records are formatted in the calling thread and enqueued; a background thread joins
+    all pending lines and writes them with a single `write` call, keeping stream I/O off the hot path.
+
+    When the queue is full, the handler drains it and writes synchronously to preserve ordering.
+    `flush()` blocks until every enqueued line is written; `Logger.inject_lambda_context`
+    calls it before returning so no logs are left behind when the execution environment is frozen.
+
+    Parameters
+    ----------
+    stream : IO[str], optional
+        Output stream, by default sys.stdout
+    max_queue_size : int, optional
+        Maximum number of pending lines before falling back to synchronous writes, by default 10000
+    max_batch_size : int, optional
+        Maximum number of lines joined in a single write, by default 1000
+
+    Example
+    -------
+    **Use batched writes for Logger output**
+
+        >>> from aws_lambda_powertools import Logger
+        >>> from aws_lambda_powertools.logging.handlers import BatchStreamHandler
+        >>>
+        >>> logger = Logger(service="payment", logger_handler=BatchStreamHandler())
+        >>>
+        >>> @logger.inject_lambda_context  # drains pending logs before returning
+        >>> def handler(event, context):
+                logger.info("Hello")
+    """
+
+    def __init__(self, stream: IO[str] | None = None, max_queue_size: int = 10000, max_batch_size: int = 1000):
+        super().__init__(stream or sys.stdout)
+        self.max_batch_size = max_batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        # Separate from the handler lock as `emit` runs while holding it and may wait for the writer
+        self._write_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+
+        self._ensure_writer()
+
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            logger.debug("Log queue is full, writing synchronously")
+            self.flush()
+            self._write(line)
+
+    def flush(self) -> None:
+        """Block until all pending log lines are written and flushed to the stream"""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+        else:
+            self._drain()
+
+    def close(self) -> None:
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+
+        if writer is not None and writer.is_alive():
+            self._queue.put(_STOP)
+            writer.join()
+
+        self._drain()
+        super().close()
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="powertools-log-writer", daemon=True)
+                self._writer.start()
+
+    def _run(self) -> None:
+        while True:
+            line = self._queue.get()
+            if line is _STOP:
+                self._queue.task_done()
+                return
+
+            batch = [line]
+            stop = False
+            while len(batch) < self.max_batch_size:
+                try:
+                    line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if line is _STOP:
+                    stop = True
+                    break
+
+                batch.append(line)
+
+            self._write("".join(batch))
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+
+            if stop:
+                return
+
+    def _drain(self) -> None:
+        """Write any pending lines from the calling thread"""
+        batch = []
+        while True:
+            try:
+                line = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            self._queue.task_done()
+            if line is not _STOP:
+                batch.append(line)
+
+        if batch:
+            self._write("".join(batch))
+
+    def _write(self, data: str) -> None:
+        try:
+            with self._write_lock:
+                self.stream.write(data)
+                if hasattr(self.stream, "flush"):
+                    self.stream.flush()
+        except Exception:  # pragma: no cover # same as stdlib, never let logging crash the writer
+            if logging.raiseExceptions:
+                traceback.print_exc(file=sys.stderr)
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import functools
 import inspect
+import io
 import logging
 import os
 import random
 import sys
+import traceback
 import warnings
 from typing import (
     IO,
@@ -18,7 +20,9 @@ from typing import (
     overload,
 )
 
+from aws_lambda_powertools.logging.buffer.cache import LoggerBufferCache
 from aws_lambda_powertools.logging.constants import (
+    LOGGER_ATTRIBUTE_BUFFER,
     LOGGER_ATTRIBUTE_PRECONFIGURED,
 )
 from aws_lambda_powertools.logging.exceptions import InvalidLoggerSamplingRateError
@@ -36,8 +40,10 @@ from aws_lambda_powertools.shared.functions import (
     resolve_truthy_env_var_choice,
 )
 from aws_lambda_powertools.utilities import jmespath_utils
+from aws_lambda_powertools.warnings import PowertoolsUserWarning
 
 if TYPE_CHECKING:
+    from aws_lambda_powertools.logging.buffer.config import LoggerBufferConfig
     from aws_lambda_powertools.shared.types import AnyCallableT
 
 logger = logging.getLogger(__name__)
@@ -65,6 +71,45 @@ def _is_cold_start() -> bool:
     return cold_start
 
 
+class LazyValue:
+    """Log message, argument or extra value computed only when the log is written or buffered
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        Function computing the value, called once the log level check passed
+    *args, **kwargs
+        Arguments to call `func` with
+
+    Example
+    -------
+    **Log an expensive summary only when DEBUG level is enabled**
+
+        >>> from aws_lambda_powertools import Logger
+        >>> from aws_lambda_powertools.logging import LazyValue
+        >>>
+        >>> logger = Logger()
+        >>> logger.debug("Received event", summary=LazyValue(summarize, event))
+    """
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self) -> Any:
+        return self.func(*self.args, **self.kwargs)
+
+    def __str__(self) -> str:
+        # e.g. when used with a standard logging.Logger
+        return str(self())
+
+    def __repr__(self) -> str:
+        return f"LazyValue({self.func!r})"
+
+
 class Logger:
     """Creates and setups a logger to format statements in JSON.
 
@@ -102,6 +147,10 @@ class Logger:
         logs uncaught exception using sys.excepthook
 
         See: https://docs.python.org/3/library/sys.html#sys.excepthook
+    buffer_config: LoggerBufferConfig, optional
+        keep logs at or below a given level in memory per invocation, and only emit them
+        when an error is logged, an exception escapes `inject_lambda_context` or `flush_buffer()` is called.
+        Child loggers share the buffer configured in their parent.
 
 
     Parameters propagated to LambdaPowertoolsFormatter
@@ -187,6 +236,17 @@ class Logger:
         >>>
         >>> logger = Logger(service="payment", log_record_order=["message"])
 
+    **Buffer debug logs and only emit them when an error occurs**
+
+        >>> from aws_lambda_powertools import Logger
+        >>> from aws_lambda_powertools.logging.buffer import LoggerBufferConfig
+        >>>
+        >>> logger = Logger(service="payment", buffer_config=LoggerBufferConfig(max_bytes=20480))
+        >>>
+        >>> @logger.inject_lambda_context
+        >>> def handler(event, context):
+                logger.debug("Only visible if this invocation logs an error")
+
     **Logging to a file instead of standard output for testing**
 
         >>> # app.py
@@ -220,6 +280,7 @@ class Logger:
         utc: bool = False,
         use_rfc3339: bool = False,
         serialize_stacktrace: bool = True,
+        buffer_config: LoggerBufferConfig | None = None,
         **kwargs,
     ) -> None:
         self.service = resolve_env_var_choice(
@@ -241,6 +302,7 @@ class Logger:
         )
         self._default_log_keys = {"service": self.service, "sampling_rate": self.sampling_rate}
         self._logger = self._get_logger()
+        self._buffer_config, self._buffer_cache = self._init_buffer(buffer_config)
 
         # NOTE: This is primarily to improve UX, so IDEs can autocomplete LambdaPowertoolsFormatter options
         # previously, we masked all of them as kwargs thus limiting feature discovery
@@ -279,6 +341,19 @@ class Logger:
 
         return logging.getLogger(logger_name)
 
+    def _init_buffer(
+        self,
+        buffer_config: LoggerBufferConfig | None,
+    ) -> tuple[LoggerBufferConfig | None, LoggerBufferCache | None]:
+        """Sets up log buffering, reusing the parent logger buffer for child loggers"""
+        if buffer_config is None:
+            source_logger = self._logger.parent if self.child else self._logger
+            return getattr(source_logger, LOGGER_ATTRIBUTE_BUFFER, (None, None))
+
+        buffer = (buffer_config, LoggerBufferCache(max_size_bytes=buffer_config.max_bytes))
+        setattr(self._logger, LOGGER_ATTRIBUTE_BUFFER, buffer)
+        return buffer
+
     def _init_logger(
         self,
         formatter_options: dict | None = None,
@@ -345,6 +420,7 @@ class Logger:
         log_event: bool | None = None,
         correlation_id_path: str | None = None,
         clear_state: bool | None = False,
+        flush_buffer_on_uncaught_error: bool = True,
     ) -> AnyCallableT: ...
 
     @overload
@@ -354,6 +430,7 @@ class Logger:
         log_event: bool | None = None,
         correlation_id_path: str | None = None,
         clear_state: bool | None = False,
+        flush_buffer_on_uncaught_error: bool = True,
     ) -> Callable[[AnyCallableT], AnyCallableT]: ...
 
     def inject_lambda_context(
@@ -362,6 +439,7 @@ class Logger:
         log_event: bool | None = None,
         correlation_id_path: str | None = None,
         clear_state: bool | None = False,
+        flush_buffer_on_uncaught_error: bool = True,
     ) -> Any:
         """Decorator to capture Lambda contextual info and inject into logger
 
@@ -375,6 +453,9 @@ class Logger:
             Instructs logger to log Lambda Event, by default False
         correlation_id_path: str, optional
             Optional JMESPath for the correlation_id
+        flush_buffer_on_uncaught_error: bool, optional
+            When log buffering is enabled, emit buffered logs if the handler raises an exception, by default True.
+            Buffered logs are discarded at the end of every invocation.
 
         Environment variables
         ---------------------
@@ -418,6 +499,7 @@ class Logger:
                 log_event=log_event,
                 correlation_id_path=correlation_id_path,
                 clear_state=clear_state,
+                flush_buffer_on_uncaught_error=flush_buffer_on_uncaught_error,
             )
 
         log_event = resolve_truthy_env_var_choice(
@@ -444,7 +526,17 @@ class Logger:
                 logger.debug("Event received")
                 self.info(extract_event_from_common_models(event))
 
-            return lambda_handler(event, context, *args, **kwargs)
+            try:
+                return lambda_handler(event, context, *args, **kwargs)
+            except Exception:
+                if flush_buffer_on_uncaught_error:
+                    self.flush_buffer()
+                raise
+            finally:
+                self.clear_buffer()
+                # Handlers writing in the background (e.g., BatchStreamHandler) must be drained
+                # before the execution environment is frozen
+                self.registered_handler.flush()
 
         return decorate
 
@@ -458,8 +550,21 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
-        extra = extra or {}
-        extra = {**extra, **kwargs}
+        if not self._is_enabled_for(logging.INFO):
+            return None
+
+        msg, args, extra = _resolve_lazy_values(msg=msg, args=args, extra=extra, kwargs=kwargs)
+
+        if self._is_buffered_level(logging.INFO) and self._add_log_record_to_buffer(
+            level=logging.INFO,
+            msg=msg,
+            args=args,
+            exc_info=exc_info,
+            stack_info=stack_info,
+            stacklevel=stacklevel,
+            extra=extra,
+        ):
+            return None
 
         return self._logger.info(
             msg,
@@ -480,8 +585,13 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
-        extra = extra or {}
-        extra = {**extra, **kwargs}
+        if not self._is_enabled_for(logging.ERROR):
+            return None
+
+        msg, args, extra = _resolve_lazy_values(msg=msg, args=args, extra=extra, kwargs=kwargs)
+
+        if self._buffer_config and self._buffer_config.flush_on_error_log:
+            self.flush_buffer()
 
         return self._logger.error(
             msg,
@@ -502,8 +612,13 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
-        extra = extra or {}
-        extra = {**extra, **kwargs}
+        if not self._is_enabled_for(logging.ERROR):
+            return None
+
+        msg, args, extra = _resolve_lazy_values(msg=msg, args=args, extra=extra, kwargs=kwargs)
+
+        if self._buffer_config and self._buffer_config.flush_on_error_log:
+            self.flush_buffer()
 
         return self._logger.exception(
             msg,
@@ -524,8 +639,13 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
-        extra = extra or {}
-        extra = {**extra, **kwargs}
+        if not self._is_enabled_for(logging.CRITICAL):
+            return None
+
+        msg, args, extra = _resolve_lazy_values(msg=msg, args=args, extra=extra, kwargs=kwargs)
+
+        if self._buffer_config and self._buffer_config.flush_on_error_log:
+            self.flush_buffer()
 
         return self._logger.critical(
             msg,
@@ -546,8 +666,21 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
-        extra = extra or {}
-        extra = {**extra, **kwargs}
+        if not self._is_enabled_for(logging.WARNING):
+            return None
+
+        msg, args, extra = _resolve_lazy_values(msg=msg, args=args, extra=extra, kwargs=kwargs)
+
+        if self._is_buffered_level(logging.WARNING) and self._add_log_record_to_buffer(
+            level=logging.WARNING,
+            msg=msg,
+            args=args,
+            exc_info=exc_info,
+            stack_info=stack_info,
+            stacklevel=stacklevel,
+            extra=extra,
+        ):
+            return None
 
         return self._logger.warning(
             msg,
@@ -568,8 +701,21 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
-        extra = extra or {}
-        extra = {**extra, **kwargs}
+        if not self._is_enabled_for(logging.DEBUG):
+            return None
+
+        msg, args, extra = _resolve_lazy_values(msg=msg, args=args, extra=extra, kwargs=kwargs)
+
+        if self._is_buffered_level(logging.DEBUG) and self._add_log_record_to_buffer(
+            level=logging.DEBUG,
+            msg=msg,
+            args=args,
+            exc_info=exc_info,
+            stack_info=stack_info,
+            stacklevel=stacklevel,
+            extra=extra,
+        ):
+            return None
 
         return self._logger.debug(
             msg,
@@ -580,6 +726,107 @@ class Logger:
             extra=extra,
         )
 
+    def flush_buffer(self) -> None:
+        """Emit all buffered logs for the current invocation, in the order they were logged"""
+        if not self._buffer_cache:
+            return
+
+        buffer_key = self._get_buffer_key()
+        if buffer_key is None:
+            return
+
+        records, has_evicted = self._buffer_cache.pop(buffer_key)
+        if has_evicted:
+            warnings.warn(
+                "Some buffered logs were evicted before being flushed. "
+                "Consider increasing max_bytes in LoggerBufferConfig.",
+                PowertoolsUserWarning,
+                stacklevel=2,
+            )
+
+        for record in records:
+            self._logger.handle(record)
+
+    def clear_buffer(self) -> None:
+        """Discard all buffered logs for the current invocation"""
+        if not self._buffer_cache:
+            return
+
+        buffer_key = self._get_buffer_key()
+        if buffer_key is not None:
+            self._buffer_cache.clear(key=buffer_key)
+
+    def _is_enabled_for(self, level: int) -> bool:
+        """Fast check to skip any log processing when a level is neither enabled nor buffered"""
+        return self._logger.isEnabledFor(level) or self._is_buffered_level(level)
+
+    def _is_buffered_level(self, level: int) -> bool:
+        if not self._buffer_config:
+            return False
+
+        return level <= logging.getLevelName(self._buffer_config.buffer_at_verbosity)
+
+    def _get_buffer_key(self) -> str | None:
+        """Returns the current invocation key: X-Ray trace id, or Lambda request id when tracing is disabled"""
+        xray_trace_id = os.getenv(constants.XRAY_TRACE_ID_ENV)
+        if xray_trace_id:
+            return xray_trace_id.split(";")[0].replace("Root=", "")
+
+        return self.get_current_keys().get("function_request_id")
+
+    def _add_log_record_to_buffer(
+        self,
+        level: int,
+        msg: object,
+        args: tuple[object, ...],
+        exc_info: logging._ExcInfoType,
+        stack_info: bool,
+        stacklevel: int,
+        extra: Mapping[str, object],
+    ) -> bool:
+        """Creates a log record and stores it in the buffer instead of emitting it.
+
+        Returns False when the record can't be buffered and should be logged right away,
+        e.g. outside of an invocation.
+        """
+        buffer_key = self._get_buffer_key()
+        if buffer_key is None:
+            return False
+
+        record_exc_info: logging._SysExcInfoType | None = None
+        if isinstance(exc_info, BaseException):
+            record_exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+        elif isinstance(exc_info, tuple):
+            record_exc_info = exc_info
+        elif exc_info:
+            record_exc_info = sys.exc_info()
+
+        # Same semantics as stdlib stacklevel: 1 is the calling log method (e.g. Logger.debug), 2 is its caller
+        fn, lno, func, sinfo = _find_caller(stacklevel=stacklevel, stack_info=stack_info)
+        record = self._logger.makeRecord(
+            self._logger.name,
+            level,
+            fn,
+            lno,
+            msg,
+            args,
+            record_exc_info,
+            func,
+            dict(extra),
+            sinfo,
+        )
+
+        # UTF-8 size of the message, its args and extra keys, without paying for JSON serialization upfront
+        record_size = sum(len(str(value).encode(errors="replace")) for value in (msg, *args, *extra.values()))
+        if not self._buffer_cache.add(key=buffer_key, item=record, item_size=record_size):  # type: ignore[union-attr]
+            warnings.warn(
+                f"Log record of {record_size} bytes exceeds the buffer max_bytes and was not buffered",
+                PowertoolsUserWarning,
+                stacklevel=stacklevel + 1,
+            )
+
+        return True
+
     def append_keys(self, **additional_keys: object) -> None:
         self.registered_formatter.append_keys(**additional_keys)
 
@@ -848,6 +1095,47 @@ def log_uncaught_exception_hook(exc_type, exc_value, exc_traceback, logger: Logg
     logger.exception(exc_value, exc_info=(exc_type, exc_value, exc_traceback))  # pragma: no cover
 
 
+def _resolve_lazy_values(
+    msg: object,
+    args: tuple[object, ...],
+    extra: Mapping[str, object] | None,
+    kwargs: dict[str, object],
+) -> tuple[object, tuple[object, ...], dict[str, object]]:
+    """Evaluate `LazyValue` message, args and extra values, and merge extra with kwargs.
+
+    Any other value, including functions, is logged as-is.
+    """
+    if isinstance(msg, LazyValue):
+        msg = msg()
+
+    if args:
+        args = tuple(arg() if isinstance(arg, LazyValue) else arg for arg in args)
+
+    # kwargs is a new dict on every call, so we can safely merge into it
+    merged_extra = {**extra, **kwargs} if extra else kwargs
+    for key, value in merged_extra.items():
+        if isinstance(value, LazyValue):
+            merged_extra[key] = value()
+
+    return msg, args, merged_extra
+
+
+def _find_caller(stacklevel: int, stack_info: bool = False) -> tuple[str, int, str, str | None]:
+    """Return (filename, line number, function name, stack info) of the frame `stacklevel` levels above the caller"""
+    # Current frame => _find_caller(); stacklevel 1 => caller of _find_caller()
+    frame = sys._getframe(stacklevel + 1)
+    code = frame.f_code
+
+    sinfo = None
+    if stack_info:
+        with io.StringIO() as sio:
+            sio.write("Stack (most recent call last):\n")
+            traceback.print_stack(frame, file=sio)
+            sinfo = sio.getvalue().rstrip("\n")
+
+    return code.co_filename, frame.f_lineno, code.co_name, sinfo
+
+
 def _get_caller_filename() -> str:
     """Return caller filename by finding the caller frame"""
     # Current frame         => _get_logger()
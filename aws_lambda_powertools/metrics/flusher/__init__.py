@@ -0,0 +1,12 @@
+"""Background metrics flushing for long-running processes, with pluggable output sinks"""
+
+from aws_lambda_powertools.metrics.flusher.flusher import MetricsFlusher
+from aws_lambda_powertools.metrics.flusher.sinks import BaseMetricSink, FileSink, StdoutSink, UdpSink
+
+__all__ = [
+    "BaseMetricSink",
+    "FileSink",
+    "MetricsFlusher",
+    "StdoutSink",
+    "UdpSink",
+]
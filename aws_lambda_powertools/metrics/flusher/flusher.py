@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+from aws_lambda_powertools.metrics.exceptions import SchemaValidationError
+from aws_lambda_powertools.metrics.flusher.sinks import BaseMetricSink, StdoutSink
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.metrics.metrics import Metrics
+    from aws_lambda_powertools.metrics.provider.cloudwatch_emf.cloudwatch import AmazonCloudWatchEMFProvider
+    from aws_lambda_powertools.metrics.provider.datadog.datadog import DatadogProvider
+    from aws_lambda_powertools.metrics.provider.datadog.metrics import DatadogMetrics
+
+logger = logging.getLogger(__name__)
+
+# Delay before retrying a failing sink, doubled on every consecutive failure up to `interval_seconds`
+RETRY_BACKOFF_SECONDS = 1
+
+
+class MetricsFlusher(BaseMetricSink):
+    """Flush metrics from a background thread, on an interval or when a size threshold is hit.
+
+    Outside Lambda (containers, AWS Glue, local workers) there's no invocation end to flush metrics at.
+    MetricsFlusher records metrics from any number of threads, and flushes them every `interval_seconds`,
+    once `max_metrics` metrics were added, or once `max_bytes` of serialized metrics are pending.
+    Pending metrics are flushed when the interpreter exits, or when calling `close()`.
+
+    Serialized metrics are written to `sink` outside of the recording path, so a slow sink doesn't
+    block threads adding metrics. When the sink fails to write them, e.g. the endpoint is unavailable,
+    they're written again on the next flush, and the background thread backs off before retrying.
+    At most `max_bytes` of them are kept for retrying, dropping the oldest ones first.
+    Metrics failing validation are dropped instead, as they'd fail again on every flush.
+
+    Parameters
+    ----------
+    metrics : Metrics | DatadogMetrics | AmazonCloudWatchEMFProvider | DatadogProvider
+        Metrics instance or provider to flush
+    sink : BaseMetricSink, optional
+        Where to write serialized metrics, by default StdoutSink
+    interval_seconds : float, optional
+        Maximum time between flushes, by default 60
+    max_metrics : int, optional
+        Number of metrics added before flushing early, by default 1000
+    max_bytes : int, optional
+        Size of pending serialized metrics before writing them early, and of serialized metrics
+        kept when the sink fails to write them, by default 262144 (256KB)
+
+    Example
+    -------
+    **Flush EMF metrics to the CloudWatch agent every 10 seconds**
+
+        >>> from aws_lambda_powertools import Metrics
+        >>> from aws_lambda_powertools.metrics.flusher import MetricsFlusher, UdpSink
+        >>>
+        >>> metrics = Metrics(namespace="ServerlessAirline", service="payment")
+        >>> flusher = MetricsFlusher(metrics, sink=UdpSink(), interval_seconds=10)
+        >>>
+        >>> def process(job):
+                flusher.add_metric(name="JobProcessed", unit="Count", value=1)
+    """
+
+    def __init__(
+        self,
+        metrics: Metrics | DatadogMetrics | AmazonCloudWatchEMFProvider | DatadogProvider,
+        sink: BaseMetricSink | None = None,
+        interval_seconds: float = 60,
+        max_metrics: int = 1000,
+        max_bytes: int = 256 * 1024,
+    ):
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be greater than 0")
+
+        self.provider: Any = getattr(metrics, "provider", metrics)
+        self.sink = sink or StdoutSink()
+        self.interval_seconds = interval_seconds
+        self.max_metrics = max_metrics
+        self.max_bytes = max_bytes
+
+        # Guards the provider: metrics can't be added while they're being serialized
+        self._provider_lock = threading.Lock()
+        self._pending_metrics = 0
+
+        self._buffer: list[str] = []
+        self._buffer_bytes = 0
+        self._buffer_lock = threading.Lock()
+        # Keeps lines in order when the background thread and `flush()` write concurrently
+        self._write_lock = threading.Lock()
+        self._failed_writes = 0
+
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+        # Providers write serialized metrics to us instead of stdout
+        self.provider.sink = self
+        atexit.register(self.close)
+
+    def add_metric(self, *args: Any, **kwargs: Any) -> None:
+        """Add a metric to the provider; accepts the same arguments as the provider `add_metric`"""
+        self._ensure_thread()
+
+        with self._provider_lock:
+            self.provider.add_metric(*args, **kwargs)
+            self._pending_metrics += 1
+            threshold_reached = self._pending_metrics >= self.max_metrics
+
+        if threshold_reached:
+            self._wakeup.set()
+
+    def write(self, lines: list[str]) -> None:
+        """Buffer serialized metrics from the provider until the next flush"""
+        with self._buffer_lock:
+            self._buffer.extend(lines)
+            self._buffer_bytes += sum(len(line) for line in lines)
+            threshold_reached = self._buffer_bytes >= self.max_bytes
+
+        if threshold_reached:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """Serialize pending metrics and write them to the sink
+
+        Raises
+        ------
+        SchemaValidationError
+            When pending metrics fail validation. They're dropped, and other metrics are still written
+        """
+        validation_error: SchemaValidationError | None = None
+        with self._provider_lock:
+            if self._has_metrics():
+                try:
+                    self.provider.flush_metrics()
+                except SchemaValidationError as exc:
+                    # invalid metrics would fail again on every flush, so we drop them
+                    logger.debug("Dropping metrics that failed validation")
+                    self.provider.clear_metrics()
+                    validation_error = exc
+            self._pending_metrics = 0
+
+        with self._write_lock:
+            with self._buffer_lock:
+                lines, self._buffer, self._buffer_bytes = self._buffer, [], 0
+
+            if lines:
+                try:
+                    self.sink.write(lines)
+                except Exception:
+                    # e.g. the sink endpoint is unavailable; keep lines ahead of newer ones for the next flush
+                    self._failed_writes += 1
+                    self._requeue(lines)
+                    raise
+
+                self._failed_writes = 0
+
+        if validation_error is not None:
+            raise validation_error
+
+    def close(self) -> None:
+        """Stop the background thread, flush pending metrics and close the sink"""
+        atexit.unregister(self.close)
+
+        with self._thread_lock:
+            self._stopped.set()
+            thread, self._thread = self._thread, None
+
+        self._wakeup.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        self.flush()
+        self.sink.close()
+        # metrics added after closing are printed by the provider as usual
+        self.provider.sink = None
+
+    def _requeue(self, lines: list[str]) -> None:
+        with self._buffer_lock:
+            self._buffer[:0] = lines
+            self._buffer_bytes += sum(len(line) for line in lines)
+
+            # a sink that stays down must not grow the buffer forever; oldest lines are dropped first
+            dropped = 0
+            while dropped < len(self._buffer) and self._buffer_bytes > self.max_bytes:
+                self._buffer_bytes -= len(self._buffer[dropped])
+                dropped += 1
+            del self._buffer[:dropped]
+
+        if dropped:
+            logger.warning(f"Dropped {dropped} serialized metrics exceeding max_bytes while the sink is failing")
+
+    def _retry_backoff(self) -> float:
+        return min(self.interval_seconds, RETRY_BACKOFF_SECONDS * 2 ** (self._failed_writes - 1))
+
+    def _has_metrics(self) -> bool:
+        # EMF keeps metrics with their own dimensions in metric groups, Datadog keeps aggregated metrics apart
+        return bool(
+            self.provider.metric_set
+            or getattr(self.provider, "metric_groups", None)
+            or getattr(self.provider, "aggregated_metric_set", None),
+        )
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None or self._stopped.is_set():
+            return
+
+        with self._thread_lock:
+            if self._thread is None and not self._stopped.is_set():
+                self._thread = threading.Thread(target=self._run, name="powertools-metrics-flusher", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(timeout=self.interval_seconds)
+            self._wakeup.clear()
+
+            try:
+                self.flush()
+            except Exception:
+                # never let a failing flush (e.g. sink error) stop the flusher
+                logger.exception("Failed to flush metrics")
+
+            if self._failed_writes:
+                # don't retry a failing sink every time the size threshold is reached
+                self._stopped.wait(timeout=self._retry_backoff())
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import logging
+import socket
+import sys
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import IO
+
+logger = logging.getLogger(__name__)
+
+CLOUDWATCH_AGENT_EMF_PORT = 25888
+
+
+class BaseMetricSink(ABC):
+    """
+    Interface to write serialized metrics, one JSON document per line.
+
+    Usage:
+        1. Inherit from this class.
+        2. Implement `write` to send lines to your destination.
+        3. Optionally, implement `close` to release resources.
+    """
+
+    @abstractmethod
+    def write(self, lines: list[str]) -> None:
+        """Write serialized metrics
+
+        Parameters
+        ----------
+        lines : list[str]
+            Serialized metrics, without trailing newlines
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resource held by the sink"""
+        return None
+
+
+class StdoutSink(BaseMetricSink):
+    """Write metrics to standard output, as providers do by default"""
+
+    def write(self, lines: list[str]) -> None:
+        # resolve sys.stdout at write time so redirections (e.g. tests) are honoured
+        sys.stdout.write("".join(f"{line}\n" for line in lines))
+        sys.stdout.flush()
+
+
+class FileSink(BaseMetricSink):
+    """Append metrics to a file, e.g. a file tailed by the CloudWatch agent
+
+    Parameters
+    ----------
+    path : str
+        File path, opened in append mode on first write
+    encoding : str, optional
+        File encoding, by default "utf-8"
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        self.path = path
+        self.encoding = encoding
+        self._file: IO[str] | None = None
+        self._lock = threading.Lock()
+
+    def write(self, lines: list[str]) -> None:
+        with self._lock:
+            if self._file is None:
+                self._file = Path(self.path).open("a", encoding=self.encoding)  # noqa: SIM115 # closed in close()
+
+            self._file.write("".join(f"{line}\n" for line in lines))
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class UdpSink(BaseMetricSink):
+    """Send each metric as a UDP datagram to a local agent, e.g. the CloudWatch agent EMF listener
+
+    UDP is fire-and-forget: metrics are lost if no agent is listening, but sending never blocks.
+
+    Parameters
+    ----------
+    host : str, optional
+        Agent host, by default "127.0.0.1"
+    port : int, optional
+        Agent port, by default 25888 (CloudWatch agent EMF port)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = CLOUDWATCH_AGENT_EMF_PORT):
+        self.address = (host, port)
+        self._socket: socket.socket | None = None
+        self._lock = threading.Lock()
+
+    def write(self, lines: list[str]) -> None:
+        with self._lock:
+            if self._socket is None:
+                self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+            for line in lines:
+                try:
+                    self._socket.sendto(f"{line}\n".encode(), self.address)
+                except OSError:
+                    logger.debug(f"Unable to send metric to {self.address}, dropping it", exc_info=True)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
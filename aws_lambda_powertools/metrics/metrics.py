@@ -1,6 +1,7 @@
 # NOTE: keeps for compatibility
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Any
 
 from aws_lambda_powertools.metrics.provider.cloudwatch_emf.cloudwatch import AmazonCloudWatchEMFProvider
@@ -56,6 +57,10 @@ class Metrics:
         Namespace for metrics
     provider: AmazonCloudWatchEMFProvider, optional
         Pre-configured AmazonCloudWatchEMFProvider provider
+    aggregate_values : bool, optional
+        Deduplicate identical values of a metric into EMF `Values` and `Counts` arrays, by default False
+    histogram_buckets : list[float], optional
+        Sorted upper bounds to bucket metric values into before aggregating them, by default None
 
     Raises
     ------
@@ -78,17 +83,25 @@ class Metrics:
     _dimensions: dict[str, str] = {}
     _metadata: dict[str, Any] = {}
     _default_dimensions: dict[str, Any] = {}
+    _metric_groups: dict[tuple[tuple[str, str], ...], dict[str, Any]] = {}
+    _dimension_sets: list[dict[str, str]] = []
+    # Guards the shared data above, as instances may be used from multiple threads
+    _lock = threading.RLock()
 
     def __init__(
         self,
         service: str | None = None,
         namespace: str | None = None,
         provider: AmazonCloudWatchEMFProvider | None = None,
+        aggregate_values: bool = False,
+        histogram_buckets: list[float] | None = None,
     ):
         self.metric_set = self._metrics
         self.metadata_set = self._metadata
         self.default_dimensions = self._default_dimensions
         self.dimension_set = self._dimensions
+        self.metric_groups = self._metric_groups
+        self.dimension_sets = self._dimension_sets
 
         self.dimension_set.update(**self._default_dimensions)
 
@@ -100,6 +113,11 @@ class Metrics:
                 dimension_set=self.dimension_set,
                 metadata_set=self.metadata_set,
                 default_dimensions=self._default_dimensions,
+                aggregate_values=aggregate_values,
+                histogram_buckets=histogram_buckets,
+                metric_groups=self.metric_groups,
+                dimension_sets=self.dimension_sets,
+                lock=self._lock,
             )
         else:
             self.provider = provider
@@ -110,12 +128,21 @@ class Metrics:
         unit: MetricUnit | str,
         value: float,
         resolution: MetricResolution | int = 60,
+        dimensions: dict[str, str] | None = None,
     ) -> None:
-        self.provider.add_metric(name=name, unit=unit, value=value, resolution=resolution)
+        if dimensions is None:
+            # custom providers may not support per-metric dimensions
+            self.provider.add_metric(name=name, unit=unit, value=value, resolution=resolution)
+            return
+
+        self.provider.add_metric(name=name, unit=unit, value=value, resolution=resolution, dimensions=dimensions)
 
     def add_dimension(self, name: str, value: str) -> None:
         self.provider.add_dimension(name=name, value=value)
 
+    def add_dimension_set(self, **dimensions: str) -> None:
+        self.provider.add_dimension_set(**dimensions)
+
     def serialize_metric_set(
         self,
         metrics: dict | None = None,
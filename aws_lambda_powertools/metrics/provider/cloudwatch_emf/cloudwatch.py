@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import bisect
 import datetime
-import json
 import logging
 import numbers
 import os
+import threading
 import warnings
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any
@@ -20,10 +21,11 @@ from aws_lambda_powertools.metrics.functions import (
 from aws_lambda_powertools.metrics.provider.base import BaseProvider
 from aws_lambda_powertools.metrics.provider.cloudwatch_emf.constants import MAX_DIMENSIONS, MAX_METRICS
 from aws_lambda_powertools.metrics.provider.cloudwatch_emf.metric_properties import MetricResolution, MetricUnit
-from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared import constants, json_backend
 from aws_lambda_powertools.shared.functions import resolve_env_var_choice
 
 if TYPE_CHECKING:
+    from aws_lambda_powertools.metrics.flusher.sinks import BaseMetricSink
     from aws_lambda_powertools.metrics.provider.cloudwatch_emf.types import CloudWatchEMFOutput
     from aws_lambda_powertools.metrics.types import MetricNameUnitResolution
     from aws_lambda_powertools.shared.types import AnyCallableT
@@ -50,6 +52,23 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
     POWERTOOLS_SERVICE_NAME : str
         service name used for default dimension
 
+    Parameters
+    ----------
+    aggregate_values : bool, optional
+        Deduplicate identical values of a metric into EMF `Values` and `Counts` arrays, by default False
+    histogram_buckets : list[float], optional
+        Sorted upper bounds to bucket metric values into before aggregating them. A value is recorded
+        as the smallest bound greater than or equal to it, and values above the last bound are kept as-is.
+        Implies `aggregate_values`, by default None
+    metric_groups : dict, optional
+        Metrics recorded with their own dimensions, grouped by dimension signature
+    dimension_sets : list[dict[str, str]], optional
+        Additional dimension sets published alongside the main dimension set
+    sink : BaseMetricSink, optional
+        Where to write serialized metrics, by default printed to standard output
+    lock : threading.RLock, optional
+        Lock guarding metric, dimension and metadata sets; share it when sharing these sets across providers
+
     Raises
     ------
     MetricUnitError
@@ -70,14 +89,27 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         metadata_set: dict[str, Any] | None = None,
         service: str | None = None,
         default_dimensions: dict[str, Any] | None = None,
+        aggregate_values: bool = False,
+        histogram_buckets: list[float] | None = None,
+        metric_groups: dict[tuple[tuple[str, str], ...], dict[str, Any]] | None = None,
+        dimension_sets: list[dict[str, str]] | None = None,
+        sink: BaseMetricSink | None = None,
+        lock: threading.RLock | None = None,
     ):
         self.metric_set = metric_set if metric_set is not None else {}
         self.dimension_set = dimension_set if dimension_set is not None else {}
+        self.metric_groups = metric_groups if metric_groups is not None else {}
+        self.dimension_sets = dimension_sets if dimension_sets is not None else []
+        self.sink = sink
+        # Reentrant as flushing adds the service dimension; uncontended acquires keep single-threaded overhead low
+        self._lock = lock or threading.RLock()
         self.default_dimensions = default_dimensions or {}
         self.namespace = resolve_env_var_choice(choice=namespace, env=os.getenv(constants.METRICS_NAMESPACE_ENV))
         self.service = resolve_env_var_choice(choice=service, env=os.getenv(constants.SERVICE_NAME_ENV))
         self.metadata_set = metadata_set if metadata_set is not None else {}
         self.timestamp: int | None = None
+        self.histogram_buckets = sorted(float(bucket) for bucket in histogram_buckets) if histogram_buckets else None
+        self.aggregate_values = aggregate_values or self.histogram_buckets is not None
 
         self._metric_units = [unit.value for unit in MetricUnit]
         self._metric_unit_valid_options = list(MetricUnit.__members__)
@@ -91,6 +123,7 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         unit: MetricUnit | str,
         value: float,
         resolution: MetricResolution | int = 60,
+        dimensions: dict[str, str] | None = None,
     ) -> None:
         """Adds given metric
 
@@ -108,6 +141,10 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
 
             metric.add_metric(name="BookingConfirmation", unit="Count", value=1, resolution=MetricResolution.High)
 
+        **Add given metric with its own dimensions**
+
+            metric.add_metric(name="BookingConfirmation", unit="Count", value=1, dimensions={"tenant_id": "123"})
+
         Parameters
         ----------
         name : str
@@ -118,6 +155,9 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
             Metric value
         resolution : MetricResolution | int
             `aws_lambda_powertools.helper.models.MetricResolution`
+        dimensions : dict[str, str], optional
+            Dimensions for this metric only, in addition to the dimensions shared by all metrics.
+            Metrics with the same dimensions are published together in a separate EMF blob
 
         Raises
         ------
@@ -125,6 +165,8 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
             When metric unit is not supported by CloudWatch
         MetricResolutionError
             When metric resolution is not supported by CloudWatch
+        SchemaValidationError
+            When the metric dimensions exceed the maximum number of dimensions
         """
         if not isinstance(value, numbers.Number):
             raise MetricValueError(f"{value} is not a valid number")
@@ -138,21 +180,45 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
             metric_resolutions=self._metric_resolutions,
             resolution=resolution,
         )
-        metric: dict = self.metric_set.get(name, defaultdict(list))
-        metric["Unit"] = unit
-        metric["StorageResolution"] = resolution
-        metric["Value"].append(float(value))
-        logger.debug(f"Adding metric: {name} with {metric}")
-        self.metric_set[name] = metric
-
-        if len(self.metric_set) == MAX_METRICS or len(metric["Value"]) == MAX_METRICS:
-            logger.debug(f"Exceeded maximum of {MAX_METRICS} metrics - Publishing existing metric set")
-            metrics = self.serialize_metric_set()
-            print(json.dumps(metrics))
-
-            # clear metric set only as opposed to metrics and dimensions set
-            # since we could have more than 100 metrics
-            self.metric_set.clear()
+        metrics_to_write: list[CloudWatchEMFOutput] = []
+
+        with self._lock:
+            signature = self._build_dimension_signature(dimensions) if dimensions else None
+            metric_set = self.metric_set if signature is None else self.metric_groups.setdefault(signature, {})
+
+            metric: dict = metric_set.get(name, defaultdict(list))
+            metric["Unit"] = unit
+            metric["StorageResolution"] = resolution
+
+            if self.aggregate_values:
+                # EMF limits the number of values per metric, not how many times each one was recorded
+                aggregated_values: dict[float, int] = metric.setdefault("AggregatedValues", {})
+                aggregated_value = self._bucket_value(float(value))
+                aggregated_values[aggregated_value] = aggregated_values.get(aggregated_value, 0) + 1
+                values_count = len(aggregated_values)
+            else:
+                metric["Value"].append(float(value))
+                values_count = len(metric["Value"])
+
+            # avoid formatting the metric on every call when debug logging is disabled
+            logger.debug("Adding metric: %s with %s", name, metric)
+            metric_set[name] = metric
+
+            if len(metric_set) == MAX_METRICS or values_count == MAX_METRICS:
+                logger.debug(f"Exceeded maximum of {MAX_METRICS} metrics - Publishing existing metric set")
+                if signature is None:
+                    metrics_to_write.append(self.serialize_metric_set())
+
+                    # clear metric set only as opposed to metrics and dimensions set
+                    # since we could have more than 100 metrics
+                    self.metric_set.clear()
+                else:
+                    metrics_to_write.append(self._serialize_metric_group(signature=signature, metrics=metric_set))
+                    del self.metric_groups[signature]
+
+        # write outside the lock so other threads can keep adding metrics
+        if metrics_to_write:
+            self._write_metrics(metrics_to_write)
 
     def serialize_metric_set(
         self,
@@ -189,6 +255,15 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         SchemaValidationError
             Raised when serialization fail schema validation
         """
+        with self._lock:
+            return self._serialize_metric_set(metrics=metrics, dimensions=dimensions, metadata=metadata)
+
+    def _serialize_metric_set(
+        self,
+        metrics: dict | None,
+        dimensions: dict | None,
+        metadata: dict | None,
+    ) -> CloudWatchEMFOutput:
         if metrics is None:  # pragma: no cover
             metrics = self.metric_set
 
@@ -198,9 +273,7 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         if metadata is None:  # pragma: no cover
             metadata = self.metadata_set
 
-        if self.service and not self.dimension_set.get("service"):
-            # self.service won't be a float
-            self.add_dimension(name="service", value=self.service)
+        self._add_service_dimension()
 
         if len(metrics) == 0:
             raise SchemaValidationError("Must contain at least one metric.")
@@ -216,11 +289,13 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         # In case using high-resolution metrics, add StorageResolution field
         # Example: [ { "Name": "metric_name", "Unit": "Count", "StorageResolution": 1 } ] # noqa ERA001
         metric_definition: list[MetricNameUnitResolution] = []
-        metric_names_and_values: dict[str, float] = {}  # { "metric_name": 1.0 }
+        metric_names_and_values: dict[str, Any] = {}  # { "metric_name": 1.0 }
 
         for metric_name in metrics:
             metric: dict = metrics[metric_name]
-            metric_value: int = metric.get("Value", 0)
+            metric_value: int | list[float] | dict[str, list] = metric.get("Value", 0)
+            if "AggregatedValues" in metric:
+                metric_value = self._serialize_aggregated_values(metric)
             metric_unit: str = metric.get("Unit", "")
             metric_resolution: int = metric.get("StorageResolution", 60)
 
@@ -234,23 +309,91 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
 
             metric_names_and_values.update({metric_name: metric_value})
 
+        # Additional dimension sets reference dimension values at the root of the EMF blob
+        # along with the default dimensions, e.g. [ [ "service", "tenant_id" ], [ "service", "environment" ] ]
+        additional_dimension_keys: list[list[str]] = []
+        additional_dimensions: dict[str, str] = {}
+        default_dimension_names = [name for name in dimensions if name in self.default_dimensions or name == "service"]
+        for dimension_set in self.dimension_sets:
+            additional_dimension_keys.append([*default_dimension_names, *dimension_set])
+            additional_dimensions.update(dimension_set)
+
         return {
             "_aws": {
                 "Timestamp": self.timestamp or int(datetime.datetime.now().timestamp() * 1000),  # epoch
                 "CloudWatchMetrics": [
                     {
                         "Namespace": self.namespace,  # "test_namespace"
-                        "Dimensions": [list(dimensions.keys())],  # [ "service" ]
+                        "Dimensions": [list(dimensions.keys()), *additional_dimension_keys],  # [ "service" ]
                         "Metrics": metric_definition,
                     },
                 ],
             },
             # NOTE: Mypy doesn't recognize splats '** syntax' in TypedDict
+            **additional_dimensions,  # type: ignore[typeddict-item] # "environment": "prod"
             **dimensions,  # "service": "test_service"
             **metadata,  # type: ignore[typeddict-item] # "username": "test"
             **metric_names_and_values,  # "single_metric": 1.0
         }
 
+    def _write_metrics(self, metrics: list[CloudWatchEMFOutput]) -> None:
+        lines = [json_backend.dumps(metric) for metric in metrics]
+        if self.sink is None:
+            for line in lines:
+                print(line)
+        else:
+            self.sink.write(lines)
+
+    def _add_service_dimension(self) -> None:
+        if self.service and not self.dimension_set.get("service"):
+            # self.service won't be a float
+            self.add_dimension(name="service", value=self.service)
+
+    def _build_dimension_signature(self, dimensions: dict[str, str]) -> tuple[tuple[str, str], ...]:
+        """Build a hashable, order-insensitive signature of metric dimensions to group metrics by"""
+        signature = tuple(
+            sorted((name, value if isinstance(value, str) else str(value)) for name, value in dimensions.items()),
+        )
+
+        if len(self.dimension_set.keys() | dimensions.keys()) > MAX_DIMENSIONS:
+            raise SchemaValidationError(
+                f"Maximum number of dimensions exceeded ({MAX_DIMENSIONS}): Unable to add metric dimensions.",
+            )
+
+        return signature
+
+    def _serialize_metric_group(
+        self,
+        signature: tuple[tuple[str, str], ...],
+        metrics: dict[str, Any],
+    ) -> CloudWatchEMFOutput:
+        """Serialize metrics sharing the same metric dimensions into their own EMF blob"""
+        self._add_service_dimension()
+        return self.serialize_metric_set(
+            metrics=metrics,
+            dimensions={**self.dimension_set, **dict(signature)},
+            metadata=self.metadata_set,
+        )
+
+    def _bucket_value(self, value: float) -> float:
+        if self.histogram_buckets is None:
+            return value
+
+        index = bisect.bisect_left(self.histogram_buckets, value)
+        return self.histogram_buckets[index] if index < len(self.histogram_buckets) else value
+
+    @staticmethod
+    def _serialize_aggregated_values(metric: dict) -> dict[str, list]:
+        """Serialize aggregated metric values into EMF Values and Counts arrays
+
+        Values recorded without aggregation into the same metric (e.g. shared metric set) are merged in.
+        """
+        aggregated_values: dict[float, int] = dict(metric["AggregatedValues"])
+        for value in metric.get("Value", []):
+            aggregated_values[value] = aggregated_values.get(value, 0) + 1
+
+        return {"Values": list(aggregated_values), "Counts": list(aggregated_values.values())}
+
     def add_dimension(self, name: str, value: str) -> None:
         """Adds given dimension to all metrics
 
@@ -268,24 +411,77 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
             Dimension value
         """
         logger.debug(f"Adding dimension: {name}:{value}")
-        if len(self.dimension_set) == MAX_DIMENSIONS:
-            raise SchemaValidationError(
-                f"Maximum number of dimensions exceeded ({MAX_DIMENSIONS}): Unable to add dimension {name}.",
-            )
+        with self._lock:
+            if len(self.dimension_set) == MAX_DIMENSIONS:
+                raise SchemaValidationError(
+                    f"Maximum number of dimensions exceeded ({MAX_DIMENSIONS}): Unable to add dimension {name}.",
+                )
+
+            value = value if isinstance(value, str) else str(value)
+
+            if not name.strip() or not value.strip():
+                warnings.warn(
+                    f"The dimension {name} doesn't meet the requirements and won't be added. "
+                    "Ensure the dimension name and value are non empty strings",
+                    stacklevel=2,
+                )
+            else:
+                # Cast value to str according to EMF spec
+                # Majority of values are expected to be string already, so
+                # checking before casting improves performance in most cases
+                self.dimension_set[name] = value
+
+    def add_dimension_set(self, **dimensions: str) -> None:
+        """Adds a new dimension set to all metrics, along with default dimensions
+
+        Each dimension set publishes the same metrics under another combination of dimensions,
+        within the same EMF blob.
 
-        value = value if isinstance(value, str) else str(value)
+        Example
+        -------
+        **Publish metrics per environment and per tenant**
 
-        if not name.strip() or not value.strip():
-            warnings.warn(
-                f"The dimension {name} doesn't meet the requirements and won't be added. "
-                "Ensure the dimension name and value are non empty strings",
-                stacklevel=2,
+            metric.add_dimension_set(environment="prod")
+            metric.add_dimension_set(tenant_id="123")
+
+        Parameters
+        ----------
+        dimensions : dict[str, str]
+            Dimension names and values
+
+        Raises
+        ------
+        SchemaValidationError
+            When the dimension set exceeds the maximum number of dimensions
+        """
+        logger.debug(f"Adding dimension set: {dimensions}")
+        if len(self.default_dimensions.keys() | dimensions.keys()) > MAX_DIMENSIONS:
+            raise SchemaValidationError(
+                f"Maximum number of dimensions exceeded ({MAX_DIMENSIONS}): Unable to add dimension set.",
             )
-        else:
-            # Cast value to str according to EMF spec
-            # Majority of values are expected to be string already, so
-            # checking before casting improves performance in most cases
-            self.dimension_set[name] = value
+
+        with self._lock:
+            dimension_set: dict[str, str] = {}
+            for name, dimension_value in dimensions.items():
+                value = dimension_value if isinstance(dimension_value, str) else str(dimension_value)
+
+                if not name.strip() or not value.strip():
+                    warnings.warn(
+                        f"The dimension {name} doesn't meet the requirements and won't be added. "
+                        "Ensure the dimension name and value are non empty strings",
+                        stacklevel=2,
+                    )
+                elif self.dimension_set.get(name, value) != value:
+                    # EMF dimension values are shared by all dimension sets within a blob
+                    warnings.warn(
+                        f"The dimension {name} already has a different value and won't be added to the dimension set.",
+                        stacklevel=2,
+                    )
+                else:
+                    dimension_set[name] = value
+
+            if dimension_set:
+                self.dimension_sets.append(dimension_set)
 
     def add_metadata(self, key: str, value: Any) -> None:
         """Adds high cardinal metadata for metrics object
@@ -314,10 +510,11 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         # Cast key to str according to EMF spec
         # Majority of keys are expected to be string already, so
         # checking before casting improves performance in most cases
-        if isinstance(key, str):
-            self.metadata_set[key] = value
-        else:
-            self.metadata_set[str(key)] = value
+        with self._lock:
+            if isinstance(key, str):
+                self.metadata_set[key] = value
+            else:
+                self.metadata_set[str(key)] = value
 
     def set_timestamp(self, timestamp: int | datetime.datetime):
         """
@@ -346,10 +543,13 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
 
     def clear_metrics(self) -> None:
         logger.debug("Clearing out existing metric set from memory")
-        self.metric_set.clear()
-        self.dimension_set.clear()
-        self.metadata_set.clear()
-        self.set_default_dimensions(**self.default_dimensions)
+        with self._lock:
+            self.metric_set.clear()
+            self.metric_groups.clear()
+            self.dimension_set.clear()
+            self.dimension_sets.clear()
+            self.metadata_set.clear()
+            self.set_default_dimensions(**self.default_dimensions)
 
     def flush_metrics(self, raise_on_empty_metrics: bool = False) -> None:
         """Manually flushes the metrics. This is normally not necessary,
@@ -361,18 +561,29 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         raise_on_empty_metrics : bool, optional
             raise exception if no metrics are emitted, by default False
         """
-        if not raise_on_empty_metrics and not self.metric_set:
-            warnings.warn(
-                "No application metrics to publish. The cold-start metric may be published if enabled. "
-                "If application metrics should never be empty, consider using 'raise_on_empty_metrics'",
-                stacklevel=2,
-            )
-        else:
+        with self._lock:
+            if not raise_on_empty_metrics and not self.metric_set and not self.metric_groups:
+                warnings.warn(
+                    "No application metrics to publish. The cold-start metric may be published if enabled. "
+                    "If application metrics should never be empty, consider using 'raise_on_empty_metrics'",
+                    stacklevel=2,
+                )
+                return
+
             logger.debug("Flushing existing metrics")
-            metrics = self.serialize_metric_set()
-            print(json.dumps(metrics, separators=(",", ":")))
+            # metrics with their own dimensions are published in one EMF blob per distinct dimensions
+            metrics: list[CloudWatchEMFOutput] = []
+            if self.metric_set or not self.metric_groups:
+                metrics.append(self.serialize_metric_set())
+
+            for signature, metric_group in self.metric_groups.items():
+                metrics.append(self._serialize_metric_group(signature=signature, metrics=metric_group))
+
+            # serialize and clear atomically so metrics added meanwhile are kept for the next flush
             self.clear_metrics()
 
+        self._write_metrics(metrics)
+
     def log_metrics(
         self,
         lambda_handler: AnyCallableT | None = None,
@@ -461,7 +672,8 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
             def lambda_handler():
                 return True
         """
-        for name, value in dimensions.items():
-            self.add_dimension(name, value)
+        with self._lock:
+            for name, value in dimensions.items():
+                self.add_dimension(name, value)
 
-        self.default_dimensions.update(**dimensions)
+            self.default_dimensions.update(**dimensions)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 import numbers
 import os
@@ -12,10 +11,11 @@ from typing import TYPE_CHECKING, Any
 from aws_lambda_powertools.metrics.exceptions import MetricValueError, SchemaValidationError
 from aws_lambda_powertools.metrics.provider import BaseProvider
 from aws_lambda_powertools.metrics.provider.datadog.warnings import DatadogDataValidationWarning
-from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared import constants, json_backend
 from aws_lambda_powertools.shared.functions import resolve_env_var_choice
 
 if TYPE_CHECKING:
+    from aws_lambda_powertools.metrics.flusher.sinks import BaseMetricSink
     from aws_lambda_powertools.shared.types import AnyCallableT
     from aws_lambda_powertools.utilities.typing import LambdaContext
 
@@ -30,6 +30,26 @@ except ImportError:  # pragma: no cover
     lambda_metric = None  # pragma: no cover
 
 DEFAULT_NAMESPACE = "default"
+# Distribution values sharing a timestamp are published together, up to this many per metric
+DISTRIBUTION_MAX_VALUES_PER_POINT = 100
+
+
+class AggregatedSeries:
+    """Metric grouped client-side by type, name and tags until flushed
+
+    Counters and gauges keep a single value. Distributions keep every value grouped by timestamp,
+    so percentiles are computed by Datadog across all invocations.
+    """
+
+    __slots__ = ("metric_type", "name", "tags", "timestamp", "value", "points")
+
+    def __init__(self, metric_type: str, name: str, tags: dict[str, Any], timestamp: int):
+        self.metric_type = metric_type
+        self.name = name
+        self.tags = tags
+        self.timestamp = timestamp
+        self.value: float = 0
+        self.points: dict[int, list[float]] | None = {} if metric_type == "distribution" else None
 
 
 class DatadogProvider(BaseProvider):
@@ -43,6 +63,13 @@ class DatadogProvider(BaseProvider):
     POWERTOOLS_METRICS_NAMESPACE : str
         metric namespace to be set for all metrics
 
+    Parameters
+    ----------
+    sink : BaseMetricSink, optional
+        Where to write serialized metrics instead of the Datadog extension or standard output
+    aggregated_metric_set : dict, optional
+        Counters, gauges and distributions grouped by name and tags until flushed
+
     Raises
     ------
     MetricValueError
@@ -57,14 +84,18 @@ class DatadogProvider(BaseProvider):
         namespace: str | None = None,
         flush_to_log: bool | None = None,
         default_tags: dict[str, Any] | None = None,
+        sink: BaseMetricSink | None = None,
+        aggregated_metric_set: dict[tuple, AggregatedSeries] | None = None,
     ):
         self.metric_set = metric_set if metric_set is not None else []
+        self.aggregated_metric_set = aggregated_metric_set if aggregated_metric_set is not None else {}
         self.namespace = (
             resolve_env_var_choice(choice=namespace, env=os.getenv(constants.METRICS_NAMESPACE_ENV))
             or DEFAULT_NAMESPACE
         )
         self.default_tags = default_tags or {}
         self.flush_to_log = resolve_env_var_choice(choice=flush_to_log, env=os.getenv(constants.DATADOG_FLUSH_TO_LOG))
+        self.sink = sink
 
     #  adding name,value,timestamp,tags
     def add_metric(
@@ -104,6 +135,129 @@ class DatadogProvider(BaseProvider):
             >>> )
         """
 
+        self._validate_metric(name=name, value=value, tags=tags)
+
+        if not timestamp:
+            timestamp = int(time.time())
+
+        logger.debug({"details": "Appending metric", "metrics": name})
+        self.metric_set.append({"m": name, "v": value, "e": timestamp, "t": tags})
+
+    def increment(self, name: str, value: float = 1, timestamp: int | None = None, **tags) -> None:
+        """Increments a counter, aggregated by name and tags until flushed
+
+        Contrary to `add_metric`, a single metric is published per name and tags with the sum of all values.
+
+        Parameters
+        ----------
+        name: str
+            Name/Key for the metric
+        value: float, optional
+            Value to add to the counter, by default 1
+        timestamp: int, optional
+            Timestamp in int for the metric, default = time.time(). The latest timestamp is published
+        tags: Any
+            Metric tags, e.g., increment(name="orders", product="latte") -> tags=['product:latte']
+
+        Examples
+        --------
+            >>> provider = DatadogProvider()
+            >>>
+            >>> for record in records:
+            >>>     provider.increment(name="records_processed", queue="orders")
+        """
+        series = self._get_aggregated_series(
+            metric_type="count",
+            name=name,
+            value=value,
+            timestamp=timestamp,
+            tags=tags,
+        )
+        series.value += value
+
+    def gauge(self, name: str, value: float, timestamp: int | None = None, **tags) -> None:
+        """Sets a gauge, aggregated by name and tags until flushed
+
+        A single metric is published per name and tags with the last value set.
+
+        Parameters
+        ----------
+        name: str
+            Name/Key for the metric
+        value: float
+            Current value of the gauge
+        timestamp: int, optional
+            Timestamp in int for the metric, default = time.time(). The latest timestamp is published
+        tags: Any
+            Metric tags, e.g., gauge(name="queue_depth", value=10, queue="orders") -> tags=['queue:orders']
+        """
+        series = self._get_aggregated_series(
+            metric_type="gauge",
+            name=name,
+            value=value,
+            timestamp=timestamp,
+            tags=tags,
+        )
+        series.value = value
+
+    def distribution(self, name: str, value: float, timestamp: int | None = None, **tags) -> None:
+        """Adds a value to a distribution, grouped by name and tags until flushed
+
+        Values sharing a timestamp are published together as a single distribution point, with up to
+        `DISTRIBUTION_MAX_VALUES_PER_POINT` values, so Datadog computes percentiles across all invocations
+        from every value. Pre-computing percentiles client-side would make them statistically invalid,
+        e.g. a p95 of p95s.
+
+        Parameters
+        ----------
+        name: str
+            Name/Key for the metric
+        value: float
+            Value to add to the distribution
+        timestamp: int, optional
+            Timestamp in int for the metric, default = time.time()
+        tags: Any
+            Metric tags, e.g., distribution(name="latency", value=12, api="orders") -> tags=['api:orders']
+        """
+        timestamp = timestamp or int(time.time())
+        series = self._get_aggregated_series(
+            metric_type="distribution",
+            name=name,
+            value=value,
+            timestamp=timestamp,
+            tags=tags,
+        )
+        series.points.setdefault(timestamp, []).append(value)  # type: ignore[union-attr] # distributions have points
+
+    def _get_aggregated_series(
+        self,
+        metric_type: str,
+        name: str,
+        value: float,
+        timestamp: int | None,
+        tags: dict[str, Any],
+    ) -> AggregatedSeries:
+        self._validate_metric(name=name, value=value, tags=tags)
+
+        timestamp = timestamp or int(time.time())
+        # tags are published as strings, and their order doesn't change the series
+        key = (metric_type, name, tuple(sorted((tag_key, str(tag_value)) for tag_key, tag_value in tags.items())))
+
+        series = self.aggregated_metric_set.get(key)
+        if series is None:
+            logger.debug({"details": "Aggregating metric", "metrics": name, "type": metric_type})
+            series = self.aggregated_metric_set[key] = AggregatedSeries(
+                metric_type=metric_type,
+                name=name,
+                tags=tags,
+                timestamp=timestamp,
+            )
+        else:
+            series.timestamp = max(series.timestamp, timestamp)
+
+        return series
+
+    def _validate_metric(self, name: str, value: float, tags: dict[str, Any]) -> None:
         # validating metric name
         if not self._validate_datadog_metric_name(name):
             docs = "https://docs.datadoghq.com/metrics/custom_metrics/#naming-custom-metrics"
@@ -118,12 +272,6 @@ class DatadogProvider(BaseProvider):
         if not isinstance(value, numbers.Real):
             raise MetricValueError(f"{value} is not a valid number")
 
-        if not timestamp:
-            timestamp = int(time.time())
-
-        logger.debug({"details": "Appending metric", "metrics": name})
-        self.metric_set.append({"m": name, "v": value, "e": timestamp, "t": tags})
-
     def serialize_metric_set(self, metrics: list | None = None) -> list:
         """Serializes metrics
 
@@ -146,33 +294,72 @@ class DatadogProvider(BaseProvider):
             Raised when serialization fail schema validation
         """
 
+        aggregated_metrics: list[AggregatedSeries] = []
         if metrics is None:  # pragma: no cover
             metrics = self.metric_set
+            aggregated_metrics = list(self.aggregated_metric_set.values())
 
-        if len(metrics) == 0:
+        if len(metrics) == 0 and len(aggregated_metrics) == 0:
             raise SchemaValidationError("Must contain at least one metric.")
 
         output_list: list = []
 
         logger.debug({"details": "Serializing metrics", "metrics": metrics})
 
-        for single_metric in metrics:
-            if self.namespace != DEFAULT_NAMESPACE:
-                metric_name = f"{self.namespace}.{single_metric['m']}"
-            else:
-                metric_name = single_metric["m"]
+        # metrics commonly share the same tags, so we serialize each unique set of tags only once
+        serialized_tags_cache: dict[tuple, list[str]] = {}
 
+        for single_metric in metrics:
             output_list.append(
                 {
-                    "m": metric_name,
+                    "m": self._prefix_namespace(single_metric["m"]),
                     "v": single_metric["v"],
                     "e": single_metric["e"],
-                    "t": self._serialize_datadog_tags(metric_tags=single_metric["t"], default_tags=self.default_tags),
+                    "t": self._serialize_tags_cached(metric_tags=single_metric["t"], cache=serialized_tags_cache),
                 },
             )
 
+        for series in aggregated_metrics:
+            metric_name = self._prefix_namespace(series.name)
+            tags = self._serialize_tags_cached(metric_tags=series.tags, cache=serialized_tags_cache)
+            if series.points is None:
+                output_list.append({"m": metric_name, "v": series.value, "e": series.timestamp, "t": tags})
+                continue
+
+            for timestamp, values in series.points.items():
+                for start in range(0, len(values), DISTRIBUTION_MAX_VALUES_PER_POINT):
+                    output_list.append(
+                        {
+                            "m": metric_name,
+                            "v": values[start : start + DISTRIBUTION_MAX_VALUES_PER_POINT],
+                            "e": timestamp,
+                            "t": tags,
+                        },
+                    )
+
         return output_list
 
+    def _prefix_namespace(self, metric_name: str) -> str:
+        if self.namespace != DEFAULT_NAMESPACE:
+            return f"{self.namespace}.{metric_name}"
+
+        return metric_name
+
+    def _serialize_tags_cached(self, metric_tags: dict[str, Any], cache: dict[tuple, list[str]]) -> list[str]:
+        try:
+            key = tuple(metric_tags.items())
+            serialized_tags = cache.get(key)
+        except TypeError:  # unhashable tag values
+            return self._serialize_datadog_tags(metric_tags=metric_tags, default_tags=self.default_tags)
+
+        if serialized_tags is None:
+            serialized_tags = cache[key] = self._serialize_datadog_tags(
+                metric_tags=metric_tags,
+                default_tags=self.default_tags,
+            )
+
+        return serialized_tags
+
     # flush serialized data to output
     def flush_metrics(self, raise_on_empty_metrics: bool = False) -> None:
         """Manually flushes the metrics. This is normally not necessary,
@@ -184,7 +371,7 @@ class DatadogProvider(BaseProvider):
         raise_on_empty_metrics : bool, optional
             raise exception if no metrics are emitted, by default False
         """
-        if not raise_on_empty_metrics and len(self.metric_set) == 0:
+        if not raise_on_empty_metrics and len(self.metric_set) == 0 and len(self.aggregated_metric_set) == 0:
             warnings.warn(
                 "No application metrics to publish. The cold-start metric may be published if enabled. "
                 "If application metrics should never be empty, consider using 'raise_on_empty_metrics'",
@@ -195,26 +382,34 @@ class DatadogProvider(BaseProvider):
             logger.debug("Flushing existing metrics")
             metrics = self.serialize_metric_set()
             # submit through datadog extension
-            if lambda_metric and not self.flush_to_log:
+            if lambda_metric and not self.flush_to_log and self.sink is None:
                 # use lambda_metric function from datadog package, submit metrics to datadog
-                for metric_item in metrics:  # pragma: no cover
-                    lambda_metric(  # pragma: no cover
-                        metric_name=metric_item["m"],
-                        value=metric_item["v"],
-                        timestamp=metric_item["e"],
-                        tags=metric_item["t"],
-                    )
+                for metric_item in metrics:
+                    # lambda_metric accepts a single value, distribution points hold many
+                    values = metric_item["v"] if isinstance(metric_item["v"], list) else [metric_item["v"]]
+                    for value in values:
+                        lambda_metric(
+                            metric_name=metric_item["m"],
+                            value=value,
+                            timestamp=metric_item["e"],
+                            tags=metric_item["t"],
+                        )
             else:
                 # dd module not found: flush to log, this format can be recognized via datadog log forwarder
                 # https://github.com/Datadog/datadog-lambda-python/blob/main/datadog_lambda/metric.py#L77
-                for metric_item in metrics:
-                    print(json.dumps(metric_item, separators=(",", ":")))
+                lines = [json_backend.dumps(metric_item) for metric_item in metrics]
+                if self.sink is None:
+                    for line in lines:
+                        print(line)
+                else:
+                    self.sink.write(lines)
 
             self.clear_metrics()
 
     def clear_metrics(self):
         logger.debug("Clearing out existing metric set from memory")
         self.metric_set.clear()
+        self.aggregated_metric_set.clear()
 
     def add_cold_start_metric(self, context: LambdaContext) -> None:
         """Add cold start metric and function_name dimension
@@ -56,6 +56,7 @@ class DatadogMetrics:
     # e.g., m1 and m2 add metric ProductCreated, however m1 has 'version' dimension  but m2 doesn't
     # Result: ProductCreated is created twice as we now have 2 different EMF blobs
     _metrics: list = []
+    _aggregated_metrics: dict = {}
     _default_tags: dict[str, Any] = {}
 
     def __init__(
@@ -65,6 +66,7 @@ class DatadogMetrics:
         provider: DatadogProvider | None = None,
     ):
         self.metric_set = self._metrics
+        self.aggregated_metric_set = self._aggregated_metrics
         self.default_tags = self._default_tags
 
         if provider is None:
@@ -72,6 +74,7 @@ class DatadogMetrics:
                 namespace=namespace,
                 flush_to_log=flush_to_log,
                 metric_set=self.metric_set,
+                aggregated_metric_set=self.aggregated_metric_set,
             )
         else:
             self.provider = provider
@@ -85,6 +88,15 @@ class DatadogMetrics:
     ) -> None:
         self.provider.add_metric(name=name, value=value, timestamp=timestamp, **tags)
 
+    def increment(self, name: str, value: float = 1, timestamp: int | None = None, **tags: Any) -> None:
+        self.provider.increment(name=name, value=value, timestamp=timestamp, **tags)
+
+    def gauge(self, name: str, value: float, timestamp: int | None = None, **tags: Any) -> None:
+        self.provider.gauge(name=name, value=value, timestamp=timestamp, **tags)
+
+    def distribution(self, name: str, value: float, timestamp: int | None = None, **tags: Any) -> None:
+        self.provider.distribution(name=name, value=value, timestamp=timestamp, **tags)
+
     def serialize_metric_set(self, metrics: list | None = None) -> list:
         return self.provider.serialize_metric_set(metrics=metrics)
 
@@ -9,7 +9,6 @@ from typing import Any, Callable
 from aws_lambda_powertools.middleware_factory.exceptions import MiddlewareInvalidArgumentError
 from aws_lambda_powertools.shared import constants
 from aws_lambda_powertools.shared.functions import resolve_truthy_env_var_choice
-from aws_lambda_powertools.tracing import Tracer
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +129,9 @@ def lambda_handler_decorator(decorator: Callable | None = None, trace_execution:
             try:
                 middleware = functools.partial(decorator, func, event, context, **kwargs, **handler_kwargs)
                 if trace_execution:
+                    # imported here, so middlewares not tracing their execution don't load Tracer
+                    from aws_lambda_powertools.tracing import Tracer
+
                     tracer = Tracer(auto_patch=False)
                     with tracer.provider.in_subsegment(name=f"## {decorator.__qualname__}"):
                         response = middleware()
@@ -0,0 +1,186 @@
+"""Streaming decoding of CloudWatch Logs subscription data
+
+CloudWatch Logs subscription data is a gzip compressed JSON document, whose `logEvents` array holds most of its size.
+Decompressing and deserializing it at once holds the compressed payload, the decompressed bytes, their text,
+and every log event in memory at the same time.
+
+Functions here decompress data in chunks and deserialize one JSON value at a time instead,
+so log events can be handled as they are decompressed and released right after.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+import zlib
+from typing import Any, Iterable, Iterator
+
+CHUNK_SIZE = 64 * 1024
+LOG_EVENTS_KEY = "logEvents"
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_log_events(payload: bytes) -> Iterator[dict[str, Any]]:
+    """Yields log events from compressed CloudWatch Logs subscription data as they are decompressed
+
+    Parameters
+    ----------
+    payload : bytes
+        CloudWatch Logs subscription data, after base64 decoding
+
+    Raises
+    ------
+    zlib.error
+        When payload isn't valid zlib or gzip compressed data
+    json.JSONDecodeError
+        When decompressed data isn't a valid JSON object
+    """
+    for key, value in iter_object_items(iter_decompressed_text(payload), stream_key=LOG_EVENTS_KEY):
+        if key == LOG_EVENTS_KEY:
+            yield value
+
+
+def iter_decompressed_text(payload: bytes, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Yields UTF-8 text decompressed from zlib or gzip compressed payload, at most `chunk_size` bytes at a time
+
+    Raises
+    ------
+    zlib.error
+        When payload isn't valid compressed data, or it's truncated
+    """
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)  # auto-detect zlib or gzip header
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    view = memoryview(payload)
+
+    for start in range(0, len(view), chunk_size):
+        data: bytes | memoryview = view[start : start + chunk_size]
+        # bounding output size keeps highly compressed data from being decompressed at once
+        while data and not decompressor.eof:
+            yield decoder.decode(decompressor.decompress(data, chunk_size))
+            data = decompressor.unconsumed_tail
+
+        if decompressor.eof:
+            break
+
+    while not decompressor.eof:
+        chunk = decompressor.decompress(b"", chunk_size)
+        if not chunk:
+            raise zlib.error("Error -5 while decompressing data: incomplete or truncated stream")
+        yield decoder.decode(chunk)
+
+    yield decoder.decode(b"", final=True)
+
+
+def iter_object_items(chunks: Iterable[str], stream_key: str) -> Iterator[tuple[str, Any]]:
+    """Yields (key, value) for each item of a JSON object split across text chunks
+
+    Values are deserialized one at a time, except for `stream_key` array whose elements
+    are yielded one by one as (stream_key, element).
+
+    Raises
+    ------
+    json.JSONDecodeError
+        When text isn't a valid JSON object
+    """
+    reader = _JsonReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.decode_value()
+        if not isinstance(key, str):
+            raise reader.error("Expecting property name enclosed in double quotes")
+
+        reader.expect(":")
+        if key == stream_key and reader.peek() == "[":
+            yield from _iter_array_elements(reader, key)
+        else:
+            yield key, reader.decode_value()
+
+        separator = reader.next_char()
+        if separator == "}":
+            return
+        if separator != ",":
+            raise reader.error("Expecting ',' delimiter")
+
+
+def _iter_array_elements(reader: _JsonReader, key: str) -> Iterator[tuple[str, Any]]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.next_char()
+        return
+
+    while True:
+        yield key, reader.decode_value()
+
+        separator = reader.next_char()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise reader.error("Expecting ',' delimiter")
+
+
+class _JsonReader:
+    """Reads JSON tokens and values from text chunks, buffering only what the current value needs"""
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+
+    def peek(self) -> str:
+        self._skip_whitespace()
+        if self._position >= len(self._buffer):
+            raise self.error("Unexpected end of data")
+        return self._buffer[self._position]
+
+    def next_char(self) -> str:
+        char = self.peek()
+        self._position += 1
+        return char
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self._position += 1
+
+    def decode_value(self) -> Any:
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # value might be incomplete, e.g. a string cut in the middle
+                if self._fill():
+                    continue
+                raise
+
+            # a value ending with the buffer might continue in the next chunk, e.g. a number
+            if end == len(self._buffer) and self._fill():
+                continue
+
+            self._position = end
+            return value
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore[union-attr]
+            if self._position < len(self._buffer) or not self._fill():
+                return
+
+    def _fill(self) -> bool:
+        """Appends the next chunk to the buffer, dropping what was already consumed"""
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
@@ -63,6 +63,7 @@ POWERTOOLS_DEBUG_ENV: str = "POWERTOOLS_DEBUG"
 # JSON constants
 PRETTY_INDENT: int = 4
 COMPACT_INDENT: None = None
+JSON_BACKEND_ENV: str = "POWERTOOLS_JSON_BACKEND"
 
 # Idempotency constants
 IDEMPOTENCY_DISABLED_ENV: str = "POWERTOOLS_IDEMPOTENCY_DISABLED"
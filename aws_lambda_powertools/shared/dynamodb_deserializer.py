@@ -12,6 +12,9 @@ DYNAMODB_CONTEXT = Context(
     traps=[Clamped, Overflow, Inexact, Rounded, Underflow],
 )
 
+# Numbers with up to 15 significant digits round-trip through a float (IEEE 754 double precision)
+FLOAT_SIGNIFICANT_DIGITS = 15
+
 
 class TypeDeserializer:
     """
@@ -21,8 +24,32 @@ class TypeDeserializer:
 
     The only notable difference is that for Binary (`B`, `BS`) values we return Python Bytes directly,
     since we don't support Python 2.
+
+    Deserializers are looked up in a dispatch table by DynamoDB type, built once per instance.
+    Create it once and reuse it, rather than once per record.
+
+    Parameters
+    ----------
+    native_numbers: bool
+        Whether to deserialize Number (`N`, `NS`) values as `int`, or as `float` when it represents them without
+        loss of precision, falling back to `Decimal` otherwise. Defaults to `False`, always returning `Decimal`.
     """
 
+    def __init__(self, native_numbers: bool = False):
+        self.native_numbers = native_numbers
+        self._deserializers: dict[str, Callable[[Any], Any]] = {
+            "NULL": self._deserialize_null,
+            "BOOL": self._deserialize_bool,
+            "N": self._deserialize_native_n if native_numbers else self._deserialize_n,
+            "S": self._deserialize_s,
+            "B": self._deserialize_b,
+            "NS": self._deserialize_native_ns if native_numbers else self._deserialize_ns,
+            "SS": self._deserialize_ss,
+            "BS": self._deserialize_bs,
+            "L": self._deserialize_l,
+            "M": self._deserialize_m,
+        }
+
     def deserialize(self, value: dict) -> Any:
         """Deserialize DynamoDB data types into Python types.
 
@@ -58,8 +85,8 @@ class TypeDeserializer:
             Python native type converted from DynamoDB type
         """
 
-        dynamodb_type = list(value.keys())[0]
-        deserializer: Callable | None = getattr(self, f"_deserialize_{dynamodb_type}".lower(), None)
+        dynamodb_type = next(iter(value), None)
+        deserializer = self._deserializers.get(dynamodb_type)  # type: ignore[arg-type]
         if deserializer is None:
             raise TypeError(f"Dynamodb type {dynamodb_type} is not supported")
 
@@ -87,6 +114,21 @@ class TypeDeserializer:
 
         return DYNAMODB_CONTEXT.create_decimal(value)
 
+    def _deserialize_native_n(self, value: str) -> int | float | Decimal:
+        if "." not in value and "e" not in value and "E" not in value:
+            return int(value)
+
+        # a float holds any number up to 15 significant digits, within DynamoDB's range, without loss
+        # a decimal point or exponent takes a character, so short values can't have more
+        if len(value) <= FLOAT_SIGNIFICANT_DIGITS + 1:
+            return float(value)
+
+        significand = value.partition("e")[0].partition("E")[0]
+        if len(significand.lstrip("+-").replace(".", "").strip("0")) <= FLOAT_SIGNIFICANT_DIGITS:
+            return float(value)
+
+        return self._deserialize_n(value)
+
     def _deserialize_s(self, value: str) -> str:
         return value
 
@@ -96,6 +138,9 @@ class TypeDeserializer:
     def _deserialize_ns(self, value: Sequence[str]) -> set[Decimal]:
         return set(map(self._deserialize_n, value))
 
+    def _deserialize_native_ns(self, value: Sequence[str]) -> set[int | float | Decimal]:
+        return set(map(self._deserialize_native_n, value))
+
     def _deserialize_ss(self, value: Sequence[str]) -> set[str]:
         return set(map(self._deserialize_s, value))
 
@@ -103,7 +148,9 @@ class TypeDeserializer:
         return set(map(self._deserialize_b, value))
 
     def _deserialize_l(self, value: Sequence[dict]) -> Sequence[Any]:
-        return [self.deserialize(v) for v in value]
+        deserialize = self.deserialize
+        return [deserialize(v) for v in value]
 
     def _deserialize_m(self, value: dict) -> dict:
-        return {k: self.deserialize(v) for k, v in value.items()}
+        deserialize = self.deserialize
+        return {k: deserialize(v) for k, v in value.items()}
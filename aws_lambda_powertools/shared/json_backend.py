@@ -0,0 +1,322 @@
+"""JSON serialization with optional fast backends.
+
+The standard library `json` module is used by default. Set `POWERTOOLS_JSON_BACKEND` to `orjson` or `msgspec`
+to opt in to a faster backend, once installed (`pip install "aws-lambda-powertools[orjson]"`).
+
+All backends produce compact JSON (no whitespace), escape non-ASCII characters unless `ensure_ascii=False`,
+and coerce unsupported types through `default` (`shared.json_encoder.encode_default` unless given).
+When a fast backend can't serialize a value (e.g. integers larger than 64 bits, or non-ASCII characters
+that must be escaped), serialization falls back to the standard library.
+
+Fast backends differ from `json.dumps` in a few ways:
+
+* NaN and Infinity are serialized as `null` instead of the non-standard `NaN` and `Infinity`
+* msgspec always encodes datetime, UUID and Enum values natively instead of calling `default`
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import warnings
+from typing import Any, Callable
+
+from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared.json_encoder import encode_default
+from aws_lambda_powertools.warnings import PowertoolsUserWarning
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+class StdlibJsonBackend:
+    name = "json"
+
+    def dumps(
+        self,
+        obj: Any,
+        default: Callable[[Any], Any] | None = None,
+        sort_keys: bool = False,
+        indent: int | None = None,
+        ensure_ascii: bool = True,
+    ) -> str:
+        return json.dumps(
+            obj,
+            default=default or encode_default,
+            sort_keys=sort_keys,
+            indent=indent,
+            separators=(",", ":"),
+            ensure_ascii=ensure_ascii,
+        )
+
+    def dumps_bytes(
+        self,
+        obj: Any,
+        default: Callable[[Any], Any] | None = None,
+        sort_keys: bool = False,
+        indent: int | None = None,
+        ensure_ascii: bool = True,
+    ) -> bytes:
+        # lone surrogates are valid in Python str but not in UTF-8; keep them as json.dumps would
+        return StdlibJsonBackend.dumps(
+            self,
+            obj,
+            default=default,
+            sort_keys=sort_keys,
+            indent=indent,
+            ensure_ascii=ensure_ascii,
+        ).encode(errors="surrogatepass")
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        return json.loads(data)
+
+
+class OrjsonBackend(StdlibJsonBackend):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        # datetimes and dataclasses are handed to `default`, so output matches the stdlib backend
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps(
+        self,
+        obj: Any,
+        default: Callable[[Any], Any] | None = None,
+        sort_keys: bool = False,
+        indent: int | None = None,
+        ensure_ascii: bool = True,
+    ) -> str:
+        try:
+            return self._encode(
+                obj,
+                default=default,
+                sort_keys=sort_keys,
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+            ).decode()
+        except TypeError:
+            logger.debug("orjson failed to serialize object, falling back to json")
+            return super().dumps(obj, default=default, sort_keys=sort_keys, indent=indent, ensure_ascii=ensure_ascii)
+
+    def dumps_bytes(
+        self,
+        obj: Any,
+        default: Callable[[Any], Any] | None = None,
+        sort_keys: bool = False,
+        indent: int | None = None,
+        ensure_ascii: bool = True,
+    ) -> bytes:
+        try:
+            return self._encode(obj, default=default, sort_keys=sort_keys, indent=indent, ensure_ascii=ensure_ascii)
+        except TypeError:
+            logger.debug("orjson failed to serialize object, falling back to json")
+            return super().dumps_bytes(
+                obj,
+                default=default,
+                sort_keys=sort_keys,
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+            )
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, no translation needed
+        return self._orjson.loads(data)
+
+    def _encode(
+        self,
+        obj: Any,
+        default: Callable[[Any], Any] | None,
+        sort_keys: bool,
+        indent: int | None,
+        ensure_ascii: bool,
+    ) -> bytes:
+        # orjson only supports 2 spaces indentation; pretty printing isn't a hot path
+        if indent and indent != 2:
+            raise TypeError(f"orjson doesn't support indent={indent}")
+
+        options = self._options
+        if sort_keys:
+            options |= self._orjson.OPT_SORT_KEYS
+        if indent:
+            options |= self._orjson.OPT_INDENT_2
+
+        data = self._orjson.dumps(obj, default=default or encode_default, option=options)
+        # orjson can't escape non-ASCII characters
+        if ensure_ascii and not data.isascii():
+            raise TypeError("orjson doesn't support ensure_ascii")
+
+        return data
+
+
+class MsgspecBackend(StdlibJsonBackend):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encode_errors = (TypeError, ValueError, OverflowError, msgspec.EncodeError)
+
+    def dumps(
+        self,
+        obj: Any,
+        default: Callable[[Any], Any] | None = None,
+        sort_keys: bool = False,
+        indent: int | None = None,
+        ensure_ascii: bool = True,
+    ) -> str:
+        try:
+            return self._encode(
+                obj,
+                default=default,
+                sort_keys=sort_keys,
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+            ).decode()
+        except self._encode_errors:
+            logger.debug("msgspec failed to serialize object, falling back to json")
+            return super().dumps(obj, default=default, sort_keys=sort_keys, indent=indent, ensure_ascii=ensure_ascii)
+
+    def dumps_bytes(
+        self,
+        obj: Any,
+        default: Callable[[Any], Any] | None = None,
+        sort_keys: bool = False,
+        indent: int | None = None,
+        ensure_ascii: bool = True,
+    ) -> bytes:
+        try:
+            return self._encode(obj, default=default, sort_keys=sort_keys, indent=indent, ensure_ascii=ensure_ascii)
+        except self._encode_errors:
+            logger.debug("msgspec failed to serialize object, falling back to json")
+            return super().dumps_bytes(
+                obj,
+                default=default,
+                sort_keys=sort_keys,
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+            )
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        try:
+            return self._msgspec.json.decode(data)
+        except self._msgspec.DecodeError as exc:
+            # keep the same exception contract as json.loads
+            doc = data if isinstance(data, str) else bytes(data).decode(errors="replace")
+            raise json.JSONDecodeError(str(exc), doc, 0) from exc
+
+    def _encode(
+        self,
+        obj: Any,
+        default: Callable[[Any], Any] | None,
+        sort_keys: bool,
+        indent: int | None,
+        ensure_ascii: bool,
+    ) -> bytes:
+        # msgspec doesn't indent on encode; pretty printing isn't a hot path
+        if indent:
+            raise TypeError("msgspec doesn't support indent")
+
+        data = self._msgspec.json.encode(
+            obj,
+            enc_hook=default or encode_default,
+            order="sorted" if sort_keys else None,
+        )
+        # msgspec can't escape non-ASCII characters
+        if ensure_ascii and not data.isascii():
+            raise TypeError("msgspec doesn't support ensure_ascii")
+
+        return data
+
+
+_BACKENDS: dict[str, type[StdlibJsonBackend]] = {
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+    "json": StdlibJsonBackend,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_json_backend(name: str | None = None) -> StdlibJsonBackend:
+    """Return a JSON backend by name, or the one set in `POWERTOOLS_JSON_BACKEND` env var.
+
+    The standard library backend is returned when no backend is set, or when the backend isn't installed.
+    An unknown backend in `POWERTOOLS_JSON_BACKEND` emits a warning and uses the standard library backend,
+    so a typo doesn't break serialization.
+
+    Parameters
+    ----------
+    name : str, optional
+        One of "orjson", "msgspec" or "json". By default, it uses `POWERTOOLS_JSON_BACKEND` env var.
+
+    Raises
+    ------
+    ValueError
+        When an unknown backend name is given
+    """
+    if name and name.lower() not in _BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}'. Valid options are: {', '.join(JSON_BACKENDS)}")
+
+    choice = (name or os.getenv(constants.JSON_BACKEND_ENV) or "json").lower()
+    if choice not in _BACKENDS:
+        warnings.warn(
+            message=f"Unknown JSON backend '{choice}' in {constants.JSON_BACKEND_ENV}. "
+            f"Valid options are: {', '.join(JSON_BACKENDS)}. Using the standard library json module instead.",
+            category=PowertoolsUserWarning,
+            stacklevel=2,
+        )
+        return StdlibJsonBackend()
+
+    try:
+        backend = _BACKENDS[choice]()
+    except ImportError:
+        logger.debug(f"JSON backend '{choice}' is not installed, using the standard library json module")
+        return StdlibJsonBackend()
+
+    logger.debug(f"Using '{backend.name}' JSON backend")
+    return backend
+
+
+def dumps(
+    obj: Any,
+    default: Callable[[Any], Any] | None = None,
+    sort_keys: bool = False,
+    indent: int | None = None,
+    ensure_ascii: bool = True,
+) -> str:
+    """Serialize `obj` to a compact JSON `str` using the active JSON backend"""
+    return get_json_backend().dumps(obj, default=default, sort_keys=sort_keys, indent=indent, ensure_ascii=ensure_ascii)
+
+
+def dumps_bytes(
+    obj: Any,
+    default: Callable[[Any], Any] | None = None,
+    sort_keys: bool = False,
+    indent: int | None = None,
+    ensure_ascii: bool = True,
+) -> bytes:
+    """Serialize `obj` to compact UTF-8 encoded JSON `bytes` using the active JSON backend"""
+    return get_json_backend().dumps_bytes(
+        obj,
+        default=default,
+        sort_keys=sort_keys,
+        indent=indent,
+        ensure_ascii=ensure_ascii,
+    )
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """Deserialize a JSON document using the active JSON backend.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        When `data` is not a valid JSON document
+    """
+    return get_json_backend().loads(data)
@@ -1,24 +1,42 @@
+import datetime
 import decimal
 import json
 import math
+from typing import Any
 
 from aws_lambda_powertools.shared.functions import dataclass_to_dict, is_dataclass, is_pydantic, pydantic_to_dict
 
 
-class Encoder(json.JSONEncoder):
-    """Custom JSON encoder to allow for serialization of Decimals, Pydantic and Dataclasses.
+def encode_default(obj: Any) -> Any:
+    """Coerce Decimals, datetimes, Pydantic models and dataclasses into JSON serializable values.
 
-    It's similar to the serializer used by Lambda internally.
+    Shared by `Encoder` and `shared.json_backend` so every JSON backend serializes these types alike.
+
+    Raises
+    ------
+    TypeError
+        When `obj` is not one of the supported types
     """
+    if isinstance(obj, decimal.Decimal):
+        return math.nan if obj.is_nan() else str(obj)
 
-    def default(self, obj):
-        if isinstance(obj, decimal.Decimal):
-            return math.nan if obj.is_nan() else str(obj)
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+
+    if is_pydantic(obj):
+        return pydantic_to_dict(obj)
+
+    if is_dataclass(obj):
+        return dataclass_to_dict(obj)
 
-        if is_pydantic(obj):
-            return pydantic_to_dict(obj)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
 
-        if is_dataclass(obj):
-            return dataclass_to_dict(obj)
 
-        return super().default(obj)
+class Encoder(json.JSONEncoder):
+    """Custom JSON encoder to allow for serialization of Decimals, datetimes, Pydantic and Dataclasses.
+
+    It's similar to the serializer used by Lambda internally.
+    """
+
+    def default(self, obj):
+        return encode_default(obj)
@@ -0,0 +1,180 @@
+"""Kinesis Producer Library (KPL) aggregated records decoding
+
+KPL aggregated records pack many user records into a single Kinesis record as:
+4 bytes magic number, a protobuf encoded `AggregatedRecord` message, and the MD5 digest of that message.
+
+Decoding slices the given buffer with memoryview, so user records' data is never copied.
+
+Reference: https://github.com/awslabs/amazon-kinesis-producer/blob/master/aggregation-format.md
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+KPL_MAGIC = b"\xf3\x89\x9a\xc2"
+DIGEST_SIZE = 16
+
+# protobuf wire types
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+_FIXED32 = 5
+
+# AggregatedRecord fields
+_PARTITION_KEY_TABLE = 1
+_EXPLICIT_HASH_KEY_TABLE = 2
+_RECORDS = 3
+
+# Record fields
+_PARTITION_KEY_INDEX = 1
+_EXPLICIT_HASH_KEY_INDEX = 2
+_DATA = 3
+
+
+class UserRecord(NamedTuple):
+    """User record found within a KPL aggregated record
+
+    `data` is a view over the aggregated record data; use `bytes(data)` to keep a copy beyond its lifetime.
+    """
+
+    partition_key: str
+    explicit_hash_key: str | None
+    sub_sequence_number: int
+    data: memoryview
+
+
+def is_aggregated(data: bytes | memoryview) -> bool:
+    """Whether data starts with the KPL magic number and is large enough to hold an aggregated record"""
+    return len(data) > len(KPL_MAGIC) + DIGEST_SIZE and data[: len(KPL_MAGIC)] == KPL_MAGIC
+
+
+def deaggregate(data: bytes | memoryview) -> list[UserRecord] | None:
+    """Decodes user records from KPL aggregated record data
+
+    Parameters
+    ----------
+    data : bytes | memoryview
+        Kinesis record data, after base64 decoding
+
+    Returns
+    -------
+    list[UserRecord] | None
+        User records in the order they were aggregated, or None when data isn't a KPL aggregated record,
+        i.e. it has no magic number or its MD5 digest doesn't match, as the Kinesis Client Library does.
+
+    Raises
+    ------
+    ValueError
+        When the aggregated record message is malformed
+    """
+    if not is_aggregated(data):
+        return None
+
+    view = memoryview(data)
+    message = view[len(KPL_MAGIC) : -DIGEST_SIZE]
+    if hashlib.md5(message).digest() != view[-DIGEST_SIZE:]:  # noqa: S324 # checksum only, as defined by KPL
+        logger.debug("KPL aggregated record digest mismatch, handling it as a regular record")
+        return None
+
+    try:
+        return _decode_aggregated_record(message)
+    except IndexError as exc:
+        raise ValueError("Malformed KPL aggregated record: message is truncated") from exc
+
+
+def _decode_aggregated_record(message: memoryview) -> list[UserRecord]:
+    partition_keys: list[str] = []
+    explicit_hash_keys: list[str] = []
+    records: list[memoryview] = []
+
+    # Tables usually come first, but protobuf doesn't guarantee field order
+    for field_number, value in _iter_fields(message):
+        if field_number == _PARTITION_KEY_TABLE:
+            partition_keys.append(str(value, "utf-8"))
+        elif field_number == _EXPLICIT_HASH_KEY_TABLE:
+            explicit_hash_keys.append(str(value, "utf-8"))
+        elif field_number == _RECORDS:
+            records.append(value)
+
+    user_records = []
+    for sub_sequence_number, record in enumerate(records):
+        partition_key_index: int | None = None
+        explicit_hash_key_index: int | None = None
+        record_data: memoryview | None = None
+        for field_number, value in _iter_fields(record):
+            if field_number == _PARTITION_KEY_INDEX:
+                partition_key_index = value
+            elif field_number == _EXPLICIT_HASH_KEY_INDEX:
+                explicit_hash_key_index = value
+            elif field_number == _DATA:
+                record_data = value
+
+        if partition_key_index is None or record_data is None:
+            raise ValueError(f"Malformed KPL aggregated record: user record {sub_sequence_number} is incomplete")
+
+        try:
+            user_records.append(
+                UserRecord(
+                    partition_key=partition_keys[partition_key_index],
+                    explicit_hash_key=(
+                        explicit_hash_keys[explicit_hash_key_index] if explicit_hash_key_index is not None else None
+                    ),
+                    sub_sequence_number=sub_sequence_number,
+                    data=record_data,
+                ),
+            )
+        except IndexError as exc:
+            raise ValueError(
+                f"Malformed KPL aggregated record: user record {sub_sequence_number} key index is out of range",
+            ) from exc
+
+    return user_records
+
+
+def _iter_fields(message: memoryview):
+    """Yields (field number, value) for each protobuf field; length delimited values are memoryview slices"""
+    position = 0
+    end = len(message)
+    while position < end:
+        key, position = _read_varint(message, position)
+        field_number, wire_type = key >> 3, key & 0x07
+
+        value: int | memoryview
+        if wire_type == _VARINT:
+            value, position = _read_varint(message, position)
+        elif wire_type == _LENGTH_DELIMITED:
+            length, position = _read_varint(message, position)
+            if position + length > end:
+                raise IndexError("length delimited field exceeds message")
+            value = message[position : position + length]
+            position += length
+        elif wire_type == _FIXED64:
+            position += 8
+            continue
+        elif wire_type == _FIXED32:
+            position += 4
+            continue
+        else:
+            raise ValueError(f"Malformed KPL aggregated record: unsupported protobuf wire type {wire_type}")
+
+        yield field_number, value
+
+
+def _read_varint(message: memoryview, position: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = message[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Malformed KPL aggregated record: varint is too long")
@@ -13,10 +13,13 @@
 # limitations under the License.
 # ==============================================================================
 
-"""A LazyLoader class."""
+"""A LazyLoader class, and lazy exports for packages."""
+
+from __future__ import annotations
 
 import importlib
 import types
+from typing import Any, Callable
 
 
 class LazyLoader(types.ModuleType):
@@ -53,3 +56,50 @@ class LazyLoader(types.ModuleType):
     def __dir__(self):
         module = self._load()
         return dir(module)
+
+
+def lazy_exports(
+    module_globals: dict[str, Any],
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create a package `__getattr__` and `__dir__` importing each exported name from its module on first access.
+
+    Like `LazyLoader` does for modules, this avoids importing every module a package exports when it's imported.
+
+    Names must not clash with a submodule of the package: importing the submodule sets it as a package attribute,
+    shadowing the lazy export. Import those eagerly instead.
+
+    Parameters
+    ----------
+    module_globals: dict[str, Any]
+        Package `globals()`, where imported names are cached so later lookups don't call `__getattr__`
+    exports: dict[str, str]
+        Module to import each exported name from, absolute or relative to the package, e.g. `{"Logger": ".logging"}`
+
+    Example
+    -------
+    **Lazily export Logger from a package `__init__.py`**
+
+        >>> from typing import TYPE_CHECKING
+        >>>
+        >>> if TYPE_CHECKING:
+        >>>     from .logging import Logger
+        >>>
+        >>> __getattr__, __dir__ = lazy_exports(globals(), {"Logger": ".logging"})
+    """
+    package = module_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*module_globals, *exports})
+
+    return __getattr__, __dir__
@@ -147,3 +147,11 @@ class BaseProvider(abc.ABC):
     @abc.abstractmethod
     def patch_all(self) -> None:
         """Instrument all supported libraries"""
+
+    def is_sampled(self) -> bool:
+        """Whether the current trace is sampled.
+
+        Tracer skips subsegments for decorated methods when it isn't. Override it when
+        the provider knows its sampling decision, by default every trace is considered sampled.
+        """
+        return True
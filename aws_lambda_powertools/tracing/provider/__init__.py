@@ -0,0 +1 @@
+"""Tracing providers other than the default AWS X-Ray SDK"""
@@ -0,0 +1,8 @@
+from aws_lambda_powertools.tracing.provider.opentelemetry.exporters import FileSpanExporter
+from aws_lambda_powertools.tracing.provider.opentelemetry.provider import OpenTelemetryProvider, OpenTelemetrySpan
+
+__all__ = [
+    "FileSpanExporter",
+    "OpenTelemetryProvider",
+    "OpenTelemetrySpan",
+]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Sequence
+
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import ReadableSpan
+
+
+class FileSpanExporter(SpanExporter):
+    """Exports spans to a file as JSON lines, one span per line, e.g. to inspect traces locally
+
+    Parameters
+    ----------
+    path : str | Path
+        File to append spans to, created when the first span is exported
+
+    Example
+    -------
+    **Export spans to a local file**
+
+        >>> from aws_lambda_powertools import Tracer
+        >>> from aws_lambda_powertools.tracing.provider.opentelemetry import FileSpanExporter, OpenTelemetryProvider
+        >>>
+        >>> provider = OpenTelemetryProvider(service="payment", exporter=FileSpanExporter("spans.jsonl"))
+        >>> tracer = Tracer(provider=provider, disabled=False)
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file: IO[str] | None = None
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        lines = "".join(f"{span.to_json(indent=None)}\n" for span in spans)
+
+        with self._lock:
+            if self._file is None:
+                self._file = self.path.open("a", encoding="utf-8")
+
+            self._file.write(lines)
+            self._file.flush()
+
+        return SpanExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import contextlib
+import importlib
+import logging
+import os
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Sequence
+
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.trace import Status, StatusCode
+
+from aws_lambda_powertools.shared import constants, json_backend
+from aws_lambda_powertools.shared.functions import resolve_env_var_choice
+from aws_lambda_powertools.shared.version import VERSION
+from aws_lambda_powertools.tracing.base import BaseProvider, BaseSegment
+
+if TYPE_CHECKING:
+    import numbers
+    import traceback
+
+    from opentelemetry.sdk.trace.export import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+# Instrumentors used by `patch`, provided by opentelemetry-instrumentation-* packages
+INSTRUMENTORS: dict[str, tuple[str, str]] = {
+    "aiohttp": ("opentelemetry.instrumentation.aiohttp_client", "AioHttpClientInstrumentor"),
+    "boto3": ("opentelemetry.instrumentation.botocore", "BotocoreInstrumentor"),
+    "botocore": ("opentelemetry.instrumentation.botocore", "BotocoreInstrumentor"),
+    "httpx": ("opentelemetry.instrumentation.httpx", "HTTPXClientInstrumentor"),
+    "psycopg2": ("opentelemetry.instrumentation.psycopg2", "Psycopg2Instrumentor"),
+    "pymysql": ("opentelemetry.instrumentation.pymysql", "PyMySQLInstrumentor"),
+    "requests": ("opentelemetry.instrumentation.requests", "RequestsInstrumentor"),
+    "sqlite3": ("opentelemetry.instrumentation.sqlite3", "SQLite3Instrumentor"),
+    "urllib3": ("opentelemetry.instrumentation.urllib3", "URLLib3Instrumentor"),
+}
+
+
+class OpenTelemetrySpan(BaseSegment):
+    """Wraps an OpenTelemetry span as a Tracer segment
+
+    Annotations are added as span attributes, and metadata as span attributes
+    named `<namespace>.<key>` with their value serialized to JSON.
+    """
+
+    def __init__(self, span: trace.Span):
+        self.span = span
+
+    def close(self, end_time: int | None = None):
+        self.span.end(end_time=int(end_time * 1e9) if end_time is not None else None)
+
+    def add_subsegment(self, subsegment: Any):
+        """OpenTelemetry spans are linked to their parent when started, there's nothing to add"""
+
+    def remove_subsegment(self, subsegment: Any):
+        """OpenTelemetry spans are linked to their parent when started, there's nothing to remove"""
+
+    def put_annotation(self, key: str, value: str | numbers.Number | bool) -> None:
+        self.span.set_attribute(key, _to_attribute_value(value))
+
+    def put_metadata(self, key: str, value: Any, namespace: str = "default") -> None:
+        self.span.set_attribute(f"{namespace}.{key}", json_backend.dumps(value, default=str))
+
+    def add_exception(self, exception: BaseException, stack: list[traceback.StackSummary], remote: bool = False):
+        self.span.record_exception(exception)
+        self.span.set_status(Status(StatusCode.ERROR, description=str(exception)))
+
+
+class OpenTelemetryProvider(BaseProvider):
+    """Tracing provider creating OpenTelemetry spans, without the X-Ray daemon
+
+    Spans are exported in batches from a background thread by a `BatchSpanProcessor`,
+    keeping export off the hot path. Pending spans are flushed when the outermost span ends,
+    e.g. the one created by `Tracer.capture_lambda_handler`, so no span is lost when
+    Lambda freezes the execution environment.
+
+    Environment variables
+    ---------------------
+    POWERTOOLS_SERVICE_NAME : str
+        service name
+
+    Parameters
+    ----------
+    service : str, optional
+        Service name, used as the `service.name` resource attribute when creating the tracer provider
+    exporter : SpanExporter, optional
+        Exporter to send spans to in batches, e.g. `InMemorySpanExporter` or `FileSpanExporter` for local testing.
+        By default, spans are sent to the global tracer provider set by OpenTelemetry SDK or distributions.
+    tracer_provider : TracerProvider, optional
+        Tracer provider to create spans with, by default one is created when an exporter is given
+
+    Example
+    -------
+    **Use OpenTelemetry with Tracer**
+
+        >>> from aws_lambda_powertools import Tracer
+        >>> from aws_lambda_powertools.tracing.provider.opentelemetry import OpenTelemetryProvider
+        >>> from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        >>>
+        >>> exporter = InMemorySpanExporter()
+        >>> tracer = Tracer(provider=OpenTelemetryProvider(service="payment", exporter=exporter))
+        >>>
+        >>> @tracer.capture_lambda_handler
+        >>> def handler(event, context):
+        >>>     ...
+    """
+
+    def __init__(
+        self,
+        service: str | None = None,
+        exporter: SpanExporter | None = None,
+        tracer_provider: trace.TracerProvider | None = None,
+    ):
+        if tracer_provider is None and exporter is not None:
+            service_name = resolve_env_var_choice(choice=service, env=os.getenv(constants.SERVICE_NAME_ENV))
+            tracer_provider = TracerProvider(
+                resource=Resource.create({"service.name": service_name or "service_undefined"}),
+            )
+
+        self.tracer_provider = tracer_provider or trace.get_tracer_provider()
+        if exporter is not None:
+            self.tracer_provider.add_span_processor(BatchSpanProcessor(exporter))  # type: ignore[attr-defined]
+
+        self.tracer: trace.Tracer = self.tracer_provider.get_tracer("aws_lambda_powertools", VERSION)
+        self.disabled = False
+        self._instrumented: set[str] = set()
+
+    def disable(self) -> None:
+        """Stop creating and exporting spans, e.g. when Tracer is disabled or running outside Lambda"""
+        self.tracer = trace.NoOpTracer()
+        self.disabled = True
+
+    @contextlib.contextmanager
+    def in_subsegment(self, name=None, **kwargs) -> Generator[BaseSegment, None, None]:
+        is_root = not self.disabled and not trace.get_current_span().get_span_context().is_valid
+        try:
+            with self.tracer.start_as_current_span(name=name, **kwargs) as span:
+                yield OpenTelemetrySpan(span)
+        finally:
+            if is_root:
+                self.force_flush()
+
+    # BaseProvider annotates it as a sync context manager, but Tracer uses it with `async with` like X-Ray SDK
+    @contextlib.asynccontextmanager
+    async def in_subsegment_async(  # type: ignore[override]
+        self,
+        name=None,
+        **kwargs,
+    ) -> AsyncGenerator[BaseSegment, None]:
+        with self.in_subsegment(name=name, **kwargs) as subsegment:
+            yield subsegment
+
+    def put_annotation(self, key: str, value: str | numbers.Number | bool) -> None:
+        OpenTelemetrySpan(trace.get_current_span()).put_annotation(key=key, value=value)
+
+    def put_metadata(self, key: str, value: Any, namespace: str = "default") -> None:
+        OpenTelemetrySpan(trace.get_current_span()).put_metadata(key=key, value=value, namespace=namespace)
+
+    def patch(self, modules: Sequence[str]) -> None:
+        """Instrument modules with their OpenTelemetry instrumentation package
+
+        Raises
+        ------
+        ValueError
+            When a module has no known OpenTelemetry instrumentation
+        ImportError
+            When the instrumentation package for a module isn't installed
+        """
+        unsupported = set(modules) - set(INSTRUMENTORS)
+        if unsupported:
+            raise ValueError(
+                f"Modules {sorted(unsupported)} are not supported for patching. "
+                f"Supported modules are: {', '.join(INSTRUMENTORS)}",
+            )
+
+        for module in modules:
+            self._instrument(module)
+
+    def patch_all(self) -> None:
+        """Instrument all modules whose OpenTelemetry instrumentation package is installed"""
+        for module in INSTRUMENTORS:
+            try:
+                self._instrument(module)
+            except ImportError:
+                logger.debug("OpenTelemetry instrumentation for '%s' is not installed, skipping", module)
+
+    def is_sampled(self) -> bool:
+        span_context = trace.get_current_span().get_span_context()
+        # without a current span, the sampler decides when the span is started
+        return span_context.trace_flags.sampled if span_context.is_valid else True
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Export all pending spans, blocking until done or timed out"""
+        force_flush = getattr(self.tracer_provider, "force_flush", None)
+        return force_flush(timeout_millis) if force_flush is not None else True
+
+    def _instrument(self, module: str) -> None:
+        instrumentor_module, instrumentor_name = INSTRUMENTORS[module]
+        if instrumentor_module in self._instrumented:
+            return
+
+        try:
+            instrumentor = getattr(importlib.import_module(instrumentor_module), instrumentor_name)
+        except ImportError as exc:
+            package = instrumentor_module.replace(".", "-").replace("_", "-")
+            raise ImportError(f"Install '{package}' to patch '{module}' with OpenTelemetry") from exc
+
+        logger.debug("Instrumenting '%s' with %s", module, instrumentor_name)
+        instrumentor().instrument(tracer_provider=self.tracer_provider)
+        self._instrumented.add(instrumentor_module)
+
+
+def _to_attribute_value(value: Any) -> str | bool | int | float:
+    # span attributes only support primitive types, e.g. Decimal annotations are sent as strings
+    return value if isinstance(value, (str, bool, int, float)) else str(value)
@@ -6,9 +6,12 @@ import functools
 import inspect
 import logging
 import os
+import random
+import time
+import traceback
 from typing import TYPE_CHECKING, Any, Callable, Sequence, TypeVar, cast, overload
 
-from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared import constants, json_backend
 from aws_lambda_powertools.shared.functions import (
     resolve_env_var_choice,
     resolve_truthy_env_var_choice,
@@ -16,11 +19,13 @@ from aws_lambda_powertools.shared.functions import (
 )
 from aws_lambda_powertools.shared.lazy_import import LazyLoader
 from aws_lambda_powertools.shared.types import AnyCallableT
+from aws_lambda_powertools.tracing.base import BaseSegment
 
 if TYPE_CHECKING:
     import numbers
+    from types import TracebackType
 
-    from aws_lambda_powertools.tracing.base import BaseProvider, BaseSegment
+    from aws_lambda_powertools.tracing.base import BaseProvider
 
 is_cold_start = True
 logger = logging.getLogger(__name__)
@@ -68,6 +73,9 @@ class Tracer:
         Tuple of modules supported by tracing provider to patch, by default all modules are patched
     provider: BaseProvider
         Tracing provider, by default it is aws_xray_sdk.core.xray_recorder
+    max_metadata_size: int | None
+        Maximum size in bytes of metadata values once serialized to JSON, e.g. method responses.
+        Larger values are truncated, by default metadata isn't truncated
 
     Returns
     -------
@@ -152,6 +160,7 @@ class Tracer:
         "auto_patch": True,
         "patch_modules": None,
         "provider": None,
+        "max_metadata_size": None,
     }
     _config = copy.copy(_default_config)
 
@@ -162,6 +171,7 @@ class Tracer:
         auto_patch: bool | None = None,
         patch_modules: Sequence[str] | None = None,
         provider: BaseProvider | None = None,
+        max_metadata_size: int | None = None,
     ):
         self.__build_config(
             service=service,
@@ -169,14 +179,16 @@ class Tracer:
             auto_patch=auto_patch,
             patch_modules=patch_modules,
             provider=provider,
+            max_metadata_size=max_metadata_size,
         )
         self.provider: BaseProvider = self._config["provider"]
         self.disabled = self._config["disabled"]
         self.service = self._config["service"]
         self.auto_patch = self._config["auto_patch"]
+        self.max_metadata_size: int | None = self._config["max_metadata_size"]
 
         if self.disabled:
-            self._disable_tracer_provider()
+            self._disable_provider()
 
         if self.auto_patch:
             self.patch(modules=patch_modules)
@@ -234,7 +246,7 @@ class Tracer:
 
         namespace = namespace or self.service
         logger.debug(f"Adding metadata on key '{key}' with '{value}' at namespace '{namespace}'")
-        self.provider.put_metadata(key=key, value=value, namespace=namespace)
+        self.provider.put_metadata(key=key, value=self._truncate_metadata(value), namespace=namespace)
 
     def patch(self, modules: Sequence[str] | None = None):
         """Patch modules for instrumentation.
@@ -364,6 +376,8 @@ class Tracer:
         method: None = None,
         capture_response: bool | None = None,
         capture_error: bool | None = None,
+        sampling_rate: float | None = None,
+        min_duration_ms: float | None = None,
     ) -> Callable[[AnyCallableT], AnyCallableT]: ...  # pragma: no cover
 
     def capture_method(
@@ -371,6 +385,8 @@ class Tracer:
         method: AnyCallableT | None = None,
         capture_response: bool | None = None,
         capture_error: bool | None = None,
+        sampling_rate: float | None = None,
+        min_duration_ms: float | None = None,
     ) -> AnyCallableT:
         """Decorator to create subsegment for arbitrary functions
 
@@ -386,6 +402,9 @@ class Tracer:
         `async.gather` is called, or use `in_subsegment_async`
         context manager via our escape hatch mechanism - See examples.
 
+        No subsegment is created when the current trace isn't sampled, so decorated methods
+        called in tight loops only add the overhead of a function call in unsampled invocations.
+
         Parameters
         ----------
         method : Callable
@@ -394,6 +413,12 @@ class Tracer:
             Instructs tracer to not include method's response as metadata
         capture_error : bool, optional
             Instructs tracer to not include handler's error as metadata, by default True
+        sampling_rate : float, optional
+            Fraction of calls to trace within sampled traces, between 0 and 1, by default 1
+        min_duration_ms : float, optional
+            Only record a subsegment when the method takes at least this long, or raises an exception.
+            The subsegment is created once the method completes, so subsegments created
+            within the method are attached to the parent subsegment instead.
 
         Example
         -------
@@ -403,6 +428,12 @@ class Tracer:
             @tracer.capture_method
             def some_function()
 
+        **Trace 10% of calls to a hot method, and only when slower than 50ms**
+
+            tracer = Tracer(service="payment")
+            @tracer.capture_method(sampling_rate=0.1, min_duration_ms=50)
+            def some_function()
+
         **Custom async method using capture_method decorator**
 
             from aws_lambda_powertools import Tracer
@@ -527,9 +558,20 @@ class Tracer:
             logger.debug("Decorator called with parameters")
             return cast(
                 AnyCallableT,
-                functools.partial(self.capture_method, capture_response=capture_response, capture_error=capture_error),
+                functools.partial(
+                    self.capture_method,
+                    capture_response=capture_response,
+                    capture_error=capture_error,
+                    sampling_rate=sampling_rate,
+                    min_duration_ms=min_duration_ms,
+                ),
             )
 
+        if sampling_rate is None:
+            sampling_rate = 1
+        elif not 0 <= sampling_rate <= 1:
+            raise ValueError(f"sampling_rate must be between 0 and 1, got {sampling_rate}")
+
         # Example: app.ClassA.get_all  # noqa ERA001
         # Valid characters can be found at http://docs.aws.amazon.com/xray/latest/devguide/xray-api-segmentdocuments.html
         method_name = sanitize_xray_segment_name(f"{method.__module__}.{method.__qualname__}")
@@ -550,6 +592,8 @@ class Tracer:
                 capture_response=capture_response,
                 capture_error=capture_error,
                 method_name=method_name,
+                sampling_rate=sampling_rate,
+                min_duration_ms=min_duration_ms,
             )
         elif inspect.isgeneratorfunction(method):
             return self._decorate_generator_function(
@@ -557,6 +601,8 @@ class Tracer:
                 capture_response=capture_response,
                 capture_error=capture_error,
                 method_name=method_name,
+                sampling_rate=sampling_rate,
+                min_duration_ms=min_duration_ms,
             )
         elif hasattr(method, "__wrapped__") and inspect.isgeneratorfunction(method.__wrapped__):
             return self._decorate_generator_function_with_context_manager(
@@ -564,6 +610,8 @@ class Tracer:
                 capture_response=capture_response,
                 capture_error=capture_error,
                 method_name=method_name,
+                sampling_rate=sampling_rate,
+                min_duration_ms=min_duration_ms,
             )
         else:
             return self._decorate_sync_function(
@@ -571,6 +619,8 @@ class Tracer:
                 capture_response=capture_response,
                 capture_error=capture_error,
                 method_name=method_name,
+                sampling_rate=sampling_rate,
+                min_duration_ms=min_duration_ms,
             )
 
     def _decorate_async_function(
@@ -579,12 +629,22 @@ class Tracer:
         capture_response: bool | str | None = None,
         capture_error: bool | str | None = None,
         method_name: str | None = None,
+        sampling_rate: float = 1,
+        min_duration_ms: float | None = None,
     ):
+        subsegment_name = f"## {method_name}"
+
         @functools.wraps(method)
         async def decorate(*args, **kwargs):
-            async with self.provider.in_subsegment_async(name=f"## {method_name}") as subsegment:
+            if not self._should_capture(sampling_rate=sampling_rate):
+                return await method(*args, **kwargs)
+
+            async with self._in_method_subsegment_async(
+                name=subsegment_name,
+                min_duration_ms=min_duration_ms,
+            ) as subsegment:
                 try:
-                    logger.debug(f"Calling method: {method_name}")
+                    logger.debug("Calling method: %s", method_name)
                     response = await method(*args, **kwargs)
                     self._add_response_as_metadata(
                         method_name=method_name,
@@ -612,12 +672,19 @@ class Tracer:
         capture_response: bool | str | None = None,
         capture_error: bool | str | None = None,
         method_name: str | None = None,
+        sampling_rate: float = 1,
+        min_duration_ms: float | None = None,
     ):
+        subsegment_name = f"## {method_name}"
+
         @functools.wraps(method)
         def decorate(*args, **kwargs):
-            with self.provider.in_subsegment(name=f"## {method_name}") as subsegment:
+            if not self._should_capture(sampling_rate=sampling_rate):
+                return (yield from method(*args, **kwargs))
+
+            with self._in_method_subsegment(name=subsegment_name, min_duration_ms=min_duration_ms) as subsegment:
                 try:
-                    logger.debug(f"Calling method: {method_name}")
+                    logger.debug("Calling method: %s", method_name)
                     result = yield from method(*args, **kwargs)
                     self._add_response_as_metadata(
                         method_name=method_name,
@@ -645,13 +712,22 @@ class Tracer:
         capture_response: bool | str | None = None,
         capture_error: bool | str | None = None,
         method_name: str | None = None,
+        sampling_rate: float = 1,
+        min_duration_ms: float | None = None,
     ):
+        subsegment_name = f"## {method_name}"
+
         @functools.wraps(method)
         @contextlib.contextmanager
         def decorate(*args, **kwargs):
-            with self.provider.in_subsegment(name=f"## {method_name}") as subsegment:
+            if not self._should_capture(sampling_rate=sampling_rate):
+                with method(*args, **kwargs) as return_val:
+                    yield return_val
+                return
+
+            with self._in_method_subsegment(name=subsegment_name, min_duration_ms=min_duration_ms) as subsegment:
                 try:
-                    logger.debug(f"Calling method: {method_name}")
+                    logger.debug("Calling method: %s", method_name)
                     with method(*args, **kwargs) as return_val:
                         result = return_val
                         yield result
@@ -679,12 +755,19 @@ class Tracer:
         capture_response: bool | str | None = None,
         capture_error: bool | str | None = None,
         method_name: str | None = None,
+        sampling_rate: float = 1,
+        min_duration_ms: float | None = None,
     ) -> AnyCallableT:
+        subsegment_name = f"## {method_name}"
+
         @functools.wraps(method)
         def decorate(*args, **kwargs):
-            with self.provider.in_subsegment(name=f"## {method_name}") as subsegment:
+            if not self._should_capture(sampling_rate=sampling_rate):
+                return method(*args, **kwargs)
+
+            with self._in_method_subsegment(name=subsegment_name, min_duration_ms=min_duration_ms) as subsegment:
                 try:
-                    logger.debug(f"Calling method: {method_name}")
+                    logger.debug("Calling method: %s", method_name)
                     response = method(*args, **kwargs)
                     self._add_response_as_metadata(
                         method_name=method_name,
@@ -729,7 +812,44 @@ class Tracer:
         if data is None or not capture_response or subsegment is None:
             return
 
-        subsegment.put_metadata(key=f"{method_name} response", value=data, namespace=self.service)
+        subsegment.put_metadata(
+            key=f"{method_name} response",
+            value=self._truncate_metadata(data),
+            namespace=self.service,
+        )
+
+    def _truncate_metadata(self, value: Any) -> Any:
+        """Truncate metadata value to its first `max_metadata_size` bytes once serialized to JSON, when larger"""
+        if not self.max_metadata_size:
+            return value
+
+        serialized = json_backend.dumps_bytes(value, default=str)
+        if len(serialized) <= self.max_metadata_size:
+            return value
+
+        logger.debug("Truncating metadata of %d bytes to %d bytes", len(serialized), self.max_metadata_size)
+        return serialized[: self.max_metadata_size].decode(errors="ignore")
+
+    def _should_capture(self, sampling_rate: float) -> bool:
+        """Whether to create a subsegment for this method call, checked before any subsegment work"""
+        if sampling_rate < 1 and random.random() >= sampling_rate:  # noqa: S311 # not used for security
+            return False
+
+        # X-Ray recorder and providers based on BaseProvider know whether the current trace is sampled
+        is_sampled = getattr(self.provider, "is_sampled", None)
+        return is_sampled() if is_sampled is not None else True
+
+    def _in_method_subsegment(self, name: str, min_duration_ms: float | None):
+        if min_duration_ms:
+            return _DeferredSubsegment(provider=self.provider, name=name, min_duration_ms=min_duration_ms)
+
+        return self.provider.in_subsegment(name=name)
+
+    def _in_method_subsegment_async(self, name: str, min_duration_ms: float | None):
+        if min_duration_ms:
+            return _DeferredSubsegment(provider=self.provider, name=name, min_duration_ms=min_duration_ms)
+
+        return self.provider.in_subsegment_async(name=name)
 
     def _add_full_exception_as_metadata(
         self,
@@ -756,6 +876,18 @@ class Tracer:
 
         subsegment.put_metadata(key=f"{method_name} error", value=error, namespace=self.service)
 
+    def _disable_provider(self):
+        """Disables tracing for the current provider, without disabling X-Ray SDK when it isn't used"""
+        if self._is_xray_provider():
+            self._disable_tracer_provider()
+            return
+
+        # e.g. OpenTelemetryProvider stops creating spans
+        disable = getattr(self.provider, "disable", None)
+        if callable(disable):
+            logger.debug("Disabling tracer provider...")
+            disable()
+
     @staticmethod
     def _disable_tracer_provider():
         """Forcefully disables tracing"""
@@ -799,6 +931,7 @@ class Tracer:
         auto_patch: bool | None = None,
         patch_modules: Sequence[str] | None = None,
         provider: BaseProvider | None = None,
+        max_metadata_size: int | None = None,
     ):
         """Populates Tracer config for new and existing initializations"""
         is_disabled = disabled if disabled is not None else self._is_tracer_disabled()
@@ -810,6 +943,7 @@ class Tracer:
         self._config["service"] = is_service or self._config["service"]
         self._config["disabled"] = is_disabled or self._config["disabled"]
         self._config["patch_modules"] = patch_modules or self._config["patch_modules"]
+        self._config["max_metadata_size"] = max_metadata_size or self._config["max_metadata_size"]
 
     @classmethod
     def _reset_config(cls):
@@ -863,3 +997,76 @@ class Tracer:
         from aws_xray_sdk.ext.httplib import add_ignored  # type: ignore
 
         add_ignored(hostname=hostname, urls=urls)
+
+
+class _DeferredSubsegment(BaseSegment):
+    """Subsegment only recorded once the method completes, when slower than a minimum duration or when it fails.
+
+    Annotations, metadata and exceptions are kept in memory until then,
+    so faster methods don't create any subsegment.
+    """
+
+    def __init__(self, provider: BaseProvider, name: str, min_duration_ms: float):
+        self.provider = provider
+        self.name = name
+        self.min_duration_ms = min_duration_ms
+        self._operations: list[tuple[str, tuple, dict]] = []
+        self._start_time = 0.0
+        self._start = 0.0
+
+    def __enter__(self) -> BaseSegment:
+        self._start_time = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        elapsed_ms = (time.perf_counter() - self._start) * 1000
+        if exc_value is None and elapsed_ms < self.min_duration_ms:
+            logger.debug("Skipping subsegment '%s' as it took %.2fms", self.name, elapsed_ms)
+            return
+
+        with self.provider.in_subsegment(name=self.name) as subsegment:
+            # X-Ray subsegments start when created, we backdate them to when the method was called
+            if hasattr(subsegment, "start_time"):
+                subsegment.start_time = self._start_time
+
+            for operation, args, kwargs in self._operations:
+                getattr(subsegment, operation)(*args, **kwargs)
+
+            if exc_value is not None:
+                stack = traceback.extract_tb(exc_traceback)
+                subsegment.add_exception(exception=exc_value, stack=stack)  # type: ignore[arg-type] # same as X-Ray SDK
+
+    async def __aenter__(self) -> BaseSegment:
+        return self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.__exit__(exc_type, exc_value, exc_traceback)
+
+    def close(self, end_time: int | None = None):
+        """Subsegment is closed once the method completes"""
+
+    def add_subsegment(self, subsegment: Any):
+        self._operations.append(("add_subsegment", (subsegment,), {}))
+
+    def remove_subsegment(self, subsegment: Any):
+        self._operations.append(("remove_subsegment", (subsegment,), {}))
+
+    def put_annotation(self, key: str, value: str | numbers.Number | bool) -> None:
+        self._operations.append(("put_annotation", (), {"key": key, "value": value}))
+
+    def put_metadata(self, key: str, value: Any, namespace: str = "default") -> None:
+        self._operations.append(("put_metadata", (), {"key": key, "value": value, "namespace": namespace}))
+
+    def add_exception(self, exception: BaseException, stack: list[traceback.StackSummary], remote: bool = False):
+        self._operations.append(("add_exception", (), {"exception": exception, "stack": stack, "remote": remote}))
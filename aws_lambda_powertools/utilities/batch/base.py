@@ -25,6 +25,7 @@ from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import
 )
 from aws_lambda_powertools.utilities.data_classes.kinesis_stream_event import (
     KinesisStreamRecord,
+    KinesisStreamUserRecord,
 )
 from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
 
@@ -234,6 +235,7 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
         event_type: EventType,
         model: BatchTypeModels | None = None,
         raise_on_entire_batch_failure: bool = True,
+        deaggregate: bool = False,
     ):
         """Process batch and partially report failed items
 
@@ -246,15 +248,24 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
         raise_on_entire_batch_failure: bool
             Raise an exception when the entire batch has failed processing.
             When set to False, partial failures are reported in the response
+        deaggregate: bool
+            De-aggregate Kinesis records produced by the Kinesis Producer Library (KPL), processing each user record
+            separately. When any user record fails, its Kinesis record is reported as failed.
 
         Exceptions
         ----------
         BatchProcessingError
             Raised when the entire batch has failed processing
+        ValueError
+            When de-aggregation is enabled for an event type other than Kinesis Data Streams
         """
+        if deaggregate and event_type != EventType.KinesisDataStreams:
+            raise ValueError("Only Kinesis Data Streams records can be de-aggregated")
+
         self.event_type = event_type
         self.model = model
         self.raise_on_entire_batch_failure = raise_on_entire_batch_failure
+        self.deaggregate = deaggregate
         self.batch_response: PartialItemFailureResponse = copy.deepcopy(self.DEFAULT_RESPONSE)
         self._COLLECTOR_MAPPING = {
             EventType.SQS: self._collect_sqs_failures,
@@ -281,6 +292,8 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
         self.fail_messages.clear()
         self.exceptions.clear()
         self.batch_response = copy.deepcopy(self.DEFAULT_RESPONSE)
+        if self.deaggregate:
+            self.records = self._deaggregate_records(self.records)
 
     def _clean(self):
         """
@@ -333,15 +346,16 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
         return failures
 
     def _collect_kinesis_failures(self):
-        failures = []
+        # De-aggregated user records share their Kinesis record sequence number, so we report it once
+        msg_ids: dict[str, None] = {}
         for msg in self.fail_messages:
             # # see https://github.com/aws-powertools/powertools-lambda-python/issues/2091
             if self.model and getattr(msg, "model_validate", None):
                 msg_id = msg.kinesis.sequenceNumber
             else:
                 msg_id = msg.kinesis.sequence_number
-            failures.append({"itemIdentifier": msg_id})
-        return failures
+            msg_ids[msg_id] = None
+        return [{"itemIdentifier": msg_id} for msg_id in msg_ids]
 
     def _collect_dynamodb_failures(self):
         failures = []
@@ -366,11 +380,28 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
     def _to_batch_type(self, record: dict, event_type: EventType) -> EventSourceDataClassTypes: ...  # pragma: no cover
 
     def _to_batch_type(self, record: dict, event_type: EventType, model: BatchTypeModels | None = None):
+        if isinstance(record, KinesisStreamUserRecord):
+            return model.model_validate(record.as_record_dict()) if model is not None else record
+
         if model is not None:
             # If a model is provided, we assume Pydantic is installed and we need to disable v2 warnings
             return model.model_validate(record)
         return self._DATA_CLASS_MAPPING[event_type](record)
 
+    def _deaggregate_records(self, records: list[dict]) -> list:
+        """Expand KPL aggregated Kinesis records into their user records"""
+        user_records: list = []
+        for record in records:
+            try:
+                user_records.extend(KinesisStreamRecord(record).deaggregate())
+            except ValueError:
+                # Malformed KPL records are handed over to the record handler as regular Kinesis records
+                logger.debug("Unable to de-aggregate Kinesis record; processing it as is")
+                user_records.append(record)
+
+        logger.debug(f"De-aggregated {len(records)} Kinesis records into {len(user_records)} user records")
+        return user_records
+
     def _register_model_validation_error_record(self, record: dict):
         """Convert and register failure due to poison pills where model failed validation early"""
         # Parser will fail validation if record is a poison pill (malformed input)
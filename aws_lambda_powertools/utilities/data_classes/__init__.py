@@ -2,50 +2,57 @@
 Event Source Data Classes utility provides classes self-describing Lambda event sources.
 """
 
-from .alb_event import ALBEvent
-from .api_gateway_proxy_event import APIGatewayProxyEvent, APIGatewayProxyEventV2
-from .appsync_resolver_event import AppSyncResolverEvent
-from .aws_config_rule_event import AWSConfigRuleEvent
-from .bedrock_agent_event import BedrockAgentEvent
-from .cloud_watch_alarm_event import (
-    CloudWatchAlarmConfiguration,
-    CloudWatchAlarmData,
-    CloudWatchAlarmEvent,
-    CloudWatchAlarmMetric,
-    CloudWatchAlarmMetricStat,
-    CloudWatchAlarmState,
-)
-from .cloud_watch_custom_widget_event import CloudWatchDashboardCustomWidgetEvent
-from .cloud_watch_logs_event import CloudWatchLogsEvent
-from .cloudformation_custom_resource_event import CloudFormationCustomResourceEvent
-from .code_deploy_lifecycle_hook_event import (
-    CodeDeployLifecycleHookEvent,
-)
-from .code_pipeline_job_event import CodePipelineJobEvent
-from .connect_contact_flow_event import ConnectContactFlowEvent
-from .dynamo_db_stream_event import DynamoDBStreamEvent
-from .event_bridge_event import EventBridgeEvent
+from typing import TYPE_CHECKING
+
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
+
+# imported eagerly, as importing the event_source module would shadow a lazy export with the same name
 from .event_source import event_source
-from .kafka_event import KafkaEvent
-from .kinesis_firehose_event import (
-    KinesisFirehoseDataTransformationRecord,
-    KinesisFirehoseDataTransformationRecordMetadata,
-    KinesisFirehoseDataTransformationResponse,
-    KinesisFirehoseEvent,
-)
-from .kinesis_stream_event import KinesisStreamEvent
-from .lambda_function_url_event import LambdaFunctionUrlEvent
-from .s3_batch_operation_event import (
-    S3BatchOperationEvent,
-    S3BatchOperationResponse,
-    S3BatchOperationResponseRecord,
-)
-from .s3_event import S3Event, S3EventBridgeNotificationEvent
-from .secrets_manager_event import SecretsManagerEvent
-from .ses_event import SESEvent
-from .sns_event import SNSEvent
-from .sqs_event import SQSEvent
-from .vpc_lattice import VPCLatticeEvent, VPCLatticeEventV2
+
+if TYPE_CHECKING:
+    from .alb_event import ALBEvent
+    from .api_gateway_proxy_event import APIGatewayProxyEvent, APIGatewayProxyEventV2
+    from .appsync_resolver_event import AppSyncResolverEvent
+    from .aws_config_rule_event import AWSConfigRuleEvent
+    from .bedrock_agent_event import BedrockAgentEvent
+    from .cloud_watch_alarm_event import (
+        CloudWatchAlarmConfiguration,
+        CloudWatchAlarmData,
+        CloudWatchAlarmEvent,
+        CloudWatchAlarmMetric,
+        CloudWatchAlarmMetricStat,
+        CloudWatchAlarmState,
+    )
+    from .cloud_watch_custom_widget_event import CloudWatchDashboardCustomWidgetEvent
+    from .cloud_watch_logs_event import CloudWatchLogsEvent
+    from .cloudformation_custom_resource_event import CloudFormationCustomResourceEvent
+    from .code_deploy_lifecycle_hook_event import (
+        CodeDeployLifecycleHookEvent,
+    )
+    from .code_pipeline_job_event import CodePipelineJobEvent
+    from .connect_contact_flow_event import ConnectContactFlowEvent
+    from .dynamo_db_stream_event import DynamoDBStreamEvent
+    from .event_bridge_event import EventBridgeEvent
+    from .kafka_event import KafkaEvent
+    from .kinesis_firehose_event import (
+        KinesisFirehoseDataTransformationRecord,
+        KinesisFirehoseDataTransformationRecordMetadata,
+        KinesisFirehoseDataTransformationResponse,
+        KinesisFirehoseEvent,
+    )
+    from .kinesis_stream_event import KinesisStreamEvent
+    from .lambda_function_url_event import LambdaFunctionUrlEvent
+    from .s3_batch_operation_event import (
+        S3BatchOperationEvent,
+        S3BatchOperationResponse,
+        S3BatchOperationResponseRecord,
+    )
+    from .s3_event import S3Event, S3EventBridgeNotificationEvent
+    from .secrets_manager_event import SecretsManagerEvent
+    from .ses_event import SESEvent
+    from .sns_event import SNSEvent
+    from .sqs_event import SQSEvent
+    from .vpc_lattice import VPCLatticeEvent, VPCLatticeEventV2
 
 __all__ = [
     "APIGatewayProxyEvent",
@@ -88,3 +95,49 @@ __all__ = [
     "VPCLatticeEventV2",
     "CloudFormationCustomResourceEvent",
 ]
+
+# exports are imported on first access, so importing the package doesn't load every module
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_exports(
+        globals(),
+        {
+            "ALBEvent": ".alb_event",
+            "APIGatewayProxyEvent": ".api_gateway_proxy_event",
+            "APIGatewayProxyEventV2": ".api_gateway_proxy_event",
+            "AppSyncResolverEvent": ".appsync_resolver_event",
+            "AWSConfigRuleEvent": ".aws_config_rule_event",
+            "BedrockAgentEvent": ".bedrock_agent_event",
+            "CloudWatchAlarmConfiguration": ".cloud_watch_alarm_event",
+            "CloudWatchAlarmData": ".cloud_watch_alarm_event",
+            "CloudWatchAlarmEvent": ".cloud_watch_alarm_event",
+            "CloudWatchAlarmMetric": ".cloud_watch_alarm_event",
+            "CloudWatchAlarmMetricStat": ".cloud_watch_alarm_event",
+            "CloudWatchAlarmState": ".cloud_watch_alarm_event",
+            "CloudWatchDashboardCustomWidgetEvent": ".cloud_watch_custom_widget_event",
+            "CloudWatchLogsEvent": ".cloud_watch_logs_event",
+            "CloudFormationCustomResourceEvent": ".cloudformation_custom_resource_event",
+            "CodeDeployLifecycleHookEvent": ".code_deploy_lifecycle_hook_event",
+            "CodePipelineJobEvent": ".code_pipeline_job_event",
+            "ConnectContactFlowEvent": ".connect_contact_flow_event",
+            "DynamoDBStreamEvent": ".dynamo_db_stream_event",
+            "EventBridgeEvent": ".event_bridge_event",
+            "KafkaEvent": ".kafka_event",
+            "KinesisFirehoseDataTransformationRecord": ".kinesis_firehose_event",
+            "KinesisFirehoseDataTransformationRecordMetadata": ".kinesis_firehose_event",
+            "KinesisFirehoseDataTransformationResponse": ".kinesis_firehose_event",
+            "KinesisFirehoseEvent": ".kinesis_firehose_event",
+            "KinesisStreamEvent": ".kinesis_stream_event",
+            "LambdaFunctionUrlEvent": ".lambda_function_url_event",
+            "S3BatchOperationEvent": ".s3_batch_operation_event",
+            "S3BatchOperationResponse": ".s3_batch_operation_event",
+            "S3BatchOperationResponseRecord": ".s3_batch_operation_event",
+            "S3Event": ".s3_event",
+            "S3EventBridgeNotificationEvent": ".s3_event",
+            "SecretsManagerEvent": ".secrets_manager_event",
+            "SESEvent": ".ses_event",
+            "SNSEvent": ".sns_event",
+            "SQSEvent": ".sqs_event",
+            "VPCLatticeEvent": ".vpc_lattice",
+            "VPCLatticeEventV2": ".vpc_lattice",
+        },
+    )
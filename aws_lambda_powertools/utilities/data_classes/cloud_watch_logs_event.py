@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import base64
 import zlib
+from typing import Iterator
 
+from aws_lambda_powertools.shared.cloudwatch_logs import iter_log_events
 from aws_lambda_powertools.utilities.data_classes.common import DictWrapper
 
 
@@ -105,3 +107,23 @@ class CloudWatchLogsEvent(DictWrapper):
             self._json_logs_data = self._json_deserializer(self.decompress_logs_data.decode("UTF-8"))
 
         return CloudWatchLogsDecodedData(self._json_logs_data)
+
+    def iter_log_events(self) -> Iterator[CloudWatchLogsLogEvent]:
+        """Decode, decompress and parse log events one at a time, as they are decompressed
+
+        Unlike `parse_logs_data`, neither the decompressed data nor all log events are held in memory at once,
+        which suits high-volume log subscriptions. Log data is parsed with the standard library `json` module.
+
+        Raises
+        ------
+        zlib.error
+            When log data isn't valid gzip compressed data
+        json.JSONDecodeError
+            When decompressed log data isn't valid JSON
+        """
+        if self._json_logs_data is not None:
+            yield from CloudWatchLogsDecodedData(self._json_logs_data).log_events
+            return
+
+        for log_event in iter_log_events(base64.b64decode(self.raw_logs_data)):
+            yield CloudWatchLogsLogEvent(log_event)
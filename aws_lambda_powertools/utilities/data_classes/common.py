@@ -4,7 +4,7 @@ import base64
 import json
 import warnings
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, overload
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterator, Mapping, TypeVar, overload
 
 from typing_extensions import deprecated
 
@@ -19,6 +19,46 @@ from aws_lambda_powertools.utilities.data_classes.shared_functions import (
     get_query_string_value,
 )
 
+T = TypeVar("T")
+
+# marks a slotted cached property that wasn't computed yet, as None is a valid value
+_NOT_COMPUTED: Any = object()
+
+
+class slotted_cached_property(property, Generic[T]):
+    """Like `functools.cached_property`, for classes declaring `__slots__` instead of an instance `__dict__`
+
+    The value is computed on first access, then cached in the `_cached_<name>` attribute
+    that the class must declare in its `__slots__`, e.g. `__slots__ = ("_cached_attributes",)`.
+
+    It's mostly used to return the same nested data class on every access, instead of wrapping it again.
+    """
+
+    def __init__(self, func: Callable[[Any], T]):
+        attrname = f"_cached_{func.__name__}"
+
+        def fget(instance: Any) -> T:
+            # DictWrapper sets cached attributes upfront, as reading an unset slot raises a slow AttributeError
+            value = getattr(instance, attrname, _NOT_COMPUTED)
+            if value is _NOT_COMPUTED:
+                value = func(instance)
+                setattr(instance, attrname, value)
+            return value
+
+        super().__init__(fget)
+        self.__doc__ = func.__doc__
+        self.attrname = attrname
+
+    if TYPE_CHECKING:
+
+        @overload
+        def __get__(self, instance: None, owner: type | None = None) -> slotted_cached_property[T]: ...
+
+        @overload
+        def __get__(self, instance: object, owner: type | None = None) -> T: ...
+
+        def __get__(self, instance: object | None, owner: type | None = None) -> Any: ...
+
 
 class CaseInsensitiveDict(dict):
     """Case insensitive dict implementation. Assumes string keys only."""
@@ -64,7 +104,26 @@ class CaseInsensitiveDict(dict):
 
 
 class DictWrapper(Mapping):
-    """Provides a single read only access to a wrapper dict"""
+    """Provides a single read only access to a wrapper dict
+
+    Data classes created for every record in a batch declare `__slots__`, so they don't allocate an instance
+    `__dict__`, and use `slotted_cached_property` to cache nested data classes.
+    """
+
+    __slots__ = ("_data", "_json_deserializer")
+
+    # attributes caching slotted_cached_property values, set by __init_subclass__
+    _cached_attrnames: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cached_attrnames = {
+            value.attrname: None
+            for klass in cls.__mro__
+            for value in vars(klass).values()
+            if isinstance(value, slotted_cached_property)
+        }
+        cls._cached_attrnames = tuple(cached_attrnames)
 
     def __init__(self, data: dict[str, Any], json_deserializer: Callable | None = None):
         """
@@ -78,6 +137,8 @@ class DictWrapper(Mapping):
         """
         self._data = data
         self._json_deserializer = json_deserializer or json.loads
+        for attrname in self._cached_attrnames:
+            setattr(self, attrname, _NOT_COMPUTED)
 
     def __getitem__(self, key: str) -> Any:
         return self._data[key]
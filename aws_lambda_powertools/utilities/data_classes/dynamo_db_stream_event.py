@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 from enum import Enum
-from functools import cached_property
-from typing import Any, Iterator
+from typing import Any, Iterator, Mapping
 
 from aws_lambda_powertools.shared.dynamodb_deserializer import TypeDeserializer
-from aws_lambda_powertools.utilities.data_classes.common import DictWrapper
+from aws_lambda_powertools.utilities.data_classes.common import DictWrapper, slotted_cached_property
 
 
 class StreamViewType(Enum):
@@ -17,18 +16,50 @@ class StreamViewType(Enum):
     NEW_AND_OLD_IMAGES = 3  # both the new and the old item images of the item.
 
 
+class DynamoDBImage(Mapping[str, Any]):
+    """Read-only item image, deserializing each attribute the first time it's accessed
+
+    Parameters
+    ----------
+    data: dict[str, Any]
+        DynamoDB attribute values by attribute name, e.g. `NewImage` in a stream record
+    deserializer: TypeDeserializer
+        Deserializer for attribute values
+    """
+
+    __slots__ = ("_data", "_deserializer", "_values")
+
+    def __init__(self, data: dict[str, Any], deserializer: TypeDeserializer):
+        self._data = data
+        self._deserializer = deserializer
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            value = self._values[key] = self._deserializer.deserialize(self._data[key])
+            return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._data)})"
+
+
 class StreamRecord(DictWrapper):
-    _deserializer = TypeDeserializer()
+    __slots__ = ("_cached_keys", "_cached_new_image", "_cached_old_image")
 
-    def __init__(self, data: dict[str, Any]):
-        """StreamRecord constructor
-        Parameters
-        ----------
-        data: dict[str, Any]
-            Represents the dynamodb dict inside DynamoDBStreamEvent's records
-        """
-        super().__init__(data)
-        self._deserializer = TypeDeserializer()
+    # deserializers are stateless, so they're shared across records
+    _deserializer = TypeDeserializer()
+    _native_numbers_deserializer = TypeDeserializer(native_numbers=True)
 
     def _deserialize_dynamodb_dict(self, key: str) -> dict[str, Any]:
         """Deserialize DynamoDB records available in `Keys`, `NewImage`, and `OldImage`
@@ -44,7 +75,12 @@ class StreamRecord(DictWrapper):
             Deserialized records in Python native types
         """
         dynamodb_dict = self._data.get(key) or {}
-        return {k: self._deserializer.deserialize(v) for k, v in dynamodb_dict.items()}
+        deserialize = self._deserializer.deserialize
+        return {k: deserialize(v) for k, v in dynamodb_dict.items()}
+
+    def _get_image(self, key: str, native_numbers: bool) -> DynamoDBImage:
+        deserializer = self._native_numbers_deserializer if native_numbers else self._deserializer
+        return DynamoDBImage(self._data.get(key) or {}, deserializer)
 
     @property
     def approximate_creation_date_time(self) -> int | None:
@@ -52,21 +88,45 @@ class StreamRecord(DictWrapper):
         item = self.get("ApproximateCreationDateTime")
         return None if item is None else int(item)
 
-    @cached_property
+    @slotted_cached_property
     def keys(self) -> dict[str, Any]:  # type: ignore[override]
         """The primary key attribute(s) for the DynamoDB item that was modified."""
         return self._deserialize_dynamodb_dict("Keys")
 
-    @cached_property
+    @slotted_cached_property
     def new_image(self) -> dict[str, Any]:
         """The item in the DynamoDB table as it appeared after it was modified."""
         return self._deserialize_dynamodb_dict("NewImage")
 
-    @cached_property
+    @slotted_cached_property
     def old_image(self) -> dict[str, Any]:
         """The item in the DynamoDB table as it appeared before it was modified."""
         return self._deserialize_dynamodb_dict("OldImage")
 
+    def get_new_image(self, native_numbers: bool = False) -> DynamoDBImage:
+        """The item as it appeared after it was modified, deserializing each attribute only when accessed
+
+        Unlike `new_image`, attributes your function doesn't read are never deserialized.
+
+        Parameters
+        ----------
+        native_numbers: bool
+            Whether to return numbers as `int`, or as `float` when lossless, instead of `Decimal`. Defaults to `False`.
+        """
+        return self._get_image("NewImage", native_numbers)
+
+    def get_old_image(self, native_numbers: bool = False) -> DynamoDBImage:
+        """The item as it appeared before it was modified, deserializing each attribute only when accessed
+
+        Unlike `old_image`, attributes your function doesn't read are never deserialized.
+
+        Parameters
+        ----------
+        native_numbers: bool
+            Whether to return numbers as `int`, or as `float` when lossless, instead of `Decimal`. Defaults to `False`.
+        """
+        return self._get_image("OldImage", native_numbers)
+
     @property
     def sequence_number(self) -> str | None:
         """The sequence number of the stream record."""
@@ -94,12 +154,14 @@ class DynamoDBRecordEventName(Enum):
 class DynamoDBRecord(DictWrapper):
     """A description of a unique event within a stream"""
 
+    __slots__ = ("_cached_dynamodb",)
+
     @property
     def aws_region(self) -> str | None:
         """The region in which the GetRecords request was received"""
         return self.get("awsRegion")
 
-    @property
+    @slotted_cached_property
     def dynamodb(self) -> StreamRecord | None:
         """The main body of the stream record, containing all the DynamoDB-specific dicts."""
         stream_record = self.get("dynamodb")
@@ -160,6 +222,8 @@ class DynamoDBStreamEvent(DictWrapper):
                 print(key)
     """
 
+    __slots__ = ()
+
     @property
     def records(self) -> Iterator[DynamoDBRecord]:
         for record in self["Records"]:
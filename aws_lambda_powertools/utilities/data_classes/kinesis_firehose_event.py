@@ -1,17 +1,32 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import json
+import logging
 import warnings
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, Sequence
 
+from aws_lambda_powertools.shared import json_backend
 from aws_lambda_powertools.utilities.data_classes.common import DictWrapper
 
 if TYPE_CHECKING:
     from typing_extensions import Literal
 
+logger = logging.getLogger(__name__)
+
+# Lambda synchronous invocation response payload limit
+FIREHOSE_MAX_RESPONSE_SIZE = 6 * 1024 * 1024
+
+# JSON size of the response and each of its records, without values, as Lambda serializes them
+_RESPONSE_OVERHEAD = len(json.dumps({"records": []}))
+_RECORD_OVERHEAD = len(json.dumps({"recordId": "", "result": "", "data": ""})) + len(", ")
+_METADATA_OVERHEAD = len(', "metadata": ')
+
+_PROCESSING_FAILED = object()  # sentinel for records whose transformation raised an exception
+
 
 @dataclass(repr=False, order=False, frozen=True)
 class KinesisFirehoseDataTransformationRecordMetadata:
@@ -235,7 +250,8 @@ class KinesisFirehoseRecord(DictWrapper):
     @property
     def data_as_bytes(self) -> bytes:
         """Decoded base64-encoded data as bytes"""
-        return base64.b64decode(self.data)
+        # same as base64.b64decode, without its Python level input checks
+        return binascii.a2b_base64(self.data)
 
     @property
     def data_as_text(self) -> str:
@@ -306,3 +322,171 @@ class KinesisFirehoseEvent(DictWrapper):
     def records(self) -> Iterator[KinesisFirehoseRecord]:
         for record in self["records"]:
             yield KinesisFirehoseRecord(data=record, json_deserializer=self._json_deserializer)
+
+    def transform(
+        self,
+        record_handler: Callable[[KinesisFirehoseRecord], Any] | None = None,
+        batch_handler: Callable[[list[KinesisFirehoseRecord]], Sequence[Any]] | None = None,
+        partition_keys: Callable[[KinesisFirehoseRecord, Any], dict[str, str]] | None = None,
+        json_serializer: Callable[[Any], str | bytes] | None = None,
+        max_response_size: int = FIREHOSE_MAX_RESPONSE_SIZE,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Transform all records and build the data transformation response
+
+        Each output is encoded straight into the response, without creating a
+        `KinesisFirehoseDataTransformationRecord` per record:
+
+        * `bytes` and `str` are base64 encoded as is
+        * `None` drops the record
+        * `KinesisFirehoseDataTransformationRecord` is used as is, e.g. to set a result explicitly
+        * anything else is serialized to JSON first
+
+        Records whose transformation raises an exception are marked as `ProcessingFailed`.
+        Records that would take the response over `max_response_size` are marked as `ProcessingFailed` too,
+        so Firehose delivers them to the processing-failed S3 prefix instead of failing the whole batch.
+
+        Parameters
+        ----------
+        record_handler : Callable[[KinesisFirehoseRecord], Any], optional
+            Function transforming a single record
+        batch_handler : Callable[[list[KinesisFirehoseRecord]], Sequence[Any]], optional
+            Function transforming all records at once, returning an output per record in the same order.
+            When it raises an exception, all records are marked as `ProcessingFailed`.
+        partition_keys : Callable[[KinesisFirehoseRecord, Any], dict[str, str]], optional
+            Function returning dynamic partitioning keys from a record and its output
+        json_serializer : Callable[[Any], str | bytes], optional
+            Function to serialize outputs to JSON, by default the fastest JSON backend available
+        max_response_size : int, optional
+            Maximum response size in bytes, by default Lambda's 6 MB response payload limit
+
+        Returns
+        -------
+        dict
+            Data transformation response to return from your Lambda handler
+
+        Raises
+        ------
+        ValueError
+            When both or none of `record_handler` and `batch_handler` are given, the event has no records,
+            or `batch_handler` doesn't return an output per record
+
+        Example
+        -------
+        **Transforming JSON records**
+
+            >>> from aws_lambda_powertools.utilities.data_classes import KinesisFirehoseEvent, event_source
+            >>>
+            >>> @event_source(data_class=KinesisFirehoseEvent)
+            >>> def lambda_handler(event: KinesisFirehoseEvent, context):
+            >>>     return event.transform(record_handler=lambda record: {"payload": record.data_as_json})
+        """
+        if (record_handler is None) == (batch_handler is None):
+            raise ValueError("Either record_handler or batch_handler must be provided")
+
+        records = list(self.records)
+        if not records:
+            raise ValueError("Amazon Kinesis Data Firehose doesn't accept empty response")
+
+        if batch_handler is not None:
+            outputs = _transform_batch(batch_handler, records)
+        else:
+            outputs = [_transform_record(record_handler, record) for record in records]  # type: ignore[arg-type]
+
+        serialize = json_serializer or json_backend.get_json_backend().dumps_bytes
+        record_ids = [record["recordId"] for record in self["records"]]
+
+        # Every record takes at least the size of a failed record; reserve it upfront
+        failed_size = _RECORD_OVERHEAD + len("ProcessingFailed")
+        available = (
+            max_response_size - _RESPONSE_OVERHEAD - sum(failed_size + len(record_id) for record_id in record_ids)
+        )
+
+        response_records = []
+        for record_id, record, output in zip(record_ids, records, outputs):
+            response_record = _build_response_record(record_id, record, output, serialize, partition_keys)
+            if response_record["result"] != "ProcessingFailed":
+                extra_size = _response_record_size(response_record) - failed_size - len(record_id)
+                if extra_size > available:
+                    logger.debug(f"Record {record_id} exceeds the response size limit, marking it as failed")
+                    response_record = _failed_response_record(record_id)
+                else:
+                    available -= extra_size
+
+            response_records.append(response_record)
+
+        return {"records": response_records}
+
+
+def _transform_record(record_handler: Callable[[KinesisFirehoseRecord], Any], record: KinesisFirehoseRecord) -> Any:
+    try:
+        return record_handler(record)
+    except Exception:
+        logger.debug(f"Failed to transform record {record.record_id}", exc_info=True)
+        return _PROCESSING_FAILED
+
+
+def _transform_batch(
+    batch_handler: Callable[[list[KinesisFirehoseRecord]], Sequence[Any]],
+    records: list[KinesisFirehoseRecord],
+) -> Sequence[Any]:
+    try:
+        outputs = batch_handler(records)
+    except Exception:
+        logger.debug("Failed to transform records batch", exc_info=True)
+        return [_PROCESSING_FAILED] * len(records)
+
+    if len(outputs) != len(records):
+        raise ValueError(f"batch_handler returned {len(outputs)} outputs for {len(records)} records")
+
+    return outputs
+
+
+def _build_response_record(
+    record_id: str,
+    record: KinesisFirehoseRecord,
+    output: Any,
+    serialize: Callable[[Any], str | bytes],
+    partition_keys: Callable[[KinesisFirehoseRecord, Any], dict[str, str]] | None,
+) -> dict[str, Any]:
+    if output is _PROCESSING_FAILED:
+        return _failed_response_record(record_id)
+    if output is None:
+        return {"recordId": record_id, "result": "Dropped", "data": ""}
+    if isinstance(output, KinesisFirehoseDataTransformationRecord):
+        return output.asdict()
+
+    data: bytes | bytearray | memoryview
+    try:
+        if isinstance(output, str):
+            data = output.encode()
+        elif isinstance(output, (bytes, bytearray, memoryview)):
+            data = output
+        else:
+            serialized = serialize(output)
+            data = serialized.encode() if isinstance(serialized, str) else serialized
+
+        response_record: dict[str, Any] = {
+            "recordId": record_id,
+            "result": "Ok",
+            "data": binascii.b2a_base64(data, newline=False).decode("ascii"),
+        }
+        if partition_keys is not None:
+            response_record["metadata"] = {"partitionKeys": partition_keys(record, output)}
+    except Exception:
+        logger.debug(f"Failed to encode record {record_id}", exc_info=True)
+        return _failed_response_record(record_id)
+
+    return response_record
+
+
+def _failed_response_record(record_id: str) -> dict[str, Any]:
+    # Firehose delivers the original record data to the processing-failed S3 prefix
+    return {"recordId": record_id, "result": "ProcessingFailed", "data": ""}
+
+
+def _response_record_size(response_record: dict[str, Any]) -> int:
+    size = _RECORD_OVERHEAD + len(response_record["recordId"]) + len(response_record["result"])
+    size += len(response_record["data"])
+    if "metadata" in response_record:
+        size += _METADATA_OVERHEAD + len(json.dumps(response_record["metadata"]))
+    return size
@@ -3,15 +3,23 @@ from __future__ import annotations
 import base64
 import json
 import zlib
-from typing import Iterator
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
+from aws_lambda_powertools.shared.cloudwatch_logs import iter_log_events
+from aws_lambda_powertools.shared.kinesis_aggregation import deaggregate
 from aws_lambda_powertools.utilities.data_classes.cloud_watch_logs_event import (
     CloudWatchLogsDecodedData,
+    CloudWatchLogsLogEvent,
 )
-from aws_lambda_powertools.utilities.data_classes.common import DictWrapper
+from aws_lambda_powertools.utilities.data_classes.common import DictWrapper, slotted_cached_property
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.shared.kinesis_aggregation import UserRecord
 
 
 class KinesisStreamRecordPayload(DictWrapper):
+    __slots__ = ()
+
     @property
     def approximate_arrival_timestamp(self) -> float:
         """The approximate time that the record was inserted into the stream"""
@@ -56,6 +64,8 @@ class KinesisStreamRecordPayload(DictWrapper):
 
 
 class KinesisStreamRecord(DictWrapper):
+    __slots__ = ("_cached_kinesis",)
+
     @property
     def aws_region(self) -> str:
         """AWS region where the event originated eg: us-east-1"""
@@ -91,11 +101,128 @@ class KinesisStreamRecord(DictWrapper):
         """The ARN for the identity used to invoke the Lambda Function"""
         return self["invokeIdentityArn"]
 
-    @property
+    @slotted_cached_property
     def kinesis(self) -> KinesisStreamRecordPayload:
         """Underlying Kinesis record associated with the event"""
         return KinesisStreamRecordPayload(self._data)
 
+    def deaggregate(self) -> list[KinesisStreamUserRecord]:
+        """User records within this record, de-aggregating it when produced by the Kinesis Producer Library (KPL)
+
+        Records that aren't KPL aggregated are returned as a single user record with sub-sequence number 0.
+        User records' data is a view over this record's decoded data, so it's never copied.
+
+        Raises
+        ------
+        ValueError
+            When the KPL aggregated record is malformed
+        """
+        data = self.kinesis.data_as_bytes()
+        user_records = deaggregate(data)
+        if user_records is None:
+            return [KinesisStreamUserRecord(self._data, user_data=memoryview(data))]
+
+        return [
+            KinesisStreamUserRecord(self._data, user_data=user_record.data, user_record=user_record)
+            for user_record in user_records
+        ]
+
+
+class KinesisStreamUserRecordPayload(KinesisStreamRecordPayload):
+    """Kinesis record payload for a user record, which might have been aggregated by the KPL"""
+
+    __slots__ = ("_user_data", "_user_record")
+
+    def __init__(self, data: dict[str, Any], user_data: memoryview, user_record: UserRecord | None = None):
+        super().__init__(data)
+        self._user_data = user_data
+        self._user_record = user_record
+
+    @property
+    def aggregated(self) -> bool:
+        """Whether this user record was aggregated with others by the KPL"""
+        return self._user_record is not None
+
+    @property
+    def data(self) -> str:
+        """The user record data blob, base64 encoded"""
+        if self._user_record is None:
+            return super().data
+        return base64.b64encode(self._user_data).decode()
+
+    @property
+    def explicit_hash_key(self) -> str | None:
+        """Explicit hash key set by the producer for the user record, if any"""
+        if self._user_record is None:
+            return None
+        return self._user_record.explicit_hash_key
+
+    @property
+    def partition_key(self) -> str:
+        """Partition key set by the producer for the user record"""
+        if self._user_record is None:
+            return super().partition_key
+        return self._user_record.partition_key
+
+    @property
+    def sub_sequence_number(self) -> int:
+        """Position of the user record within the aggregated record, 0 when it wasn't aggregated"""
+        if self._user_record is None:
+            return 0
+        return self._user_record.sub_sequence_number
+
+    def data_as_memoryview(self) -> memoryview:
+        """User record data without copying it"""
+        return self._user_data
+
+    def data_as_bytes(self) -> bytes:
+        """User record data as bytes"""
+        return bytes(self._user_data)
+
+    def data_as_text(self) -> str:
+        """Decode user record data as text"""
+        return str(self._user_data, "utf-8")
+
+
+class KinesisStreamUserRecord(KinesisStreamRecord):
+    """User record within a Kinesis stream record, as sent by the producer
+
+    It shares the Kinesis record fields, e.g. `kinesis.sequence_number` to report it as a batch item failure,
+    while `kinesis` exposes the user record data, partition key and sub-sequence number.
+    """
+
+    __slots__ = ("_user_data", "_user_record")
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        user_data: memoryview,
+        user_record: UserRecord | None = None,
+        json_deserializer: Callable | None = None,
+    ):
+        super().__init__(data, json_deserializer=json_deserializer)
+        self._user_data = user_data
+        self._user_record = user_record
+
+    @slotted_cached_property
+    def kinesis(self) -> KinesisStreamUserRecordPayload:
+        """Underlying Kinesis record associated with the event, with the user record data"""
+        return KinesisStreamUserRecordPayload(self._data, user_data=self._user_data, user_record=self._user_record)
+
+    def as_record_dict(self) -> dict[str, Any]:
+        """Kinesis record as found in the event for this user record, e.g. to validate it with a Parser model"""
+        kinesis = self.kinesis
+        return {
+            **self._data,
+            "kinesis": {
+                **self._data["kinesis"],
+                "data": kinesis.data,
+                "partitionKey": kinesis.partition_key,
+                "explicitHashKey": kinesis.explicit_hash_key,
+                "subSequenceNumber": kinesis.sub_sequence_number,
+            },
+        }
+
 
 class KinesisStreamEvent(DictWrapper):
     """Kinesis stream event
@@ -105,11 +232,19 @@ class KinesisStreamEvent(DictWrapper):
     - https://docs.aws.amazon.com/lambda/latest/dg/with-kinesis.html
     """
 
+    __slots__ = ()
+
     @property
     def records(self) -> Iterator[KinesisStreamRecord]:
         for record in self["Records"]:
             yield KinesisStreamRecord(record)
 
+    @property
+    def user_records(self) -> Iterator[KinesisStreamUserRecord]:
+        """User records across all records, de-aggregating records produced by the Kinesis Producer Library"""
+        for record in self.records:
+            yield from record.deaggregate()
+
 
 def extract_cloudwatch_logs_from_event(event: KinesisStreamEvent) -> list[CloudWatchLogsDecodedData]:
     return [CloudWatchLogsDecodedData(record.kinesis.data_zlib_compressed_as_json()) for record in event.records]
@@ -117,3 +252,9 @@ def extract_cloudwatch_logs_from_event(event: KinesisStreamEvent) -> list[CloudW
 
 def extract_cloudwatch_logs_from_record(record: KinesisStreamRecord) -> CloudWatchLogsDecodedData:
     return CloudWatchLogsDecodedData(data=record.kinesis.data_zlib_compressed_as_json())
+
+
+def iter_cloudwatch_log_events_from_record(record: KinesisStreamRecord) -> Iterator[CloudWatchLogsLogEvent]:
+    """Yields CloudWatch Logs log events delivered in a Kinesis record, one at a time as they are decompressed"""
+    for log_event in iter_log_events(record.kinesis.data_as_bytes()):
+        yield CloudWatchLogsLogEvent(log_event)
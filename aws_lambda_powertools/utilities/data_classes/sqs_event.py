@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from functools import cached_property
 from typing import Any, Dict, ItemsView, Iterator, TypeVar
 
 from aws_lambda_powertools.utilities.data_classes import S3Event
-from aws_lambda_powertools.utilities.data_classes.common import DictWrapper
+from aws_lambda_powertools.utilities.data_classes.common import DictWrapper, slotted_cached_property
 from aws_lambda_powertools.utilities.data_classes.sns_event import SNSMessage
 
 
 class SQSRecordAttributes(DictWrapper):
+    __slots__ = ()
+
     @property
     def aws_trace_header(self) -> str | None:
         """Returns the AWS X-Ray trace header string."""
@@ -68,6 +69,8 @@ class SQSRecordAttributes(DictWrapper):
 class SQSMessageAttribute(DictWrapper):
     """The user-specified message attribute value."""
 
+    __slots__ = ()
+
     @property
     def string_value(self) -> str | None:
         """Strings are Unicode with UTF-8 binary encoding."""
@@ -98,6 +101,8 @@ class SQSMessageAttributes(Dict[str, SQSMessageAttribute]):
 class SQSRecord(DictWrapper):
     """An Amazon SQS message"""
 
+    __slots__ = ("_cached_json_body", "_cached_attributes", "_cached_message_attributes")
+
     NestedEvent = TypeVar("NestedEvent", bound=DictWrapper)
 
     @property
@@ -120,7 +125,7 @@ class SQSRecord(DictWrapper):
         """The message's contents (not URL-encoded)."""
         return self["body"]
 
-    @cached_property
+    @slotted_cached_property
     def json_body(self) -> Any:
         """Deserializes JSON string available in 'body' property
 
@@ -147,12 +152,12 @@ class SQSRecord(DictWrapper):
         """
         return self._json_deserializer(self["body"])
 
-    @property
+    @slotted_cached_property
     def attributes(self) -> SQSRecordAttributes:
         """A map of the attributes requested in ReceiveMessage to their respective values."""
         return SQSRecordAttributes(self["attributes"])
 
-    @property
+    @slotted_cached_property
     def message_attributes(self) -> SQSMessageAttributes:
         """Each message attribute consists of a Name, Type, and Value."""
         return SQSMessageAttributes(self["messageAttributes"])
@@ -255,6 +260,8 @@ class SQSEvent(DictWrapper):
     - https://docs.aws.amazon.com/lambda/latest/dg/with-sqs.html
     """
 
+    __slots__ = ()
+
     @property
     def records(self) -> Iterator[SQSRecord]:
         for record in self["Records"]:
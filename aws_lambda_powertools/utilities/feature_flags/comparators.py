@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime, tzinfo
-from typing import Any
+from typing import Any, Callable
 
 from dateutil.tz import gettz
 
 from aws_lambda_powertools.utilities.feature_flags.constants import HOUR_MIN_SEPARATOR
-from aws_lambda_powertools.utilities.feature_flags.schema import ModuloRangeValues, TimeValues
+from aws_lambda_powertools.utilities.feature_flags.schema import ModuloRangeValues, RuleAction, TimeValues
+
+Matcher = Callable[[Any], bool]
 
 
 def _get_now_from_timezone(timezone: tzinfo | None) -> datetime:
@@ -148,3 +150,175 @@ def compare_none_in_list(context_value: list, condition_value: list) -> bool:
         raise ValueError("Context provided must be a list. Unable to compare NONE_IN_VALUE action.")
 
     return all(key not in condition_value for key in context_value)
+
+
+RULE_ACTION_MAPPING = {
+    RuleAction.EQUALS.value: lambda a, b: a == b,
+    RuleAction.NOT_EQUALS.value: lambda a, b: a != b,
+    RuleAction.KEY_GREATER_THAN_VALUE.value: lambda a, b: a > b,
+    RuleAction.KEY_GREATER_THAN_OR_EQUAL_VALUE.value: lambda a, b: a >= b,
+    RuleAction.KEY_LESS_THAN_VALUE.value: lambda a, b: a < b,
+    RuleAction.KEY_LESS_THAN_OR_EQUAL_VALUE.value: lambda a, b: a <= b,
+    RuleAction.STARTSWITH.value: lambda a, b: a.startswith(b),
+    RuleAction.ENDSWITH.value: lambda a, b: a.endswith(b),
+    RuleAction.IN.value: lambda a, b: a in b,
+    RuleAction.NOT_IN.value: lambda a, b: a not in b,
+    RuleAction.KEY_IN_VALUE.value: lambda a, b: a in b,
+    RuleAction.KEY_NOT_IN_VALUE.value: lambda a, b: a not in b,
+    RuleAction.VALUE_IN_KEY.value: lambda a, b: b in a,
+    RuleAction.VALUE_NOT_IN_KEY.value: lambda a, b: b not in a,
+    RuleAction.ALL_IN_VALUE.value: lambda a, b: compare_all_in_list(a, b),
+    RuleAction.ANY_IN_VALUE.value: lambda a, b: compare_any_in_list(a, b),
+    RuleAction.NONE_IN_VALUE.value: lambda a, b: compare_none_in_list(a, b),
+    RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value: lambda a, b: compare_time_range(a, b),
+    RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE.value: lambda a, b: compare_datetime_range(a, b),
+    RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK.value: lambda a, b: compare_days_of_week(a, b),
+    RuleAction.MODULO_RANGE.value: lambda a, b: compare_modulo_range(a, b),
+}
+
+
+def _compile_membership(condition_value: Any) -> Matcher:
+    """Returns `item in condition_value`, using a set when condition value is a list of hashable items"""
+    if not isinstance(condition_value, list):
+        return lambda item: item in condition_value
+
+    try:
+        values = frozenset(condition_value)
+    except TypeError:
+        return condition_value.__contains__
+
+    def contains(item: Any) -> bool:
+        try:
+            return item in values
+        except TypeError:  # unhashable context value, e.g. a dict
+            return item in condition_value
+
+    return contains
+
+
+def _compile_in(condition_value: Any) -> Matcher:
+    return _compile_membership(condition_value)
+
+
+def _compile_not_in(condition_value: Any) -> Matcher:
+    contains = _compile_membership(condition_value)
+    return lambda context_value: not contains(context_value)
+
+
+def _compile_any_in_list(condition_value: list) -> Matcher:
+    contains = _compile_membership(condition_value)
+
+    def any_in_list(context_value: Any) -> bool:
+        if not isinstance(context_value, list):
+            raise ValueError("Context provided must be a list. Unable to compare ANY_IN_VALUE action.")
+        return any(contains(key) for key in context_value)
+
+    return any_in_list
+
+
+def _compile_all_in_list(condition_value: list) -> Matcher:
+    contains = _compile_membership(condition_value)
+
+    def all_in_list(context_value: Any) -> bool:
+        if not isinstance(context_value, list):
+            raise ValueError("Context provided must be a list. Unable to compare ALL_IN_VALUE action.")
+        return all(contains(key) for key in context_value)
+
+    return all_in_list
+
+
+def _compile_none_in_list(condition_value: list) -> Matcher:
+    contains = _compile_membership(condition_value)
+
+    def none_in_list(context_value: Any) -> bool:
+        if not isinstance(context_value, list):
+            raise ValueError("Context provided must be a list. Unable to compare NONE_IN_VALUE action.")
+        return not any(contains(key) for key in context_value)
+
+    return none_in_list
+
+
+def _compile_days_of_week(condition_value: dict) -> Matcher:
+    timezone = gettz(condition_value.get(TimeValues.TIMEZONE.value, "UTC"))
+    days = frozenset(condition_value.get(TimeValues.DAYS.value, []))
+
+    # %A = Weekday as locale’s full name.
+    return lambda context_value: _get_now_from_timezone(timezone).strftime("%A").upper() in days
+
+
+def _compile_datetime_range(condition_value: dict) -> Matcher:
+    timezone = gettz(condition_value.get(TimeValues.TIMEZONE.value, "UTC"))
+    start_date = datetime.fromisoformat(condition_value.get(TimeValues.START.value, "")).replace(tzinfo=timezone)
+    end_date = datetime.fromisoformat(condition_value.get(TimeValues.END.value, "")).replace(tzinfo=timezone)
+
+    return lambda context_value: start_date <= _get_now_from_timezone(timezone) <= end_date
+
+
+def _compile_time_range(condition_value: dict) -> Matcher:
+    timezone = gettz(condition_value.get(TimeValues.TIMEZONE.value, "UTC"))
+    start_hour, start_min = map(int, condition_value.get(TimeValues.START.value, "").split(HOUR_MIN_SEPARATOR))
+    end_hour, end_min = map(int, condition_value.get(TimeValues.END.value, "").split(HOUR_MIN_SEPARATOR))
+    crosses_midnight = end_hour < start_hour
+
+    def time_range(context_value: Any) -> bool:
+        current_time = _get_now_from_timezone(timezone)
+        start_time = current_time.replace(hour=start_hour, minute=start_min)
+        end_time = current_time.replace(hour=end_hour, minute=end_min)
+
+        # see compare_time_range for how ranges crossing a day's boundary are handled
+        if crosses_midnight:
+            return (start_time <= current_time) or (current_time <= end_time)
+        return start_time <= current_time <= end_time
+
+    return time_range
+
+
+def _compile_modulo_range(condition_value: dict) -> Matcher:
+    base = condition_value.get(ModuloRangeValues.BASE.value, 1)
+    start = condition_value.get(ModuloRangeValues.START.value, 1)
+    end = condition_value.get(ModuloRangeValues.END.value, 1)
+
+    return lambda context_value: start <= context_value % base <= end
+
+
+# Actions whose condition value can be parsed ahead of evaluation, e.g. lists into sets or time ranges into integers
+COMPILED_ACTION_MAPPING: dict[str, Callable[[Any], Matcher]] = {
+    RuleAction.IN.value: _compile_in,
+    RuleAction.NOT_IN.value: _compile_not_in,
+    RuleAction.KEY_IN_VALUE.value: _compile_in,
+    RuleAction.KEY_NOT_IN_VALUE.value: _compile_not_in,
+    RuleAction.ALL_IN_VALUE.value: _compile_all_in_list,
+    RuleAction.ANY_IN_VALUE.value: _compile_any_in_list,
+    RuleAction.NONE_IN_VALUE.value: _compile_none_in_list,
+    RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value: _compile_time_range,
+    RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE.value: _compile_datetime_range,
+    RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK.value: _compile_days_of_week,
+    RuleAction.MODULO_RANGE.value: _compile_modulo_range,
+}
+
+
+def compile_comparator(action: str, condition_value: Any) -> Matcher:
+    """Compiles a condition into a function matching context values, parsing its value once
+
+    Parameters
+    ----------
+    action : str
+        condition action, e.g. `RuleAction.IN.value`
+    condition_value : Any
+        schema value available for condition being compiled
+
+    Returns
+    -------
+    Callable[[Any], bool]
+        Function returning whether a context value matches the condition. Unknown actions never match.
+    """
+    compile_action = COMPILED_ACTION_MAPPING.get(action)
+    if compile_action is not None:
+        try:
+            return compile_action(condition_value)
+        except Exception:
+            # Invalid condition values fail when matching instead, so validation exception handlers still apply
+            pass
+
+    compare = RULE_ACTION_MAPPING.get(action, lambda a, b: False)
+    return lambda context_value: compare(context_value, condition_value)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from typing import Any, NamedTuple
+
+from aws_lambda_powertools.utilities.feature_flags import schema
+from aws_lambda_powertools.utilities.feature_flags.comparators import Matcher, compile_comparator
+
+# time based rule actions have no user context. the context is the condition key
+TIME_BASED_ACTIONS = frozenset(
+    {
+        schema.RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value,
+        schema.RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE.value,
+        schema.RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK.value,
+    },
+)
+
+
+class CompiledCondition(NamedTuple):
+    key: str
+    action: str
+    match: Matcher
+    time_based: bool
+
+
+class CompiledRule(NamedTuple):
+    name: str
+    match_value: Any
+    conditions: tuple[CompiledCondition, ...]
+
+
+class CompiledFeature(NamedTuple):
+    name: str
+    default: Any
+    boolean_feature: bool
+    rules: tuple[CompiledRule, ...]
+
+
+def compile_condition(condition: dict[str, Any]) -> CompiledCondition:
+    action = condition.get(schema.CONDITION_ACTION, "")
+    return CompiledCondition(
+        key=condition.get(schema.CONDITION_KEY, ""),
+        action=action,
+        match=compile_comparator(action, condition.get(schema.CONDITION_VALUE)),
+        time_based=action in TIME_BASED_ACTIONS,
+    )
+
+
+def _condition_identity(condition: dict[str, Any]) -> str | None:
+    try:
+        return json.dumps(condition, sort_keys=True)
+    except (TypeError, ValueError):  # values that aren't JSON serializable, e.g. from a custom store
+        return None
+
+
+def compile_rule(
+    rule_name: str,
+    rule: dict[str, Any],
+    conditions: dict[str, CompiledCondition] | None = None,
+) -> CompiledRule:
+    """Compiles a rule, reusing identical conditions already compiled in `conditions`"""
+    compiled_conditions: list[CompiledCondition] = []
+    for condition in rule.get(schema.CONDITIONS_KEY) or ():
+        identity = None if conditions is None else _condition_identity(condition)
+        if conditions is None or identity is None:
+            compiled_conditions.append(compile_condition(condition))
+            continue
+
+        if identity not in conditions:
+            conditions[identity] = compile_condition(condition)
+        compiled_conditions.append(conditions[identity])
+
+    return CompiledRule(
+        name=rule_name,
+        match_value=rule.get(schema.RULE_MATCH_VALUE),
+        conditions=tuple(compiled_conditions),
+    )
+
+
+def compile_feature(
+    name: str,
+    feature: dict[str, Any],
+    conditions: dict[str, CompiledCondition] | None = None,
+) -> CompiledFeature:
+    rules: dict[str, Any] = feature.get(schema.RULES_KEY) or {}
+    return CompiledFeature(
+        name=name,
+        default=feature.get(schema.FEATURE_DEFAULT_VAL_KEY),
+        boolean_feature=feature.get(schema.FEATURE_DEFAULT_VAL_TYPE_KEY, True),  # backwards compatibility
+        rules=tuple(compile_rule(rule_name, rule, conditions) for rule_name, rule in rules.items()),
+    )
+
+
+def compile_features(config: dict[str, Any]) -> dict[str, CompiledFeature]:
+    """Compiles a validated feature flags configuration into features that evaluate without parsing it again
+
+    Parameters
+    ----------
+    config : dict[str, Any]
+        Feature flags configuration, validated with `SchemaValidator`
+
+    Returns
+    -------
+    dict[str, CompiledFeature]
+        Compiled features by name, keeping rules in configuration order.
+        Identical conditions across rules and features are compiled once, and share the same object.
+    """
+    conditions: dict[str, CompiledCondition] = {}
+    return {name: compile_feature(name, feature, conditions) for name, feature in config.items()}
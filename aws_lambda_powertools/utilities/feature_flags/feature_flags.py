@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import copy
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Callable, List, cast
+import os
+from typing import TYPE_CHECKING, Any, Callable
 
+from aws_lambda_powertools.shared import constants
 from aws_lambda_powertools.utilities.feature_flags import schema
-from aws_lambda_powertools.utilities.feature_flags.comparators import (
-    compare_all_in_list,
-    compare_any_in_list,
-    compare_datetime_range,
-    compare_days_of_week,
-    compare_modulo_range,
-    compare_none_in_list,
-    compare_time_range,
+from aws_lambda_powertools.utilities.feature_flags.comparators import (  # noqa: F401 # RULE_ACTION_MAPPING moved
+    RULE_ACTION_MAPPING,
+    compile_comparator,
+)
+from aws_lambda_powertools.utilities.feature_flags.compiler import (
+    CompiledCondition,
+    CompiledFeature,
+    CompiledRule,
+    compile_features,
+    compile_rule,
 )
 from aws_lambda_powertools.utilities.feature_flags.exceptions import ConfigurationStoreError
 
@@ -21,31 +27,6 @@ if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.feature_flags.types import JSONType, P, T
 
 
-RULE_ACTION_MAPPING = {
-    schema.RuleAction.EQUALS.value: lambda a, b: a == b,
-    schema.RuleAction.NOT_EQUALS.value: lambda a, b: a != b,
-    schema.RuleAction.KEY_GREATER_THAN_VALUE.value: lambda a, b: a > b,
-    schema.RuleAction.KEY_GREATER_THAN_OR_EQUAL_VALUE.value: lambda a, b: a >= b,
-    schema.RuleAction.KEY_LESS_THAN_VALUE.value: lambda a, b: a < b,
-    schema.RuleAction.KEY_LESS_THAN_OR_EQUAL_VALUE.value: lambda a, b: a <= b,
-    schema.RuleAction.STARTSWITH.value: lambda a, b: a.startswith(b),
-    schema.RuleAction.ENDSWITH.value: lambda a, b: a.endswith(b),
-    schema.RuleAction.IN.value: lambda a, b: a in b,
-    schema.RuleAction.NOT_IN.value: lambda a, b: a not in b,
-    schema.RuleAction.KEY_IN_VALUE.value: lambda a, b: a in b,
-    schema.RuleAction.KEY_NOT_IN_VALUE.value: lambda a, b: a not in b,
-    schema.RuleAction.VALUE_IN_KEY.value: lambda a, b: b in a,
-    schema.RuleAction.VALUE_NOT_IN_KEY.value: lambda a, b: b not in a,
-    schema.RuleAction.ALL_IN_VALUE.value: lambda a, b: compare_all_in_list(a, b),
-    schema.RuleAction.ANY_IN_VALUE.value: lambda a, b: compare_any_in_list(a, b),
-    schema.RuleAction.NONE_IN_VALUE.value: lambda a, b: compare_none_in_list(a, b),
-    schema.RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value: lambda a, b: compare_time_range(a, b),
-    schema.RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE.value: lambda a, b: compare_datetime_range(a, b),
-    schema.RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK.value: lambda a, b: compare_days_of_week(a, b),
-    schema.RuleAction.MODULO_RANGE.value: lambda a, b: compare_modulo_range(a, b),
-}
-
-
 class FeatureFlags:
     def __init__(self, store: StoreProvider, logger: logging.Logger | Logger | None = None):
         """Evaluates whether feature flags should be enabled based on a given context.
@@ -80,12 +61,30 @@ class FeatureFlags:
         self.logger = logger or logging.getLogger(__name__)
         self._exception_handlers: dict[Exception, Callable] = {}
 
+        # Copy of the configuration features were compiled from, and the compiled features for evaluation
+        self._configuration: dict | None = None
+        self._features: dict[str, CompiledFeature] = {}
+
+        # Values of all features by context, cached by `evaluate_all` for the current invocation only
+        self._evaluations: dict[str, dict[str, Any]] = {}
+        self._evaluations_invocation: str | None = None
+
     def _match_by_action(self, action: str, condition_value: Any, context_value: Any) -> bool:
+        condition = CompiledCondition(
+            key="",
+            action=action,
+            match=compile_comparator(action, condition_value),
+            time_based=False,
+        )
+        return self._match_condition(condition=condition, context_value=context_value)
+
+    def _match_condition(self, condition: CompiledCondition, context_value: Any) -> bool:
         try:
-            func = RULE_ACTION_MAPPING.get(action, lambda a, b: False)
-            return func(context_value, condition_value)
+            return condition.match(context_value)
         except Exception as exc:
-            self.logger.debug(f"caught exception while matching action: action={action}, exception={str(exc)}")
+            self.logger.debug(
+                f"caught exception while matching action: action={condition.action}, exception={str(exc)}",
+            )
 
             handler = self._lookup_exception_handler(exc)
             if handler:
@@ -102,71 +101,118 @@ class FeatureFlags:
         context: dict[str, Any],
     ) -> bool:
         """Evaluates whether context matches conditions, return False otherwise"""
-        rule_match_value = rule.get(schema.RULE_MATCH_VALUE)
-        conditions = cast(List[dict], rule.get(schema.CONDITIONS_KEY))
+        return self._match_rule(feature_name=feature_name, rule=compile_rule(rule_name, rule), context=context)
+
+    def _match_rule(
+        self,
+        feature_name: str,
+        rule: CompiledRule,
+        context: dict[str, Any],
+        matches: dict[int, Any] | None = None,
+    ) -> bool:
+        """Evaluates whether context matches compiled rule conditions, return False otherwise
 
-        if not conditions:
+        When `matches` is set, results of conditions shared across rules and features are reused from it.
+        """
+        if not rule.conditions:
             self.logger.debug(
-                f"rule did not match, no conditions to match, rule_name={rule_name}, rule_value={rule_match_value}, "
+                f"rule did not match, no conditions to match, rule_name={rule.name}, rule_value={rule.match_value}, "
                 f"name={feature_name} ",
             )
             return False
 
-        for condition in conditions:
-            context_value = context.get(condition.get(schema.CONDITION_KEY, ""))
-            cond_action = condition.get(schema.CONDITION_ACTION, "")
-            cond_value = condition.get(schema.CONDITION_VALUE)
+        for condition in rule.conditions:
+            # time based rule actions have no user context. the context is the condition key, e.g., CURRENT_TIME
+            context_value = condition.key if condition.time_based else context.get(condition.key)
 
-            # time based rule actions have no user context. the context is the condition key
-            if cond_action in (
-                schema.RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value,
-                schema.RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE.value,
-                schema.RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK.value,
-            ):
-                context_value = condition.get(schema.CONDITION_KEY)  # e.g., CURRENT_TIME
+            if matches is None:
+                matched = self._match_condition(condition=condition, context_value=context_value)
+            elif id(condition) in matches:
+                matched = matches[id(condition)]
+            else:
+                matched = matches[id(condition)] = self._match_condition(condition, context_value)
 
-            if not self._match_by_action(action=cond_action, condition_value=cond_value, context_value=context_value):
+            if not matched:
                 self.logger.debug(
-                    f"rule did not match action, rule_name={rule_name}, rule_value={rule_match_value}, "
+                    f"rule did not match action, rule_name={rule.name}, rule_value={rule.match_value}, "
                     f"name={feature_name}, context_value={str(context_value)} ",
                 )
                 return False  # context doesn't match condition
 
-        self.logger.debug(f"rule matched, rule_name={rule_name}, rule_value={rule_match_value}, name={feature_name}")
+        self.logger.debug(f"rule matched, rule_name={rule.name}, rule_value={rule.match_value}, name={feature_name}")
         return True
 
     def _evaluate_rules(
         self,
         *,
-        feature_name: str,
+        feature: CompiledFeature,
         context: dict[str, Any],
-        feat_default: Any,
-        rules: dict[str, Any],
-        boolean_feature: bool,
-    ) -> bool:
+        matches: dict[int, Any] | None = None,
+    ) -> Any:
         """Evaluates whether context matches rules and conditions, otherwise return feature default"""
-        for rule_name, rule in rules.items():
-            rule_match_value = rule.get(schema.RULE_MATCH_VALUE)
-
+        for rule in feature.rules:
             # Context might contain PII data; do not log its value
             self.logger.debug(
-                f"Evaluating rule matching, rule={rule_name}, feature={feature_name}, default={str(feat_default)}, boolean_feature={boolean_feature}",  # noqa: E501
+                f"Evaluating rule matching, rule={rule.name}, feature={feature.name}, default={str(feature.default)}, boolean_feature={feature.boolean_feature}",  # noqa: E501
             )
-            if self._evaluate_conditions(rule_name=rule_name, feature_name=feature_name, rule=rule, context=context):
+            if self._match_rule(feature_name=feature.name, rule=rule, context=context, matches=matches):
                 # Maintenance: Revisit before going GA.
-                return bool(rule_match_value) if boolean_feature else rule_match_value
+                return bool(rule.match_value) if feature.boolean_feature else rule.match_value
 
         # no rule matched, return default value of feature
         self.logger.debug(
-            f"no rule matched, returning feature default, default={str(feat_default)}, name={feature_name}, boolean_feature={boolean_feature}",  # noqa: E501
+            f"no rule matched, returning feature default, default={str(feature.default)}, name={feature.name}, boolean_feature={feature.boolean_feature}",  # noqa: E501
         )
-        return feat_default
+        return feature.default
+
+    def _evaluate_feature(
+        self,
+        feature: CompiledFeature,
+        context: dict[str, Any],
+        matches: dict[int, Any] | None = None,
+    ) -> Any:
+        """Evaluates feature value, as when rules match or its default otherwise"""
+        # Maintenance: Revisit before going GA. We might to simplify customers on-boarding by not requiring it
+        # for non-boolean flags. It'll need minor implementation changes, docs changes, and maybe refactor
+        # get_enabled_features. We can minimize breaking change, despite Beta label, by having a new
+        # method `get_matching_features` returning dict[feature_name, feature_value]
+        if not feature.rules:
+            self.logger.debug(
+                f"no rules found, returning feature default, name={feature.name}, default={str(feature.default)}, boolean_feature={feature.boolean_feature}",  # noqa: E501
+            )
+            # Maintenance: Revisit before going GA. We might to simplify customers on-boarding by not requiring it
+            # for non-boolean flags.
+            return bool(feature.default) if feature.boolean_feature else feature.default
+
+        self.logger.debug(
+            f"looking for rule match, name={feature.name}, default={str(feature.default)}, boolean_feature={feature.boolean_feature}",  # noqa: E501
+        )
+        return self._evaluate_rules(feature=feature, context=context, matches=matches)
+
+    def _is_current_configuration(self, config: dict) -> bool:
+        # Stores return the same payload until they fetch a new one, e.g. AppConfigStore within max_age.
+        # We compare values with a copy rather than identity, as custom stores may change their payload in place
+        return self._configuration is not None and config == self._configuration
+
+    def _get_features(self) -> dict[str, CompiledFeature]:
+        """Get features compiled from the configuration in store, compiling them again only when it changes"""
+        config = self.get_configuration()
+        if not self._is_current_configuration(config):
+            self.logger.debug("Compiling feature flags configuration")
+            self._features = compile_features(config)
+            self._configuration = copy.deepcopy(config)
+            self._evaluations.clear()
+
+        return self._features
 
     def get_configuration(self) -> dict:
         """Get validated feature flag schema from configured store.
 
         Largely used to aid testing, since it's called by `evaluate` and `get_enabled_features` methods.
 
+        Configuration is validated once per payload returned by the store, and compiled for evaluation until
+        the store returns a new one.
+
         Raises
         ------
         ConfigurationStoreError
@@ -207,6 +253,10 @@ class FeatureFlags:
         # parse result conf as JSON, keep in cache for max age defined in store
         self.logger.debug(f"Fetching schema from registered store, store={self.store}")
         config: dict = self.store.get_configuration()
+        if self._is_current_configuration(config):
+            self.logger.debug("Configuration hasn't changed since it was compiled, skipping schema validation")
+            return config
+
         validator = schema.SchemaValidator(schema=config, logger=self.logger)
         validator.validate()
 
@@ -289,7 +339,7 @@ class FeatureFlags:
             context = {}
 
         try:
-            features = self.get_configuration()
+            features = self._get_features()
         except ConfigurationStoreError as err:
             self.logger.debug(f"Failed to fetch feature flags from store, returning default provided, reason={err}")
             return default
@@ -299,34 +349,7 @@ class FeatureFlags:
             self.logger.debug(f"Feature not found; returning default provided, name={name}, default={default}")
             return default
 
-        rules = feature.get(schema.RULES_KEY)
-        feat_default = feature.get(schema.FEATURE_DEFAULT_VAL_KEY)
-        # Maintenance: Revisit before going GA. We might to simplify customers on-boarding by not requiring it
-        # for non-boolean flags. It'll need minor implementation changes, docs changes, and maybe refactor
-        # get_enabled_features. We can minimize breaking change, despite Beta label, by having a new
-        # method `get_matching_features` returning dict[feature_name, feature_value]
-        boolean_feature = feature.get(
-            schema.FEATURE_DEFAULT_VAL_TYPE_KEY,
-            True,
-        )  # backwards compatibility, assume feature flag
-        if not rules:
-            self.logger.debug(
-                f"no rules found, returning feature default, name={name}, default={str(feat_default)}, boolean_feature={boolean_feature}",  # noqa: E501
-            )
-            # Maintenance: Revisit before going GA. We might to simplify customers on-boarding by not requiring it
-            # for non-boolean flags.
-            return bool(feat_default) if boolean_feature else feat_default
-
-        self.logger.debug(
-            f"looking for rule match, name={name}, default={str(feat_default)}, boolean_feature={boolean_feature}",  # noqa: E501
-        )
-        return self._evaluate_rules(
-            feature_name=name,
-            context=context,
-            feat_default=feat_default,
-            rules=rules,
-            boolean_feature=boolean_feature,
-        )
+        return self._evaluate_feature(feature=feature, context=context)
 
     def get_enabled_features(self, *, context: dict[str, Any] | None = None) -> list[str]:
         """Get all enabled feature flags while also taking into account context
@@ -360,35 +383,116 @@ class FeatureFlags:
         features_enabled: list[str] = []
 
         try:
-            features: dict[str, Any] = self.get_configuration()
+            features = self._get_features()
         except ConfigurationStoreError as err:
             self.logger.debug(f"Failed to fetch feature flags from store, returning empty list, reason={err}")
             return features_enabled
 
         self.logger.debug("Evaluating all features")
+        matches: dict[int, Any] = {}
         for name, feature in features.items():
-            rules = feature.get(schema.RULES_KEY, {})
-            feature_default_value = feature.get(schema.FEATURE_DEFAULT_VAL_KEY)
-            boolean_feature = feature.get(
-                schema.FEATURE_DEFAULT_VAL_TYPE_KEY,
-                True,
-            )  # backwards compatibility, assume feature flag
-
-            if feature_default_value and not rules:
+            if feature.default and not feature.rules:
                 self.logger.debug(f"feature is enabled by default and has no defined rules, name={name}")
                 features_enabled.append(name)
-            elif self._evaluate_rules(
-                feature_name=name,
-                context=context,
-                feat_default=feature_default_value,
-                rules=rules,
-                boolean_feature=boolean_feature,
-            ):
+            elif self._evaluate_rules(feature=feature, context=context, matches=matches):
                 self.logger.debug(f"feature's calculated value is True, name={name}")
                 features_enabled.append(name)
 
         return features_enabled
 
+    def evaluate_all(self, *, context: dict[str, Any] | None = None, cache: bool = False) -> dict[str, JSONType]:
+        """Evaluate all features in a single pass, including non-boolean features
+
+        Each feature is evaluated as in `evaluate`. Conditions shared across rules and features, e.g. the same
+        customer tier, are matched once per pass.
+
+        Parameters
+        ----------
+        context: dict[str, Any] | None
+            Attributes that should be evaluated against the stored schema.
+
+            for example: `{"tenant_id": "X", "username": "Y", "region": "Z"}`
+        cache: bool
+            Whether to reuse values for the same context within the current Lambda invocation, by default False.
+            Values are evaluated again when the store returns a new configuration.
+
+        Examples
+        --------
+
+        ```python
+        from aws_lambda_powertools.utilities.feature_flags import AppConfigStore, FeatureFlags
+        from aws_lambda_powertools.utilities.typing import LambdaContext
+
+        app_config = AppConfigStore(environment="dev", application="product-catalogue", name="features")
+
+        feature_flags = FeatureFlags(store=app_config)
+
+
+        def lambda_handler(event: dict, context: LambdaContext):
+            ctx = {"tier": event.get("tier", "standard")}
+
+            features = feature_flags.evaluate_all(context=ctx, cache=True)
+            if features["premium_features"]:
+                # enable premium features
+                ...
+        ```
+
+        Returns
+        ------
+        dict[str, JSONType]
+            value of every feature by name, or an empty dict when the configuration can't be fetched
+
+            **Example**
+
+        ```python
+        {"premium_features": True, "ten_percent_off_campaign": False, "discount_percentage": 10}
+        ```
+
+        Raises
+        ------
+        SchemaValidationError
+            When schema doesn't conform with feature flag schema
+        """
+        if context is None:
+            context = {}
+
+        try:
+            features = self._get_features()
+        except ConfigurationStoreError as err:
+            self.logger.debug(f"Failed to fetch feature flags from store, returning no features, reason={err}")
+            return {}
+
+        cache_key = self._get_evaluations_cache_key(context) if cache else None
+        if cache_key is not None and cache_key in self._evaluations:
+            self.logger.debug("Returning features evaluated for the same context in this invocation")
+            return dict(self._evaluations[cache_key])
+
+        self.logger.debug("Evaluating all features")
+        matches: dict[int, Any] = {}
+        values = {
+            name: self._evaluate_feature(feature=feature, context=context, matches=matches)
+            for name, feature in features.items()
+        }
+
+        if cache_key is not None:
+            self._evaluations[cache_key] = values
+            return dict(values)
+
+        return values
+
+    def _get_evaluations_cache_key(self, context: dict[str, Any]) -> str | None:
+        # Lambda sets a new trace id on every invocation, so cached values don't outlive it
+        invocation = os.getenv(constants.XRAY_TRACE_ID_ENV)
+        if invocation != self._evaluations_invocation:
+            self._evaluations.clear()
+            self._evaluations_invocation = invocation
+
+        try:
+            return json.dumps(context, sort_keys=True)
+        except (TypeError, ValueError):
+            self.logger.debug("Context isn't JSON serializable, evaluating features without cache")
+            return None
+
     def validation_exception_handler(self, exc_class: Exception | list[Exception]):
         """Registers function to handle unexpected validation exceptions when evaluating flags.
 
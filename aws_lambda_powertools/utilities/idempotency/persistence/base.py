@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING, Any
 
 import jmespath
 
-from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared import constants, json_backend
 from aws_lambda_powertools.shared.cache_dict import LRUDict
 from aws_lambda_powertools.shared.json_encoder import Encoder
 from aws_lambda_powertools.utilities.idempotency.exceptions import (
@@ -263,7 +263,7 @@ class BasePersistenceLayer(ABC):
             # See: https://github.com/aws-powertools/powertools-lambda-python/issues/2465
             return None
 
-        response_data = json.dumps(result, cls=Encoder, sort_keys=True)
+        response_data = json_backend.dumps(result, sort_keys=True)
 
         data_record = DataRecord(
             idempotency_key=idempotency_key,
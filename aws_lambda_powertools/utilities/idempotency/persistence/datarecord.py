@@ -9,6 +9,8 @@ import json
 import logging
 from types import MappingProxyType
 
+from aws_lambda_powertools.shared import json_backend
+
 logger = logging.getLogger(__name__)
 
 STATUS_CONSTANTS = MappingProxyType({"INPROGRESS": "INPROGRESS", "COMPLETED": "COMPLETED", "EXPIRED": "EXPIRED"})
@@ -91,7 +93,14 @@ class DataRecord:
         dict | None
             previous response data deserialized
         """
-        return json.loads(self.response_data) if self.response_data else None
+        if not self.response_data:
+            return None
+
+        try:
+            return json_backend.loads(self.response_data)
+        except json.JSONDecodeError:
+            # records stored by previous versions may contain NaN/Infinity, which only stdlib json accepts
+            return json.loads(self.response_data)
 
     def get_expiration_datetime(self) -> datetime.datetime | None:
         """
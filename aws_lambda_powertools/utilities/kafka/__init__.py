@@ -0,0 +1,38 @@
+"""Deserialize Kafka records encoded with a schema registry"""
+
+from aws_lambda_powertools.utilities.kafka.consumer import KafkaConsumer, KafkaConsumerRecord
+from aws_lambda_powertools.utilities.kafka.deserializer import (
+    SchemaRegistryDeserializer,
+    avro_decoder,
+    json_decoder,
+    protobuf_decoder,
+    validating_json_decoder,
+)
+from aws_lambda_powertools.utilities.kafka.exceptions import (
+    KafkaDeserializationError,
+    SchemaNotFoundError,
+    SchemaRegistryError,
+)
+from aws_lambda_powertools.utilities.kafka.schema_registry import (
+    BaseSchemaSource,
+    ConfluentSchemaRegistrySource,
+    InMemorySchemaSource,
+    Schema,
+)
+
+__all__ = [
+    "BaseSchemaSource",
+    "ConfluentSchemaRegistrySource",
+    "InMemorySchemaSource",
+    "KafkaConsumer",
+    "KafkaConsumerRecord",
+    "KafkaDeserializationError",
+    "Schema",
+    "SchemaNotFoundError",
+    "SchemaRegistryDeserializer",
+    "SchemaRegistryError",
+    "avro_decoder",
+    "json_decoder",
+    "protobuf_decoder",
+    "validating_json_decoder",
+]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import base64
+from typing import Any, Callable
+
+from aws_lambda_powertools.utilities.data_classes.kafka_event import KafkaEvent, KafkaEventRecord
+from aws_lambda_powertools.utilities.kafka.exceptions import KafkaDeserializationError
+
+
+class KafkaConsumerRecord(KafkaEventRecord):
+    """Kafka event record with its key and value deserialized"""
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        deserialized_key: Any,
+        deserialized_value: Any,
+        json_deserializer: Callable | None = None,
+    ):
+        super().__init__(data, json_deserializer=json_deserializer)
+        self._deserialized_key = deserialized_key
+        self._deserialized_value = deserialized_value
+
+    @property
+    def deserialized_key(self) -> Any:
+        """Record key deserialized with the key deserializer, raw bytes without one, or None when it's absent"""
+        return self._deserialized_key
+
+    @property
+    def deserialized_value(self) -> Any:
+        """Record value deserialized with the value deserializer, or None when it's absent (tombstone)"""
+        return self._deserialized_value
+
+
+class KafkaConsumer:
+    """Deserialize keys and values of all records in a Kafka event
+
+    Parameters
+    ----------
+    value_deserializer : Callable[[bytes], Any]
+        Function deserializing record values, e.g. a `SchemaRegistryDeserializer`
+    key_deserializer : Callable[[bytes], Any], optional
+        Function deserializing record keys; keys are kept as raw bytes by default
+
+    Example
+    -------
+    **Deserialize keys and values with a schema registry**
+
+        >>> from aws_lambda_powertools.utilities.kafka import KafkaConsumer, SchemaRegistryDeserializer
+        >>>
+        >>> deserializer = SchemaRegistryDeserializer(schema_source)
+        >>> consumer = KafkaConsumer(value_deserializer=deserializer, key_deserializer=deserializer)
+        >>>
+        >>> def lambda_handler(event: dict, context):
+        >>>     for record in consumer.deserialize_records(event):
+        >>>         print(record.deserialized_key, record.deserialized_value)
+    """
+
+    def __init__(
+        self,
+        value_deserializer: Callable[[bytes], Any],
+        key_deserializer: Callable[[bytes], Any] | None = None,
+    ):
+        self.value_deserializer = value_deserializer
+        self.key_deserializer = key_deserializer
+
+    def deserialize_records(self, event: KafkaEvent | dict[str, Any]) -> list[KafkaConsumerRecord]:
+        """Deserialize all records in a single pass, across topic partitions
+
+        Raises
+        ------
+        KafkaDeserializationError
+            When a record key or value can't be deserialized, naming the record topic, partition and offset
+        """
+        if not isinstance(event, KafkaEvent):
+            event = KafkaEvent(event)
+
+        return [
+            self._deserialize_record(record, json_deserializer=event._json_deserializer)
+            for records in event["records"].values()
+            for record in records
+        ]
+
+    def _deserialize_record(self, record: dict[str, Any], json_deserializer: Callable) -> KafkaConsumerRecord:
+        try:
+            key = self._deserialize(record.get("key"), self.key_deserializer)
+            value = self._deserialize(record.get("value"), self.value_deserializer)
+        except Exception as exc:
+            raise KafkaDeserializationError(
+                f"Unable to deserialize record at topic {record.get('topic')}, "
+                f"partition {record.get('partition')}, offset {record.get('offset')}: {exc}",
+            ) from exc
+
+        return KafkaConsumerRecord(record, key, value, json_deserializer=json_deserializer)
+
+    @staticmethod
+    def _deserialize(data: str | None, deserializer: Callable[[bytes], Any] | None) -> Any:
+        if data is None:
+            return None
+
+        decoded = base64.b64decode(data)
+        return deserializer(decoded) if deserializer is not None else decoded
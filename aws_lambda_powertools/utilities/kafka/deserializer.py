@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Callable
+
+from aws_lambda_powertools.utilities.kafka.exceptions import KafkaDeserializationError
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.kafka.schema_registry import BaseSchemaSource, Schema
+
+logger = logging.getLogger(__name__)
+
+# Confluent wire format: magic byte, then the schema id as a 4 bytes big-endian integer
+MAGIC_BYTE = 0
+HEADER_SIZE = 5
+
+Decoder = Callable[[memoryview], Any]
+DecoderFactory = Callable[["Schema"], Decoder]
+
+
+def json_decoder(schema: Schema) -> Decoder:
+    """Decode JSON Schema encoded payloads as JSON, without validating them"""
+    return lambda payload: json.loads(bytes(payload))
+
+
+def validating_json_decoder(schema: Schema) -> Decoder:
+    """Decode JSON Schema encoded payloads as JSON, validating them against their compiled schema
+
+    Requires `fastjsonschema`, installed with the `validation` extra.
+    """
+    try:
+        import fastjsonschema  # type: ignore
+    except ImportError as exc:
+        raise ImportError("Install 'fastjsonschema' to validate JSON Schema encoded records") from exc
+
+    validate = fastjsonschema.compile(json.loads(schema.schema))
+    return lambda payload: validate(json.loads(bytes(payload)))
+
+
+def avro_decoder(schema: Schema) -> Decoder:
+    """Decode Avro encoded payloads as dicts with their parsed writer schema
+
+    Requires `fastavro`.
+    """
+    try:
+        import fastavro
+    except ImportError as exc:
+        raise ImportError("Install 'fastavro' to decode Avro encoded records") from exc
+
+    parsed_schema = fastavro.parse_schema(json.loads(schema.schema))
+    return lambda payload: fastavro.schemaless_reader(io.BytesIO(payload), parsed_schema)
+
+
+def protobuf_decoder(message_type: Any) -> DecoderFactory:
+    """Decode Protobuf encoded payloads with a generated message class
+
+    Protobuf schemas need to be compiled ahead of time, so records are parsed with your generated message class.
+
+    Parameters
+    ----------
+    message_type : type[google.protobuf.message.Message]
+        Generated Protobuf message class, e.g. `order_pb2.Order`
+
+    Example
+    -------
+    **Decode Protobuf records**
+
+        >>> from aws_lambda_powertools.utilities.kafka import SchemaRegistryDeserializer, protobuf_decoder
+        >>>
+        >>> deserializer = SchemaRegistryDeserializer(
+        >>>     schema_source=schema_source,
+        >>>     decoders={"PROTOBUF": protobuf_decoder(order_pb2.Order)},
+        >>> )
+    """
+
+    def factory(schema: Schema) -> Decoder:
+        return lambda payload: message_type.FromString(bytes(_skip_message_indexes(payload)))
+
+    return factory
+
+
+DEFAULT_DECODERS: dict[str, DecoderFactory] = {
+    "AVRO": avro_decoder,
+    "JSON": json_decoder,
+}
+
+
+class SchemaRegistryDeserializer:
+    """Deserialize Kafka record keys or values encoded with a schema registry (Confluent wire format)
+
+    Schemas are fetched from `schema_source` and compiled into decoders once per schema id,
+    then cached for the lifetime of the deserializer. Create it outside your Lambda handler
+    to reuse decoders across invocations.
+
+    Parameters
+    ----------
+    schema_source : BaseSchemaSource
+        Source of schemas by schema id, e.g. `ConfluentSchemaRegistrySource` or `InMemorySchemaSource`
+    decoders : dict[str, DecoderFactory], optional
+        Decoder factories by schema type, merged with the defaults for "AVRO" and "JSON".
+        A factory receives a `Schema` and returns a function decoding a payload without its header.
+
+    Example
+    -------
+    **Deserialize Avro record values from a schema registry**
+
+        >>> from aws_lambda_powertools.utilities.data_classes import KafkaEvent, event_source
+        >>> from aws_lambda_powertools.utilities.kafka import (
+        >>>     ConfluentSchemaRegistrySource,
+        >>>     KafkaConsumer,
+        >>>     SchemaRegistryDeserializer,
+        >>> )
+        >>>
+        >>> deserializer = SchemaRegistryDeserializer(ConfluentSchemaRegistrySource("https://registry.example.com"))
+        >>> consumer = KafkaConsumer(value_deserializer=deserializer)
+        >>>
+        >>> @event_source(data_class=KafkaEvent)
+        >>> def lambda_handler(event: KafkaEvent, context):
+        >>>     for record in consumer.deserialize_records(event):
+        >>>         process_order(record.deserialized_value)
+    """
+
+    def __init__(self, schema_source: BaseSchemaSource, decoders: dict[str, DecoderFactory] | None = None):
+        self.schema_source = schema_source
+        self.decoders = {**DEFAULT_DECODERS, **(decoders or {})}
+        self._decoders_cache: dict[int, Decoder] = {}
+
+    def __call__(self, data: bytes) -> Any:
+        return self.deserialize(data)
+
+    def deserialize(self, data: bytes) -> Any:
+        """Deserialize data prefixed with the magic byte and schema id
+
+        Raises
+        ------
+        KafkaDeserializationError
+            When data isn't in Confluent wire format, its schema can't be found, or decoding fails
+        """
+        view = memoryview(data)
+        if len(view) < HEADER_SIZE or view[0] != MAGIC_BYTE:
+            raise KafkaDeserializationError("Data isn't in Confluent wire format: magic byte or schema id is missing")
+
+        schema_id = int.from_bytes(view[1:HEADER_SIZE], "big")
+        decoder = self._decoders_cache.get(schema_id) or self.get_decoder(schema_id)
+        try:
+            return decoder(view[HEADER_SIZE:])
+        except Exception as exc:
+            raise KafkaDeserializationError(f"Unable to decode data with schema id {schema_id}: {exc}") from exc
+
+    def get_decoder(self, schema_id: int) -> Decoder:
+        """Fetch and compile the decoder for a schema id, caching it for later records"""
+        decoder = self._decoders_cache.get(schema_id)
+        if decoder is not None:
+            return decoder
+
+        schema = self.schema_source.get_schema(schema_id)
+        try:
+            factory = self.decoders[schema.schema_type]
+        except KeyError:
+            raise KafkaDeserializationError(
+                f"No decoder for schema type '{schema.schema_type}' of schema id {schema_id}. "
+                f"Supported schema types are: {', '.join(self.decoders)}",
+            ) from None
+
+        logger.debug(f"Compiling decoder for schema id {schema_id} ({schema.schema_type})")
+        decoder = self._decoders_cache[schema_id] = factory(schema)
+        return decoder
+
+    def clear_cache(self) -> None:
+        self._decoders_cache.clear()
+
+
+def _skip_message_indexes(payload: memoryview) -> memoryview:
+    """Skip the Protobuf message indexes that follow the header, as zigzag encoded varints"""
+    count, position = _read_varint(payload, 0)
+    count = (count >> 1) ^ -(count & 1)
+    for _ in range(count):  # a single 0 means the first message in the schema, i.e. [0]
+        _, position = _read_varint(payload, position)
+    return payload[position:]
+
+
+def _read_varint(data: memoryview, position: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
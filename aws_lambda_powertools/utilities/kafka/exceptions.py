@@ -0,0 +1,10 @@
+class KafkaDeserializationError(Exception):
+    """When a Kafka record key or value can't be deserialized"""
+
+
+class SchemaNotFoundError(KafkaDeserializationError):
+    """When a schema id isn't found in the schema source"""
+
+
+class SchemaRegistryError(KafkaDeserializationError):
+    """When the schema registry can't be reached or returns an unexpected response"""
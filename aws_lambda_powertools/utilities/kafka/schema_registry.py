@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import urllib.error
+import urllib.request
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable
+
+from aws_lambda_powertools.utilities.kafka.exceptions import SchemaNotFoundError, SchemaRegistryError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Schema:
+    """Schema registered under a schema id
+
+    Parameters
+    ----------
+    schema_id : int
+        Schema id, as found in the Confluent wire format header
+    schema : str
+        Schema definition, e.g. an Avro schema or a JSON Schema document
+    schema_type : str
+        One of "AVRO", "JSON" or "PROTOBUF"; schema registries default to "AVRO"
+    """
+
+    schema_id: int
+    schema: str
+    schema_type: str = "AVRO"
+
+
+class BaseSchemaSource(ABC):
+    """Source of schemas by schema id, e.g. a schema registry
+
+    Schemas are immutable once registered, so deserializers fetch each schema id only once.
+    """
+
+    @abstractmethod
+    def get_schema(self, schema_id: int) -> Schema:
+        """Retrieve the schema registered under a schema id
+
+        Raises
+        ------
+        SchemaNotFoundError
+            When no schema is registered under that schema id
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+
+class InMemorySchemaSource(BaseSchemaSource):
+    """Schemas known upfront, e.g. bundled with your function or standing in for a schema registry in tests
+
+    Example
+    -------
+    **Decode records with a local schema**
+
+        >>> from aws_lambda_powertools.utilities.kafka import InMemorySchemaSource, Schema
+        >>>
+        >>> schema_source = InMemorySchemaSource([Schema(schema_id=1, schema=ORDER_SCHEMA, schema_type="JSON")])
+    """
+
+    def __init__(self, schemas: Iterable[Schema] = ()):
+        self._schemas = {schema.schema_id: schema for schema in schemas}
+
+    def register(self, schema: Schema) -> None:
+        self._schemas[schema.schema_id] = schema
+
+    def get_schema(self, schema_id: int) -> Schema:
+        try:
+            return self._schemas[schema_id]
+        except KeyError:
+            raise SchemaNotFoundError(f"Schema id {schema_id} not found") from None
+
+
+class ConfluentSchemaRegistrySource(BaseSchemaSource):
+    """Schemas fetched from a Confluent compatible schema registry REST API
+
+    Parameters
+    ----------
+    url : str
+        Schema registry URL, e.g. `https://schema-registry.example.com`
+    basic_auth : tuple[str, str], optional
+        Username (or API key) and password (or API secret) for HTTP basic authentication
+    headers : dict[str, str], optional
+        Additional HTTP headers sent with each request
+    timeout : float, optional
+        Request timeout in seconds, by default 5
+    """
+
+    def __init__(
+        self,
+        url: str,
+        basic_auth: tuple[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 5,
+    ):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.headers = {"Accept": "application/vnd.schemaregistry.v1+json, application/json", **(headers or {})}
+        if basic_auth:
+            credentials = base64.b64encode(":".join(basic_auth).encode()).decode()
+            self.headers["Authorization"] = f"Basic {credentials}"
+
+    def get_schema(self, schema_id: int) -> Schema:
+        logger.debug(f"Fetching schema id {schema_id} from schema registry")
+        request = urllib.request.Request(f"{self.url}/schemas/ids/{schema_id}", headers=self.headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:  # noqa: S310 # user provided URL
+                body = json.load(response)
+            return Schema(schema_id=schema_id, schema=body["schema"], schema_type=body.get("schemaType", "AVRO"))
+        except urllib.error.HTTPError as exc:
+            if exc.code == 404:
+                raise SchemaNotFoundError(f"Schema id {schema_id} not found") from exc
+            raise SchemaRegistryError(f"Schema registry returned HTTP {exc.code} for schema id {schema_id}") from exc
+        except (urllib.error.URLError, OSError, ValueError, KeyError, TypeError) as exc:
+            raise SchemaRegistryError(f"Unable to fetch schema id {schema_id} from schema registry") from exc
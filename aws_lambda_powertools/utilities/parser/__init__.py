@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field, ValidationError, field_validator, model_v
 from aws_lambda_powertools.utilities.parser import envelopes
 from aws_lambda_powertools.utilities.parser.envelopes import BaseEnvelope
 from aws_lambda_powertools.utilities.parser.parser import event_parser, parse
+from aws_lambda_powertools.utilities.parser.types import ParsedRecords, RecordError
 
 __all__ = [
     "event_parser",
@@ -17,4 +18,6 @@ __all__ = [
     "field_validator",
     "model_validator",
     "ValidationError",
+    "ParsedRecords",
+    "RecordError",
 ]
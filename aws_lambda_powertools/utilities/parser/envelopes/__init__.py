@@ -1,18 +1,23 @@
-from .apigw import ApiGatewayEnvelope
-from .apigwv2 import ApiGatewayV2Envelope
-from .base import BaseEnvelope
-from .bedrock_agent import BedrockAgentEnvelope
-from .cloudwatch import CloudWatchLogsEnvelope
-from .dynamodb import DynamoDBStreamEnvelope
-from .event_bridge import EventBridgeEnvelope
-from .kafka import KafkaEnvelope
-from .kinesis import KinesisDataStreamEnvelope
-from .kinesis_firehose import KinesisFirehoseEnvelope
-from .lambda_function_url import LambdaFunctionUrlEnvelope
-from .sns import SnsEnvelope, SnsSqsEnvelope
-from .sqs import SqsEnvelope
-from .vpc_lattice import VpcLatticeEnvelope
-from .vpc_latticev2 import VpcLatticeV2Envelope
+from typing import TYPE_CHECKING
+
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .apigw import ApiGatewayEnvelope
+    from .apigwv2 import ApiGatewayV2Envelope
+    from .base import BaseEnvelope
+    from .bedrock_agent import BedrockAgentEnvelope
+    from .cloudwatch import CloudWatchLogsEnvelope
+    from .dynamodb import DynamoDBStreamEnvelope
+    from .event_bridge import EventBridgeEnvelope
+    from .kafka import KafkaEnvelope
+    from .kinesis import KinesisDataStreamEnvelope
+    from .kinesis_firehose import KinesisFirehoseEnvelope
+    from .lambda_function_url import LambdaFunctionUrlEnvelope
+    from .sns import SnsEnvelope, SnsSqsEnvelope
+    from .sqs import SqsEnvelope
+    from .vpc_lattice import VpcLatticeEnvelope
+    from .vpc_latticev2 import VpcLatticeV2Envelope
 
 __all__ = [
     "ApiGatewayEnvelope",
@@ -32,3 +37,27 @@ __all__ = [
     "VpcLatticeEnvelope",
     "VpcLatticeV2Envelope",
 ]
+
+# exports are imported on first access, so importing the package doesn't load every module
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_exports(
+        globals(),
+        {
+            "ApiGatewayEnvelope": ".apigw",
+            "ApiGatewayV2Envelope": ".apigwv2",
+            "BaseEnvelope": ".base",
+            "BedrockAgentEnvelope": ".bedrock_agent",
+            "CloudWatchLogsEnvelope": ".cloudwatch",
+            "DynamoDBStreamEnvelope": ".dynamodb",
+            "EventBridgeEnvelope": ".event_bridge",
+            "KafkaEnvelope": ".kafka",
+            "KinesisDataStreamEnvelope": ".kinesis",
+            "KinesisFirehoseEnvelope": ".kinesis_firehose",
+            "LambdaFunctionUrlEnvelope": ".lambda_function_url",
+            "SnsEnvelope": ".sns",
+            "SnsSqsEnvelope": ".sns",
+            "SqsEnvelope": ".sqs",
+            "VpcLatticeEnvelope": ".vpc_lattice",
+            "VpcLatticeV2Envelope": ".vpc_latticev2",
+        },
+    )
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import functools
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, TypeVar
+
+from pydantic import Json, TypeAdapter, ValidationError
+from typing_extensions import TypedDict
 
 from aws_lambda_powertools.utilities.parser.functions import (
     _parse_and_validate_event,
+    _retrieve_or_set_envelope_adapter,
     _retrieve_or_set_model_from_cache,
 )
+from aws_lambda_powertools.utilities.parser.types import ParsedRecords, RecordError
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.parser.types import T
@@ -63,6 +69,162 @@ class BaseEnvelope(ABC):
         """
         return NotImplemented  # pragma: no cover
 
+    def parse_single_pass(self, data: dict[str, Any] | Any | None, model: type[T]):
+        """Parses data within the envelope against model provided, without validating the envelope itself
+
+        Envelopes supporting it validate only the fields they extract data from, and JSON payloads
+        against the model, in a single validation pass. Envelopes that don't fall back to `parse`.
+
+        NOTE: Call `_parse_single_pass` method with the composite type to validate, e.g. {"detail": model}.
+        """
+        return self.parse(data=data, model=model)
+
+    def _parse_single_pass(
+        self,
+        data: dict[str, Any] | Any | None,
+        model: type[T],
+        build_type: Callable[[Any], Any],
+        extract: Callable[[Any], Any],
+    ) -> Any:
+        """Validates data against the composite type built for model, then extracts the parsed data
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[T]
+            Data model to parse data within the envelope against
+        build_type : Callable[[Any], Any]
+            Returns the composite type to validate the event with for a given model, cached per envelope and model
+        extract : Callable[[Any], Any]
+            Returns parsed data from the validated event
+
+        Returns
+        -------
+        Any
+            Parsed data
+        """
+        if isinstance(model, TypeAdapter):
+            logger.debug("Model is a TypeAdapter, parsing envelope and model separately")
+            return self.parse(data=data, model=model)
+
+        adapter = _retrieve_or_set_envelope_adapter(envelope=type(self), model=model, build_type=build_type)
+
+        logger.debug("Parsing event against envelope and model in a single pass")
+        try:
+            return extract(adapter.validate_python(data))
+        except NotImplementedError:
+            # See: https://github.com/aws-powertools/powertools-lambda-python/issues/5303
+            logger.debug("Falling back to parsing envelope and model separately due to Pydantic implementation")
+            return self.parse(data=data, model=model)
+
+    def parse_tolerant(self, data: dict[str, Any] | Any | None, model: type[T]) -> ParsedRecords:
+        """Parses each record within the envelope against model provided, collecting errors instead of raising
+
+        Envelopes with records validate each record separately, so a malformed record doesn't fail
+        the entire event. Errors not specific to a record, e.g. the event has no records, are still raised.
+        Other envelopes, e.g. EventBridge, parse the entire event as a single record at index 0.
+
+        NOTE: Call `_parse_records_tolerant` method with the records found in the event.
+        """
+        return self._parse_records_tolerant(
+            records=[data],
+            parse_record=lambda event: self.parse(data=event, model=model),
+        )
+
+    def parse_lazy(self, data: dict[str, Any] | Any | None, model: type[T]) -> Iterator[Any]:
+        """Parses each record within the envelope against model provided, one at a time as they're iterated
+
+        Envelopes with records only check the event contains records upfront, deferring validation of each
+        record, and data within it, until it's consumed. Nothing is kept after a record is yielded.
+        Other envelopes, e.g. EventBridge, parse the entire event once iterated, yielding each item
+        when `parse` returns a list, or the parsed data otherwise.
+
+        NOTE: Return a generator calling `_parse` for each record found in the event.
+        """
+        parsed = self.parse(data=data, model=model)
+        if isinstance(parsed, list):
+            yield from parsed
+        else:
+            yield parsed
+
+    @staticmethod
+    def _parse_records_tolerant(
+        records: Iterable[Any],
+        parse_record: Callable[[Any], Any],
+        get_identifier: Callable[[Any], str] | None = None,
+    ) -> ParsedRecords:
+        """Parses each record, isolating validation errors per record
+
+        Parameters
+        ----------
+        records : Iterable[Any]
+            Records found in the event
+        parse_record : Callable[[Any], Any]
+            Validates a record and returns data parsed with model provided
+        get_identifier : Callable[[Any], str], optional
+            Returns a record identifier to report it as a batch item failure
+
+        Returns
+        -------
+        ParsedRecords
+            Data parsed from valid records, and errors for the ones that failed validation
+        """
+        result: ParsedRecords = ParsedRecords()
+        for index, record in enumerate(records):
+            try:
+                result.models[index] = parse_record(record)
+            except ValidationError as exc:
+                logger.debug(f"Record at index {index} failed validation")
+                result.errors.append(
+                    RecordError(
+                        index=index,
+                        record=record,
+                        error=exc,
+                        item_identifier=_get_item_identifier(record, get_identifier),
+                    ),
+                )
+
+        logger.debug(f"Parsed {len(result.models)} records, {len(result.errors)} failed validation")
+        return result
+
+
+def _get_item_identifier(record: Any, get_identifier: Callable[[Any], str] | None) -> str | None:
+    """Returns the record identifier, if available, as malformed records might not have one"""
+    if get_identifier is None:
+        return None
+
+    try:
+        return get_identifier(record)
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _records_adapter(key: str, records_type: Any) -> TypeAdapter:
+    return TypeAdapter(_build_typed_dict("EnvelopeRecords", {key: records_type}))
+
+
+def _get_records(data: dict[str, Any] | Any | None, key: str = "Records", records_type: Any = List[Any]) -> Any:
+    """Returns records found in the event under key, leaving each record validation to the envelope
+
+    Raises
+    ------
+    ValidationError
+        When the event has no records under key
+    """
+    return _records_adapter(key, records_type).validate_python(data)[key]
+
+
+def _build_typed_dict(name: str, fields: dict[str, Any]) -> Any:
+    """Builds a TypedDict at runtime, e.g. to validate only some fields of an event against a given model"""
+    return TypedDict(name, fields)  # type: ignore[operator]
+
+
+def _json_type(model: Any) -> Any:
+    """Builds a type parsing a JSON string against model within the same validation pass"""
+    return Json[model]  # type: ignore[misc]
+
 
 # Generic to support type annotations throughout parser
 # Note: Can't be defined under base.py due to circular dependency
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import base64
+import binascii
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
 
+from aws_lambda_powertools.shared.cloudwatch_logs import iter_log_events
 from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.models import CloudWatchLogsModel
+from aws_lambda_powertools.utilities.parser.models import CloudWatchLogsLogEvent, CloudWatchLogsModel
 
 if TYPE_CHECKING:
-    from aws_lambda_powertools.utilities.parser.types import Model
+    from aws_lambda_powertools.utilities.parser.types import Model, ParsedRecords
 
 logger = logging.getLogger(__name__)
 
@@ -43,3 +46,62 @@ class CloudWatchLogsEnvelope(BaseEnvelope):
         return [
             self._parse(data=record.message, model=model) for record in parsed_envelope.awslogs.decoded_data.logEvents
         ]
+
+    def parse_tolerant(self, data: dict[str, Any] | Any | None, model: type[Model]) -> ParsedRecords[Model | None]:
+        """Parses each log event's `message` with model provided, collecting validation errors per log event
+
+        NOTE: Log data is decoded and decompressed first, so errors decoding it are still raised.
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        ParsedRecords
+            Data parsed with model provided from valid log events, and errors for the ones that failed validation
+        """
+        logger.debug(f"Parsing incoming data with CloudWatch Logs model {CloudWatchLogsModel}")
+        parsed_envelope = CloudWatchLogsModel.model_validate(data)
+        logger.debug(f"Parsing CloudWatch log events in `message` with {model}, isolating errors per log event")
+        return self._parse_records_tolerant(
+            records=parsed_envelope.awslogs.decoded_data.logEvents,
+            parse_record=lambda record: self._parse(data=record.message, model=model),
+            get_identifier=lambda record: record.id,
+        )
+
+    def parse_lazy(self, data: dict[str, Any] | Any | None, model: type[Model]) -> Iterator[Model | None]:
+        """Parses each log event's `message` with model provided, one log event at a time as they're iterated
+
+        Log data is decompressed and deserialized incrementally, so only the log event being parsed is held in memory.
+        Errors decoding log data are raised while iterating.
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        Iterator
+            Log events parsed with model provided, validated as they're iterated
+        """
+        logger.debug("Decoding CloudWatch Logs data to decompress it as log events are iterated")
+        payload = _get_logs_payload(data)
+        logger.debug(f"Parsing CloudWatch log events in `message` with {model} as they're iterated")
+        return (
+            self._parse(data=CloudWatchLogsLogEvent.model_validate(log_event).message, model=model)
+            for log_event in iter_log_events(payload)
+        )
+
+
+def _get_logs_payload(data: dict[str, Any] | Any | None) -> bytes:
+    try:
+        return base64.b64decode(data["awslogs"]["data"], validate=True)  # type: ignore[index]
+    except (KeyError, TypeError, binascii.Error) as exc:
+        raise ValueError("unable to decode CloudWatch Logs data") from exc
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.models import DynamoDBStreamModel
+from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope, _get_records
+from aws_lambda_powertools.utilities.parser.models import DynamoDBStreamModel, DynamoDBStreamRecordModel
 
 if TYPE_CHECKING:
-    from aws_lambda_powertools.utilities.parser.types import Model
+    from aws_lambda_powertools.utilities.parser.types import Model, ParsedRecords
 
 logger = logging.getLogger(__name__)
 
@@ -44,3 +44,59 @@ class DynamoDBStreamEnvelope(BaseEnvelope):
             }
             for record in parsed_envelope.Records
         ]
+
+    def parse_tolerant(
+        self,
+        data: dict[str, Any] | Any | None,
+        model: type[Model],
+    ) -> ParsedRecords[dict[str, Model | None]]:
+        """Parses each DynamoDB Stream record's NewImage and OldImage with model provided, collecting errors per record
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        ParsedRecords
+            Dictionaries with NewImage and OldImage parsed with model provided from valid records,
+            and errors for the ones that failed validation
+        """
+        logger.debug(f"Parsing DynamoDB Stream new and old records with {model}, isolating errors per record")
+        return self._parse_records_tolerant(
+            records=_get_records(data),
+            parse_record=lambda record: self._parse_record(record=record, model=model),
+            get_identifier=lambda record: record["dynamodb"]["SequenceNumber"],
+        )
+
+    def parse_lazy(
+        self,
+        data: dict[str, Any] | Any | None,
+        model: type[Model],
+    ) -> Iterator[dict[str, Model | None]]:
+        """Parses each DynamoDB Stream record's NewImage and OldImage with model provided, as they're iterated
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        Iterator
+            Dictionaries with NewImage and OldImage parsed with model provided, validated as they're iterated
+        """
+        logger.debug(f"Parsing DynamoDB Stream new and old records with {model} as they're iterated")
+        return (self._parse_record(record=record, model=model) for record in _get_records(data))
+
+    def _parse_record(self, record: dict[str, Any], model: type[Model]) -> dict[str, Model | None]:
+        parsed_record = DynamoDBStreamRecordModel.model_validate(record)
+        return {
+            "NewImage": self._parse(data=parsed_record.dynamodb.NewImage, model=model),
+            "OldImage": self._parse(data=parsed_record.dynamodb.OldImage, model=model),
+        }
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
+from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope, _build_typed_dict
 from aws_lambda_powertools.utilities.parser.models import EventBridgeModel
 
 if TYPE_CHECKING:
@@ -34,3 +34,31 @@ class EventBridgeEnvelope(BaseEnvelope):
         parsed_envelope: EventBridgeModel = EventBridgeModel.model_validate(data)
         logger.debug(f"Parsing event payload in `detail` with {model}")
         return self._parse(data=parsed_envelope.detail, model=model)
+
+    def parse_single_pass(self, data: dict[str, Any] | Any | None, model: type[Model]) -> Model | None:
+        """Parses `detail` with model provided in a single pass, without validating the rest of the event
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        Any
+            Parsed detail payload with model provided
+        """
+        logger.debug(f"Parsing EventBridge `detail` with {model} in a single pass")
+        return self._parse_single_pass(
+            data=data,
+            model=model,
+            build_type=_build_single_pass_type,
+            extract=lambda event: event["detail"],
+        )
+
+
+def _build_single_pass_type(model: Any) -> Any:
+    """Builds a type validating only the EventBridge event `detail` against model"""
+    return _build_typed_dict("EventBridgeDetail", {"detail": model})
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, cast
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.models import KafkaMskEventModel, KafkaSelfManagedEventModel
+from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope, _get_records
+from aws_lambda_powertools.utilities.parser.models import (
+    KafkaMskEventModel,
+    KafkaRecordModel,
+    KafkaSelfManagedEventModel,
+)
 
 if TYPE_CHECKING:
-    from aws_lambda_powertools.utilities.parser.types import Model
+    from aws_lambda_powertools.utilities.parser.types import Model, ParsedRecords
 
 logger = logging.getLogger(__name__)
 
@@ -48,3 +52,51 @@ class KafkaEnvelope(BaseEnvelope):
         for records in parsed_envelope.records.values():
             ret_list += [self._parse(data=record.value, model=model) for record in records]
         return ret_list
+
+    def parse_tolerant(self, data: dict[str, Any] | Any | None, model: type[Model]) -> ParsedRecords[Model | None]:
+        """Parses each record's `value` across topic partitions with model provided, collecting errors per record
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        ParsedRecords
+            Data parsed with model provided from valid records, and errors for the ones that failed validation
+        """
+        logger.debug(f"Parsing Kafka event records in `value` with {model}, isolating errors per record")
+        records = _get_records(data, key="records", records_type=Dict[str, List[Any]])
+        return self._parse_records_tolerant(
+            records=(record for partition_records in records.values() for record in partition_records),
+            parse_record=lambda record: self._parse_record(record=record, model=model),
+        )
+
+    def parse_lazy(self, data: dict[str, Any] | Any | None, model: type[Model]) -> Iterator[Model | None]:
+        """Parses each record's `value` across topic partitions with model provided, as they're iterated
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        Iterator
+            Records parsed with model provided, validated as they're iterated
+        """
+        logger.debug(f"Parsing Kafka event records in `value` with {model} as they're iterated")
+        records = _get_records(data, key="records", records_type=Dict[str, List[Any]])
+        return (
+            self._parse_record(record=record, model=model)
+            for partition_records in records.values()
+            for record in partition_records
+        )
+
+    def _parse_record(self, record: dict[str, Any], model: type[Model]) -> Model | None:
+        return self._parse(data=KafkaRecordModel.model_validate(record).value, model=model)
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Iterator, cast
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.models import KinesisDataStreamModel
+from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope, _get_records
+from aws_lambda_powertools.utilities.parser.models import KinesisDataStreamModel, KinesisDataStreamRecord
 
 if TYPE_CHECKING:
-    from aws_lambda_powertools.utilities.parser.types import Model
+    from aws_lambda_powertools.utilities.parser.types import Model, ParsedRecords
 
 logger = logging.getLogger(__name__)
 
@@ -47,3 +47,48 @@ class KinesisDataStreamEnvelope(BaseEnvelope):
             data = cast(bytes, record.kinesis.data)
             models.append(self._parse(data=data.decode("utf-8"), model=model))
         return models
+
+    def parse_tolerant(self, data: dict[str, Any] | Any | None, model: type[Model]) -> ParsedRecords[Model | None]:
+        """Parses each record's `data` with model provided, collecting validation errors per record
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        ParsedRecords
+            Data parsed with model provided from valid records, and errors for the ones that failed validation
+        """
+        logger.debug(f"Parsing Kinesis records in `data` with {model}, isolating errors per record")
+        return self._parse_records_tolerant(
+            records=_get_records(data),
+            parse_record=lambda record: self._parse_record(record=record, model=model),
+            get_identifier=lambda record: record["kinesis"]["sequenceNumber"],
+        )
+
+    def parse_lazy(self, data: dict[str, Any] | Any | None, model: type[Model]) -> Iterator[Model | None]:
+        """Parses each record's `data` with model provided, one record at a time as they're iterated
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        Iterator
+            Records parsed with model provided, validated as they're iterated
+        """
+        logger.debug(f"Parsing Kinesis records in `data` with {model} as they're iterated")
+        return (self._parse_record(record=record, model=model) for record in _get_records(data))
+
+    def _parse_record(self, record: dict[str, Any], model: type[Model]) -> Model | None:
+        # We allow either AWS expected contract (bytes) or a custom Model, see #943
+        data = cast(bytes, KinesisDataStreamRecord.model_validate(record).kinesis.data)
+        return self._parse(data=data.decode("utf-8"), model=model)
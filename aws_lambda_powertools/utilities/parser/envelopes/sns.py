@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, cast
-
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.models import SnsModel, SnsNotificationModel, SqsModel
+from typing import TYPE_CHECKING, Any, Iterator, List, cast
+
+from aws_lambda_powertools.utilities.parser.envelopes.base import (
+    BaseEnvelope,
+    _build_typed_dict,
+    _get_records,
+    _json_type,
+)
+from aws_lambda_powertools.utilities.parser.models import (
+    SnsModel,
+    SnsNotificationModel,
+    SnsRecordModel,
+    SqsModel,
+    SqsRecordModel,
+)
 
 if TYPE_CHECKING:
-    from aws_lambda_powertools.utilities.parser.types import Model
+    from aws_lambda_powertools.utilities.parser.types import Model, ParsedRecords
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +53,75 @@ class SnsEnvelope(BaseEnvelope):
         logger.debug(f"Parsing SNS records in `body` with {model}")
         return [self._parse(data=record.Sns.Message, model=model) for record in parsed_envelope.Records]
 
+    def parse_single_pass(self, data: dict[str, Any] | Any | None, model: type[Model]) -> list[Model | None]:
+        """Parses records' `Sns.Message` with model provided in a single pass, without validating the rest of the event
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        list
+            List of records parsed with model provided
+        """
+        logger.debug(f"Parsing SNS records' `Sns.Message` with {model} in a single pass")
+        return self._parse_single_pass(
+            data=data,
+            model=model,
+            build_type=_build_sns_single_pass_type,
+            extract=lambda event: [record["Sns"]["Message"] for record in event["Records"]],
+        )
+
+    def parse_tolerant(self, data: dict[str, Any] | Any | None, model: type[Model]) -> ParsedRecords[Model | None]:
+        """Parses each record's `Message` with model provided, collecting validation errors per record
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        ParsedRecords
+            Data parsed with model provided from valid records, and errors for the ones that failed validation
+        """
+        logger.debug(f"Parsing SNS records in `Message` with {model}, isolating errors per record")
+        return self._parse_records_tolerant(
+            records=_get_records(data),
+            parse_record=lambda record: self._parse(
+                data=SnsRecordModel.model_validate(record).Sns.Message,
+                model=model,
+            ),
+            get_identifier=lambda record: record["Sns"]["MessageId"],
+        )
+
+    def parse_lazy(self, data: dict[str, Any] | Any | None, model: type[Model]) -> Iterator[Model | None]:
+        """Parses each record's `Message` with model provided, one record at a time as they're iterated
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        Iterator
+            Records parsed with model provided, validated as they're iterated
+        """
+        logger.debug(f"Parsing SNS records in `Message` with {model} as they're iterated")
+        return (self._parse_record(record=record, model=model) for record in _get_records(data))
+
+    def _parse_record(self, record: dict[str, Any], model: type[Model]) -> Model | None:
+        return self._parse(data=SnsRecordModel.model_validate(record).Sns.Message, model=model)
+
 
 class SnsSqsEnvelope(BaseEnvelope):
     """SNS plus SQS Envelope to extract array of Records
@@ -78,3 +158,86 @@ class SnsSqsEnvelope(BaseEnvelope):
             sns_notification = SnsNotificationModel.model_validate_json(body)
             output.append(self._parse(data=sns_notification.Message, model=model))
         return output
+
+    def parse_single_pass(self, data: dict[str, Any] | Any | None, model: type[Model]) -> list[Model | None]:
+        """Parses `Message` within records' `body` with model provided in a single pass, without validating the rest
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        list
+            List of records parsed with model provided
+        """
+        logger.debug(f"Parsing SQS records' SNS `Message` with {model} in a single pass")
+        return self._parse_single_pass(
+            data=data,
+            model=model,
+            build_type=_build_sns_sqs_single_pass_type,
+            extract=lambda event: [record["body"]["Message"] for record in event["Records"]],
+        )
+
+    def parse_tolerant(self, data: dict[str, Any] | Any | None, model: type[Model]) -> ParsedRecords[Model | None]:
+        """Parses each SNS notification `Message` within SQS records with model provided, collecting errors per record
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        ParsedRecords
+            Data parsed with model provided from valid records, and errors for the ones that failed validation
+        """
+        logger.debug(f"Parsing SNS notifications in SQS records `body` with {model}, isolating errors per record")
+        return self._parse_records_tolerant(
+            records=_get_records(data),
+            parse_record=lambda record: self._parse_record(record=record, model=model),
+            get_identifier=lambda record: record["messageId"],
+        )
+
+    def parse_lazy(self, data: dict[str, Any] | Any | None, model: type[Model]) -> Iterator[Model | None]:
+        """Parses each SNS notification `Message` within SQS records with model provided, as they're iterated
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        Iterator
+            Records parsed with model provided, validated as they're iterated
+        """
+        logger.debug(f"Parsing SNS notifications in SQS records `body` with {model} as they're iterated")
+        return (self._parse_record(record=record, model=model) for record in _get_records(data))
+
+    def _parse_record(self, record: dict[str, Any], model: type[Model]) -> Model | None:
+        # We allow either AWS expected contract (str) or a custom Model, see #943
+        body = cast(str, SqsRecordModel.model_validate(record).body)
+        sns_notification = SnsNotificationModel.model_validate_json(body)
+        return self._parse(data=sns_notification.Message, model=model)
+
+
+def _build_sns_single_pass_type(model: Any) -> Any:
+    """Builds a type validating only the SNS event records' `Sns.Message` against model"""
+    sns = _build_typed_dict("SnsMessage", {"Message": _json_type(model)})
+    record = _build_typed_dict("SnsRecordMessage", {"Sns": sns})
+    return _build_typed_dict("SnsRecordsMessage", {"Records": List[record]})  # type: ignore[valid-type]
+
+
+def _build_sns_sqs_single_pass_type(model: Any) -> Any:
+    """Builds a type validating only the SNS `Message` within SQS event records' `body` against model"""
+    notification = _build_typed_dict("SnsNotificationMessage", {"Message": _json_type(model)})
+    record = _build_typed_dict("SqsRecordSnsNotification", {"body": _json_type(notification)})
+    return _build_typed_dict("SqsRecordsSnsNotification", {"Records": List[record]})  # type: ignore[valid-type]
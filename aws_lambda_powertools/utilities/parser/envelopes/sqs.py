@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator, List
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.models import SqsModel
+from aws_lambda_powertools.utilities.parser.envelopes.base import (
+    BaseEnvelope,
+    _build_typed_dict,
+    _get_records,
+    _json_type,
+)
+from aws_lambda_powertools.utilities.parser.models import SqsModel, SqsRecordModel
 
 if TYPE_CHECKING:
-    from aws_lambda_powertools.utilities.parser.types import Model
+    from aws_lambda_powertools.utilities.parser.types import Model, ParsedRecords
 
 logger = logging.getLogger(__name__)
 
@@ -41,3 +46,75 @@ class SqsEnvelope(BaseEnvelope):
         parsed_envelope = SqsModel.model_validate(data)
         logger.debug(f"Parsing SQS records in `body` with {model}")
         return [self._parse(data=record.body, model=model) for record in parsed_envelope.Records]
+
+    def parse_single_pass(self, data: dict[str, Any] | Any | None, model: type[Model]) -> list[Model | None]:
+        """Parses records' `body` with model provided in a single pass, without validating the rest of the event
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        list
+            List of records parsed with model provided
+        """
+        logger.debug(f"Parsing SQS records' `body` with {model} in a single pass")
+        return self._parse_single_pass(
+            data=data,
+            model=model,
+            build_type=_build_single_pass_type,
+            extract=lambda event: [record["body"] for record in event["Records"]],
+        )
+
+    def parse_tolerant(self, data: dict[str, Any] | Any | None, model: type[Model]) -> ParsedRecords[Model | None]:
+        """Parses each record's `body` with model provided, collecting validation errors per record
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        ParsedRecords
+            Data parsed with model provided from valid records, and errors for the ones that failed validation
+        """
+        logger.debug(f"Parsing SQS records in `body` with {model}, isolating errors per record")
+        return self._parse_records_tolerant(
+            records=_get_records(data),
+            parse_record=lambda record: self._parse_record(record=record, model=model),
+            get_identifier=lambda record: record["messageId"],
+        )
+
+    def parse_lazy(self, data: dict[str, Any] | Any | None, model: type[Model]) -> Iterator[Model | None]:
+        """Parses each record's `body` with model provided, one record at a time as they're iterated
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        Iterator
+            Records parsed with model provided, validated as they're iterated
+        """
+        logger.debug(f"Parsing SQS records in `body` with {model} as they're iterated")
+        return (self._parse_record(record=record, model=model) for record in _get_records(data))
+
+    def _parse_record(self, record: dict[str, Any], model: type[Model]) -> Model | None:
+        return self._parse(data=SqsRecordModel.model_validate(record).body, model=model)
+
+
+def _build_single_pass_type(model: Any) -> Any:
+    """Builds a type validating only the SQS event records' `body` against model"""
+    record = _build_typed_dict("SqsRecordBody", {"body": _json_type(model)})
+    return _build_typed_dict("SqsRecordsBody", {"Records": List[record]})  # type: ignore[valid-type]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
+from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope, _build_typed_dict, _json_type
 from aws_lambda_powertools.utilities.parser.models import VpcLatticeModel
 
 if TYPE_CHECKING:
@@ -34,3 +34,31 @@ class VpcLatticeEnvelope(BaseEnvelope):
         parsed_envelope: VpcLatticeModel = VpcLatticeModel.model_validate(data)
         logger.debug(f"Parsing event payload in `detail` with {model}")
         return self._parse(data=parsed_envelope.body, model=model)
+
+    def parse_single_pass(self, data: dict[str, Any] | Any | None, model: type[Model]) -> Model | None:
+        """Parses `body` with model provided in a single pass, without validating the rest of the event
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        Any
+            Parsed detail payload with model provided
+        """
+        logger.debug(f"Parsing VPC Lattice `body` with {model} in a single pass")
+        return self._parse_single_pass(
+            data=data,
+            model=model,
+            build_type=_build_single_pass_type,
+            extract=lambda event: event["body"],
+        )
+
+
+def _build_single_pass_type(model: Any) -> Any:
+    """Builds a type validating only the VPC Lattice event `body` against model"""
+    return _build_typed_dict("VpcLatticeBody", {"body": _json_type(model)})
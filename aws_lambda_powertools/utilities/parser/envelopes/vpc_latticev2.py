@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
+from typing_extensions import NotRequired
+
+from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope, _build_typed_dict, _json_type
 from aws_lambda_powertools.utilities.parser.models import VpcLatticeV2Model
 
 if TYPE_CHECKING:
@@ -34,3 +36,31 @@ class VpcLatticeV2Envelope(BaseEnvelope):
         parsed_envelope: VpcLatticeV2Model = VpcLatticeV2Model.model_validate(data)
         logger.debug(f"Parsing event payload in `detail` with {model}")
         return self._parse(data=parsed_envelope.body, model=model)
+
+    def parse_single_pass(self, data: dict[str, Any] | Any | None, model: type[Model]) -> Model | None:
+        """Parses `body` with model provided in a single pass, without validating the rest of the event
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed
+        model : type[Model]
+            Data model provided to parse after extracting data using envelope
+
+        Returns
+        -------
+        Any
+            Parsed detail payload with model provided
+        """
+        logger.debug(f"Parsing VPC Lattice V2 `body` with {model} in a single pass")
+        return self._parse_single_pass(
+            data=data,
+            model=model,
+            build_type=_build_single_pass_type,
+            extract=lambda event: event.get("body"),
+        )
+
+
+def _build_single_pass_type(model: Any) -> Any:
+    """Builds a type validating only the VPC Lattice V2 event `body` against model"""
+    return _build_typed_dict("VpcLatticeV2Body", {"body": NotRequired[Optional[_json_type(model)]]})
@@ -4,3 +4,7 @@ class InvalidEnvelopeError(Exception):
 
 class InvalidModelTypeError(Exception):
     """Input data model does not implement BaseModel"""
+
+
+class MissingItemIdentifierError(Exception):
+    """Record failed validation without an identifier, so it can't be reported as a batch item failure"""
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from pydantic import TypeAdapter
 
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.parser.types import T
 
 CACHE_TYPE_ADAPTER = LRUDict(max_items=1024)
+CACHE_ENVELOPE_TYPE_ADAPTER = LRUDict(max_items=1024)
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,37 @@ def _retrieve_or_set_model_from_cache(model: type[T]) -> TypeAdapter:
     return CACHE_TYPE_ADAPTER[id_model]
 
 
+def _retrieve_or_set_envelope_adapter(envelope: type, model: Any, build_type: Callable[[Any], Any]) -> TypeAdapter:
+    """
+    Retrieves or sets a TypeAdapter instance from the cache for the given envelope and model pair.
+
+    The TypeAdapter validates the composite type returned by `build_type` for the model,
+    e.g. SQS records with a `body` JSON string parsed into the model.
+
+    Parameters
+    ----------
+    envelope: type
+        The envelope class the composite type is built for.
+    model: Any
+        The model type to parse the data within the envelope with.
+    build_type: Callable[[Any], Any]
+        Function returning the composite type for the model, only called when it isn't cached yet.
+
+    Returns
+    -------
+    TypeAdapter
+        The TypeAdapter instance for the composite type,
+        either retrieved from the cache or newly created and stored in the cache.
+    """
+
+    key = (envelope, id(model))
+
+    if key not in CACHE_ENVELOPE_TYPE_ADAPTER:
+        CACHE_ENVELOPE_TYPE_ADAPTER[key] = TypeAdapter(build_type(model))
+
+    return CACHE_ENVELOPE_TYPE_ADAPTER[key]
+
+
 def _parse_and_validate_event(data: dict[str, Any] | Any, adapter: TypeAdapter):
     """
     Parse and validate the event data using the provided adapter.
@@ -1,106 +1,111 @@
-from .alb import AlbModel, AlbRequestContext, AlbRequestContextData
-from .apigw import (
-    ApiGatewayAuthorizerRequest,
-    ApiGatewayAuthorizerToken,
-    APIGatewayEventAuthorizer,
-    APIGatewayEventIdentity,
-    APIGatewayEventRequestContext,
-    APIGatewayProxyEventModel,
-)
-from .apigwv2 import (
-    ApiGatewayAuthorizerRequestV2,
-    APIGatewayProxyEventV2Model,
-    RequestContextV2,
-    RequestContextV2Authorizer,
-    RequestContextV2AuthorizerIam,
-    RequestContextV2AuthorizerIamCognito,
-    RequestContextV2AuthorizerJwt,
-    RequestContextV2Http,
-)
-from .bedrock_agent import (
-    BedrockAgentEventModel,
-    BedrockAgentModel,
-    BedrockAgentPropertyModel,
-    BedrockAgentRequestBodyModel,
-    BedrockAgentRequestMediaModel,
-)
-from .cloudformation_custom_resource import (
-    CloudFormationCustomResourceBaseModel,
-    CloudFormationCustomResourceCreateModel,
-    CloudFormationCustomResourceDeleteModel,
-    CloudFormationCustomResourceUpdateModel,
-)
-from .cloudwatch import (
-    CloudWatchLogsData,
-    CloudWatchLogsDecode,
-    CloudWatchLogsLogEvent,
-    CloudWatchLogsModel,
-)
-from .dynamodb import (
-    DynamoDBStreamChangedRecordModel,
-    DynamoDBStreamModel,
-    DynamoDBStreamRecordModel,
-)
-from .event_bridge import EventBridgeModel
-from .kafka import (
-    KafkaBaseEventModel,
-    KafkaMskEventModel,
-    KafkaRecordModel,
-    KafkaSelfManagedEventModel,
-)
-from .kinesis import (
-    KinesisDataStreamModel,
-    KinesisDataStreamRecord,
-    KinesisDataStreamRecordPayload,
-)
-from .kinesis_firehose import (
-    KinesisFirehoseModel,
-    KinesisFirehoseRecord,
-    KinesisFirehoseRecordMetadata,
-)
-from .kinesis_firehose_sqs import KinesisFirehoseSqsModel, KinesisFirehoseSqsRecord
-from .lambda_function_url import LambdaFunctionUrlModel
-from .s3 import (
-    S3EventNotificationEventBridgeDetailModel,
-    S3EventNotificationEventBridgeModel,
-    S3EventNotificationObjectModel,
-    S3Model,
-    S3RecordModel,
-)
-from .s3_batch_operation import (
-    S3BatchOperationJobModel,
-    S3BatchOperationModel,
-    S3BatchOperationTaskModel,
-)
-from .s3_event_notification import (
-    S3SqsEventNotificationModel,
-    S3SqsEventNotificationRecordModel,
-)
-from .s3_object_event import (
-    S3ObjectConfiguration,
-    S3ObjectContext,
-    S3ObjectLambdaEvent,
-    S3ObjectSessionAttributes,
-    S3ObjectSessionContext,
-    S3ObjectSessionIssuer,
-    S3ObjectUserIdentity,
-    S3ObjectUserRequest,
-)
-from .ses import (
-    SesMail,
-    SesMailCommonHeaders,
-    SesMailHeaders,
-    SesMessage,
-    SesModel,
-    SesReceipt,
-    SesReceiptAction,
-    SesReceiptVerdict,
-    SesRecordModel,
-)
-from .sns import SnsModel, SnsNotificationModel, SnsRecordModel
-from .sqs import SqsAttributesModel, SqsModel, SqsMsgAttributeModel, SqsRecordModel
-from .vpc_lattice import VpcLatticeModel
-from .vpc_latticev2 import VpcLatticeV2Model
+from typing import TYPE_CHECKING
+
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .alb import AlbModel, AlbRequestContext, AlbRequestContextData
+    from .apigw import (
+        ApiGatewayAuthorizerRequest,
+        ApiGatewayAuthorizerToken,
+        APIGatewayEventAuthorizer,
+        APIGatewayEventIdentity,
+        APIGatewayEventRequestContext,
+        APIGatewayProxyEventModel,
+    )
+    from .apigwv2 import (
+        ApiGatewayAuthorizerRequestV2,
+        APIGatewayProxyEventV2Model,
+        RequestContextV2,
+        RequestContextV2Authorizer,
+        RequestContextV2AuthorizerIam,
+        RequestContextV2AuthorizerIamCognito,
+        RequestContextV2AuthorizerJwt,
+        RequestContextV2Http,
+    )
+    from .bedrock_agent import (
+        BedrockAgentEventModel,
+        BedrockAgentModel,
+        BedrockAgentPropertyModel,
+        BedrockAgentRequestBodyModel,
+        BedrockAgentRequestMediaModel,
+    )
+    from .cloudformation_custom_resource import (
+        CloudFormationCustomResourceBaseModel,
+        CloudFormationCustomResourceCreateModel,
+        CloudFormationCustomResourceDeleteModel,
+        CloudFormationCustomResourceUpdateModel,
+    )
+    from .cloudwatch import (
+        CloudWatchLogsData,
+        CloudWatchLogsDecode,
+        CloudWatchLogsLogEvent,
+        CloudWatchLogsModel,
+    )
+    from .dynamodb import (
+        DynamoDBStreamChangedRecordModel,
+        DynamoDBStreamModel,
+        DynamoDBStreamRecordModel,
+    )
+    from .event_bridge import EventBridgeModel
+    from .kafka import (
+        KafkaBaseEventModel,
+        KafkaMskEventModel,
+        KafkaRecordModel,
+        KafkaSelfManagedEventModel,
+    )
+    from .kinesis import (
+        KinesisDataStreamModel,
+        KinesisDataStreamRecord,
+        KinesisDataStreamRecordPayload,
+    )
+    from .kinesis_firehose import (
+        KinesisFirehoseModel,
+        KinesisFirehoseRecord,
+        KinesisFirehoseRecordMetadata,
+    )
+    from .kinesis_firehose_sqs import KinesisFirehoseSqsModel, KinesisFirehoseSqsRecord
+    from .lambda_function_url import LambdaFunctionUrlModel
+    from .s3 import (
+        S3EventNotificationEventBridgeDetailModel,
+        S3EventNotificationEventBridgeModel,
+        S3EventNotificationObjectModel,
+        S3Model,
+        S3RecordModel,
+    )
+    from .s3_batch_operation import (
+        S3BatchOperationJobModel,
+        S3BatchOperationModel,
+        S3BatchOperationTaskModel,
+    )
+    from .s3_event_notification import (
+        S3SqsEventNotificationModel,
+        S3SqsEventNotificationRecordModel,
+    )
+    from .s3_object_event import (
+        S3ObjectConfiguration,
+        S3ObjectContext,
+        S3ObjectLambdaEvent,
+        S3ObjectSessionAttributes,
+        S3ObjectSessionContext,
+        S3ObjectSessionIssuer,
+        S3ObjectUserIdentity,
+        S3ObjectUserRequest,
+    )
+    from .ses import (
+        SesMail,
+        SesMailCommonHeaders,
+        SesMailHeaders,
+        SesMessage,
+        SesModel,
+        SesReceipt,
+        SesReceiptAction,
+        SesReceiptVerdict,
+        SesRecordModel,
+    )
+    from .sns import SnsModel, SnsNotificationModel, SnsRecordModel
+    from .sqs import SqsAttributesModel, SqsModel, SqsMsgAttributeModel, SqsRecordModel
+    from .vpc_lattice import VpcLatticeModel
+    from .vpc_latticev2 import VpcLatticeV2Model
 
 __all__ = [
     "APIGatewayProxyEventV2Model",
@@ -188,3 +193,94 @@ __all__ = [
     "S3BatchOperationModel",
     "S3BatchOperationTaskModel",
 ]
+
+# exports are imported on first access, so importing the package doesn't load every module
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_exports(
+        globals(),
+        {
+            "AlbModel": ".alb",
+            "AlbRequestContext": ".alb",
+            "AlbRequestContextData": ".alb",
+            "ApiGatewayAuthorizerRequest": ".apigw",
+            "ApiGatewayAuthorizerToken": ".apigw",
+            "APIGatewayEventAuthorizer": ".apigw",
+            "APIGatewayEventIdentity": ".apigw",
+            "APIGatewayEventRequestContext": ".apigw",
+            "APIGatewayProxyEventModel": ".apigw",
+            "ApiGatewayAuthorizerRequestV2": ".apigwv2",
+            "APIGatewayProxyEventV2Model": ".apigwv2",
+            "RequestContextV2": ".apigwv2",
+            "RequestContextV2Authorizer": ".apigwv2",
+            "RequestContextV2AuthorizerIam": ".apigwv2",
+            "RequestContextV2AuthorizerIamCognito": ".apigwv2",
+            "RequestContextV2AuthorizerJwt": ".apigwv2",
+            "RequestContextV2Http": ".apigwv2",
+            "BedrockAgentEventModel": ".bedrock_agent",
+            "BedrockAgentModel": ".bedrock_agent",
+            "BedrockAgentPropertyModel": ".bedrock_agent",
+            "BedrockAgentRequestBodyModel": ".bedrock_agent",
+            "BedrockAgentRequestMediaModel": ".bedrock_agent",
+            "CloudFormationCustomResourceBaseModel": ".cloudformation_custom_resource",
+            "CloudFormationCustomResourceCreateModel": ".cloudformation_custom_resource",
+            "CloudFormationCustomResourceDeleteModel": ".cloudformation_custom_resource",
+            "CloudFormationCustomResourceUpdateModel": ".cloudformation_custom_resource",
+            "CloudWatchLogsData": ".cloudwatch",
+            "CloudWatchLogsDecode": ".cloudwatch",
+            "CloudWatchLogsLogEvent": ".cloudwatch",
+            "CloudWatchLogsModel": ".cloudwatch",
+            "DynamoDBStreamChangedRecordModel": ".dynamodb",
+            "DynamoDBStreamModel": ".dynamodb",
+            "DynamoDBStreamRecordModel": ".dynamodb",
+            "EventBridgeModel": ".event_bridge",
+            "KafkaBaseEventModel": ".kafka",
+            "KafkaMskEventModel": ".kafka",
+            "KafkaRecordModel": ".kafka",
+            "KafkaSelfManagedEventModel": ".kafka",
+            "KinesisDataStreamModel": ".kinesis",
+            "KinesisDataStreamRecord": ".kinesis",
+            "KinesisDataStreamRecordPayload": ".kinesis",
+            "KinesisFirehoseModel": ".kinesis_firehose",
+            "KinesisFirehoseRecord": ".kinesis_firehose",
+            "KinesisFirehoseRecordMetadata": ".kinesis_firehose",
+            "KinesisFirehoseSqsModel": ".kinesis_firehose_sqs",
+            "KinesisFirehoseSqsRecord": ".kinesis_firehose_sqs",
+            "LambdaFunctionUrlModel": ".lambda_function_url",
+            "S3EventNotificationEventBridgeDetailModel": ".s3",
+            "S3EventNotificationEventBridgeModel": ".s3",
+            "S3EventNotificationObjectModel": ".s3",
+            "S3Model": ".s3",
+            "S3RecordModel": ".s3",
+            "S3BatchOperationJobModel": ".s3_batch_operation",
+            "S3BatchOperationModel": ".s3_batch_operation",
+            "S3BatchOperationTaskModel": ".s3_batch_operation",
+            "S3SqsEventNotificationModel": ".s3_event_notification",
+            "S3SqsEventNotificationRecordModel": ".s3_event_notification",
+            "S3ObjectConfiguration": ".s3_object_event",
+            "S3ObjectContext": ".s3_object_event",
+            "S3ObjectLambdaEvent": ".s3_object_event",
+            "S3ObjectSessionAttributes": ".s3_object_event",
+            "S3ObjectSessionContext": ".s3_object_event",
+            "S3ObjectSessionIssuer": ".s3_object_event",
+            "S3ObjectUserIdentity": ".s3_object_event",
+            "S3ObjectUserRequest": ".s3_object_event",
+            "SesMail": ".ses",
+            "SesMailCommonHeaders": ".ses",
+            "SesMailHeaders": ".ses",
+            "SesMessage": ".ses",
+            "SesModel": ".ses",
+            "SesReceipt": ".ses",
+            "SesReceiptAction": ".ses",
+            "SesReceiptVerdict": ".ses",
+            "SesRecordModel": ".ses",
+            "SnsModel": ".sns",
+            "SnsNotificationModel": ".sns",
+            "SnsRecordModel": ".sns",
+            "SqsAttributesModel": ".sqs",
+            "SqsModel": ".sqs",
+            "SqsMsgAttributeModel": ".sqs",
+            "SqsRecordModel": ".sqs",
+            "VpcLatticeModel": ".vpc_lattice",
+            "VpcLatticeV2Model": ".vpc_latticev2",
+        },
+    )
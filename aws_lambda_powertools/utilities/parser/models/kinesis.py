@@ -1,12 +1,15 @@
 import json
 import zlib
-from typing import Dict, List, Literal, Type, Union
+from typing import Dict, Iterator, List, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, field_validator
 
+from aws_lambda_powertools.shared.cloudwatch_logs import iter_log_events
 from aws_lambda_powertools.shared.functions import base64_decode
+from aws_lambda_powertools.shared.kinesis_aggregation import deaggregate
 from aws_lambda_powertools.utilities.parser.models.cloudwatch import (
     CloudWatchLogsDecode,
+    CloudWatchLogsLogEvent,
 )
 
 
@@ -16,6 +19,9 @@ class KinesisDataStreamRecordPayload(BaseModel):
     sequenceNumber: str
     data: Union[bytes, Type[BaseModel], BaseModel]  # base64 encoded str is parsed into bytes
     approximateArrivalTimestamp: float
+    # Only set for user records de-aggregated from a KPL aggregated record
+    explicitHashKey: Optional[str] = None
+    subSequenceNumber: Optional[int] = None
 
     @field_validator("data", mode="before")
     def data_base64_decode(cls, value):
@@ -39,10 +45,43 @@ class KinesisDataStreamRecord(BaseModel):
 
         return json.loads(zlib.decompress(self.kinesis.data, zlib.MAX_WBITS | 32))
 
+    def deaggregate(self) -> List["KinesisDataStreamRecord"]:
+        """User records within this record, de-aggregating it when produced by the Kinesis Producer Library (KPL)
+
+        Records that aren't KPL aggregated are returned as is. Each user record is a copy of this record
+        with its own data, partition key, explicit hash key and sub-sequence number.
+        """
+        if not isinstance(self.kinesis.data, bytes):
+            raise ValueError("We can only de-aggregate bytes data, not custom models.")
+
+        user_records = deaggregate(self.kinesis.data)
+        if user_records is None:
+            return [self]
+
+        return [
+            self.model_copy(
+                update={
+                    "kinesis": self.kinesis.model_copy(
+                        update={
+                            "data": bytes(user_record.data),
+                            "partitionKey": user_record.partition_key,
+                            "explicitHashKey": user_record.explicit_hash_key,
+                            "subSequenceNumber": user_record.sub_sequence_number,
+                        },
+                    ),
+                },
+            )
+            for user_record in user_records
+        ]
+
 
 class KinesisDataStreamModel(BaseModel):
     Records: List[KinesisDataStreamRecord]
 
+    def deaggregate(self) -> List[KinesisDataStreamRecord]:
+        """User records across all records, de-aggregating records produced by the Kinesis Producer Library"""
+        return [user_record for record in self.Records for user_record in record.deaggregate()]
+
 
 def extract_cloudwatch_logs_from_event(event: KinesisDataStreamModel) -> List[CloudWatchLogsDecode]:
     return [CloudWatchLogsDecode(**record.decompress_zlib_record_data_as_json()) for record in event.Records]
@@ -50,3 +89,12 @@ def extract_cloudwatch_logs_from_event(event: KinesisDataStreamModel) -> List[Cl
 
 def extract_cloudwatch_logs_from_record(record: KinesisDataStreamRecord) -> CloudWatchLogsDecode:
     return CloudWatchLogsDecode(**record.decompress_zlib_record_data_as_json())
+
+
+def iter_cloudwatch_log_events_from_record(record: KinesisDataStreamRecord) -> Iterator[CloudWatchLogsLogEvent]:
+    """Yields CloudWatch Logs log events delivered in a Kinesis record, validated as they're decompressed"""
+    if not isinstance(record.kinesis.data, bytes):
+        raise ValueError("We can only decompress bytes data, not custom models.")
+
+    for log_event in iter_log_events(record.kinesis.data):
+        yield CloudWatchLogsLogEvent.model_validate(log_event)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import typing
-from typing import TYPE_CHECKING, Any, Callable, overload
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Literal, overload
 
 from pydantic import PydanticSchemaGenerationError
 
@@ -15,7 +15,7 @@ from aws_lambda_powertools.utilities.parser.functions import (
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.parser.envelopes.base import Envelope
-    from aws_lambda_powertools.utilities.parser.types import EventParserReturnType, T
+    from aws_lambda_powertools.utilities.parser.types import EventParserReturnType, ParsedRecords, T
     from aws_lambda_powertools.utilities.typing import LambdaContext
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,9 @@ def event_parser(
     context: LambdaContext,
     model: type[T] | None = None,
     envelope: type[Envelope] | None = None,
+    validate_envelope: bool = True,
+    tolerant: bool = False,
+    lazy: bool = False,
     **kwargs: Any,
 ) -> EventParserReturnType:
     """Lambda handler decorator to parse & validate events using Pydantic models
@@ -44,6 +47,15 @@ def event_parser(
 
     NOTE: If envelope is omitted, the complete event is parsed to match the model parameter definition.
 
+    When `validate_envelope` is False, envelopes supporting it skip the first step and only validate
+    the fields they extract data from, parsing it against the model within a single validation pass.
+
+    When `tolerant` is True, envelopes validate each record separately and the handler receives
+    a `ParsedRecords` with data parsed from valid records, and errors for malformed ones.
+
+    When `lazy` is True, envelopes return an iterator validating each record as it's consumed,
+    so the handler can process large events one record at a time.
+
     Example
     -------
     **Lambda handler decorator to parse & validate event**
@@ -80,6 +92,12 @@ def event_parser(
         Your data model that will replace the event.
     envelope: Envelope
         Optional envelope to extract the model from
+    validate_envelope: bool
+        Whether to validate the whole event against the envelope model, by default True
+    tolerant: bool
+        Whether to collect validation errors per record instead of raising, by default False
+    lazy: bool
+        Whether to parse records one at a time as they're iterated, by default False
 
     Raises
     ------
@@ -105,7 +123,14 @@ def event_parser(
 
     try:
         if envelope:
-            parsed_event = parse(event=event, model=model, envelope=envelope)
+            parsed_event = parse(
+                event=event,
+                model=model,
+                envelope=envelope,
+                validate_envelope=validate_envelope,
+                tolerant=tolerant,
+                lazy=lazy,
+            )
         else:
             parsed_event = parse(event=event, model=model)
 
@@ -120,10 +145,59 @@ def parse(event: dict[str, Any], model: type[T]) -> T: ...  # pragma: no cover
 
 
 @overload
-def parse(event: dict[str, Any], model: type[T], envelope: type[Envelope]) -> T: ...  # pragma: no cover
+def parse(
+    event: dict[str, Any],
+    model: type[T],
+    envelope: type[Envelope],
+    validate_envelope: bool = True,
+    tolerant: Literal[False] = False,
+    lazy: Literal[False] = False,
+) -> T: ...  # pragma: no cover
+
+
+@overload
+def parse(
+    event: dict[str, Any],
+    model: type[T],
+    envelope: type[Envelope],
+    validate_envelope: bool = True,
+    *,
+    tolerant: Literal[True],
+    lazy: Literal[False] = False,
+) -> ParsedRecords: ...  # pragma: no cover
+
+
+@overload
+def parse(
+    event: dict[str, Any],
+    model: type[T],
+    envelope: type[Envelope],
+    validate_envelope: bool = True,
+    tolerant: Literal[False] = False,
+    *,
+    lazy: Literal[True],
+) -> Iterator[Any]: ...  # pragma: no cover
+
+
+@overload
+def parse(
+    event: dict[str, Any],
+    model: type[T],
+    envelope: type[Envelope],
+    validate_envelope: bool = True,
+    tolerant: bool = False,
+    lazy: bool = False,
+) -> T | ParsedRecords | Iterator[Any]: ...  # pragma: no cover
 
 
-def parse(event: dict[str, Any], model: type[T], envelope: type[Envelope] | None = None):
+def parse(
+    event: dict[str, Any],
+    model: type[T],
+    envelope: type[Envelope] | None = None,
+    validate_envelope: bool = True,
+    tolerant: bool = False,
+    lazy: bool = False,
+):
     """Standalone function to parse & validate events using Pydantic models
 
     Typically used when you need fine-grained control over error handling compared to event_parser decorator.
@@ -159,6 +233,26 @@ def parse(event: dict[str, Any], model: type[T], envelope: type[Envelope] | None
             except ValidationError:
                 ...
 
+    **Parse SQS messages' body in a single pass, without validating the rest of the event**
+
+        def handler(event: dict, context: LambdaContext):
+            orders = parse(event=event, model=Order, envelope=envelopes.SqsEnvelope, validate_envelope=False)
+
+    **Parse SQS messages' body, reporting malformed messages as batch item failures**
+
+        def handler(event: dict, context: LambdaContext):
+            parsed = parse(event=event, model=Order, envelope=envelopes.SqsEnvelope, tolerant=True)
+            for order in parsed.models.values():
+                ...
+
+            return {"batchItemFailures": parsed.batch_item_failures()}
+
+    **Parse Kinesis records one at a time, validating each record as it's consumed**
+
+        def handler(event: dict, context: LambdaContext):
+            for order in parse(event=event, model=Order, envelope=envelopes.KinesisDataStreamEnvelope, lazy=True):
+                ...
+
     Parameters
     ----------
     event:    dict
@@ -167,6 +261,18 @@ def parse(event: dict[str, Any], model: type[T], envelope: type[Envelope] | None
         Your data model that will replace the event
     envelope: Envelope
         Optional envelope to extract the model from
+    validate_envelope: bool
+        Whether to validate the whole event against the envelope model, by default True.
+        When False, envelopes supporting it only validate the fields they extract data from,
+        and parse JSON payloads against the model within a single validation pass.
+    tolerant: bool
+        Whether to validate each record within the envelope separately, by default False.
+        When True, envelopes return a `ParsedRecords` with data parsed from valid records,
+        and a `RecordError` for each record that failed validation instead of raising.
+        Envelopes without records parse the entire event as a single record.
+    lazy: bool
+        Whether to parse records within the envelope one at a time as they're iterated, by default False.
+        When True, envelopes return an iterator, and validation errors are raised while iterating.
 
     Raises
     ------
@@ -176,9 +282,26 @@ def parse(event: dict[str, Any], model: type[T], envelope: type[Envelope] | None
         When model given does not implement BaseModel
     InvalidEnvelopeError
         When envelope given does not implement BaseEnvelope
+    ValueError
+        When both `tolerant` and `lazy` are True
     """
+    if tolerant and lazy:
+        raise ValueError("tolerant and lazy parsing can't be used together")
+
     if envelope and callable(envelope):
         try:
+            if tolerant:
+                logger.debug(f"Parsing event model with envelope={envelope}, isolating errors per record")
+                return envelope().parse_tolerant(data=event, model=model)
+
+            if lazy:
+                logger.debug(f"Parsing event model with envelope={envelope} as records are iterated")
+                return envelope().parse_lazy(data=event, model=model)
+
+            if not validate_envelope:
+                logger.debug(f"Parsing event model with envelope={envelope} in a single pass")
+                return envelope().parse_single_pass(data=event, model=model)
+
             logger.debug(f"Parsing and validating event model with envelope={envelope}")
             return envelope().parse(data=event, model=model)
         except AttributeError as exc:
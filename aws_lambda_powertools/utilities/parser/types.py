@@ -1,8 +1,13 @@
 """Generics and other shared types used across parser"""
 
-from typing import Any, Dict, Literal, Type, TypeVar, Union
+from __future__ import annotations
 
-from pydantic import BaseModel, Json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, Literal, Type, TypeVar, Union
+
+from pydantic import BaseModel, Json, ValidationError
+
+from aws_lambda_powertools.utilities.parser.exceptions import MissingItemIdentifierError
 
 Model = TypeVar("Model", bound=BaseModel)
 EnvelopeModel = TypeVar("EnvelopeModel")
@@ -11,4 +16,72 @@ AnyInheritedModel = Union[Type[BaseModel], BaseModel]
 RawDictOrModel = Union[Dict[str, Any], AnyInheritedModel]
 T = TypeVar("T")
 
-__all__ = ["Json", "Literal"]
+
+@dataclass(frozen=True)
+class RecordError:
+    """Record that failed validation when parsing an event in tolerant mode
+
+    Parameters
+    ----------
+    index : int
+        Position of the record within the event records
+    record : Any
+        Record as found in the event, before any parsing
+    error : ValidationError
+        Validation error raised while parsing the record, or the data within it
+    item_identifier : str, optional
+        Record identifier to report it as a batch item failure, e.g. SQS messageId, if available
+    """
+
+    index: int
+    record: Any
+    error: ValidationError
+    item_identifier: str | None = None
+
+
+@dataclass
+class ParsedRecords(Generic[T]):
+    """Outcome of parsing an event in tolerant mode
+
+    Parameters
+    ----------
+    models : dict[int, T]
+        Data parsed from each valid record, keyed by the record position within the event records
+    errors : list[RecordError]
+        Records that failed validation, in the order they appear in the event
+
+    Example
+    -------
+    **Report malformed SQS messages as batch item failures**
+
+        parsed = parse(event=event, model=Order, envelope=envelopes.SqsEnvelope, tolerant=True)
+        for order in parsed.models.values():
+            ...
+
+        return {"batchItemFailures": parsed.batch_item_failures()}
+    """
+
+    models: dict[int, T] = field(default_factory=dict)
+    errors: list[RecordError] = field(default_factory=list)
+
+    def batch_item_failures(self) -> list[dict[str, str]]:
+        """Records that failed validation in the partial batch response format, e.g. [{"itemIdentifier": "..."}]
+
+        Raises
+        ------
+        MissingItemIdentifierError
+            When a record that failed validation has no identifier, e.g. when it's malformed itself.
+            Records not reported are deleted from the event source, so the entire batch must fail instead.
+        """
+        failures = []
+        for error in self.errors:
+            if error.item_identifier is None:
+                raise MissingItemIdentifierError(
+                    f"Record at index {error.index} failed validation and has no identifier to report it "
+                    "as a batch item failure. Fail the entire batch to retry it.",
+                ) from error.error
+            failures.append({"itemIdentifier": error.item_identifier})
+        return failures
+
+
+__all__ = ["Json", "Literal", "ParsedRecords", "RecordError"]
@@ -0,0 +1,75 @@
+"""Events for each benchmarked handler, built before the handler is imported so they're not measured"""
+
+from __future__ import annotations
+
+import json
+from typing import Callable
+
+
+def api_gateway_rest_event(invocation: int) -> dict:
+    if invocation % 2:
+        method, path, body = "GET", f"/todos/{invocation}", None
+    else:
+        method, path = "POST", "/todos"
+        body = json.dumps({"title": f"Task {invocation}", "tags": ["home", "errands"]})
+
+    return {
+        "resource": path,
+        "path": path,
+        "httpMethod": method,
+        "headers": {"Content-Type": "application/json", "Host": "api.example.com"},
+        "multiValueHeaders": {"Content-Type": ["application/json"], "Host": ["api.example.com"]},
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "pathParameters": None,
+        "stageVariables": None,
+        "requestContext": {
+            "accountId": "123456789012",
+            "apiId": "1234567890",
+            "httpMethod": method,
+            "path": f"/prod{path}",
+            "requestId": f"request-{invocation}",
+            "resourcePath": path,
+            "stage": "prod",
+            "identity": {"sourceIp": "127.0.0.1"},
+        },
+        "body": body,
+        "isBase64Encoded": False,
+    }
+
+
+def sqs_event(invocation: int, records: int = 10) -> dict:
+    return {
+        "Records": [
+            {
+                "messageId": f"{invocation}-{i}",
+                "receiptHandle": "MessageReceiptHandle",
+                "body": json.dumps({"order_id": f"{invocation}-{i}", "quantity": -1 if i == 0 else i}),
+                "attributes": {
+                    "ApproximateReceiveCount": "1",
+                    "SentTimestamp": "1523232000000",
+                    "SenderId": "123456789012",
+                    "ApproximateFirstReceiveTimestamp": "1523232000001",
+                },
+                "messageAttributes": {},
+                "md5OfBody": "7b270e59b47ff90a553787216d55d91d",
+                "eventSource": "aws:sqs",
+                "eventSourceARN": "arn:aws:sqs:us-east-1:123456789012:orders",
+                "awsRegion": "us-east-1",
+            }
+            for i in range(records)
+        ],
+    }
+
+
+def order_event(invocation: int) -> dict:
+    return {"order_id": f"order-{invocation}", "amount": 42.5, "customer": {"id": "customer-1", "tier": "gold"}}
+
+
+EVENTS: dict[str, Callable[[int], dict]] = {
+    "reference": order_event,
+    "core_utilities": order_event,
+    "rest_validation": api_gateway_rest_event,
+    "batch_sqs": sqs_event,
+    "idempotency": order_event,
+}
@@ -0,0 +1,20 @@
+"""BatchProcessor reporting partial failures for SQS"""
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities.batch import BatchProcessor, EventType, process_partial_response
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+
+logger = Logger()
+processor = BatchProcessor(event_type=EventType.SQS)
+
+
+def record_handler(record: SQSRecord) -> dict:
+    order = record.json_body
+    if order["quantity"] < 0:
+        raise ValueError(f"Invalid quantity for order {order['order_id']}")
+    return order
+
+
+@logger.inject_lambda_context
+def handler(event, context):
+    return process_partial_response(event=event, record_handler=record_handler, processor=processor, context=context)
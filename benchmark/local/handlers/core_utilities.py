@@ -0,0 +1,24 @@
+"""Handler decorated with Logger, Metrics and Tracer"""
+
+from aws_lambda_powertools import Logger, Metrics, Tracer
+from aws_lambda_powertools.metrics import MetricUnit
+
+logger = Logger()
+metrics = Metrics()
+tracer = Tracer()
+
+
+@tracer.capture_method
+def create_order(order: dict) -> dict:
+    tracer.put_annotation(key="order_id", value=order["order_id"])
+    return {"order_id": order["order_id"], "status": "CREATED"}
+
+
+@logger.inject_lambda_context
+@metrics.log_metrics
+@tracer.capture_lambda_handler
+def handler(event, context):
+    order = create_order(event)
+    logger.info("Order created", order_id=order["order_id"])
+    metrics.add_metric(name="OrderCreated", unit=MetricUnit.Count, value=1)
+    return order
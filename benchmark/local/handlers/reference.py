@@ -0,0 +1,7 @@
+"""Reference handler without Powertools for AWS Lambda (Python), as a baseline"""
+
+import json
+
+
+def handler(event, context):
+    return {"statusCode": 200, "body": json.dumps({"message": "success"})}
@@ -0,0 +1,34 @@
+"""REST API resolver with request and response validation"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+
+logger = Logger()
+app = APIGatewayRestResolver(enable_validation=True)
+
+
+class Todo(BaseModel):
+    id: Optional[int] = None
+    title: str
+    completed: bool = False
+    tags: List[str] = []
+
+
+@app.post("/todos")
+def create_todo(todo: Todo) -> Todo:
+    todo.id = 1
+    return todo
+
+
+@app.get("/todos/<todo_id>")
+def get_todo(todo_id: int) -> Todo:
+    return Todo(id=todo_id, title="Buy milk")
+
+
+@logger.inject_lambda_context
+def handler(event, context):
+    return app.resolve(event, context)
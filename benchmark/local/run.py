@@ -0,0 +1,186 @@
+"""Local cold start and warm invoke benchmark for representative Powertools for AWS Lambda (Python) handlers
+
+Every cold start runs in a new interpreter, measuring:
+
+* import time of the handler module, i.e. the init phase
+* latency of the first invoke, and of warm invokes that follow
+* peak resident set size (RSS)
+
+Results are stored as JSON, so they can be compared between commits:
+
+    python benchmark/local/run.py run --output before.json
+    git checkout my-branch
+    python benchmark/local/run.py run --output after.json
+    python benchmark/local/run.py compare before.json after.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+BENCHMARK_PATH = Path(__file__).parent
+REPOSITORY_PATH = BENCHMARK_PATH.parent.parent
+WORKER = BENCHMARK_PATH / "worker.py"
+HANDLERS = ["reference", "core_utilities", "rest_validation", "batch_sqs", "idempotency"]
+DEFAULT_RESULTS_PATH = BENCHMARK_PATH / "results"
+
+
+def run_cold_start(handler: str, warm_invokes: int) -> dict[str, Any]:
+    """Runs handler in a new interpreter, importing Powertools from this repository"""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(REPOSITORY_PATH), os.getenv("PYTHONPATH")]))}
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "measurements.json"
+        command = [sys.executable, str(WORKER), handler, "--warm-invokes", str(warm_invokes), "--output", str(output)]
+        # handlers' logs and metrics are discarded, but still written as they would be in Lambda
+        result = subprocess.run(
+            command,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Benchmark of {handler} handler failed:\n{result.stderr}")
+        return json.loads(output.read_text())
+
+
+def percentile(values: list[float], percent: int) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))]
+
+
+def summarize(cold_starts: list[dict[str, Any]]) -> dict[str, dict[str, float]]:
+    import_ms = [cold_start["import_ms"] for cold_start in cold_starts]
+    first_invoke_ms = [cold_start["first_invoke_ms"] for cold_start in cold_starts]
+    warm_invoke_ms = [duration for cold_start in cold_starts for duration in cold_start["warm_invokes_ms"]]
+    peak_rss_mb = [cold_start["peak_rss_mb"] for cold_start in cold_starts]
+
+    summary = {
+        "import_ms": {"median": statistics.median(import_ms), "min": min(import_ms), "max": max(import_ms)},
+        "first_invoke_ms": {"median": statistics.median(first_invoke_ms), "max": max(first_invoke_ms)},
+        "peak_rss_mb": {"median": statistics.median(peak_rss_mb), "max": max(peak_rss_mb)},
+    }
+    if warm_invoke_ms:
+        summary["warm_invoke_ms"] = {p: percentile(warm_invoke_ms, int(p[1:])) for p in ("p50", "p90", "p99")}
+    return summary
+
+
+def git_revision() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=REPOSITORY_PATH,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run(args: argparse.Namespace) -> None:
+    revision = git_revision()
+    metadata = {
+        "revision": revision,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cold_starts": args.cold_starts,
+        "warm_invokes": args.warm_invokes,
+    }
+
+    results = {}
+    for handler in args.handlers:
+        # compiles bytecode, so the first cold start measured doesn't pay for it
+        run_cold_start(handler, warm_invokes=0)
+
+        cold_starts = [run_cold_start(handler, args.warm_invokes) for _ in range(args.cold_starts)]
+        results[handler] = summarize(cold_starts)
+        print(format_summary(handler, results[handler]))
+
+    output = args.output or DEFAULT_RESULTS_PATH / f"{revision or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"metadata": metadata, "results": results}, indent=2))
+    print(f"Results stored in {output}")
+
+
+def format_summary(handler: str, summary: dict[str, dict[str, float]]) -> str:
+    metrics = ", ".join(f"{metric} {stats}" for metric, stats in flatten(summary).items())
+    return f"{handler}: {metrics}"
+
+
+def flatten(summary: dict[str, dict[str, float]]) -> dict[str, str]:
+    return {f"{metric}.{stat}": f"{value:.2f}" for metric, stats in summary.items() for stat, value in stats.items()}
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    print(f"Baseline: {baseline['metadata']['revision']}, current: {current['metadata']['revision']}")
+
+    regressions = 0
+    row = "{:<18} {:<24} {:>12} {:>12} {:>9}"
+    print(row.format("handler", "metric", "baseline", "current", "change"))
+    for handler, summary in current["results"].items():
+        baseline_summary = baseline["results"].get(handler)
+        if baseline_summary is None:
+            continue
+
+        for metric, stats in summary.items():
+            for stat, value in stats.items():
+                baseline_value = baseline_summary.get(metric, {}).get(stat)
+                if not baseline_value:
+                    continue
+
+                change = (value - baseline_value) / baseline_value * 100
+                regressed = change > args.threshold
+                regressions += regressed
+                flag = " !" if regressed else ""
+                print(
+                    row.format(handler, f"{metric}.{stat}", f"{baseline_value:.2f}", f"{value:.2f}", f"{change:+.1f}%")
+                    + flag,
+                )
+
+    if regressions:
+        print(f"{regressions} measurements regressed by more than {args.threshold}%")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Benchmark handlers, storing results as JSON")
+    run_parser.add_argument("--handlers", nargs="+", choices=HANDLERS, default=HANDLERS)
+    run_parser.add_argument("--cold-starts", type=int, default=10, help="New interpreters per handler")
+    run_parser.add_argument("--warm-invokes", type=int, default=100, help="Invokes after the first one")
+    run_parser.add_argument("--output", type=Path, help="Results file, by default results/<git revision>.json")
+
+    compare_parser = commands.add_parser("compare", help="Compare results, exiting with 1 on regressions")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=10, help="Regression threshold in percent")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        return compare(args)
+
+    run(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
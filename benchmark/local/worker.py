@@ -0,0 +1,99 @@
+"""Measures a single cold start of a benchmark handler, then warm invokes, in this interpreter
+
+Run by `run.py` in a new interpreter for every cold start. Writes measurements as JSON to the given output file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import resource
+import sys
+import time
+import uuid
+from pathlib import Path
+
+BENCHMARK_PATH = Path(__file__).parent
+
+# Lambda environment, so utilities behave as they would in a Lambda function
+LAMBDA_ENVIRONMENT = {
+    "AWS_LAMBDA_FUNCTION_NAME": "benchmark",
+    "AWS_LAMBDA_FUNCTION_MEMORY_SIZE": "128",
+    "AWS_LAMBDA_FUNCTION_VERSION": "$LATEST",
+    "AWS_REGION": "us-east-1",
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "POWERTOOLS_SERVICE_NAME": "benchmark",
+    "POWERTOOLS_METRICS_NAMESPACE": "Benchmark",
+    # X-Ray SDK runs in Lambda mode, sending segments over UDP whether or not a daemon is listening
+    "LAMBDA_TASK_ROOT": str(BENCHMARK_PATH),
+    "_X_AMZN_TRACE_ID": "Root=1-5759e988-bd862e3fe1be46a994272793;Parent=53995c3f42cd8ad8;Sampled=1",
+    "AWS_XRAY_DAEMON_ADDRESS": "127.0.0.1:2000",
+}
+
+
+class LambdaContext:
+    function_name = "benchmark"
+    function_version = "$LATEST"
+    invoked_function_arn = "arn:aws:lambda:us-east-1:123456789012:function:benchmark"
+    memory_limit_in_mb = 128
+    log_group_name = "/aws/lambda/benchmark"
+    log_stream_name = "2024/01/01/[$LATEST]benchmark"
+
+    def __init__(self):
+        self.aws_request_id = str(uuid.uuid4())
+
+    def get_remaining_time_in_millis(self) -> int:
+        return 30_000
+
+
+def elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("handler", help="Handler module in the handlers folder, e.g. batch_sqs")
+    parser.add_argument("--warm-invokes", type=int, default=100)
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    os.environ.update(LAMBDA_ENVIRONMENT)
+    sys.path.insert(0, str(BENCHMARK_PATH))
+
+    from events import EVENTS
+
+    build_event = EVENTS[args.handler]
+    events = [build_event(invocation) for invocation in range(args.warm_invokes + 1)]
+
+    # init phase: importing the handler module, including Powertools and global initialization
+    start = time.perf_counter()
+    handler = importlib.import_module(f"handlers.{args.handler}").handler
+    import_ms = elapsed_ms(start)
+
+    start = time.perf_counter()
+    handler(events[0], LambdaContext())
+    first_invoke_ms = elapsed_ms(start)
+
+    warm_invokes_ms = []
+    for event in events[1:]:
+        start = time.perf_counter()
+        handler(event, LambdaContext())
+        warm_invokes_ms.append(elapsed_ms(start))
+
+    # ru_maxrss is in kilobytes on Linux, and bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+
+    measurements = {
+        "import_ms": import_ms,
+        "first_invoke_ms": first_invoke_ms,
+        "warm_invokes_ms": warm_invokes_ms,
+        "peak_rss_mb": peak_rss_mb,
+    }
+    args.output.write_text(json.dumps(measurements))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+from aws_lambda_powertools.utilities.data_classes import (
+    KinesisFirehoseEvent,
+    event_source,
+)
+from aws_lambda_powertools.utilities.data_classes.kinesis_firehose_event import KinesisFirehoseRecord
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+def record_handler(record: KinesisFirehoseRecord) -> dict:
+    payload: dict = record.data_as_json  # (1)!
+    return {"tool_used": "powertools_transform", "original_payload": payload}  # (2)!
+
+
+def partition_keys(record: KinesisFirehoseRecord, output: dict) -> dict:
+    return {"customer_id": output["original_payload"]["customer_id"]}
+
+
+@event_source(data_class=KinesisFirehoseEvent)
+def lambda_handler(event: KinesisFirehoseEvent, context: LambdaContext):
+    return event.transform(record_handler=record_handler, partition_keys=partition_keys)  # (3)!
@@ -0,0 +1,19 @@
+from aws_lambda_powertools.utilities.feature_flags import AppConfigStore, FeatureFlags
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+app_config = AppConfigStore(environment="dev", application="comments", name="config")
+
+feature_flags = FeatureFlags(store=app_config)
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    # Get customer's tier from incoming request
+    ctx = {"tier": event.get("tier", "standard")}
+
+    # Evaluate all features for this customer's tier, and reuse them for the rest of this invocation
+    features = feature_flags.evaluate_all(context=ctx, cache=True)
+
+    return {
+        "Premium features enabled": features["premium_features"],
+        "Discount percentage": features["discount_percentage"],
+    }
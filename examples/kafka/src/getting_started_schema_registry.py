@@ -0,0 +1,23 @@
+import os
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities.data_classes import KafkaEvent, event_source
+from aws_lambda_powertools.utilities.kafka import (
+    ConfluentSchemaRegistrySource,
+    KafkaConsumer,
+    SchemaRegistryDeserializer,
+)
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger()
+
+schema_source = ConfluentSchemaRegistrySource(os.environ["SCHEMA_REGISTRY_URL"])  # (1)!
+deserializer = SchemaRegistryDeserializer(schema_source=schema_source)  # (2)!
+consumer = KafkaConsumer(value_deserializer=deserializer)
+
+
+@event_source(data_class=KafkaEvent)
+def lambda_handler(event: KafkaEvent, context: LambdaContext):
+    for record in consumer.deserialize_records(event):  # (3)!
+        order: dict = record.deserialized_value
+        logger.info("Processing order", order_id=order["id"], offset=record.offset)
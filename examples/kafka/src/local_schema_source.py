@@ -0,0 +1,17 @@
+import json
+
+from aws_lambda_powertools.utilities.kafka import (
+    InMemorySchemaSource,
+    KafkaConsumer,
+    Schema,
+    SchemaRegistryDeserializer,
+)
+
+ORDER_SCHEMA = json.dumps({"type": "object", "properties": {"id": {"type": "string"}}})
+
+schema_source = InMemorySchemaSource([Schema(schema_id=1, schema=ORDER_SCHEMA, schema_type="JSON")])
+consumer = KafkaConsumer(value_deserializer=SchemaRegistryDeserializer(schema_source=schema_source))
+
+
+def lambda_handler(event: dict, context):
+    return [record.deserialized_value for record in consumer.deserialize_records(event)]
@@ -0,0 +1,22 @@
+import os
+
+from order_pb2 import Order  # generated with protoc
+
+from aws_lambda_powertools.utilities.kafka import (
+    ConfluentSchemaRegistrySource,
+    KafkaConsumer,
+    SchemaRegistryDeserializer,
+    protobuf_decoder,
+)
+
+deserializer = SchemaRegistryDeserializer(
+    schema_source=ConfluentSchemaRegistrySource(os.environ["SCHEMA_REGISTRY_URL"]),
+    decoders={"PROTOBUF": protobuf_decoder(Order)},
+)
+consumer = KafkaConsumer(value_deserializer=deserializer)
+
+
+def lambda_handler(event: dict, context):
+    for record in consumer.deserialize_records(event):
+        order: Order = record.deserialized_value
+        print(order.id)
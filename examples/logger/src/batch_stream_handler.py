@@ -0,0 +1,12 @@
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.logging.handlers import BatchStreamHandler
+
+logger = Logger(service="payment", logger_handler=BatchStreamHandler())
+
+
+@logger.inject_lambda_context
+def lambda_handler(event: dict, context):
+    for record in event.get("Records", []):
+        logger.info("Processing record", record_id=record.get("messageId"))
+
+    return "hello world"
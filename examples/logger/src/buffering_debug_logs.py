@@ -0,0 +1,16 @@
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.logging.buffer import LoggerBufferConfig
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+buffer_config = LoggerBufferConfig(max_bytes=20480, flush_on_error_log=True)
+logger = Logger(buffer_config=buffer_config)
+
+
+@logger.inject_lambda_context
+def lambda_handler(event: dict, context: LambdaContext):
+    logger.debug("Only written if this invocation logs an error")
+
+    if not event.get("order_id"):
+        logger.error("Missing order_id")  # buffered debug logs are written before this one
+
+    return "hello world"
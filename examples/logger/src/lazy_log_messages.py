@@ -0,0 +1,17 @@
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.logging import LazyValue
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger(level="INFO")
+
+
+def summarize(event: dict) -> dict:
+    return {"records": len(event.get("Records", [])), "keys": sorted(event)}
+
+
+def lambda_handler(event: dict, context: LambdaContext) -> str:
+    # summarize() is only called when DEBUG level is enabled
+    logger.debug(LazyValue(lambda: f"Received event with {len(event)} keys"), summary=LazyValue(summarize, event))
+    logger.debug("Received order %s", LazyValue(event.get, "order_id"))
+
+    return "hello world"
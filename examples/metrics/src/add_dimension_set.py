@@ -0,0 +1,12 @@
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+metrics = Metrics()
+
+
+@metrics.log_metrics
+def lambda_handler(event: dict, context: LambdaContext):
+    metrics.add_dimension(name="environment", value="prod")
+    metrics.add_dimension_set(region="eu-west-1", payment_method="card")
+    metrics.add_metric(name="SuccessfulBooking", unit=MetricUnit.Count, value=1)
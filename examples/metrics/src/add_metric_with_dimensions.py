@@ -0,0 +1,18 @@
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+metrics = Metrics()
+
+
+@metrics.log_metrics  # one EMF blob per tenant, plus one for metrics without their own dimensions
+def lambda_handler(event: dict, context: LambdaContext):
+    for order in event["orders"]:
+        metrics.add_metric(
+            name="OrderPlaced",
+            unit=MetricUnit.Count,
+            value=1,
+            dimensions={"tenant_id": order["tenant_id"]},
+        )
+
+    metrics.add_metric(name="OrdersBatchProcessed", unit=MetricUnit.Count, value=1)
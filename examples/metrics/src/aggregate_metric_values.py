@@ -0,0 +1,12 @@
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+# latencies are recorded as the closest bucket upper bound, e.g. 42ms as 50ms
+metrics = Metrics(histogram_buckets=[10, 50, 100, 500, 1000])
+
+
+@metrics.log_metrics
+def lambda_handler(event: dict, context: LambdaContext):
+    for record in event["Records"]:
+        metrics.add_metric(name="RecordLatency", unit=MetricUnit.Milliseconds, value=record["latency"])
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.metrics.flusher import MetricsFlusher, UdpSink
+
+metrics = Metrics(namespace="ServerlessAirline", service="booking")
+
+# sends EMF to the CloudWatch agent every 10 seconds, or every 500 metrics
+flusher = MetricsFlusher(metrics, sink=UdpSink(port=25888), interval_seconds=10, max_metrics=500)
+
+
+def process_booking(booking: dict):
+    ...
+    flusher.add_metric(name="BookingProcessed", unit=MetricUnit.Count, value=1)
+
+
+def main(bookings: list[dict]):
+    with ThreadPoolExecutor() as executor:
+        executor.map(process_booking, bookings)
+
+    flusher.close()  # optional: pending metrics are also flushed when the interpreter exits
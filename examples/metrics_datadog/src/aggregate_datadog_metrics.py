@@ -0,0 +1,15 @@
+from aws_lambda_powertools.metrics.provider.datadog import DatadogMetrics
+from aws_lambda_powertools.utilities.data_classes import SQSEvent, event_source
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+metrics = DatadogMetrics()
+
+
+@metrics.log_metrics  # ensures metrics are flushed upon request completion/failure
+@event_source(data_class=SQSEvent)
+def lambda_handler(event: SQSEvent, context: LambdaContext):
+    for record in event.records:
+        metrics.increment(name="RecordsProcessed", queue="orders")
+        metrics.distribution(name="RecordSize", value=len(record.body), queue="orders")
+
+    metrics.gauge(name="BatchSize", value=len(list(event.records)))
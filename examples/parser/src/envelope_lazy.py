@@ -0,0 +1,22 @@
+from typing import Iterator
+
+from pydantic import BaseModel
+
+from aws_lambda_powertools.utilities.parser import envelopes, event_parser
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+class Order(BaseModel):
+    order_id: str
+    quantity: int
+
+
+@event_parser(model=Order, envelope=envelopes.KinesisDataStreamEnvelope, lazy=True)
+def lambda_handler(event: Iterator[Order], context: LambdaContext):
+    total = 0
+    for order in event:  # each record is decoded and validated only when it's reached
+        total += order.quantity
+        if total >= 1_000:
+            break  # remaining records are never parsed
+
+    return {"total": total}
@@ -0,0 +1,17 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from aws_lambda_powertools.utilities.parser import envelopes, event_parser
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+class Order(BaseModel):
+    order_id: str
+    quantity: int
+
+
+@event_parser(model=Order, envelope=envelopes.SqsEnvelope, validate_envelope=False)
+def lambda_handler(event: List[Order], context: LambdaContext):
+    # Only each record's `body` was validated against Order, in a single pass
+    return {"processed": sum(order.quantity for order in event)}
@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities.parser import envelopes, parse
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger()
+
+
+class Order(BaseModel):
+    order_id: str
+    quantity: int
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    parsed = parse(event=event, model=Order, envelope=envelopes.SqsEnvelope, tolerant=True)
+
+    for order in parsed.models.values():
+        logger.info("Processing order", order_id=order.order_id)
+
+    for failure in parsed.errors:
+        logger.warning("Malformed record", index=failure.index, errors=failure.error.errors())
+
+    # Only malformed messages return to the queue, requires ReportBatchItemFailures
+    return {"batchItemFailures": parsed.batch_item_failures()}
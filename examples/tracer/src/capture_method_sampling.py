@@ -0,0 +1,14 @@
+from aws_lambda_powertools import Tracer
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+tracer = Tracer(max_metadata_size=4096)  # responses larger than 4KB are truncated
+
+
+@tracer.capture_method(sampling_rate=0.1, min_duration_ms=50)
+def process_order(order: dict) -> dict:
+    return {"order_id": order["id"], "status": "processed"}
+
+
+@tracer.capture_lambda_handler
+def lambda_handler(event: dict, context: LambdaContext) -> list:
+    return [process_order(order=order) for order in event.get("orders", [])]
@@ -0,0 +1,18 @@
+from aws_lambda_powertools import Tracer
+from aws_lambda_powertools.tracing.provider.opentelemetry import FileSpanExporter, OpenTelemetryProvider
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+# spans are written as JSON lines to inspect them locally, without the X-Ray daemon
+provider = OpenTelemetryProvider(service="payment", exporter=FileSpanExporter("spans.jsonl"))
+tracer = Tracer(provider=provider, patch_modules=["botocore"])
+
+
+@tracer.capture_method
+def collect_payment(charge_id: str) -> str:
+    tracer.put_annotation(key="PaymentId", value=charge_id)
+    return f"dummy payment collected for charge: {charge_id}"
+
+
+@tracer.capture_lambda_handler
+def lambda_handler(event: dict, context: LambdaContext) -> str:
+    return collect_payment(charge_id=event.get("charge_id", ""))
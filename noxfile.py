@@ -97,6 +97,32 @@ def test_with_xray_sdk_as_required_package(session: nox.Session):
     )
 
 
+@nox.session()
+def test_with_opentelemetry_as_required_package(session: nox.Session):
+    """Tests that depends on OpenTelemetry SDK library"""
+    # Tracer - OpenTelemetry provider
+    build_and_run_test(
+        session,
+        folders=[
+            f"{PREFIX_TESTS_FUNCTIONAL}/tracer/_opentelemetry/",
+        ],
+        extras="opentelemetry",
+    )
+
+
+@nox.session()
+def test_with_fast_json_backends_as_required_package(session: nox.Session):
+    """Tests that depends on orjson and msgspec libraries"""
+    # Shared - JSON backends
+    build_and_run_test(
+        session,
+        folders=[
+            f"{PREFIX_TESTS_UNIT}/shared/",
+        ],
+        extras="orjson,msgspec",
+    )
+
+
 @nox.session()
 def test_with_boto3_sdk_as_required_package(session: nox.Session):
     """Tests that depends on boto3/botocore library"""
@@ -1,3 +1,4 @@
+import base64
 import json
 import uuid
 from random import randint
@@ -31,7 +32,7 @@ from tests.functional.batch._pydantic.sample_models import (
     OrderKinesisRecord,
     OrderSqs,
 )
-from tests.functional.utils import b64_to_str, str_to_b64
+from tests.functional.utils import b64_to_str, kpl_aggregate, str_to_b64
 
 
 @pytest.fixture(scope="module")
@@ -414,6 +415,29 @@ def test_batch_processor_kinesis_context_parser_model(
     assert batch.response() == {"batchItemFailures": []}
 
 
+def test_batch_processor_kinesis_deaggregate_parser_model(
+    kinesis_record_handler_model: Callable,
+    kinesis_event_factory,
+    order_event_factory,
+):
+    # GIVEN a KPL aggregated record with a failing order
+    order_event = order_event_factory({"type": "success"})
+    order_event_fail = order_event_factory({"type": "fail"})
+    record = kinesis_event_factory("")
+    aggregated = kpl_aggregate([("pk", order_event.encode()), ("pk", order_event_fail.encode())])
+    record["kinesis"]["data"] = base64.b64encode(aggregated).decode()
+
+    # WHEN
+    processor = BatchProcessor(event_type=EventType.KinesisDataStreams, model=OrderKinesisRecord, deaggregate=True)
+    with processor([record], kinesis_record_handler_model) as batch:
+        processed_messages = batch.process()
+
+    # THEN each user record should be validated against the model
+    assert processed_messages[0][:2] == ("success", json.loads(order_event)["item"])
+    assert processed_messages[1][0] == "fail"
+    assert batch.response() == {"batchItemFailures": [{"itemIdentifier": record["kinesis"]["sequenceNumber"]}]}
+
+
 def test_batch_processor_kinesis_context_parser_model_with_failure(
     kinesis_record_handler_model: Callable,
     kinesis_event_factory,
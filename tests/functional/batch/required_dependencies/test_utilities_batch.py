@@ -1,3 +1,4 @@
+import base64
 import json
 import uuid
 from random import randint
@@ -24,7 +25,7 @@ from aws_lambda_powertools.utilities.data_classes.kinesis_stream_event import (
 )
 from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
-from tests.functional.utils import b64_to_str, str_to_b64
+from tests.functional.utils import b64_to_str, kpl_aggregate, str_to_b64
 
 
 @pytest.fixture(scope="module")
@@ -319,6 +320,53 @@ def test_batch_processor_kinesis_middleware_with_failure(kinesis_event_factory,
     assert len(result["batchItemFailures"]) == 2
 
 
+def test_batch_processor_kinesis_deaggregate_with_failure(kinesis_event_factory, kinesis_record_handler):
+    # GIVEN a KPL aggregated record with a failing user record, and a regular record
+    aggregated_record = kinesis_event_factory("")
+    aggregated = kpl_aggregate([("pk", b"success"), ("pk", b"failure"), ("pk", b"failure again")])
+    aggregated_record["kinesis"]["data"] = base64.b64encode(aggregated).decode()
+    regular_record = kinesis_event_factory("success")
+    processor = BatchProcessor(event_type=EventType.KinesisDataStreams, deaggregate=True)
+
+    # WHEN processing records
+    with processor([aggregated_record, regular_record], kinesis_record_handler) as batch:
+        processed_messages = batch.process()
+
+    # THEN each user record should be processed separately
+    assert [message[1] for message in processed_messages if message[0] == "success"] == ["success", "success"]
+    assert len(processed_messages) == 4
+
+    # and the aggregated record should be reported as failed only once
+    assert batch.response() == {
+        "batchItemFailures": [{"itemIdentifier": aggregated_record["kinesis"]["sequenceNumber"]}],
+    }
+
+
+def test_batch_processor_kinesis_deaggregate_success_only(kinesis_event_factory, kinesis_record_handler):
+    # GIVEN a KPL aggregated record
+    record = kinesis_event_factory("")
+    record["kinesis"]["data"] = base64.b64encode(kpl_aggregate([("pk-1", b"success"), ("pk-2", b"success")])).decode()
+    processor = BatchProcessor(event_type=EventType.KinesisDataStreams, deaggregate=True)
+
+    # WHEN processing it
+    result = process_partial_response(
+        event={"Records": [record]},
+        record_handler=kinesis_record_handler,
+        processor=processor,
+    )
+
+    # THEN no failure should be reported
+    assert result == {"batchItemFailures": []}
+
+
+def test_batch_processor_deaggregate_non_kinesis_event_type():
+    # GIVEN de-aggregation is enabled for SQS
+    # WHEN initializing the processor
+    # THEN a ValueError should be raised
+    with pytest.raises(ValueError):
+        BatchProcessor(event_type=EventType.SQS, deaggregate=True)
+
+
 def test_batch_processor_dynamodb_context_success_only(dynamodb_event_factory, dynamodb_record_handler):
     # GIVEN
     first_record = dynamodb_event_factory("success")
@@ -1,3 +1,5 @@
+import base64
+import gzip
 import json
 import warnings
 from typing import Dict
@@ -124,3 +126,127 @@ def test_openapi_swagger_oauth2_with_powertools_dev(monkeypatch):
         )
 
     monkeypatch.delenv("POWERTOOLS_DEV")
+
+
+def test_openapi_swagger_not_modified_with_etag():
+    # GIVEN Swagger UI is enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger()
+
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    first = app(event, {})
+
+    # WHEN requesting it again with the ETag from the first response
+    event["headers"] = {"If-None-Match": first["multiValueHeaders"]["ETag"][0]}
+    result = app(event, {})
+
+    # THEN we get a 304 without a body
+    assert result["statusCode"] == 304
+    assert result["body"] == ""
+    assert result["multiValueHeaders"]["ETag"] == first["multiValueHeaders"]["ETag"]
+
+
+def test_openapi_swagger_modified_with_outdated_etag():
+    # GIVEN Swagger UI is enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger()
+
+    # WHEN requesting it with an ETag that doesn't match
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    event["headers"] = {"If-None-Match": '"outdated"'}
+    result = app(event, {})
+
+    # THEN we get the full Swagger UI
+    assert result["statusCode"] == 200
+    assert "swagger-ui" in result["body"]
+
+
+def test_openapi_swagger_compressed_not_modified_with_etag():
+    # GIVEN Swagger UI is enabled with compression
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger(compress=True)
+
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    uncompressed = app(event, {})
+
+    event["headers"] = {"Accept-Encoding": "gzip, deflate, br"}
+    compressed = app(event, {})
+
+    # WHEN requesting it again with the ETag from the compressed response
+    event["headers"]["If-None-Match"] = compressed["multiValueHeaders"]["ETag"][0]
+    result = app(event, {})
+
+    # THEN compressed and uncompressed representations have different ETags
+    assert compressed["multiValueHeaders"]["ETag"] != uncompressed["multiValueHeaders"]["ETag"]
+    assert compressed["multiValueHeaders"]["Vary"] == ["Accept-Encoding"]
+    assert gzip.decompress(base64.b64decode(compressed["body"])).decode() == uncompressed["body"]
+
+    # THEN we get a 304 without a body
+    assert result["statusCode"] == 304
+    assert result["body"] == ""
+    assert "Content-Encoding" not in result["multiValueHeaders"]
+
+
+def test_openapi_swagger_generates_schema_once(mocker):
+    # GIVEN Swagger UI is enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger()
+    get_openapi_schema = mocker.spy(app, "get_openapi_schema")
+
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+
+    # WHEN requesting Swagger UI and its OpenAPI schema several times
+    responses = [app(event, {}) for _ in range(3)]
+    event["queryStringParameters"] = {"format": "json"}
+    responses += [app(event, {}) for _ in range(3)]
+
+    # THEN the OpenAPI schema is only generated once
+    assert get_openapi_schema.call_count == 1
+    assert all(response["statusCode"] == 200 for response in responses)
+
+
+def test_openapi_swagger_regenerated_on_new_route():
+    # GIVEN Swagger UI was already requested
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger()
+
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    event["queryStringParameters"] = {"format": "json"}
+    first = app(event, {})
+
+    # WHEN a new route is registered
+    @app.get("/hello")
+    def hello():
+        return "world"
+
+    result = app(event, {})
+
+    # THEN the OpenAPI schema includes it, with a new ETag
+    assert "/hello" not in json.loads(first["body"])["paths"]
+    assert "/hello" in json.loads(result["body"])["paths"]
+    assert result["multiValueHeaders"]["ETag"] != first["multiValueHeaders"]["ETag"]
+
+
+def test_openapi_swagger_cached_per_stage():
+    # GIVEN Swagger UI is enabled without explicit servers
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger()
+
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    event["queryStringParameters"] = {"format": "json"}
+
+    # WHEN requesting it through two different stages
+    servers = []
+    for stage in ("dev", "prod"):
+        event["requestContext"]["stage"] = stage
+        event["requestContext"]["path"] = f"/{stage}/swagger"
+        servers.append(json.loads(app(event, {})["body"])["servers"])
+
+    # THEN each stage gets its own server URL
+    assert servers == [[{"url": "/dev"}], [{"url": "/prod"}]]
@@ -13,7 +13,9 @@ from aws_lambda_powertools.utilities.feature_flags import (
     schema,
 )
 from aws_lambda_powertools.utilities.feature_flags.appconfig import AppConfigStore
-from aws_lambda_powertools.utilities.feature_flags.exceptions import StoreClientError
+from aws_lambda_powertools.utilities.feature_flags.base import StoreProvider
+from aws_lambda_powertools.utilities.feature_flags.comparators import RULE_ACTION_MAPPING, compile_comparator
+from aws_lambda_powertools.utilities.feature_flags.exceptions import SchemaValidationError, StoreClientError
 from aws_lambda_powertools.utilities.feature_flags.feature_flags import FeatureFlags
 from aws_lambda_powertools.utilities.feature_flags.schema import (
     CONDITION_ACTION,
@@ -26,6 +28,7 @@ from aws_lambda_powertools.utilities.feature_flags.schema import (
     RULES_KEY,
     ModuloRangeValues,
     RuleAction,
+    SchemaValidator,
 )
 from aws_lambda_powertools.utilities.parameters import GetParameterError
 
@@ -1701,3 +1704,235 @@ def test_exception_handler(mocker, config):
             context={"tenant_id": "not a list value"},
             default=False,
         )
+
+
+class InMemoryStore(StoreProvider):
+    def __init__(self, configuration: Dict):
+        self.configuration = configuration
+
+    @property
+    def get_raw_configuration(self) -> Dict:
+        return self.configuration
+
+    def get_configuration(self) -> Dict:
+        return self.configuration
+
+
+def tier_feature(tier: str) -> Dict:
+    return {
+        "my_feature": {
+            "default": False,
+            "rules": {
+                "tier matches": {
+                    "when_match": True,
+                    "conditions": [{"action": RuleAction.EQUALS.value, "key": "tier", "value": tier}],
+                },
+            },
+        },
+    }
+
+
+def test_flags_configuration_validated_once_per_payload(mocker):
+    # GIVEN a store returning the same configuration payload
+    store = InMemoryStore(tier_feature("premium"))
+    feature_flags = FeatureFlags(store=store)
+    validate = mocker.spy(SchemaValidator, "validate")
+
+    # WHEN evaluating features several times
+    for _ in range(3):
+        assert feature_flags.evaluate(name="my_feature", context={"tier": "premium"}, default=False) is True
+        assert feature_flags.get_enabled_features(context={"tier": "premium"}) == ["my_feature"]
+
+    # THEN configuration should only be validated once
+    assert validate.call_count == 1
+
+    # WHEN the store returns an equal payload
+    store.configuration = tier_feature("premium")
+    feature_flags.evaluate(name="my_feature", context={"tier": "premium"}, default=False)
+
+    # THEN configuration should not be validated again
+    assert validate.call_count == 1
+
+
+def test_flags_configuration_compiled_again_on_new_payload(mocker):
+    # GIVEN features evaluated from a configuration payload
+    store = InMemoryStore(tier_feature("premium"))
+    feature_flags = FeatureFlags(store=store)
+    validate = mocker.spy(SchemaValidator, "validate")
+    assert feature_flags.evaluate(name="my_feature", context={"tier": "standard"}, default=False) is False
+
+    # WHEN the store returns a new payload
+    store.configuration = tier_feature("standard")
+
+    # THEN it should be validated and its rules evaluated
+    assert feature_flags.evaluate(name="my_feature", context={"tier": "standard"}, default=False) is True
+    assert validate.call_count == 2
+
+
+def test_flags_configuration_changed_in_place_by_store(mocker):
+    # GIVEN features evaluated from a payload the store keeps changing in place
+    configuration = tier_feature("premium")
+    store = InMemoryStore(configuration)
+    feature_flags = FeatureFlags(store=store)
+    validate = mocker.spy(SchemaValidator, "validate")
+    assert feature_flags.evaluate(name="my_feature", context={"tier": "standard"}, default=False) is False
+
+    # WHEN the store changes a rule in the same payload object
+    configuration["my_feature"]["rules"]["tier matches"]["conditions"][0]["value"] = "standard"
+
+    # THEN it should be validated and its new rules evaluated
+    assert feature_flags.evaluate(name="my_feature", context={"tier": "standard"}, default=False) is True
+    assert validate.call_count == 2
+
+    # WHEN the store changes it in place into an invalid configuration
+    configuration["my_feature"]["default"] = "not a boolean"
+
+    # THEN it should fail validation instead of using the previously compiled features
+    with pytest.raises(SchemaValidationError):
+        feature_flags.evaluate(name="my_feature", context={"tier": "standard"}, default=False)
+
+
+def test_flags_invalid_configuration_always_raises():
+    # GIVEN a store returning an invalid configuration
+    feature_flags = FeatureFlags(store=InMemoryStore({"my_feature": {"default": "not a boolean"}}))
+
+    # WHEN evaluating it several times
+    # THEN every evaluation should fail validation
+    for _ in range(2):
+        with pytest.raises(SchemaValidationError):
+            feature_flags.evaluate(name="my_feature", default=False)
+
+
+@pytest.mark.parametrize(
+    "action,condition_value,context_values",
+    [
+        (RuleAction.IN.value, ["a", 1, True], ["a", "b", 1, 2, 1.0, {"a": 1}, ["a"], None]),
+        (RuleAction.NOT_IN.value, ["a", 1], ["a", "b", 1, {"a": 1}]),
+        (RuleAction.KEY_IN_VALUE.value, "abcdef", ["bcd", "xyz", 1]),
+        (RuleAction.KEY_NOT_IN_VALUE.value, [{"a": 1}, "b"], [{"a": 1}, "b", "c"]),
+        (RuleAction.ANY_IN_VALUE.value, ["a", "b"], [["a"], ["c"], [], ["c", "b"], [{"a": 1}], "a", None]),
+        (RuleAction.ALL_IN_VALUE.value, ["a", "b"], [["a"], ["a", "c"], [], "a"]),
+        (RuleAction.NONE_IN_VALUE.value, ["a", "b"], [["a"], ["c"], [], [["a"]], "a"]),
+        (RuleAction.MODULO_RANGE.value, {"BASE": 100, "START": 0, "END": 49}, [0, 49, 50, 1234, "a"]),
+        (RuleAction.STARTSWITH.value, "abc", ["abcdef", "xyz", 1]),
+    ],
+)
+def test_compiled_comparators_match_rule_actions(action, condition_value, context_values):
+    # GIVEN a condition compiled ahead of evaluation
+    match = compile_comparator(action, condition_value)
+    compare = RULE_ACTION_MAPPING[action]
+
+    # WHEN matching context values
+    # THEN results and errors should be the same as comparing them with the original condition value
+    for context_value in context_values:
+        try:
+            expected = compare(context_value, condition_value)
+        except Exception as exc:
+            with pytest.raises(type(exc)):
+                match(context_value)
+        else:
+            assert match(context_value) == expected
+
+
+def tiered_features() -> Dict:
+    premium_tier = {"action": RuleAction.EQUALS.value, "key": "tier", "value": "premium"}
+    return {
+        "premium_features": {
+            "default": False,
+            "rules": {"premium tier": {"when_match": True, "conditions": [dict(premium_tier)]}},
+        },
+        "discount_percentage": {
+            "default": 0,
+            "boolean_type": False,
+            "rules": {"premium tier": {"when_match": 10, "conditions": [dict(premium_tier)]}},
+        },
+        "new_ui": {"default": True},
+    }
+
+
+def test_evaluate_all_boolean_and_non_boolean_features():
+    # GIVEN boolean and non-boolean features
+    feature_flags = FeatureFlags(store=InMemoryStore(tiered_features()))
+
+    # WHEN evaluating all features at once
+    for tier in ("premium", "standard"):
+        context = {"tier": tier}
+        values = feature_flags.evaluate_all(context=context)
+
+        # THEN every feature should have the same value as when evaluated on its own
+        assert values == {
+            name: feature_flags.evaluate(name=name, context=context, default=None) for name in tiered_features()
+        }
+
+    assert feature_flags.evaluate_all(context={"tier": "premium"}) == {
+        "premium_features": True,
+        "discount_percentage": 10,
+        "new_ui": True,
+    }
+
+
+def test_evaluate_all_matches_shared_conditions_once(mocker):
+    # GIVEN features sharing an identical condition
+    feature_flags = FeatureFlags(store=InMemoryStore(tiered_features()))
+    match_condition = mocker.spy(feature_flags, "_match_condition")
+
+    # WHEN evaluating all features at once
+    feature_flags.evaluate_all(context={"tier": "premium"})
+
+    # THEN the shared condition should be compiled and matched once
+    premium_features, discount_percentage, _ = feature_flags._get_features().values()
+    assert premium_features.rules[0].conditions[0] is discount_percentage.rules[0].conditions[0]
+    assert match_condition.call_count == 1
+
+
+def test_evaluate_all_handles_error(mocker, config):
+    # GIVEN a schema fetch that raises a ConfigurationStoreError
+    schema_fetcher = init_fetcher_side_effect(mocker, config, GetParameterError())
+    feature_flags = FeatureFlags(schema_fetcher)
+
+    # WHEN calling evaluate_all
+    values = feature_flags.evaluate_all(context=None)
+
+    # THEN handle the error and return no features
+    assert values == {}
+
+
+def test_evaluate_all_cache_per_context_and_invocation(mocker, monkeypatch):
+    # GIVEN features evaluated with cache in an invocation
+    monkeypatch.setenv("_X_AMZN_TRACE_ID", "Root=1-5759e988-bd862e3fe1be46a994272793")
+    feature_flags = FeatureFlags(store=InMemoryStore(tiered_features()))
+    evaluate_feature = mocker.spy(feature_flags, "_evaluate_feature")
+    premium = feature_flags.evaluate_all(context={"tier": "premium"}, cache=True)
+
+    # WHEN evaluating the same context again in the same invocation
+    premium["new_ui"] = False
+    assert feature_flags.evaluate_all(context={"tier": "premium"}, cache=True)["new_ui"] is True
+
+    # THEN cached values should be returned as a copy
+    assert evaluate_feature.call_count == 3
+
+    # WHEN evaluating a different context
+    assert feature_flags.evaluate_all(context={"tier": "standard"}, cache=True)["premium_features"] is False
+
+    # THEN it should be evaluated
+    assert evaluate_feature.call_count == 6
+
+    # WHEN evaluating the same context in a new invocation
+    monkeypatch.setenv("_X_AMZN_TRACE_ID", "Root=1-5759e988-bd862e3fe1be46a994272794")
+    feature_flags.evaluate_all(context={"tier": "premium"}, cache=True)
+
+    # THEN it should be evaluated again
+    assert evaluate_feature.call_count == 9
+
+
+def test_evaluate_all_cache_reset_on_new_payload():
+    # GIVEN features evaluated with cache
+    store = InMemoryStore(tier_feature("premium"))
+    feature_flags = FeatureFlags(store=store)
+    assert feature_flags.evaluate_all(context={"tier": "standard"}, cache=True) == {"my_feature": False}
+
+    # WHEN the store returns a new payload
+    store.configuration = tier_feature("standard")
+
+    # THEN features should be evaluated against the new payload
+    assert feature_flags.evaluate_all(context={"tier": "standard"}, cache=True) == {"my_feature": True}
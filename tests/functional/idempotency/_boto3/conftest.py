@@ -14,7 +14,7 @@ from aws_lambda_powertools.utilities.idempotency.idempotency import IdempotencyC
 from aws_lambda_powertools.utilities.jmespath_utils import query
 from aws_lambda_powertools.utilities.validation import envelopes
 from tests.functional.idempotency.utils import hash_idempotency_key
-from tests.functional.utils import json_serialize, load_event
+from tests.functional.utils import json_serialize_response, load_event
 
 TABLE_NAME = "TEST_TABLE"
 
@@ -63,12 +63,12 @@ def lambda_response():
 
 @pytest.fixture(scope="module")
 def serialized_lambda_response(lambda_response):
-    return json_serialize(lambda_response)
+    return json_serialize_response(lambda_response)
 
 
 @pytest.fixture(scope="module")
 def deserialized_lambda_response(lambda_response):
-    return json.loads(json_serialize(lambda_response))
+    return json.loads(json_serialize_response(lambda_response))
 
 
 @pytest.fixture
@@ -5,7 +5,7 @@ from typing import Any, Dict, Optional
 from botocore import stub
 from pytest import FixtureRequest
 
-from tests.functional.utils import json_serialize
+from tests.functional.utils import json_serialize, json_serialize_response
 
 
 def hash_idempotency_key(data: Any):
@@ -61,7 +61,7 @@ def build_idempotency_update_item_stub(
     idempotency_key_hash = (
         f"{function_name}.{module_name}.{function_qualified_name}.{handler_name}#{hash_idempotency_key(data)}"
     )
-    serialized_lambda_response = json_serialize(handler_response)
+    serialized_lambda_response = json_serialize_response(handler_response)
     return {
         "ExpressionAttributeNames": {
             "#expiry": "expiration",
@@ -0,0 +1,243 @@
+import base64
+import io
+import json
+import struct
+import urllib.error
+
+import pytest
+
+from aws_lambda_powertools.utilities.data_classes import KafkaEvent
+from aws_lambda_powertools.utilities.kafka import (
+    BaseSchemaSource,
+    ConfluentSchemaRegistrySource,
+    InMemorySchemaSource,
+    KafkaConsumer,
+    KafkaDeserializationError,
+    Schema,
+    SchemaNotFoundError,
+    SchemaRegistryDeserializer,
+    SchemaRegistryError,
+    protobuf_decoder,
+    validating_json_decoder,
+)
+from tests.functional.utils import load_event
+
+ORDER_SCHEMA = json.dumps(
+    {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "item": {"type": "string"}},
+        "required": ["id", "item"],
+    },
+)
+
+
+class CountingSchemaSource(InMemorySchemaSource):
+    def __init__(self, schemas):
+        super().__init__(schemas)
+        self.calls = 0
+
+    def get_schema(self, schema_id: int) -> Schema:
+        self.calls += 1
+        return super().get_schema(schema_id)
+
+
+def wire_format(schema_id: int, payload: bytes) -> bytes:
+    return b"\x00" + struct.pack(">I", schema_id) + payload
+
+
+def kafka_event(values: list, key: bytes = b"recordKey") -> dict:
+    raw_event = load_event("kafkaEventMsk.json")
+    record = raw_event["records"]["mytopic-0"][0]
+    raw_event["records"]["mytopic-0"] = [
+        {**record, "offset": offset, "key": base64.b64encode(key).decode(), "value": base64.b64encode(value).decode()}
+        for offset, value in enumerate(values)
+    ]
+    return raw_event
+
+
+@pytest.fixture
+def schema_source():
+    return CountingSchemaSource([Schema(schema_id=1, schema=ORDER_SCHEMA, schema_type="JSON")])
+
+
+def test_consumer_deserializes_values_by_schema_id(schema_source):
+    # GIVEN a Kafka event with JSON Schema encoded values
+    values = [wire_format(1, json.dumps({"id": i, "item": "book"}).encode()) for i in range(3)]
+    consumer = KafkaConsumer(value_deserializer=SchemaRegistryDeserializer(schema_source))
+
+    # WHEN deserializing its records
+    records = consumer.deserialize_records(KafkaEvent(kafka_event(values)))
+
+    # THEN values should be decoded, and keys kept as raw bytes
+    assert [record.deserialized_value for record in records] == [{"id": i, "item": "book"} for i in range(3)]
+    assert [record.deserialized_key for record in records] == [b"recordKey"] * 3
+    assert records[0].topic == "mytopic"
+
+
+def test_deserializer_caches_decoders_per_schema_id(schema_source):
+    # GIVEN a deserializer shared across invocations
+    deserializer = SchemaRegistryDeserializer(schema_source)
+    consumer = KafkaConsumer(value_deserializer=deserializer)
+    event = kafka_event([wire_format(1, b'{"id": 1, "item": "book"}')] * 10)
+
+    # WHEN deserializing many records with the same schema id, over two invocations
+    consumer.deserialize_records(event)
+    consumer.deserialize_records(event)
+
+    # THEN the schema should be fetched only once
+    assert schema_source.calls == 1
+
+    # and fetched again once the cache is cleared
+    deserializer.clear_cache()
+    consumer.deserialize_records(event)
+    assert schema_source.calls == 2
+
+
+def test_consumer_deserializes_keys(schema_source):
+    # GIVEN keys encoded with a schema too
+    deserializer = SchemaRegistryDeserializer(schema_source)
+    consumer = KafkaConsumer(value_deserializer=deserializer, key_deserializer=deserializer)
+    key = wire_format(1, b'{"id": 1, "item": "key"}')
+    event = kafka_event([wire_format(1, b'{"id": 2, "item": "value"}')], key=key)
+
+    # WHEN deserializing its records
+    record = consumer.deserialize_records(event)[0]
+
+    # THEN both key and value should be decoded
+    assert record.deserialized_key == {"id": 1, "item": "key"}
+    assert record.deserialized_value == {"id": 2, "item": "value"}
+
+
+def test_consumer_tombstone_record(schema_source):
+    # GIVEN a record without key nor value
+    raw_event = kafka_event([b""])
+    record = raw_event["records"]["mytopic-0"][0]
+    del record["key"], record["value"]
+    consumer = KafkaConsumer(value_deserializer=SchemaRegistryDeserializer(schema_source))
+
+    # WHEN deserializing it
+    # THEN key and value should be None
+    deserialized = consumer.deserialize_records(raw_event)[0]
+    assert deserialized.deserialized_key is None
+    assert deserialized.deserialized_value is None
+
+
+@pytest.mark.parametrize(
+    "value, match",
+    [
+        (b'{"id": 1}', "Confluent wire format"),
+        (wire_format(1, b"not json"), "schema id 1"),
+        (wire_format(2, b"{}"), "Schema id 2 not found"),
+    ],
+)
+def test_consumer_deserialization_errors(schema_source, value, match):
+    # GIVEN a record that can't be deserialized
+    consumer = KafkaConsumer(value_deserializer=SchemaRegistryDeserializer(schema_source))
+
+    # WHEN deserializing it
+    # THEN a KafkaDeserializationError should be raised naming the record
+    with pytest.raises(KafkaDeserializationError, match=match) as exc:
+        consumer.deserialize_records(kafka_event([value]))
+    assert "topic mytopic, partition 0, offset 0" in str(exc.value)
+
+
+def test_deserializer_unsupported_schema_type():
+    # GIVEN a schema type without decoder
+    schema_source = InMemorySchemaSource([Schema(schema_id=1, schema="syntax = 'proto3';", schema_type="PROTOBUF")])
+    deserializer = SchemaRegistryDeserializer(schema_source)
+
+    # WHEN deserializing data using it
+    # THEN a KafkaDeserializationError should be raised
+    with pytest.raises(KafkaDeserializationError, match="No decoder for schema type 'PROTOBUF'"):
+        deserializer.deserialize(wire_format(1, b"\x00"))
+
+
+def test_deserializer_validating_json_decoder(schema_source):
+    # GIVEN a deserializer validating JSON Schema encoded data
+    deserializer = SchemaRegistryDeserializer(schema_source, decoders={"JSON": validating_json_decoder})
+
+    # WHEN deserializing valid and invalid data
+    # THEN invalid data should be rejected
+    assert deserializer.deserialize(wire_format(1, b'{"id": 1, "item": "book"}')) == {"id": 1, "item": "book"}
+    with pytest.raises(KafkaDeserializationError):
+        deserializer.deserialize(wire_format(1, b'{"id": "1"}'))
+
+
+@pytest.mark.parametrize("message_indexes", [b"\x00", b"\x04\x02\x06"], ids=["first", "nested"])
+def test_deserializer_protobuf_decoder(message_indexes):
+    # GIVEN a Protobuf generated message class stand-in
+    class Order:
+        @classmethod
+        def FromString(cls, data: bytes):
+            return data
+
+    schema_source = InMemorySchemaSource([Schema(schema_id=7, schema="syntax = 'proto3';", schema_type="PROTOBUF")])
+    deserializer = SchemaRegistryDeserializer(schema_source, decoders={"PROTOBUF": protobuf_decoder(Order)})
+
+    # WHEN deserializing data with message indexes
+    # THEN message indexes should be skipped before parsing the message
+    assert deserializer.deserialize(wire_format(7, message_indexes + b"\x08\x96\x01")) == b"\x08\x96\x01"
+
+
+def test_custom_schema_source():
+    # GIVEN a custom schema source
+    class StaticSchemaSource(BaseSchemaSource):
+        def get_schema(self, schema_id: int) -> Schema:
+            return Schema(schema_id=schema_id, schema="{}", schema_type="JSON")
+
+    deserializer = SchemaRegistryDeserializer(StaticSchemaSource())
+
+    # WHEN deserializing data
+    # THEN its schema should come from the custom source
+    assert deserializer.deserialize(wire_format(42, b"[1, 2]")) == [1, 2]
+
+
+def test_confluent_schema_registry_source(mocker):
+    # GIVEN a schema registry returning a JSON schema
+    response = io.BytesIO(json.dumps({"schema": ORDER_SCHEMA, "schemaType": "JSON"}).encode())
+    urlopen = mocker.patch("urllib.request.urlopen", return_value=response)
+    schema_source = ConfluentSchemaRegistrySource("https://registry.example.com/", basic_auth=("key", "secret"))
+
+    # WHEN fetching a schema
+    schema = schema_source.get_schema(1)
+
+    # THEN it should be requested by id with credentials
+    assert schema == Schema(schema_id=1, schema=ORDER_SCHEMA, schema_type="JSON")
+    request = urlopen.call_args.args[0]
+    assert request.full_url == "https://registry.example.com/schemas/ids/1"
+    assert request.get_header("Authorization") == "Basic " + base64.b64encode(b"key:secret").decode()
+
+
+def test_confluent_schema_registry_source_defaults_to_avro(mocker):
+    # GIVEN a schema registry response without schemaType
+    mocker.patch("urllib.request.urlopen", return_value=io.BytesIO(b'{"schema": "\\"string\\""}'))
+
+    # WHEN fetching a schema
+    # THEN it should default to Avro
+    assert ConfluentSchemaRegistrySource("https://registry.example.com").get_schema(1).schema_type == "AVRO"
+
+
+@pytest.mark.parametrize("code, exception", [(404, SchemaNotFoundError), (500, SchemaRegistryError)])
+def test_confluent_schema_registry_source_errors(mocker, code, exception):
+    # GIVEN a schema registry returning an HTTP error
+    error = urllib.error.HTTPError("https://registry.example.com", code, "error", {}, None)
+    mocker.patch("urllib.request.urlopen", side_effect=error)
+
+    # WHEN fetching a schema
+    # THEN the matching exception should be raised
+    with pytest.raises(exception):
+        ConfluentSchemaRegistrySource("https://registry.example.com").get_schema(1)
+
+
+def test_deserializer_avro_decoder():
+    fastavro = pytest.importorskip("fastavro")
+
+    # GIVEN an Avro encoded value
+    schema = {"type": "record", "name": "Order", "fields": [{"name": "id", "type": "long"}]}
+    payload = io.BytesIO()
+    fastavro.schemaless_writer(payload, fastavro.parse_schema(schema), {"id": 42})
+    schema_source = InMemorySchemaSource([Schema(schema_id=3, schema=json.dumps(schema))])
+
+    # WHEN deserializing it
+    # THEN it should be decoded with its writer schema
+    assert SchemaRegistryDeserializer(schema_source).deserialize(wire_format(3, payload.getvalue())) == {"id": 42}
@@ -15,14 +15,16 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 import pytest
 
 from aws_lambda_powertools import Logger
-from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.logging import LazyValue, correlation_paths
 from aws_lambda_powertools.logging.exceptions import InvalidLoggerSamplingRateError
 from aws_lambda_powertools.logging.formatter import (
     BasePowertoolsFormatter,
     LambdaPowertoolsFormatter,
 )
 from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared.json_backend import get_json_backend
 from aws_lambda_powertools.utilities.data_classes import S3Event, event_source
+from aws_lambda_powertools.warnings import PowertoolsUserWarning
 
 
 @pytest.fixture
@@ -1114,3 +1116,90 @@ def test_logger_json_unicode(stdout, service_name):
 
     assert log["message"] == non_ascii_chars
     assert log[japanese_field] == japanese_string
+
+
+def test_logger_with_unknown_json_backend(monkeypatch, request, stdout, service_name):
+    # GIVEN POWERTOOLS_JSON_BACKEND is set to an unknown JSON library
+    monkeypatch.setenv(constants.JSON_BACKEND_ENV, "orjsn")
+    get_json_backend.cache_clear()
+    request.addfinalizer(get_json_backend.cache_clear)
+    logger = Logger(service=service_name, stream=stdout)
+
+    # WHEN logging a message
+    with pytest.warns(PowertoolsUserWarning, match="Unknown JSON backend"):
+        logger.info("スコビルデモ")
+
+    # THEN it should still be logged, without escaping non-ASCII characters
+    assert "スコビルデモ" in stdout.getvalue()
+    assert capture_logging_output(stdout)["message"] == "スコビルデモ"
+
+
+def test_logger_lazy_message_and_extra_not_evaluated_when_level_disabled(stdout, service_name):
+    # GIVEN Logger is initialized with INFO level
+    logger = Logger(service=service_name, stream=stdout, level="INFO")
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return "expensive"
+
+    # WHEN debug logs use lazy message, args and extra values
+    logger.debug(LazyValue(expensive))
+    logger.debug("value: %s", LazyValue(expensive))
+    logger.debug("extra", extra={"value": LazyValue(expensive)}, other=LazyValue(expensive))
+
+    # THEN nothing should be evaluated nor written
+    assert calls == []
+    assert stdout.getvalue() == ""
+
+
+def test_logger_lazy_message_and_extra_evaluated_when_level_enabled(stdout, service_name):
+    # GIVEN Logger is initialized with INFO level
+    logger = Logger(service=service_name, stream=stdout, level="INFO")
+
+    # WHEN info logs use lazy message, args and extra values
+    logger.info(LazyValue(lambda: "lazy message"))
+    logger.info(
+        "value: %s",
+        LazyValue(str.upper, "lazy arg"),
+        extra={"lazy_extra": LazyValue(lambda: 1)},
+        lazy_kwarg=LazyValue(int, "2"),
+    )
+
+    # THEN lazy values should be evaluated and logged
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert logs[0]["message"] == "lazy message"
+    assert logs[1]["message"] == "value: LAZY ARG"
+    assert logs[1]["lazy_extra"] == 1
+    assert logs[1]["lazy_kwarg"] == 2
+
+
+def test_logger_extra_mapping_is_not_mutated(stdout, service_name):
+    # GIVEN Logger is initialized and an extra mapping with lazy values
+    logger = Logger(service=service_name, stream=stdout)
+    extra = {"lazy": LazyValue(lambda: "value")}
+
+    # WHEN extra is used alongside keyword arguments
+    logger.info("hello", extra=extra, request="id")
+
+    # THEN the original mapping should be left untouched
+    assert isinstance(extra["lazy"], LazyValue)
+    log = capture_logging_output(stdout)
+    assert log["lazy"] == "value"
+    assert log["request"] == "id"
+
+
+def test_logger_callables_are_not_evaluated(stdout, service_name):
+    # GIVEN Logger is initialized
+    logger = Logger(service=service_name, stream=stdout)
+
+    def handler(event):
+        raise AssertionError("should not be called")
+
+    # WHEN functions are logged without LazyValue
+    logger.info("hello", callback=handler, factory=functools.partial(handler, {}))
+
+    # THEN they should be logged as-is, without being called
+    log = capture_logging_output(stdout)
+    assert log["callback"] == str(handler)
+    assert log["factory"] == str(functools.partial(handler, {}))
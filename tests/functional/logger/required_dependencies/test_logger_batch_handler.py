@@ -0,0 +1,138 @@
+import io
+import json
+import random
+import string
+import threading
+from collections import namedtuple
+
+import pytest
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.logging.handlers import BatchStreamHandler
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.write_calls = 0
+
+    def write(self, s):
+        self.write_calls += 1
+        return super().write(s)
+
+
+@pytest.fixture
+def stdout():
+    return CountingStream()
+
+
+@pytest.fixture
+def lambda_context():
+    lambda_context = {
+        "function_name": "test",
+        "memory_limit_in_mb": 128,
+        "invoked_function_arn": "arn:aws:lambda:eu-west-1:809313241:function:test",
+        "aws_request_id": "52fdfc07-2182-154f-163f-5f0f9a621d72",
+    }
+
+    return namedtuple("LambdaContext", lambda_context.keys())(*lambda_context.values())
+
+
+@pytest.fixture
+def service_name():
+    chars = string.ascii_letters + string.digits
+    return "".join(random.SystemRandom().choice(chars) for _ in range(15))
+
+
+def capture_multiple_logging_statements_output(stdout):
+    return [json.loads(line.strip()) for line in stdout.getvalue().split("\n") if line]
+
+
+def test_batch_handler_writes_all_logs_in_order(stdout, service_name):
+    # GIVEN Logger is initialized with a BatchStreamHandler
+    handler = BatchStreamHandler(stream=stdout)
+    logger = Logger(service=service_name, logger_handler=handler)
+
+    # WHEN many logs are emitted and the handler is flushed
+    for i in range(500):
+        logger.info(f"log {i}")
+    handler.flush()
+
+    # THEN all logs should be written in order
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == [f"log {i}" for i in range(500)]
+    # and written in fewer write calls than log records
+    assert stdout.write_calls <= 500
+
+
+def test_batch_handler_blocked_writer_batches_lines(stdout, service_name):
+    # GIVEN a BatchStreamHandler whose writer is blocked on the first write
+    release = threading.Event()
+    original_write = stdout.write
+
+    def blocking_write(s):
+        release.wait(timeout=5)
+        return original_write(s)
+
+    stdout.write = blocking_write
+    handler = BatchStreamHandler(stream=stdout)
+    logger = Logger(service=service_name, logger_handler=handler)
+
+    # WHEN logs are emitted while the writer is busy
+    for i in range(100):
+        logger.info(f"log {i}")
+    release.set()
+    handler.flush()
+
+    # THEN pending lines should be joined in a handful of writes
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert len(logs) == 100
+    assert stdout.write_calls < 100
+
+
+def test_batch_handler_falls_back_to_synchronous_writes_when_full(stdout, service_name):
+    # GIVEN a BatchStreamHandler with a tiny queue
+    handler = BatchStreamHandler(stream=stdout, max_queue_size=2)
+    logger = Logger(service=service_name, logger_handler=handler)
+
+    # WHEN more logs than the queue size are emitted
+    for i in range(200):
+        logger.info(f"log {i}")
+    handler.flush()
+
+    # THEN no log should be lost nor reordered
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == [f"log {i}" for i in range(200)]
+
+
+def test_batch_handler_drained_by_inject_lambda_context(stdout, service_name, lambda_context):
+    # GIVEN Logger is initialized with a BatchStreamHandler
+    logger = Logger(service=service_name, logger_handler=BatchStreamHandler(stream=stdout))
+
+    @logger.inject_lambda_context
+    def handler(event, context):
+        for i in range(100):
+            logger.info(f"log {i}")
+
+    # WHEN the decorated handler returns
+    handler({}, lambda_context)
+
+    # THEN all logs should already be written
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert len(logs) == 100
+
+
+def test_batch_handler_close_drains_and_stops_writer(stdout, service_name):
+    # GIVEN a BatchStreamHandler with pending logs
+    handler = BatchStreamHandler(stream=stdout)
+    logger = Logger(service=service_name, logger_handler=handler)
+    logger.info("last words")
+
+    # WHEN the handler is closed
+    writer = handler._writer
+    handler.close()
+
+    # THEN pending logs should be written and the writer thread stopped
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == ["last words"]
+    assert writer is not None and not writer.is_alive()
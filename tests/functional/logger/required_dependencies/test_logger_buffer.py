@@ -0,0 +1,289 @@
+import io
+import json
+import random
+import string
+import threading
+from collections import namedtuple
+
+import pytest
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.logging.buffer import LoggerBufferConfig
+from aws_lambda_powertools.logging.buffer.cache import LoggerBufferCache
+from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.warnings import PowertoolsUserWarning
+
+
+@pytest.fixture
+def stdout():
+    return io.StringIO()
+
+
+@pytest.fixture
+def lambda_context():
+    lambda_context = {
+        "function_name": "test",
+        "memory_limit_in_mb": 128,
+        "invoked_function_arn": "arn:aws:lambda:eu-west-1:809313241:function:test",
+        "aws_request_id": "52fdfc07-2182-154f-163f-5f0f9a621d72",
+    }
+
+    return namedtuple("LambdaContext", lambda_context.keys())(*lambda_context.values())
+
+
+@pytest.fixture
+def service_name():
+    chars = string.ascii_letters + string.digits
+    return "".join(random.SystemRandom().choice(chars) for _ in range(15))
+
+
+@pytest.fixture
+def trace_id(monkeypatch):
+    monkeypatch.setenv(constants.XRAY_TRACE_ID_ENV, "Root=1-5759e988-bd862e3fe1be46a994272793;Parent=53995c3f42cd8ad8")
+    return "1-5759e988-bd862e3fe1be46a994272793"
+
+
+def capture_multiple_logging_statements_output(stdout):
+    return [json.loads(line.strip()) for line in stdout.getvalue().split("\n") if line]
+
+
+def test_buffer_config_invalid_values():
+    # GIVEN invalid buffer configuration values
+    # WHEN LoggerBufferConfig is initialized
+    # THEN a ValueError should be raised
+    with pytest.raises(ValueError):
+        LoggerBufferConfig(max_bytes=0)
+
+    with pytest.raises(ValueError):
+        LoggerBufferConfig(buffer_at_verbosity="ERROR")
+
+
+def test_buffer_debug_logs_are_not_emitted_without_error(stdout, service_name, trace_id):
+    # GIVEN Logger is initialized with log buffering at INFO level
+    logger = Logger(service=service_name, stream=stdout, buffer_config=LoggerBufferConfig())
+
+    # WHEN debug logs are emitted without any error
+    logger.debug("buffered")
+    logger.info("not buffered")
+
+    # THEN only the info log should be written
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == ["not buffered"]
+
+
+def test_buffer_flushed_on_error_log(stdout, service_name, trace_id):
+    # GIVEN Logger is initialized with log buffering
+    logger = Logger(service=service_name, stream=stdout, buffer_config=LoggerBufferConfig())
+
+    # WHEN debug logs are buffered and an error is logged afterwards
+    logger.debug("first")
+    logger.debug("second %s", "arg")
+    logger.error("boom")
+
+    # THEN buffered logs should be written in order before the error log
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == ["first", "second arg", "boom"]
+    assert [log["level"] for log in logs] == ["DEBUG", "DEBUG", "ERROR"]
+    # and location should point to the original call site
+    assert logs[0]["location"].startswith("test_buffer_flushed_on_error_log:")
+
+
+def test_buffer_not_flushed_on_error_log_when_disabled(stdout, service_name, trace_id):
+    # GIVEN Logger is initialized with log buffering without flushing on error
+    logger = Logger(
+        service=service_name,
+        stream=stdout,
+        buffer_config=LoggerBufferConfig(flush_on_error_log=False),
+    )
+
+    # WHEN an error is logged
+    logger.debug("buffered")
+    logger.error("boom")
+
+    # THEN buffered logs should remain buffered until explicitly flushed
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == ["boom"]
+
+    logger.flush_buffer()
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == ["boom", "buffered"]
+
+
+def test_buffer_at_warning_verbosity(stdout, service_name, trace_id):
+    # GIVEN Logger is initialized with log buffering at WARNING level
+    logger = Logger(
+        service=service_name,
+        stream=stdout,
+        level="DEBUG",
+        buffer_config=LoggerBufferConfig(buffer_at_verbosity="WARNING"),
+    )
+
+    # WHEN debug, info and warning logs are emitted
+    logger.debug("debug")
+    logger.info("info")
+    logger.warning("warning")
+
+    # THEN nothing should be written until the buffer is flushed
+    assert stdout.getvalue() == ""
+
+    logger.flush_buffer()
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == ["debug", "info", "warning"]
+
+
+def test_buffer_logs_immediately_outside_invocation(stdout, service_name, monkeypatch):
+    # GIVEN Logger is initialized with log buffering and DEBUG level
+    monkeypatch.delenv(constants.XRAY_TRACE_ID_ENV, raising=False)
+    logger = Logger(service=service_name, stream=stdout, level="DEBUG", buffer_config=LoggerBufferConfig())
+
+    # WHEN logging outside of an invocation (no trace id nor request id)
+    logger.debug("not buffered")
+
+    # THEN the log should be written right away
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == ["not buffered"]
+
+
+def test_buffer_discarded_at_end_of_invocation(stdout, service_name, lambda_context, monkeypatch):
+    # GIVEN Logger is initialized with log buffering and no X-Ray tracing
+    monkeypatch.delenv(constants.XRAY_TRACE_ID_ENV, raising=False)
+    logger = Logger(service=service_name, stream=stdout, buffer_config=LoggerBufferConfig())
+
+    @logger.inject_lambda_context
+    def handler(event, context):
+        logger.debug("buffered")
+
+    # WHEN the handler completes successfully
+    handler({}, lambda_context)
+    logger.flush_buffer()
+
+    # THEN buffered logs should be discarded
+    assert stdout.getvalue() == ""
+
+
+def test_buffer_flushed_on_uncaught_exception(stdout, service_name, lambda_context, trace_id):
+    # GIVEN Logger is initialized with log buffering
+    logger = Logger(service=service_name, stream=stdout, buffer_config=LoggerBufferConfig())
+
+    @logger.inject_lambda_context
+    def handler(event, context):
+        logger.debug("buffered")
+        raise ValueError("oops")
+
+    # WHEN the handler raises an exception
+    with pytest.raises(ValueError):
+        handler({}, lambda_context)
+
+    # THEN buffered logs should be written along with Lambda context keys
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == ["buffered"]
+    assert logs[0]["function_request_id"] == lambda_context.aws_request_id
+
+
+def test_buffer_not_flushed_on_uncaught_exception_when_disabled(stdout, service_name, lambda_context, trace_id):
+    # GIVEN Logger is initialized with log buffering
+    logger = Logger(service=service_name, stream=stdout, buffer_config=LoggerBufferConfig())
+
+    @logger.inject_lambda_context(flush_buffer_on_uncaught_error=False)
+    def handler(event, context):
+        logger.debug("buffered")
+        raise ValueError("oops")
+
+    # WHEN the handler raises an exception
+    with pytest.raises(ValueError):
+        handler({}, lambda_context)
+
+    # THEN buffered logs should be discarded
+    assert stdout.getvalue() == ""
+
+
+def test_buffer_evicts_oldest_logs_when_full(stdout, service_name, trace_id):
+    # GIVEN Logger is initialized with a small log buffer
+    logger = Logger(service=service_name, stream=stdout, buffer_config=LoggerBufferConfig(max_bytes=10))
+
+    # WHEN more bytes than the buffer limit are logged
+    logger.debug("12345")
+    logger.debug("67890")
+    logger.debug("abcde")
+
+    # THEN the oldest logs should be evicted and a warning emitted when flushing
+    with pytest.warns(PowertoolsUserWarning, match="evicted"):
+        logger.flush_buffer()
+
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == [67890, "abcde"]
+
+
+def test_buffer_record_larger_than_buffer_is_dropped(stdout, service_name, trace_id):
+    # GIVEN Logger is initialized with a small log buffer
+    logger = Logger(service=service_name, stream=stdout, buffer_config=LoggerBufferConfig(max_bytes=10))
+
+    # WHEN a single log is larger than the buffer
+    # THEN a warning should be emitted
+    with pytest.warns(PowertoolsUserWarning, match="exceeds the buffer"):
+        logger.debug("a" * 11)
+
+    logger.flush_buffer()
+    assert stdout.getvalue() == ""
+
+
+def test_buffer_size_counts_utf8_bytes(stdout, service_name, trace_id):
+    # GIVEN Logger is initialized with a small log buffer
+    logger = Logger(service=service_name, stream=stdout, buffer_config=LoggerBufferConfig(max_bytes=10))
+
+    # WHEN a log of 4 characters, but 12 UTF-8 bytes, is buffered
+    # THEN it should exceed the buffer size
+    with pytest.warns(PowertoolsUserWarning, match="Log record of 12 bytes exceeds the buffer"):
+        logger.debug("ログ記録")
+
+
+def test_buffer_drops_previous_invocations_without_decorator(stdout, service_name, monkeypatch):
+    # GIVEN Logger with log buffering used without inject_lambda_context
+    logger = Logger(service=service_name, stream=stdout, buffer_config=LoggerBufferConfig())
+
+    # WHEN many invocations, each with their own trace id, buffer logs
+    for invocation in range(100):
+        monkeypatch.setenv(constants.XRAY_TRACE_ID_ENV, f"Root=1-5759e988-{invocation:024x}")
+        logger.debug(f"invocation {invocation}")
+
+    # THEN only the current invocation buffer should be kept in memory
+    assert list(logger._buffer_cache.cache) == [f"1-5759e988-{99:024x}"]
+
+    logger.flush_buffer()
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == ["invocation 99"]
+
+
+def test_buffer_shared_with_child_logger(stdout, service_name, trace_id):
+    # GIVEN a parent Logger with log buffering and a child Logger
+    logger = Logger(service=service_name, stream=stdout, buffer_config=LoggerBufferConfig())
+    child = Logger(service=service_name, child=True)
+
+    # WHEN the child logs a debug message and the parent logs an error
+    child.debug("from child")
+    logger.error("boom")
+
+    # THEN the child log should be flushed by the parent
+    logs = capture_multiple_logging_statements_output(stdout)
+    assert [log["message"] for log in logs] == ["from child", "boom"]
+
+
+def test_buffer_cache_thread_safety():
+    # GIVEN a buffer cache large enough for all items
+    cache = LoggerBufferCache(max_size_bytes=1_000_000)
+
+    def add_items():
+        for i in range(1000):
+            cache.add(key="key", item=i, item_size=1)
+
+    # WHEN many threads add to the same key concurrently
+    threads = [threading.Thread(target=add_items) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # THEN no items should be lost
+    items, has_evicted = cache.pop("key")
+    assert len(items) == 8000
+    assert has_evicted is False
@@ -6,7 +6,7 @@ import pytest
 
 from aws_lambda_powertools.metrics.exceptions import MetricValueError, SchemaValidationError
 from aws_lambda_powertools.metrics.provider.cold_start import reset_cold_start_flag
-from aws_lambda_powertools.metrics.provider.datadog import DatadogMetrics, DatadogProvider
+from aws_lambda_powertools.metrics.provider.datadog import DatadogMetrics, DatadogProvider, datadog
 
 
 def test_datadog_coldstart(capsys):
@@ -334,3 +334,138 @@ def test_namespace_env_var(monkeypatch):
 
     # THEN namespace should match the explicitly passed variable and not the env var
     assert output[0]["m"] == f"{env_namespace}.item_sold"
+
+
+def test_datadog_increment_aggregates_by_name_and_tags(capsys):
+    # GIVEN DatadogProvider is initialized
+    metrics = DatadogProvider(flush_to_log=True)
+
+    # WHEN counters are incremented many times, with tags in any order
+    for _ in range(1000):
+        metrics.increment(name="item_sold", product="latte", order="online")
+        metrics.increment(name="item_sold", order="online", product="latte", value=2)
+        metrics.increment(name="item_sold", product="mocha", order="online")
+    metrics.flush_metrics()
+
+    # THEN a single metric should be published per name and tags
+    logs = [json.loads(line) for line in capsys.readouterr().out.strip().split("\n")]
+    assert [(log["m"], log["v"], log["t"]) for log in logs] == [
+        ("item_sold", 3000, ["product:latte", "order:online"]),
+        ("item_sold", 1000, ["product:mocha", "order:online"]),
+    ]
+
+
+def test_datadog_gauge_keeps_last_value_and_timestamp(capsys):
+    # GIVEN DatadogProvider is initialized
+    metrics = DatadogProvider(flush_to_log=True)
+
+    # WHEN a gauge is set multiple times
+    metrics.gauge(name="queue_depth", value=10, timestamp=1691678198, queue="orders")
+    metrics.gauge(name="queue_depth", value=3, timestamp=1691678200, queue="orders")
+    metrics.flush_metrics()
+
+    # THEN the last value and latest timestamp should be published
+    logs = json.loads(capsys.readouterr().out.strip())
+    assert logs == {"m": "queue_depth", "v": 3, "e": 1691678200, "t": ["queue:orders"]}
+
+
+def test_datadog_distribution_groups_values_per_timestamp(capsys):
+    # GIVEN DatadogProvider is initialized
+    metrics = DatadogProvider(namespace="api", flush_to_log=True)
+
+    # WHEN values are added to a distribution at different timestamps
+    metrics.distribution(name="latency", value=12, timestamp=1691678198, endpoint="orders")
+    metrics.distribution(name="latency", value=5, timestamp=1691678200, endpoint="orders")
+    metrics.distribution(name="latency", value=7, timestamp=1691678198, endpoint="orders")
+    metrics.flush_metrics()
+
+    # THEN values sharing a timestamp should be published as a single point, so Datadog computes percentiles
+    logs = [json.loads(line) for line in capsys.readouterr().out.strip().split("\n")]
+    assert logs == [
+        {"m": "api.latency", "v": [12, 7], "e": 1691678198, "t": ["endpoint:orders"]},
+        {"m": "api.latency", "v": [5], "e": 1691678200, "t": ["endpoint:orders"]},
+    ]
+
+
+def test_datadog_distribution_bounds_values_per_point():
+    # GIVEN DatadogProvider is initialized
+    metrics = DatadogProvider(flush_to_log=True)
+
+    # WHEN more values than a point holds are added with the same timestamp
+    total = datadog.DISTRIBUTION_MAX_VALUES_PER_POINT * 2 + 1
+    for value in range(total):
+        metrics.distribution(name="latency", value=value, timestamp=1691678198)
+    output = metrics.serialize_metric_set()
+
+    # THEN values should be split across points of at most DISTRIBUTION_MAX_VALUES_PER_POINT values, in order
+    assert [len(point["v"]) for point in output] == [
+        datadog.DISTRIBUTION_MAX_VALUES_PER_POINT,
+        datadog.DISTRIBUTION_MAX_VALUES_PER_POINT,
+        1,
+    ]
+    assert [value for point in output for value in point["v"]] == list(range(total))
+
+
+def test_datadog_distribution_submitted_through_lambda_metric(monkeypatch):
+    # GIVEN DatadogProvider submits metrics through the Datadog extension
+    submitted = []
+    monkeypatch.setattr(datadog, "lambda_metric", lambda **kwargs: submitted.append(kwargs))
+    metrics = DatadogProvider(flush_to_log=False)
+
+    # WHEN values are added to a distribution
+    for latency in (5, 10, 15):
+        metrics.distribution(name="latency", value=latency, timestamp=1691678198)
+    metrics.flush_metrics()
+
+    # THEN each value should be submitted on its own, as lambda_metric accepts a single value
+    assert [(item["metric_name"], item["value"]) for item in submitted] == [
+        ("latency", 5),
+        ("latency", 10),
+        ("latency", 15),
+    ]
+
+
+def test_datadog_aggregated_metrics_validation():
+    # GIVEN DatadogMetrics is initialized
+    metrics = DatadogMetrics()
+
+    # WHEN aggregated metrics use invalid names or values
+    # THEN they should fail validation like add_metric
+    with pytest.raises(SchemaValidationError):
+        metrics.increment(name="1_invalid")
+
+    with pytest.raises(MetricValueError):
+        metrics.gauge(name="queue_depth", value="a")
+
+
+def test_datadog_serialized_tags_shared_per_unique_tag_set():
+    # GIVEN DatadogProvider is initialized with default tags
+    metrics = DatadogProvider(flush_to_log=True)
+    metrics.set_default_tags(environment="prod")
+
+    # WHEN many metrics share the same tags
+    for _ in range(10):
+        metrics.add_metric(name="item_sold", value=1, product="latte")
+    metrics.add_metric(name="item_sold", value=1, product="mocha")
+    output = metrics.serialize_metric_set()
+
+    # THEN tags should be serialized once per unique tag set
+    assert output[0]["t"] == ["environment:prod", "product:latte"]
+    assert all(metric["t"] is output[0]["t"] for metric in output[:10])
+    assert output[10]["t"] == ["environment:prod", "product:mocha"]
+
+
+def test_datadog_metrics_aggregated_methods(capsys):
+    # GIVEN DatadogMetrics is initialized
+    metrics = DatadogMetrics(flush_to_log=True)
+    metrics.clear_metrics()
+
+    # WHEN aggregated metrics are added
+    metrics.increment(name="item_sold")
+    metrics.gauge(name="queue_depth", value=3)
+    metrics.distribution(name="latency", value=10)
+    metrics.flush_metrics()
+
+    # THEN they should be published through the provider
+    logs = [json.loads(line)["m"] for line in capsys.readouterr().out.strip().split("\n")]
+    assert logs == ["item_sold", "queue_depth", "latency"]
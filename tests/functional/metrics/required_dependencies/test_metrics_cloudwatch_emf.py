@@ -1329,3 +1329,183 @@ def test_metric_custom_timestamp_with_wrong_type(namespace, metric):
             "This metric doesn't meet the requirements and will be skipped by Amazon CloudWatch. "
             "Ensure the timestamp is within 14 days past or 2 hours future."
         )
+
+
+def expand_aggregated_values(metric_value: Dict) -> List[float]:
+    """Helper function to expand EMF Values and Counts arrays into the list of recorded values"""
+    return [value for value, count in zip(metric_value["Values"], metric_value["Counts"]) for _ in range(count)]
+
+
+def test_metrics_aggregate_values_equivalent_to_raw_values(capsys, namespace):
+    # GIVEN two EMF providers, with and without value aggregation
+    values = [1, 5, 1, 1, 2.5, 5, 7]
+    raw_metrics = AmazonCloudWatchEMFProvider(namespace=namespace)
+    aggregated_metrics = AmazonCloudWatchEMFProvider(namespace=namespace, aggregate_values=True)
+
+    # WHEN the same values are recorded
+    for value in values:
+        raw_metrics.add_metric(name="Latency", unit=MetricUnit.Milliseconds, value=value)
+        aggregated_metrics.add_metric(name="Latency", unit=MetricUnit.Milliseconds, value=value)
+
+    raw_output = raw_metrics.serialize_metric_set()
+    aggregated_output = aggregated_metrics.serialize_metric_set()
+
+    # THEN identical values should be deduplicated into Values and Counts
+    assert aggregated_output["Latency"] == {"Values": [1.0, 5.0, 2.5, 7.0], "Counts": [3, 2, 1, 1]}
+    # and represent the same data points as the raw values
+    assert sorted(expand_aggregated_values(aggregated_output["Latency"])) == sorted(raw_output["Latency"])
+    # and keep the same metric definition
+    remove_timestamp(metrics=[raw_output, aggregated_output])
+    assert raw_output["_aws"] == aggregated_output["_aws"]
+
+
+def test_metrics_aggregate_values_reduces_emf_documents(capsys, namespace):
+    # GIVEN Metrics is initialized with value aggregation
+    my_metrics = Metrics(namespace=namespace, aggregate_values=True)
+
+    # WHEN a large number of values with low cardinality is recorded
+    @my_metrics.log_metrics
+    def lambda_handler(evt, ctx):
+        for i in range(10_000):
+            my_metrics.add_metric(name="RecordSize", unit=MetricUnit.Count, value=i % 10)
+
+    lambda_handler({}, {})
+
+    # THEN a single EMF document should hold all data points
+    outputs = capture_metrics_output_multiple_emf_objects(capsys)
+    assert len(outputs) == 1
+    assert sum(outputs[0]["RecordSize"]["Counts"]) == 10_000
+
+
+def test_metrics_aggregate_values_flushes_at_max_distinct_values(capsys, namespace):
+    # GIVEN Metrics is initialized with value aggregation
+    my_metrics = Metrics(namespace=namespace, aggregate_values=True)
+
+    # WHEN more than 100 distinct values are recorded
+    for i in range(150):
+        my_metrics.add_metric(name="RecordSize", unit=MetricUnit.Count, value=i)
+    my_metrics.flush_metrics()
+
+    # THEN values should be split across EMF documents without losing any
+    outputs = capture_metrics_output_multiple_emf_objects(capsys)
+    assert len(outputs) == 2
+    values = [value for output in outputs for value in expand_aggregated_values(output["RecordSize"])]
+    assert values == [float(i) for i in range(150)]
+
+
+def test_metrics_histogram_buckets(capsys, namespace):
+    # GIVEN Metrics is initialized with histogram buckets
+    my_metrics = Metrics(namespace=namespace, histogram_buckets=[100, 10, 50])
+
+    # WHEN values across buckets are recorded
+    for value in [1, 10, 11, 49, 50, 99, 250]:
+        my_metrics.add_metric(name="Latency", unit=MetricUnit.Milliseconds, value=value)
+    my_metrics.flush_metrics()
+
+    # THEN values should be recorded as their bucket upper bound
+    # and values above the last bucket kept as-is
+    output = capture_metrics_output(capsys)
+    assert output["Latency"] == {"Values": [10.0, 50.0, 100.0, 250.0], "Counts": [2, 3, 1, 1]}
+
+
+def test_metrics_add_dimension_set(capsys, namespace, service):
+    # GIVEN Metrics is initialized with a default dimension
+    my_metrics = Metrics(namespace=namespace, service=service)
+    my_metrics.set_default_dimensions(environment="prod")
+    my_metrics.add_dimension(name="operation", value="checkout")
+
+    # WHEN additional dimension sets are added
+    my_metrics.add_dimension_set(tenant_id="123")
+    my_metrics.add_dimension_set(region="eu-west-1", tenant_id="123")
+    my_metrics.add_metric(name="SuccessfulBooking", unit=MetricUnit.Count, value=1)
+    my_metrics.flush_metrics()
+
+    # THEN a single EMF blob should publish metrics under every dimension set
+    output = capture_metrics_output_multiple_emf_objects(capsys)
+    assert len(output) == 1
+    assert output[0]["_aws"]["CloudWatchMetrics"][0]["Dimensions"] == [
+        ["environment", "operation", "service"],
+        ["environment", "service", "tenant_id"],
+        ["environment", "service", "region", "tenant_id"],
+    ]
+    # and dimension values should be available at the root
+    assert output[0]["tenant_id"] == "123"
+    assert output[0]["region"] == "eu-west-1"
+    assert output[0]["operation"] == "checkout"
+
+
+def test_metrics_add_dimension_set_conflicting_value(namespace):
+    # GIVEN Metrics is initialized with a dimension
+    my_metrics = Metrics(namespace=namespace)
+    my_metrics.add_dimension(name="tenant_id", value="123")
+
+    # WHEN a dimension set uses a different value for the same dimension
+    # THEN a warning should be raised and the dimension skipped
+    with pytest.warns(UserWarning, match="tenant_id already has a different value"):
+        my_metrics.add_dimension_set(tenant_id="456")
+
+    assert my_metrics.dimension_sets == []
+
+
+def test_metrics_per_metric_dimensions_grouped_by_signature(capsys, namespace, service):
+    # GIVEN Metrics is initialized with a shared dimension
+    my_metrics = Metrics(namespace=namespace, service=service)
+    my_metrics.add_dimension(name="operation", value="checkout")
+
+    # WHEN metrics are added for many tenants, with dimensions in any order
+    for tenant_id in ("a", "b", "a", "b"):
+        my_metrics.add_metric(name="Orders", unit=MetricUnit.Count, value=1, dimensions={"tenant_id": tenant_id})
+        my_metrics.add_metric(
+            name="Revenue",
+            unit=MetricUnit.Count,
+            value=10,
+            dimensions={"plan": "pro", "tenant_id": tenant_id},
+        )
+    my_metrics.add_metric(name="Revenue", unit=MetricUnit.Count, value=5, dimensions={"tenant_id": "a", "plan": "pro"})
+    my_metrics.add_metric(name="Requests", unit=MetricUnit.Count, value=1)
+    my_metrics.flush_metrics()
+
+    # THEN one EMF blob should be published per distinct dimensions
+    outputs = capture_metrics_output_multiple_emf_objects(capsys)
+    assert len(outputs) == 5
+
+    assert outputs[0]["Requests"] == [1.0]
+    assert outputs[0]["_aws"]["CloudWatchMetrics"][0]["Dimensions"] == [["operation", "service"]]
+
+    tenant_blobs = [output for output in outputs[1:] if "Orders" in output]
+    assert [(blob["tenant_id"], blob["Orders"]) for blob in tenant_blobs] == [("a", [1.0, 1.0]), ("b", [1.0, 1.0])]
+    assert tenant_blobs[0]["_aws"]["CloudWatchMetrics"][0]["Dimensions"] == [["operation", "service", "tenant_id"]]
+
+    revenue_blobs = [output for output in outputs[1:] if "Revenue" in output]
+    assert [(blob["tenant_id"], blob["Revenue"]) for blob in revenue_blobs] == [
+        ("a", [10.0, 10.0, 5.0]),
+        ("b", [10.0, 10.0]),
+    ]
+    assert all(blob["plan"] == "pro" and blob["operation"] == "checkout" for blob in revenue_blobs)
+
+
+def test_metrics_per_metric_dimensions_flushed_at_max_metrics(capsys, namespace):
+    # GIVEN Metrics is initialized
+    my_metrics = Metrics(namespace=namespace)
+
+    # WHEN more than 100 values are added for the same metric dimensions
+    for i in range(101):
+        my_metrics.add_metric(name="Orders", unit=MetricUnit.Count, value=i, dimensions={"tenant_id": "a"})
+    my_metrics.flush_metrics()
+
+    # THEN values should be split across EMF blobs without losing any
+    outputs = capture_metrics_output_multiple_emf_objects(capsys)
+    assert [len(output["Orders"]) for output in outputs] == [100, 1]
+    assert all(output["tenant_id"] == "a" for output in outputs)
+
+
+def test_metrics_per_metric_dimensions_max_dimensions(namespace):
+    # GIVEN Metrics is initialized with the maximum number of dimensions
+    my_metrics = Metrics(namespace=namespace)
+    for i in range(MAX_DIMENSIONS):
+        my_metrics.add_dimension(name=f"dimension_{i}", value="test")
+
+    # WHEN a metric adds another dimension
+    # THEN it should fail validation
+    with pytest.raises(SchemaValidationError, match="Maximum number of dimensions exceeded"):
+        my_metrics.add_metric(name="Orders", unit=MetricUnit.Count, value=1, dimensions={"tenant_id": "a"})
@@ -0,0 +1,308 @@
+import json
+import logging
+import socket
+import threading
+import time
+from typing import List
+
+import pytest
+
+from aws_lambda_powertools.metrics import Metrics, MetricUnit, SchemaValidationError
+from aws_lambda_powertools.metrics.flusher import BaseMetricSink, FileSink, MetricsFlusher, StdoutSink, UdpSink
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.cloudwatch import AmazonCloudWatchEMFProvider
+from aws_lambda_powertools.metrics.provider.datadog import DatadogProvider
+
+
+class InMemorySink(BaseMetricSink):
+    def __init__(self):
+        self.lines: List[str] = []
+        self.closed = False
+
+    def write(self, lines: List[str]) -> None:
+        self.lines.extend(lines)
+
+    def close(self) -> None:
+        self.closed = True
+
+    @property
+    def documents(self) -> List[dict]:
+        return [json.loads(line) for line in self.lines]
+
+
+def wait_for(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def sink():
+    return InMemorySink()
+
+
+@pytest.fixture
+def provider(namespace):
+    return AmazonCloudWatchEMFProvider(namespace=namespace)
+
+
+def test_flusher_flushes_on_interval(provider, sink):
+    # GIVEN a flusher with a short interval
+    flusher = MetricsFlusher(provider, sink=sink, interval_seconds=0.05)
+
+    # WHEN a metric is added
+    flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=1)
+
+    # THEN it should be written to the sink without flushing explicitly
+    assert wait_for(lambda: len(sink.lines) == 1)
+    assert sink.documents[0]["JobProcessed"] == [1.0]
+    flusher.close()
+
+
+def test_flusher_flushes_when_max_metrics_reached(provider, sink):
+    # GIVEN a flusher with a long interval and a small metrics threshold
+    flusher = MetricsFlusher(provider, sink=sink, interval_seconds=60, max_metrics=10)
+
+    # WHEN the threshold is reached
+    for _ in range(10):
+        flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=1)
+
+    # THEN metrics should be flushed before the interval elapses
+    assert wait_for(lambda: len(sink.lines) == 1)
+    assert len(sink.documents[0]["JobProcessed"]) == 10
+    flusher.close()
+
+
+def test_flusher_writes_when_max_bytes_reached(provider, sink):
+    # GIVEN a flusher with a long interval and a small bytes threshold
+    flusher = MetricsFlusher(provider, sink=sink, interval_seconds=60, max_bytes=1)
+
+    # WHEN the provider serializes metrics on its own (100 values per EMF blob)
+    for _ in range(100):
+        flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=1)
+
+    # THEN pending metrics should be written before the interval elapses
+    assert wait_for(lambda: len(sink.lines) >= 1)
+    assert len(sink.documents[0]["JobProcessed"]) == 100
+    flusher.close()
+
+
+def test_flusher_close_drains_pending_metrics(provider, sink):
+    # GIVEN a flusher with pending metrics
+    flusher = MetricsFlusher(provider, sink=sink, interval_seconds=60)
+    flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=1)
+    thread = flusher._thread
+
+    # WHEN the flusher is closed
+    flusher.close()
+
+    # THEN pending metrics should be written, the sink closed and the thread stopped
+    assert sink.documents[0]["JobProcessed"] == [1.0]
+    assert sink.closed is True
+    assert thread is not None and not thread.is_alive()
+    # and the provider should print metrics as usual afterwards
+    assert provider.sink is None
+
+
+def test_flusher_many_threads_no_lost_metrics(provider, sink):
+    # GIVEN a flusher flushing often
+    flusher = MetricsFlusher(provider, sink=sink, interval_seconds=0.01, max_metrics=50)
+
+    def add_metrics():
+        for _ in range(500):
+            flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=1)
+
+    # WHEN metrics are added from many threads concurrently
+    threads = [threading.Thread(target=add_metrics) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    flusher.close()
+
+    # THEN every metric value should be written exactly once
+    assert sum(len(document["JobProcessed"]) for document in sink.documents) == 4000
+
+
+def test_flusher_with_metrics_instance(namespace, sink):
+    # GIVEN a flusher wrapping a Metrics instance
+    metrics = Metrics(namespace=namespace)
+    flusher = MetricsFlusher(metrics, sink=sink, interval_seconds=60)
+
+    # WHEN metrics with their own dimensions are added and flushed
+    flusher.add_metric(name="Orders", unit=MetricUnit.Count, value=1, dimensions={"tenant_id": "a"})
+    flusher.add_metric(name="Orders", unit=MetricUnit.Count, value=1, dimensions={"tenant_id": "b"})
+    flusher.flush()
+    flusher.close()
+
+    # THEN one EMF blob per tenant should be written to the sink
+    assert [document["tenant_id"] for document in sink.documents] == ["a", "b"]
+
+
+def test_flusher_with_datadog_provider(sink):
+    # GIVEN a flusher wrapping a Datadog provider
+    flusher = MetricsFlusher(DatadogProvider(namespace="jobs"), sink=sink, interval_seconds=60)
+
+    # WHEN metrics are added and flushed
+    flusher.add_metric(name="processed", value=1, queue="high")
+    flusher.add_metric(name="processed", value=2, queue="low")
+    flusher.close()
+
+    # THEN each metric should be written to the sink
+    assert [(document["m"], document["v"], document["t"]) for document in sink.documents] == [
+        ("jobs.processed", 1, ["queue:high"]),
+        ("jobs.processed", 2, ["queue:low"]),
+    ]
+
+
+def test_flusher_drops_metrics_failing_validation(sink):
+    # GIVEN a flusher whose provider has no namespace, so its metrics fail validation
+    provider = AmazonCloudWatchEMFProvider()
+    flusher = MetricsFlusher(provider, sink=sink, interval_seconds=60)
+    flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=1)
+
+    # WHEN flushing
+    with pytest.raises(SchemaValidationError):
+        flusher.flush()
+
+    # THEN invalid metrics should be dropped instead of failing every flush
+    assert not flusher._has_metrics()
+    flusher.flush()
+
+    # and valid metrics added later should still be written
+    provider.namespace = "Flusher"
+    flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=1)
+    flusher.close()
+    assert [document["JobProcessed"] for document in sink.documents] == [[1.0]]
+
+
+def test_flusher_retries_failed_sink_writes(provider):
+    # GIVEN a sink failing to write once
+    class FlakySink(InMemorySink):
+        def __init__(self):
+            super().__init__()
+            self.failures = 1
+
+        def write(self, lines: List[str]) -> None:
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("sink unavailable")
+            super().write(lines)
+
+    sink = FlakySink()
+    flusher = MetricsFlusher(provider, sink=sink, interval_seconds=60)
+    flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=1)
+
+    # WHEN the sink fails to write
+    with pytest.raises(ConnectionError):
+        flusher.flush()
+
+    # THEN metrics should be written, in order, on the next flush
+    flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=2)
+    flusher.close()
+    assert [document["JobProcessed"] for document in sink.documents] == [[1.0], [2.0]]
+
+
+class FailingSink(InMemorySink):
+    def __init__(self):
+        super().__init__()
+        self.failing = True
+        self.attempts = 0
+
+    def write(self, lines: List[str]) -> None:
+        self.attempts += 1
+        if self.failing:
+            raise ConnectionError("sink unavailable")
+        super().write(lines)
+
+
+def test_flusher_bounds_retried_lines_when_sink_keeps_failing(provider, caplog, monkeypatch):
+    # GIVEN a sink that keeps failing to write
+    monkeypatch.setattr(logging.getLogger("aws_lambda_powertools"), "propagate", True)
+    sink = FailingSink()
+    flusher = MetricsFlusher(provider, sink=sink, interval_seconds=60, max_bytes=1024)
+
+    # WHEN metrics keep being flushed
+    for value in range(20):
+        flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=value)
+        with pytest.raises(ConnectionError):
+            flusher.flush()
+
+    # THEN at most max_bytes of lines should be kept, dropping the oldest ones
+    assert 0 < flusher._buffer_bytes <= 1024
+    assert "serialized metrics exceeding max_bytes" in caplog.text
+
+    # and the newest lines should be written once the sink recovers
+    sink.failing = False
+    flusher.close()
+    written = [document["JobProcessed"][0] for document in sink.documents]
+    assert written == list(range(20 - len(written), 20))
+
+
+def test_flusher_backs_off_when_sink_keeps_failing(provider):
+    # GIVEN a sink that keeps failing, and a flusher woken up on every metric
+    sink = FailingSink()
+    flusher = MetricsFlusher(provider, sink=sink, interval_seconds=60, max_metrics=1)
+
+    # WHEN metrics keep being added
+    deadline = time.monotonic() + 0.5
+    while time.monotonic() < deadline:
+        flusher.add_metric(name="JobProcessed", unit=MetricUnit.Count, value=1)
+        time.sleep(0.01)
+
+    # THEN the background thread should wait before retrying the sink
+    assert wait_for(lambda: sink.attempts >= 1)
+    assert sink.attempts == 1
+
+    sink.failing = False
+    flusher.close()
+    assert len(sink.lines) > 0
+
+
+def test_flusher_invalid_interval(provider):
+    # GIVEN an invalid interval
+    # WHEN MetricsFlusher is initialized
+    # THEN a ValueError should be raised
+    with pytest.raises(ValueError):
+        MetricsFlusher(provider, interval_seconds=0)
+
+
+def test_stdout_sink(capsys):
+    # GIVEN a StdoutSink
+    # WHEN lines are written
+    StdoutSink().write(['{"a":1}', '{"b":2}'])
+
+    # THEN each line should be printed
+    assert capsys.readouterr().out == '{"a":1}\n{"b":2}\n'
+
+
+def test_file_sink(tmp_path):
+    # GIVEN a FileSink
+    path = tmp_path / "metrics.log"
+    sink = FileSink(str(path))
+
+    # WHEN lines are written in multiple batches
+    sink.write(['{"a":1}'])
+    sink.write(['{"b":2}'])
+    sink.close()
+
+    # THEN lines should be appended to the file
+    assert path.read_text() == '{"a":1}\n{"b":2}\n'
+
+
+def test_udp_sink():
+    # GIVEN a local UDP agent
+    agent = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    agent.bind(("127.0.0.1", 0))
+    agent.settimeout(5)
+    sink = UdpSink(port=agent.getsockname()[1])
+
+    # WHEN lines are written
+    sink.write(['{"a":1}', '{"b":2}'])
+    sink.close()
+
+    # THEN each line should be sent as a datagram
+    assert [agent.recv(1024), agent.recv(1024)] == [b'{"a":1}\n', b'{"b":2}\n']
+    agent.close()
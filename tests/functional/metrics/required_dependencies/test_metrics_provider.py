@@ -74,3 +74,20 @@ def test_metrics_provider_class_decorator_with_additional_handler_args():
     # the wrapped function is passed additional arguments
     assert lambda_handler({}, {}, "arg_value", additional_kw_arg="kw_arg_value") == ("arg_value", "kw_arg_value")
     assert lambda_handler({}, {}, "arg_value") == ("arg_value", "default_value")
+
+
+def test_metrics_class_with_custom_provider_without_dimensions_parameter(capsys):
+    # GIVEN a custom provider whose add_metric doesn't support per-metric dimensions
+    class StrictMetricsProvider(FakeMetricsProvider):
+        def add_metric(self, name: str, unit: str, value: float, resolution: int = 60):
+            self.metric_store.append({"name": name, "value": value})
+
+    metrics = Metrics(provider=StrictMetricsProvider())
+
+    # WHEN adding a metric without dimensions
+    metrics.add_metric(name="SuccessfulBooking", unit="Count", value=1)
+    metrics.flush_metrics()
+
+    # THEN the metric should be added without passing dimensions to the provider
+    output = capture_metrics_output(capsys)
+    assert output == [{"name": "SuccessfulBooking", "value": 1}]
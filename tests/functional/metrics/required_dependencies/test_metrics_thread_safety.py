@@ -0,0 +1,102 @@
+import json
+import threading
+from typing import List
+
+from aws_lambda_powertools.metrics import Metrics, MetricUnit
+from aws_lambda_powertools.metrics.flusher import BaseMetricSink
+
+THREADS = 32
+METRICS_PER_THREAD = 500
+
+
+class InMemorySink(BaseMetricSink):
+    def __init__(self):
+        self.lines: List[str] = []
+        self._lock = threading.Lock()
+
+    def write(self, lines: List[str]) -> None:
+        with self._lock:
+            self.lines.extend(lines)
+
+    @property
+    def documents(self) -> List[dict]:
+        return [json.loads(line) for line in self.lines]
+
+
+def run_threads(target, count: int = THREADS):
+    barrier = threading.Barrier(count)
+
+    def run(index: int):
+        barrier.wait()  # maximize contention
+        target(index)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_metrics_concurrent_add_metric_and_flush(namespace):
+    # GIVEN Metrics instances sharing data and writing to the same sink
+    sink = InMemorySink()
+    metrics = Metrics(namespace=namespace)
+    metrics.provider.sink = sink
+    stop_flushing = threading.Event()
+
+    def add_metrics(index: int):
+        # each thread uses its own Metrics instance, as in a thread-pool batch handler
+        thread_metrics = Metrics(namespace=namespace)
+        thread_metrics.provider.sink = sink
+        for i in range(METRICS_PER_THREAD):
+            thread_metrics.add_metric(name=f"Metric{i % 5}", unit=MetricUnit.Count, value=1)
+            thread_metrics.add_metric(name="Tenant", unit=MetricUnit.Count, value=1, dimensions={"tenant": str(i % 3)})
+            thread_metrics.add_metadata(key=f"thread_{index}", value=i)
+
+    def flush_periodically():
+        while not stop_flushing.is_set():
+            metrics.flush_metrics(raise_on_empty_metrics=False)
+
+    # WHEN metrics are added from 32 threads while being flushed concurrently
+    flusher = threading.Thread(target=flush_periodically)
+    flusher.start()
+    try:
+        run_threads(add_metrics)
+    finally:
+        stop_flushing.set()
+        flusher.join()
+    metrics.flush_metrics()
+
+    # THEN no metric value should be lost nor duplicated
+    documents = sink.documents
+    totals = {}
+    for document in documents:
+        for metric in document["_aws"]["CloudWatchMetrics"][0]["Metrics"]:
+            totals[metric["Name"]] = totals.get(metric["Name"], 0) + len(document[metric["Name"]])
+
+    expected_per_metric = THREADS * METRICS_PER_THREAD // 5
+    assert totals == {
+        **{f"Metric{i}": expected_per_metric for i in range(5)},
+        "Tenant": THREADS * METRICS_PER_THREAD,
+    }
+    # and each EMF blob should respect the maximum number of values per metric
+    assert all(len(document[name]) <= 100 for document in documents for name in totals if name in document)
+
+
+def test_metrics_concurrent_aggregated_values(namespace):
+    # GIVEN Metrics is initialized with value aggregation
+    sink = InMemorySink()
+    metrics = Metrics(namespace=namespace, aggregate_values=True)
+    metrics.provider.sink = sink
+
+    def add_metrics(index: int):
+        for i in range(METRICS_PER_THREAD):
+            metrics.add_metric(name="Latency", unit=MetricUnit.Milliseconds, value=i % 10)
+
+    # WHEN the same instance is used from 32 threads
+    run_threads(add_metrics)
+    metrics.flush_metrics()
+
+    # THEN counts should add up to every recorded value
+    counts = [count for document in sink.documents for count in document["Latency"]["Counts"]]
+    assert sum(counts) == THREADS * METRICS_PER_THREAD
@@ -7,11 +7,12 @@ import pytest
 from pydantic import ValidationError
 from typing_extensions import Annotated
 
-from aws_lambda_powertools.utilities.parser import event_parser, exceptions, parse
+from aws_lambda_powertools.utilities.parser import BaseEnvelope, event_parser, exceptions, parse
 from aws_lambda_powertools.utilities.parser.envelopes.sqs import SqsEnvelope
 from aws_lambda_powertools.utilities.parser.models import SqsModel
 from aws_lambda_powertools.utilities.parser.models.event_bridge import EventBridgeModel
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from tests.functional.utils import load_event
 
 
 @pytest.mark.parametrize("invalid_value", [None, False, [], (), object])
@@ -235,3 +236,132 @@ def test_parser_with_model_type_model_and_envelope():
         assert parsed_event[0].version == "version"
 
     handler(event, LambdaContext())
+
+
+def test_parser_single_pass_with_custom_envelope_falls_back_to_parse(dummy_event, dummy_schema, dummy_envelope):
+    # GIVEN a custom envelope not implementing single pass parsing
+    # WHEN parsing without validating the envelope
+    parsed_event = parse(event=dummy_event, model=dummy_schema, envelope=dummy_envelope, validate_envelope=False)
+
+    # THEN it should parse the envelope and model separately
+    assert parsed_event.message == dummy_event["payload"]["message"]
+
+
+def test_parser_single_pass_with_type_adapter_instance():
+    # GIVEN an SQS event and a TypeAdapter model
+    event = {"Records": [{"body": json.dumps({"status": "failed", "error": "oh some error"})}]}
+
+    class FailedCallback(pydantic.BaseModel):
+        status: Literal["failed"]
+        error: str
+
+    adapter = pydantic.TypeAdapter(FailedCallback)
+
+    # WHEN parsing without validating the envelope
+    # THEN it should fall back to validating the envelope, which is incomplete
+    with pytest.raises(ValidationError):
+        parse(event=event, model=adapter, envelope=SqsEnvelope, validate_envelope=False)
+
+
+def test_event_parser_single_pass(dummy_schema):
+    # GIVEN an SQS event missing envelope fields unused by the model
+    event = {"Records": [{"body": json.dumps({"message": "hello world"})}]}
+
+    @event_parser(model=dummy_schema, envelope=SqsEnvelope, validate_envelope=False)
+    def handler(event, _: Any):
+        return event
+
+    # WHEN the handler is invoked
+    ret = handler(event, None)
+
+    # THEN only the body should be validated against the model
+    assert ret[0].message == "hello world"
+
+
+def test_event_parser_tolerant(dummy_schema):
+    # GIVEN an SQS event with a malformed record
+    event = load_event("sqsEvent.json")
+    event["Records"][0]["body"] = json.dumps({"message": "hello world"})
+    event["Records"][1]["body"] = json.dumps({"text": "hello world"})
+
+    @event_parser(model=dummy_schema, envelope=SqsEnvelope, tolerant=True)
+    def handler(event, _: Any):
+        return event
+
+    # WHEN the handler is invoked
+    ret = handler(event, None)
+
+    # THEN it should receive valid records and errors for malformed ones
+    assert ret.models[0].message == "hello world"
+    assert ret.batch_item_failures() == [{"itemIdentifier": event["Records"][1]["messageId"]}]
+
+
+def test_parser_tolerant_with_envelope_without_records(dummy_event, dummy_schema, dummy_envelope):
+    # GIVEN a custom envelope not implementing tolerant parsing
+    # WHEN parsing valid and malformed events in tolerant mode
+    valid = parse(event=dummy_event, model=dummy_schema, envelope=dummy_envelope, tolerant=True)
+    malformed = parse(event={"payload": {}}, model=dummy_schema, envelope=dummy_envelope, tolerant=True)
+
+    # THEN the entire event should be parsed as a single record
+    assert valid.models[0].message == "hello world"
+    assert valid.errors == []
+    assert malformed.models == {}
+    assert malformed.errors[0].index == 0
+    assert malformed.errors[0].record == {"payload": {}}
+
+    # and it can't be reported as a batch item failure
+    with pytest.raises(exceptions.MissingItemIdentifierError):
+        malformed.batch_item_failures()
+
+
+def test_event_parser_lazy(dummy_schema):
+    # GIVEN an SQS event whose last record is malformed
+    event = load_event("sqsEvent.json")
+    event["Records"][0]["body"] = json.dumps({"message": "hello world"})
+    event["Records"][1]["body"] = "Not valid json"
+
+    @event_parser(model=dummy_schema, envelope=SqsEnvelope, lazy=True)
+    def handler(event, _: Any):
+        return next(event)
+
+    # WHEN the handler only consumes the first record
+    ret = handler(event, None)
+
+    # THEN the malformed record should never be validated
+    assert ret.message == "hello world"
+
+
+def test_parser_lazy_with_envelope_without_records(dummy_event, dummy_schema, dummy_envelope):
+    # GIVEN a custom envelope not implementing lazy parsing
+    # WHEN parsing a malformed event lazily
+    records = parse(event={"payload": {}}, model=dummy_schema, envelope=dummy_envelope, lazy=True)
+
+    # THEN it should only be validated once iterated
+    with pytest.raises(ValidationError):
+        next(records)
+
+    # and a valid event should be parsed as a single record
+    (record,) = parse(event=dummy_event, model=dummy_schema, envelope=dummy_envelope, lazy=True)
+    assert record.message == "hello world"
+
+
+def test_parser_lazy_with_envelope_returning_list(dummy_schema):
+    # GIVEN a custom envelope returning a list, not implementing lazy parsing
+    class ListEnvelope(BaseEnvelope):
+        def parse(self, data, model):
+            return [self._parse(data=item, model=model) for item in data["items"]]
+
+    # WHEN parsing lazily
+    event = {"items": [{"message": "a"}, {"message": "b"}]}
+    records = parse(event=event, model=dummy_schema, envelope=ListEnvelope, lazy=True)
+
+    # THEN each item should be yielded
+    assert [record.message for record in records] == ["a", "b"]
+
+
+def test_parser_tolerant_and_lazy(dummy_event, dummy_schema):
+    # GIVEN both tolerant and lazy parsing are requested
+    # WHEN parsing
+    # THEN it should raise ValueError
+    with pytest.raises(ValueError):
+        parse(event=dummy_event, model=dummy_schema, envelope=SqsEnvelope, tolerant=True, lazy=True)
@@ -1,4 +1,10 @@
-from aws_lambda_powertools.shared.lazy_import import LazyLoader
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from aws_lambda_powertools.shared.lazy_import import LazyLoader, lazy_exports
 
 
 def test_lazy_loader_dir():
@@ -7,3 +13,63 @@ def test_lazy_loader_dir():
     module_dir = lazy_loader.__dir__()
     assert isinstance(module_dir, list)
     assert "Enum" in module_dir
+
+
+@pytest.mark.parametrize(
+    "package",
+    [
+        "aws_lambda_powertools",
+        "aws_lambda_powertools.event_handler",
+        "aws_lambda_powertools.utilities.data_classes",
+        "aws_lambda_powertools.utilities.parser.envelopes",
+        "aws_lambda_powertools.utilities.parser.models",
+    ],
+)
+def test_lazy_exports_packages(package):
+    # GIVEN a package exporting names lazily
+    module = importlib.import_module(package)
+
+    # WHEN resolving every exported name
+    # THEN each one should be importable and listed by dir()
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+
+def test_lazy_exports_imports_on_first_access():
+    # GIVEN a package exporting a name lazily
+    module_globals = {"__name__": "tests.functional"}
+    __getattr__, __dir__ = lazy_exports(
+        module_globals,
+        {"Enum": "enum", "LazyLoader": "aws_lambda_powertools.shared.lazy_import"},
+    )
+
+    # WHEN accessing exported names
+    # THEN they should be imported from their module and cached in the package globals
+    assert __getattr__("LazyLoader") is LazyLoader
+    assert module_globals["LazyLoader"] is LazyLoader
+    assert "Enum" in __dir__() and "Enum" not in module_globals
+
+
+def test_lazy_exports_unknown_name():
+    # GIVEN a package exporting names lazily
+    __getattr__, _ = lazy_exports({"__name__": "tests.functional"}, {"Enum": "enum"})
+
+    # WHEN accessing a name that isn't exported
+    # THEN an AttributeError should be raised
+    with pytest.raises(AttributeError, match="module 'tests.functional' has no attribute 'Flag'"):
+        __getattr__("Flag")
+
+
+def test_lazy_exports_from_import():
+    # GIVEN a fresh import of the top-level package
+    code = (
+        "import sys; import aws_lambda_powertools; "
+        "assert 'aws_lambda_powertools.logging.logger' not in sys.modules; "
+        "from aws_lambda_powertools import Logger; "
+        "assert Logger.__module__ == 'aws_lambda_powertools.logging.logger'"
+    )
+
+    # WHEN importing it, then an exported name
+    # THEN core utilities should only be imported when accessed
+    subprocess.run([sys.executable, "-c", code], check=True)
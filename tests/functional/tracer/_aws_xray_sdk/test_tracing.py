@@ -1,4 +1,5 @@
 import contextlib
+import time
 
 import pytest
 
@@ -226,3 +227,70 @@ def test_tracer_yield_with_capture():
     result = handler({}, {})
     assert "testresult" in result
     assert "testresult2" in result
+
+
+@pytest.fixture
+def xray_recorder(monkeypatch):
+    from aws_xray_sdk import global_sdk_config
+    from aws_xray_sdk.core import xray_recorder
+    from aws_xray_sdk.core.context import Context
+
+    # segments can't be created in Lambda, where the recorder discards them
+    monkeypatch.delenv("LAMBDA_TASK_ROOT", raising=False)
+    context = xray_recorder.context
+    xray_recorder.context = Context()
+    sdk_enabled = global_sdk_config.sdk_enabled()
+    global_sdk_config.set_sdk_enabled(True)
+    streaming_threshold = xray_recorder.streaming_threshold
+    # keep subsegments in their segment instead of streaming them to the X-Ray daemon
+    xray_recorder.configure(streaming_threshold=1000)
+    yield xray_recorder
+    xray_recorder.clear_trace_entities()
+    xray_recorder.context = context
+    xray_recorder.configure(streaming_threshold=streaming_threshold)
+    global_sdk_config.set_sdk_enabled(sdk_enabled)
+
+
+def test_tracer_method_not_sampled(xray_recorder, dummy_response):
+    # GIVEN tracer is enabled and the current segment isn't sampled
+    tracer = Tracer(disabled=False, auto_patch=False)
+    xray_recorder.configure(streaming_threshold=1000)
+    segment = xray_recorder.begin_segment("handler", sampling=0)
+
+    # WHEN a method decorated with capture_method is called
+    @tracer.capture_method
+    def greeting():
+        return dummy_response
+
+    # THEN it should be called without creating any subsegment
+    assert greeting() == dummy_response
+    assert xray_recorder.current_segment() is segment
+    assert segment.subsegments == []
+
+
+def test_tracer_method_min_duration_backdates_subsegment(xray_recorder, dummy_response):
+    # GIVEN tracer is enabled and the current segment is sampled
+    tracer = Tracer(disabled=False, auto_patch=False)
+    xray_recorder.configure(streaming_threshold=1000)
+    segment = xray_recorder.begin_segment("handler", sampling=1)
+
+    # WHEN methods slower and faster than their minimum duration are called
+    @tracer.capture_method(min_duration_ms=5)
+    def slow_greeting():
+        time.sleep(0.02)
+        return dummy_response
+
+    @tracer.capture_method(min_duration_ms=10_000)
+    def fast_greeting():
+        return dummy_response
+
+    slow_greeting()
+    fast_greeting()
+
+    # THEN only the slower method should be recorded, starting when it was called
+    assert [subsegment.name for subsegment in segment.subsegments] == [
+        "## tests.functional.tracer._aws_xray_sdk.test_tracing."
+        "test_tracer_method_min_duration_backdates_subsegment.locals.slow_greeting",
+    ]
+    subsegment = segment.subsegments[0]
+    assert subsegment.end_time - subsegment.start_time >= 0.02
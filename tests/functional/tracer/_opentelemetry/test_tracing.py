@@ -0,0 +1,200 @@
+import json
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF  # noqa: E402
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+from aws_lambda_powertools import Tracer  # noqa: E402
+from aws_lambda_powertools.tracing.provider.opentelemetry import (  # noqa: E402
+    FileSpanExporter,
+    OpenTelemetryProvider,
+)
+from aws_lambda_powertools.tracing.provider.opentelemetry import provider as opentelemetry_provider  # noqa: E402
+
+MODULE_PREFIX = "tests.functional.tracer._opentelemetry.test_tracing"
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_tracing_config():
+    Tracer._reset_config()
+    yield
+    Tracer._reset_config()
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    provider = OpenTelemetryProvider(service="booking", exporter=exporter)
+    return Tracer(service="booking", provider=provider, disabled=False, auto_patch=False)
+
+
+def test_capture_lambda_handler_and_method_spans(tracer, exporter):
+    # GIVEN Tracer is initialized with the OpenTelemetry provider
+    @tracer.capture_method
+    def greeting(name):
+        return {"message": f"hello {name}"}
+
+    @tracer.capture_lambda_handler
+    def handler(event, context):
+        tracer.put_annotation(key="PaymentStatus", value="CONFIRMED")
+        return greeting(name="Foo")
+
+    # WHEN the handler is called
+    handler({}, {})
+
+    # THEN spans should be exported when the handler span ends, without flushing explicitly
+    method_span, handler_span = exporter.get_finished_spans()
+    assert handler_span.name == "## handler"
+    assert method_span.name == f"## {MODULE_PREFIX}.test_capture_lambda_handler_and_method_spans.locals.greeting"
+    assert method_span.parent.span_id == handler_span.context.span_id
+    assert handler_span.resource.attributes["service.name"] == "booking"
+
+    # and annotations and metadata should be added as span attributes
+    assert handler_span.attributes["PaymentStatus"] == "CONFIRMED"
+    assert handler_span.attributes["Service"] == "booking"
+    assert "ColdStart" in handler_span.attributes
+    metadata = method_span.attributes[f"booking.{method_span.name[3:]} response"]
+    assert json.loads(metadata) == {"message": "hello Foo"}
+
+
+def test_capture_method_exception(tracer, exporter):
+    # GIVEN Tracer is initialized with the OpenTelemetry provider
+    @tracer.capture_method
+    def greeting():
+        raise ValueError("oops")
+
+    # WHEN a decorated method raises an exception
+    with pytest.raises(ValueError):
+        greeting()
+
+    # THEN the span should record the exception with an error status
+    (span,) = exporter.get_finished_spans()
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.events[0].name == "exception"
+    assert span.attributes[f"booking.{span.name[3:]} error"] == '"oops"'
+
+
+@pytest.mark.asyncio
+async def test_capture_method_async(tracer, exporter):
+    # GIVEN Tracer is initialized with the OpenTelemetry provider
+    @tracer.capture_method
+    async def get_identity():
+        return "identity"
+
+    @tracer.capture_method
+    async def async_tasks():
+        return await get_identity()
+
+    # WHEN nested async methods are called
+    await async_tasks()
+
+    # THEN spans should be nested
+    identity_span, tasks_span = exporter.get_finished_spans()
+    assert identity_span.name.endswith("get_identity")
+    assert identity_span.parent.span_id == tasks_span.context.span_id
+
+
+def test_capture_method_not_sampled(exporter):
+    # GIVEN Tracer is initialized with a tracer provider that doesn't sample any trace
+    tracer_provider = TracerProvider(sampler=ALWAYS_OFF)
+    provider = OpenTelemetryProvider(exporter=exporter, tracer_provider=tracer_provider)
+    tracer = Tracer(provider=provider, disabled=False, auto_patch=False)
+    calls = []
+
+    @tracer.capture_method
+    def greeting():
+        calls.append(provider.is_sampled())
+
+    # WHEN a decorated method is called within an unsampled span
+    with provider.in_subsegment(name="parent"):
+        greeting()
+
+    # THEN no span should be created for it nor exported
+    assert calls == [False]
+    assert exporter.get_finished_spans() == ()
+
+
+@pytest.mark.parametrize(
+    "env",
+    [{"POWERTOOLS_TRACE_DISABLED": "true", "LAMBDA_TASK_ROOT": "/var/task"}, {}],
+    ids=["disabled_via_env_var", "outside_lambda"],
+)
+def test_tracer_disabled(exporter, monkeypatch, env):
+    # GIVEN Tracer is disabled explicitly, or by running outside Lambda
+    monkeypatch.delenv("LAMBDA_TASK_ROOT", raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    provider = OpenTelemetryProvider(service="booking", exporter=exporter)
+    tracer = Tracer(service="booking", provider=provider, auto_patch=False)
+
+    @tracer.capture_method
+    def greeting():
+        return "hello"
+
+    @tracer.capture_lambda_handler
+    def handler(event, context):
+        return greeting()
+
+    # WHEN the handler is called
+    response = handler({}, {})
+
+    # THEN no span should be exported
+    assert tracer.disabled
+    assert response == "hello"
+    provider.force_flush()
+    assert exporter.get_finished_spans() == ()
+
+
+def test_file_span_exporter(tmp_path):
+    # GIVEN the OpenTelemetry provider exports spans to a file
+    path = tmp_path / "spans.jsonl"
+    provider = OpenTelemetryProvider(service="booking", exporter=FileSpanExporter(path))
+
+    # WHEN spans are created
+    with provider.in_subsegment(name="parent"):
+        with provider.in_subsegment(name="child") as subsegment:
+            subsegment.put_annotation(key="order_id", value=1)
+
+    # THEN one JSON line should be written per span
+    provider.tracer_provider.shutdown()
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [span["name"] for span in spans] == ["child", "parent"]
+    assert spans[0]["attributes"] == {"order_id": 1}
+
+
+def test_patch_unsupported_module(exporter):
+    # GIVEN the OpenTelemetry provider
+    provider = OpenTelemetryProvider(exporter=exporter)
+
+    # WHEN patching a module without OpenTelemetry instrumentation
+    # THEN a ValueError should be raised
+    with pytest.raises(ValueError, match="not supported"):
+        provider.patch(["unknown_module"])
+
+
+def test_patch_missing_instrumentation(exporter, monkeypatch):
+    # GIVEN the OpenTelemetry provider and an instrumentation package that isn't installed
+    monkeypatch.setitem(
+        opentelemetry_provider.INSTRUMENTORS,
+        "requests",
+        ("opentelemetry.instrumentation.not_installed", "NotInstalledInstrumentor"),
+    )
+    provider = OpenTelemetryProvider(exporter=exporter)
+
+    # WHEN patching the module explicitly
+    # THEN an ImportError should tell which package to install
+    with pytest.raises(ImportError, match="opentelemetry-instrumentation-not-installed"):
+        provider.patch(["requests"])
+
+    # and patching all modules should skip it
+    provider.patch_all()
@@ -1,8 +1,10 @@
 import base64
+import hashlib
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, List, Optional, Tuple
 
+from aws_lambda_powertools.shared import json_backend
 from aws_lambda_powertools.shared.json_encoder import Encoder
 
 
@@ -21,3 +23,43 @@ def b64_to_str(data: str) -> str:
 
 def json_serialize(data):
     return json.dumps(data, sort_keys=True, cls=Encoder)
+
+
+def json_serialize_response(data):
+    """Serialize data the same way idempotency stores responses"""
+    return json_backend.dumps(data, sort_keys=True)
+
+
+def _protobuf_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+def _protobuf_field(field_number: int, value) -> bytes:
+    if isinstance(value, int):
+        return _protobuf_varint(field_number << 3) + _protobuf_varint(value)
+    return _protobuf_varint(field_number << 3 | 2) + _protobuf_varint(len(value)) + value
+
+
+def kpl_aggregate(records: List[Tuple[str, bytes]], explicit_hash_key: Optional[str] = None) -> bytes:
+    """Aggregate (partition key, data) user records the way the Kinesis Producer Library does"""
+    partition_keys = list(dict.fromkeys(partition_key for partition_key, _ in records))
+    message = b"".join(_protobuf_field(1, partition_key.encode()) for partition_key in partition_keys)
+    if explicit_hash_key is not None:
+        message += _protobuf_field(2, explicit_hash_key.encode())
+
+    for partition_key, data in records:
+        record = _protobuf_field(1, partition_keys.index(partition_key))
+        if explicit_hash_key is not None:
+            record += _protobuf_field(2, 0)
+        record += _protobuf_field(3, data)
+        message += _protobuf_field(3, record)
+
+    return b"\xf3\x89\x9a\xc2" + message + hashlib.md5(message).digest()
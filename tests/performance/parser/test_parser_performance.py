@@ -1,4 +1,8 @@
+import base64
+import copy
+import json
 import time
+import tracemalloc
 from contextlib import contextmanager
 from typing import Generator, Literal, Union
 
@@ -7,6 +11,7 @@ from pydantic import BaseModel, Field
 from typing_extensions import Annotated
 
 from aws_lambda_powertools.utilities.parser import parse
+from aws_lambda_powertools.utilities.parser.envelopes import KinesisDataStreamEnvelope, SqsEnvelope
 
 # adjusted for slower machines in CI too
 PARSER_VALIDATION_SLA: float = 0.010
@@ -69,3 +74,83 @@ def test_parser_with_cache():
     elapsed = t()
     if elapsed > PARSER_VALIDATION_SLA:
         pytest.fail(f"Parser validation should be below {PARSER_VALIDATION_SLA}s: {elapsed}")
+
+
+class Order(BaseModel):
+    order_id: str
+    quantity: int
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("validate_envelope", [True, False], ids=["two_passes", "single_pass"])
+@pytest.mark.benchmark(group="envelope")
+def test_parser_sqs_envelope(benchmark, validate_envelope):
+    # GIVEN an SQS batch with 1,000 records
+    record = {
+        "messageId": "19dd0b57-b21e-4ac1-bd88-01bbb068cb78",
+        "receiptHandle": "MessageReceiptHandle",
+        "body": '{"order_id": "b5e8b0a8", "quantity": 2}',
+        "attributes": {
+            "ApproximateReceiveCount": "1",
+            "SentTimestamp": "1523232000000",
+            "SenderId": "123456789012",
+            "ApproximateFirstReceiveTimestamp": "1523232000001",
+        },
+        "messageAttributes": {},
+        "md5OfBody": "7b270e59b47ff90a553787216d55d91d",
+        "eventSource": "aws:sqs",
+        "eventSourceARN": "arn:aws:sqs:us-east-1:123456789012:MyQueue",
+        "awsRegion": "us-east-1",
+    }
+    event = {"Records": [record] * 1_000}
+
+    # WHEN we parse it with and without validating the envelope
+    orders = benchmark(parse, event=event, model=Order, envelope=SqsEnvelope, validate_envelope=validate_envelope)
+
+    # THEN all records should be parsed
+    assert len(orders) == 1_000
+
+
+def kinesis_event(count: int) -> dict:
+    data = base64.b64encode(json.dumps({"order_id": "b5e8b0a8", "quantity": 2, "notes": "x" * 400}).encode()).decode()
+    record = {
+        "kinesis": {
+            "kinesisSchemaVersion": "1.0",
+            "partitionKey": "1",
+            "sequenceNumber": "49590338271490256608559692538361571095921575989136588898",
+            "data": data,
+            "approximateArrivalTimestamp": 1545084650.987,
+        },
+        "eventSource": "aws:kinesis",
+        "eventVersion": "1.0",
+        "eventID": "shardId-000000000006:49590338271490256608559692538361571095921575989136588898",
+        "eventName": "aws:kinesis:record",
+        "invokeIdentityArn": "arn:aws:iam::123456789012:role/lambda-role",
+        "awsRegion": "us-east-2",
+        "eventSourceARN": "arn:aws:kinesis:us-east-2:123456789012:stream/lambda-stream",
+    }
+    return {"Records": [copy.deepcopy(record) for _ in range(count)]}
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+@pytest.mark.benchmark(group="envelope_memory")
+def test_parser_kinesis_envelope_memory(benchmark, lazy):
+    # GIVEN a Kinesis event with 10,000 records
+    event = kinesis_event(count=10_000)
+
+    def process_records():
+        quantity = 0
+        for order in parse(event=event, model=Order, envelope=KinesisDataStreamEnvelope, lazy=lazy):
+            quantity += order.quantity
+        return quantity
+
+    # WHEN we process all records parsing them eagerly or lazily
+    assert benchmark(process_records) == 20_000
+
+    # THEN we report peak memory allocated while processing them
+    tracemalloc.start()
+    process_records()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["peak_memory_kb"] = peak // 1024
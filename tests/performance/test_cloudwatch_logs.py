@@ -0,0 +1,59 @@
+import base64
+import gzip
+import json
+import secrets
+import tracemalloc
+
+import pytest
+
+from aws_lambda_powertools.utilities.data_classes import CloudWatchLogsEvent
+
+# compressed size of the CloudWatch Logs subscription payload
+COMPRESSED_PAYLOAD_SIZE = 1024 * 1024
+
+
+def cloudwatch_logs_event(compressed_size: int) -> dict:
+    # random tokens keep the payload from compressing too well, much like real log messages
+    log_events = []
+    for i in range(compressed_size // 30):
+        message = f"[INFO] request {i} processed in 12ms, trace={secrets.token_hex(16)}"
+        log_events.append({"id": f"{i:056d}", "timestamp": 1440442987000 + i, "message": message})
+
+    logs_data = {
+        "messageType": "DATA_MESSAGE",
+        "owner": "123456789123",
+        "logGroup": "testLogGroup",
+        "logStream": "testLogStream",
+        "subscriptionFilters": ["testFilter"],
+        "logEvents": log_events,
+    }
+    payload = gzip.compress(json.dumps(logs_data).encode())
+    assert len(payload) >= compressed_size
+
+    return {"awslogs": {"data": base64.b64encode(payload).decode()}}
+
+
+@pytest.fixture(scope="module")
+def event() -> dict:
+    return cloudwatch_logs_event(compressed_size=COMPRESSED_PAYLOAD_SIZE)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("streaming", [False, True], ids=["parse_logs_data", "iter_log_events"])
+@pytest.mark.benchmark(group="cloudwatch_logs_memory")
+def test_cloudwatch_logs_decoding_memory(benchmark, event, streaming):
+    # GIVEN a CloudWatch Logs event with 1 MB of compressed log data
+    def process_log_events():
+        logs_event = CloudWatchLogsEvent(event)
+        log_events = logs_event.iter_log_events() if streaming else logs_event.parse_logs_data().log_events
+        return sum(1 for log_event in log_events if log_event.message.startswith("[INFO]"))
+
+    # WHEN we process all log events decoding them at once or as they're decompressed
+    count = benchmark(process_log_events)
+
+    # THEN we report peak memory allocated while processing them
+    tracemalloc.start()
+    assert process_log_events() == count
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["peak_memory_kb"] = peak // 1024
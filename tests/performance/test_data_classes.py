@@ -0,0 +1,76 @@
+import tracemalloc
+
+import pytest
+
+from aws_lambda_powertools.utilities.data_classes import DynamoDBStreamEvent, KinesisStreamEvent, SQSEvent
+from tests.functional.utils import load_event
+
+RECORDS_COUNT = 10_000
+
+
+def batch_event(event_file: str) -> dict:
+    event = load_event(event_file)
+    record = event["Records"][0]
+    event["Records"] = [record] * RECORDS_COUNT
+    return event
+
+
+def access_sqs_record(record) -> int:
+    return (
+        len(record.body)
+        + int(record.attributes.approximate_receive_count)
+        + len(record.attributes.sent_timestamp)
+        + len(record.attributes.sender_id)
+        + len(record.message_attributes)
+    )
+
+
+def access_kinesis_record(record) -> int:
+    return len(record.kinesis.data) + len(record.kinesis.partition_key) + len(record.kinesis.sequence_number)
+
+
+def access_dynamodb_record(record) -> int:
+    return len(record.dynamodb.keys) + len(record.dynamodb.new_image) + (record.dynamodb.size_bytes or 0)
+
+
+DATA_CLASSES = [
+    pytest.param(SQSEvent, "sqsEvent.json", access_sqs_record, id="sqs"),
+    pytest.param(KinesisStreamEvent, "kinesisStreamEvent.json", access_kinesis_record, id="kinesis"),
+    pytest.param(DynamoDBStreamEvent, "dynamoStreamEvent.json", access_dynamodb_record, id="dynamodb"),
+]
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("data_class,event_file,access_record", DATA_CLASSES)
+@pytest.mark.benchmark(group="data_classes_access")
+def test_data_class_record_access(benchmark, data_class, event_file, access_record):
+    # GIVEN a batch of 10,000 records
+    event = batch_event(event_file)
+
+    # WHEN accessing nested fields of each record a few times
+    def process_records():
+        return sum(access_record(record) for record in data_class(event).records)
+
+    # THEN records should be processed
+    assert benchmark(process_records) > 0
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("data_class,event_file,access_record", DATA_CLASSES)
+@pytest.mark.benchmark(group="data_classes_memory")
+def test_data_class_record_memory(benchmark, data_class, event_file, access_record):
+    # GIVEN a batch of 10,000 records
+    event = batch_event(event_file)
+
+    # WHEN keeping all records, e.g. to process them later
+    def keep_records():
+        return list(data_class(event).records)
+
+    benchmark(keep_records)
+
+    # THEN we report memory allocated per record, besides the event itself
+    tracemalloc.start()
+    records = keep_records()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["memory_per_record_bytes"] = size // len(records)
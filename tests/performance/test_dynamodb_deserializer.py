@@ -0,0 +1,85 @@
+import pytest
+
+from aws_lambda_powertools.utilities.data_classes import DynamoDBStreamEvent
+
+
+def new_image(i: int) -> dict:
+    line_items = [
+        {
+            "M": {
+                "Sku": {"S": f"SKU-{i}-{n}"},
+                "Quantity": {"N": str(n + 1)},
+                "Price": {"N": f"{n}.99"},
+                "Tags": {"SS": ["fragile", "gift"]},
+            },
+        }
+        for n in range(5)
+    ]
+    return {
+        "Id": {"S": f"order-{i}"},
+        "CreatedAt": {"N": "1700000000"},
+        "Total": {"N": "24.95"},
+        "Paid": {"BOOL": True},
+        "Notes": {"NULL": True},
+        "Customer": {
+            "M": {
+                "Name": {"S": "John Doe"},
+                "Address": {"M": {"Street": {"S": "Main St"}, "ZipCode": {"N": "12345"}}},
+            },
+        },
+        "LineItems": {"L": line_items},
+        "Ratings": {"NS": ["1", "4.5", "5"]},
+    }
+
+
+@pytest.fixture(scope="module")
+def event() -> dict:
+    return {
+        "Records": [
+            {
+                "eventID": str(i),
+                "eventName": "MODIFY",
+                "eventSource": "aws:dynamodb",
+                "dynamodb": {
+                    "Keys": {"Id": {"S": f"order-{i}"}},
+                    "NewImage": new_image(i),
+                    "OldImage": new_image(i),
+                    "StreamViewType": "NEW_AND_OLD_IMAGES",
+                },
+            }
+            for i in range(1_000)
+        ],
+    }
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="dynamodb_stream_images")
+def test_dynamodb_stream_images(benchmark, event):
+    # GIVEN 1,000 stream records with nested maps and lists
+    def process_records():
+        return sum(
+            len(record.dynamodb.new_image) + len(record.dynamodb.old_image)
+            for record in DynamoDBStreamEvent(event).records
+        )
+
+    # WHEN deserializing new and old images in full
+    # THEN all attributes should be deserialized
+    assert benchmark(process_records) == 16_000
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("native_numbers", [False, True], ids=["decimal", "native_numbers"])
+@pytest.mark.benchmark(group="dynamodb_stream_images")
+def test_dynamodb_stream_images_lazy(benchmark, event, native_numbers):
+    # GIVEN 1,000 stream records with nested maps and lists
+    def process_records():
+        changed = 0
+        for record in DynamoDBStreamEvent(event).records:
+            new_image = record.dynamodb.get_new_image(native_numbers=native_numbers)
+            old_image = record.dynamodb.get_old_image(native_numbers=native_numbers)
+            changed += new_image["Total"] != old_image["Total"] or new_image["Paid"] != old_image["Paid"]
+        return changed
+
+    # WHEN deserializing only attributes we compare
+    # THEN records should be processed without deserializing other attributes
+    assert benchmark(process_records) == 0
@@ -0,0 +1,113 @@
+import copy
+
+import pytest
+
+from aws_lambda_powertools.utilities.feature_flags import FeatureFlags, RuleAction, StoreProvider
+
+# number of features in the configuration
+FEATURES = 100
+
+
+class InMemoryStore(StoreProvider):
+    def __init__(self, configuration: dict, copy_on_fetch: bool = False):
+        self.configuration = configuration
+        self.copy_on_fetch = copy_on_fetch
+
+    @property
+    def get_raw_configuration(self) -> dict:
+        return self.configuration
+
+    def get_configuration(self) -> dict:
+        # a copy emulates a store returning a new payload on every fetch
+        return copy.deepcopy(self.configuration) if self.copy_on_fetch else self.configuration
+
+
+def feature(i: int) -> dict:
+    return {
+        "default": False,
+        "rules": {
+            "internal users": {
+                "when_match": True,
+                "conditions": [
+                    {"action": RuleAction.EQUALS.value, "key": "tier", "value": "internal"},
+                ],
+            },
+            "allowed tenants in premium tier": {
+                "when_match": True,
+                "conditions": [
+                    {"action": RuleAction.EQUALS.value, "key": "tier", "value": "premium"},
+                    {"action": RuleAction.IN.value, "key": "tenant_id", "value": [f"tenant-{n}" for n in range(50)]},
+                    {"action": RuleAction.ANY_IN_VALUE.value, "key": "groups", "value": ["beta", f"group-{i}"]},
+                ],
+            },
+            "office hours rollout": {
+                "when_match": True,
+                "conditions": [
+                    {
+                        "action": RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value,
+                        "key": "CURRENT_TIME",
+                        "value": {"START": "09:00", "END": "17:00", "TIMEZONE": "Europe/Lisbon"},
+                    },
+                    {
+                        "action": RuleAction.MODULO_RANGE.value,
+                        "key": "user_id",
+                        "value": {"BASE": 100, "START": 0, "END": i % 100},
+                    },
+                ],
+            },
+        },
+    }
+
+
+CONTEXT = {"tier": "premium", "tenant_id": "tenant-49", "groups": ["alpha", "group-7"], "user_id": 1234}
+
+
+@pytest.fixture(scope="module")
+def configuration() -> dict:
+    return {f"feature_{i}": feature(i) for i in range(FEATURES)}
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("copy_on_fetch", [False, True], ids=["same_payload", "new_payload"])
+@pytest.mark.benchmark(group="feature_flags_evaluate")
+def test_feature_flags_evaluate(benchmark, configuration, copy_on_fetch):
+    # GIVEN a configuration with 100 features
+    feature_flags = FeatureFlags(store=InMemoryStore(configuration, copy_on_fetch=copy_on_fetch))
+
+    # WHEN evaluating every feature, one at a time
+    def evaluate_features():
+        return [feature_flags.evaluate(name=name, context=CONTEXT, default=False) for name in configuration]
+
+    result = benchmark(evaluate_features)
+
+    # THEN every feature is evaluated
+    assert len(result) == FEATURES
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("copy_on_fetch", [False, True], ids=["same_payload", "new_payload"])
+@pytest.mark.benchmark(group="feature_flags_get_enabled_features")
+def test_feature_flags_get_enabled_features(benchmark, configuration, copy_on_fetch):
+    # GIVEN a configuration with 100 features
+    feature_flags = FeatureFlags(store=InMemoryStore(configuration, copy_on_fetch=copy_on_fetch))
+
+    # WHEN getting enabled features
+    result = benchmark(feature_flags.get_enabled_features, context=CONTEXT)
+
+    # THEN features matching the context are enabled
+    assert "feature_7" in result
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("copy_on_fetch", [False, True], ids=["same_payload", "new_payload"])
+@pytest.mark.benchmark(group="feature_flags_evaluate_all")
+def test_feature_flags_evaluate_all(benchmark, configuration, copy_on_fetch):
+    # GIVEN a configuration with 100 features
+    feature_flags = FeatureFlags(store=InMemoryStore(configuration, copy_on_fetch=copy_on_fetch))
+
+    # WHEN evaluating all features in one pass
+    result = benchmark(feature_flags.evaluate_all, context=CONTEXT)
+
+    # THEN every feature is evaluated
+    assert len(result) == FEATURES
+    assert result["feature_7"] is True
@@ -1,6 +1,8 @@
 import importlib
+import subprocess
+import sys
 from types import ModuleType
-from typing import Tuple
+from typing import Dict, Tuple
 
 import pytest
 
@@ -14,6 +16,13 @@ TRACING_PACKAGE = "aws_lambda_powertools.tracing"
 LOGGING_PACKAGE = "aws_lambda_powertools.logging"
 METRICS_PACKAGE = "aws_lambda_powertools.metrics"
 TRACER_PACKAGE = "aws_lambda_powertools.utilities.parser"
+LAZY_EXPORTS_PACKAGES = [
+    PARENT_PACKAGE,
+    "aws_lambda_powertools.event_handler",
+    "aws_lambda_powertools.utilities.data_classes",
+    "aws_lambda_powertools.utilities.parser.envelopes",
+    "aws_lambda_powertools.utilities.parser.models",
+]
 
 
 def import_core_utilities() -> Tuple[ModuleType, ModuleType, ModuleType]:
@@ -26,6 +35,31 @@ def import_core_utilities() -> Tuple[ModuleType, ModuleType, ModuleType]:
     )
 
 
+def run_importtime(code: str) -> Dict[str, int]:
+    """Runs code in a new interpreter, returning each imported module self import time in microseconds"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # import time: self [us] | cumulative | imported package
+    import_times = {}
+    for line in result.stderr.splitlines():
+        self_time, _, name = line.split(":", 1)[-1].split("|")
+        if self_time.strip().isdigit():
+            import_times[name.strip()] = int(self_time)
+    return import_times
+
+
+def measure_import_time(package: str) -> int:
+    """Total import time of package in microseconds, including its parents and dependencies"""
+    interpreter_imports = run_importtime("pass")
+    return sum(
+        self_time for name, self_time in run_importtime(f"import {package}").items() if name not in interpreter_imports
+    )
+
+
 @pytest.fixture(autouse=True)
 def clear_cache():
     importlib.invalidate_caches()
@@ -108,3 +142,17 @@ def test_parser_init(benchmark):
     stat = benchmark.stats.stats.max
     if stat > PARSER_INIT_SLA:
         pytest.fail(f"High level imports should be below ${PARSER_INIT_SLA}s: {stat}")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("package", LAZY_EXPORTS_PACKAGES)
+@pytest.mark.benchmark(group="package_imports", disable_gc=True, warmup=False)
+def test_package_import_time(benchmark, package):
+    # GIVEN a package exporting names lazily
+    import_times = []
+
+    # WHEN it's imported in a new interpreter
+    benchmark.pedantic(lambda: import_times.append(measure_import_time(package)), rounds=5, iterations=1)
+
+    # THEN we report its total import time, including its parent packages and dependencies
+    benchmark.extra_info["import_time_ms"] = min(import_times) / 1000
@@ -0,0 +1,49 @@
+import datetime
+import decimal
+
+import pytest
+
+from aws_lambda_powertools.shared.json_backend import get_json_backend
+
+BACKENDS = ["json", "orjson", "msgspec"]
+
+
+@pytest.fixture
+def log_record():
+    return {
+        "level": "INFO",
+        "location": "collect_payment:42",
+        "message": "Collecting payment",
+        "timestamp": "2024-01-01 10:30:00,123+0000",
+        "service": "payment",
+        "cold_start": True,
+        "function_name": "test",
+        "function_memory_size": 128,
+        "function_request_id": "52fdfc07-2182-154f-163f-5f0f9a621d72",
+        "xray_trace_id": "1-5759e988-bd862e3fe1be46a994272793",
+        "order": {"id": 1, "total": decimal.Decimal("10.5"), "created": datetime.datetime(2024, 1, 1)},
+        "items": [{"sku": f"sku-{i}", "quantity": i, "price": 9.99} for i in range(20)],
+    }
+
+
+def _backend(name: str):
+    if name != "json":
+        pytest.importorskip(name)
+    return get_json_backend(name)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("backend_name", BACKENDS)
+@pytest.mark.benchmark(group="json_dumps")
+def test_json_backend_dumps(benchmark, backend_name, log_record):
+    backend = _backend(backend_name)
+    benchmark(backend.dumps, log_record, default=str)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("backend_name", BACKENDS)
+@pytest.mark.benchmark(group="json_loads")
+def test_json_backend_loads(benchmark, backend_name, log_record):
+    backend = _backend(backend_name)
+    document = backend.dumps(log_record, default=str)
+    benchmark(backend.loads, document)
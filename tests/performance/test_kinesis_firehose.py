@@ -0,0 +1,65 @@
+import base64
+import json
+
+import pytest
+
+from aws_lambda_powertools.utilities.data_classes import (
+    KinesisFirehoseDataTransformationRecord,
+    KinesisFirehoseDataTransformationResponse,
+    KinesisFirehoseEvent,
+)
+from aws_lambda_powertools.utilities.serialization import base64_from_json
+
+
+@pytest.fixture(scope="module")
+def event() -> dict:
+    data = base64.b64encode(json.dumps({"order_id": "5c49", "quantity": 2, "price": 9.99}).encode()).decode()
+    return {
+        "invocationId": "2b4d1ad9-2f48-94bd-a088-767c317e994a",
+        "deliveryStreamArn": "arn:aws:firehose:us-east-2:123456789012:deliverystream/delivery-stream-name",
+        "region": "us-east-2",
+        "records": [
+            {"recordId": f"record{i}", "approximateArrivalTimestamp": 1664028820148, "data": data}
+            for i in range(10_000)
+        ],
+    }
+
+
+def transform(record):
+    # kept trivial so benchmarks measure building the response
+    return {"record_id": record.record_id, "tool_used": "powertools"}
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="firehose_response")
+def test_firehose_response_dataclasses(benchmark, event):
+    def build_response():
+        response = KinesisFirehoseDataTransformationResponse()
+        for record in KinesisFirehoseEvent(event).records:
+            response.add_record(
+                KinesisFirehoseDataTransformationRecord(
+                    record_id=record.record_id,
+                    data=base64_from_json(transform(record)),
+                ),
+            )
+        return response.asdict()
+
+    assert len(benchmark(build_response)["records"]) == 10_000
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="firehose_response")
+def test_firehose_response_transform(benchmark, event):
+    def build_response():
+        return KinesisFirehoseEvent(event).transform(record_handler=transform)
+
+    assert len(benchmark(build_response)["records"]) == 10_000
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="firehose_response")
+def test_firehose_response_transform_batch(benchmark, event):
+    def build_response():
+        return KinesisFirehoseEvent(event).transform(batch_handler=lambda records: [transform(r) for r in records])
+
+    assert len(benchmark(build_response)["records"]) == 10_000
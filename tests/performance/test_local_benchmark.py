@@ -0,0 +1,38 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+RUNNER = Path(__file__).parents[2] / "benchmark" / "local" / "run.py"
+
+
+@pytest.mark.perf
+def test_local_benchmark_stores_comparable_results(tmp_path):
+    # GIVEN the local benchmark runner
+    results = tmp_path / "results.json"
+
+    # WHEN benchmarking every handler with a single cold start
+    command = [
+        sys.executable,
+        str(RUNNER),
+        "run",
+        "--cold-starts",
+        "1",
+        "--warm-invokes",
+        "5",
+        "--output",
+        str(results),
+    ]
+    subprocess.run(command, check=True, capture_output=True)
+
+    # THEN results should include cold start, warm invoke and memory measurements for every handler
+    stored = json.loads(results.read_text())
+    assert set(stored["results"]) == {"reference", "core_utilities", "rest_validation", "batch_sqs", "idempotency"}
+    for summary in stored["results"].values():
+        assert {"import_ms", "first_invoke_ms", "warm_invoke_ms", "peak_rss_mb"} <= set(summary)
+
+    # THEN results should compare against themselves without regressions
+    compare = subprocess.run([sys.executable, str(RUNNER), "compare", str(results), str(results)], check=False)
+    assert compare.returncode == 0
@@ -0,0 +1,57 @@
+import io
+import logging
+import time
+
+import pytest
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.logging import LazyValue
+
+# Disabled log levels should be cheap enough to leave debug logs in hot paths
+DISABLED_LEVEL_SLA: float = 0.5  # seconds
+LOG_CALLS: int = 100_000
+
+
+@pytest.fixture
+def logger():
+    return Logger(service="perf", stream=io.StringIO(), level="INFO")
+
+
+def _log_disabled_debug(logger: Logger, count: int = LOG_CALLS):
+    for i in range(count):
+        logger.debug(
+            "Processing item",
+            extra={"item": i},
+            order_id="1234",
+            payload=LazyValue(dict, expensive=i),
+        )
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="logger_disabled_level")
+def test_logger_disabled_level_overhead(benchmark, logger):
+    benchmark(_log_disabled_debug, logger, 1_000)
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="logger_disabled_level")
+def test_stdlib_logger_disabled_level_overhead(benchmark):
+    # baseline to compare Logger against
+    stdlib_logger = logging.getLogger("perf-stdlib")
+    stdlib_logger.setLevel(logging.INFO)
+
+    def log_disabled_debug():
+        for i in range(1_000):
+            stdlib_logger.debug("Processing item", extra={"item": i, "order_id": "1234"})
+
+    benchmark(log_disabled_debug)
+
+
+@pytest.mark.perf
+def test_logger_disabled_level_within_sla(logger):
+    start = time.perf_counter()
+    _log_disabled_debug(logger)
+    elapsed = time.perf_counter() - start
+
+    if elapsed > DISABLED_LEVEL_SLA:
+        pytest.fail(f"Disabled level logging should be below {DISABLED_LEVEL_SLA}s: {elapsed}")
@@ -1,5 +1,6 @@
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Dict, Generator
 
@@ -8,6 +9,7 @@ import pytest
 from aws_lambda_powertools import Metrics
 from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.metrics import metrics as metrics_global
+from aws_lambda_powertools.metrics.provider.datadog import DatadogProvider
 
 # adjusted for slower machines in CI too
 METRICS_VALIDATION_SLA: float = 0.002
@@ -85,3 +87,92 @@ def test_metrics_large_operation_and_json_serialization_sla(namespace):
     elapsed = t()
     if elapsed > METRICS_SERIALIZATION_SLA:
         pytest.fail(f"Metric serialization should be below {METRICS_SERIALIZATION_SLA}s: {elapsed}")
+
+
+def record_batch_latencies(metrics_instance: Metrics, count: int = 10_000):
+    # integer milliseconds latencies repeat often within a batch
+    for i in range(count):
+        metrics_instance.add_metric(name="RecordLatency", unit="Milliseconds", value=i % 50)
+    metrics_instance.flush_metrics()
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize(
+    "aggregation",
+    [{}, {"aggregate_values": True}, {"histogram_buckets": [5, 10, 25, 50]}],
+    ids=["raw", "aggregated", "histogram"],
+)
+@pytest.mark.benchmark(group="metrics_batch_values")
+def test_metrics_batch_values(benchmark, capsys, namespace, aggregation):
+    # GIVEN Metrics is initialized with or without value aggregation
+    my_metrics = Metrics(namespace=namespace, **aggregation)
+
+    # WHEN we record a latency value per record in a 10,000 records batch
+    benchmark(record_batch_latencies, my_metrics)
+
+    # THEN we report how many EMF documents and bytes were printed per batch
+    output = capsys.readouterr().out.splitlines()
+    benchmark.extra_info["emf_documents"] = len(output) // (benchmark.stats.stats.rounds or 1)
+    benchmark.extra_info["bytes"] = sum(len(line) for line in output) // (benchmark.stats.stats.rounds or 1)
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="metrics_add_metric")
+def test_metrics_add_metric_single_thread(benchmark, capsys, namespace):
+    # GIVEN Metrics is initialized
+    my_metrics = Metrics(namespace=namespace)
+
+    # WHEN metrics are added from a single thread, where the lock is never contended
+    def add_metrics():
+        for i in range(1_000):
+            my_metrics.add_metric(name=f"metric_{i % 10}", unit="Count", value=1)
+        my_metrics.clear_metrics()
+
+    benchmark(add_metrics)
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="metrics_add_metric")
+def test_metrics_add_metric_many_threads(benchmark, capsys, namespace):
+    # GIVEN Metrics is initialized and shared by a thread pool
+    my_metrics = Metrics(namespace=namespace)
+
+    def add_metrics(_):
+        for i in range(1_000 // 32):
+            my_metrics.add_metric(name=f"metric_{i % 10}", unit="Count", value=1)
+
+    # WHEN roughly the same number of metrics is added from 32 threads
+    with ThreadPoolExecutor(max_workers=32) as executor:
+
+        def add_metrics_concurrently():
+            list(executor.map(add_metrics, range(32)))
+            my_metrics.clear_metrics()
+
+        benchmark(add_metrics_concurrently)
+
+
+def record_datadog_batch(provider: DatadogProvider, aggregated: bool, count: int = 10_000):
+    for i in range(count):
+        if aggregated:
+            provider.increment("records_processed", queue="orders")
+            provider.distribution("record_latency", i % 50, queue="orders")
+        else:
+            provider.add_metric(name="records_processed", value=1, queue="orders")
+            provider.add_metric(name="record_latency", value=i % 50, queue="orders")
+    provider.flush_metrics()
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("aggregated", [False, True], ids=["add_metric", "aggregated"])
+@pytest.mark.benchmark(group="datadog_batch")
+def test_datadog_metrics_batch(benchmark, capsys, aggregated):
+    # GIVEN DatadogProvider is initialized to flush to standard output
+    provider = DatadogProvider(flush_to_log=True)
+
+    # WHEN we record a counter and a latency per record in a 10,000 records batch
+    benchmark(record_datadog_batch, provider, aggregated)
+
+    # THEN we report how many metric lines and bytes were printed per batch
+    output = capsys.readouterr().out.splitlines()
+    benchmark.extra_info["lines"] = len(output) // (benchmark.stats.stats.rounds or 1)
+    benchmark.extra_info["bytes"] = sum(len(line) for line in output) // (benchmark.stats.stats.rounds or 1)
@@ -0,0 +1,77 @@
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from tests.functional.utils import load_event
+
+# number of validated routes documented by the OpenAPI schema
+ROUTES = 30
+
+
+class Todo(BaseModel):
+    id: int
+    title: str
+    completed: bool = False
+    tags: List[str] = []
+    assignee: Optional[str] = None
+
+
+def build_app(compress: bool) -> APIGatewayRestResolver:
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger(compress=compress)
+
+    for i in range(ROUTES):
+
+        @app.get(f"/todos{i}/<todo_id>")
+        def get_todo(todo_id: int) -> Todo:
+            return Todo(id=todo_id, title="benchmark")
+
+        @app.post(f"/todos{i}")
+        def create_todo(todo: Todo) -> Todo:
+            return todo
+
+    return app
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("cached", [False, True], ids=["regenerated", "cached"])
+@pytest.mark.parametrize("compress", [False, True], ids=["uncompressed", "compressed"])
+@pytest.mark.benchmark(group="openapi_swagger")
+def test_openapi_swagger_repeated_requests(benchmark, cached, compress):
+    # GIVEN Swagger UI documenting many validated routes
+    app = build_app(compress=compress)
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    event["headers"] = {"Accept-Encoding": "gzip"}
+
+    def request_swagger():
+        if not cached:
+            # generates the OpenAPI schema and Swagger UI on every request, as it was before caching
+            app._swagger_cache.clear()
+        return app(event, {})
+
+    # WHEN requesting Swagger UI repeatedly
+    result = benchmark(request_swagger)
+
+    # THEN responses are served in full
+    assert result["statusCode"] == 200
+    benchmark.extra_info["response_size_kb"] = len(result["body"]) // 1024
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="openapi_swagger")
+def test_openapi_swagger_not_modified(benchmark):
+    # GIVEN Swagger UI already cached by the browser
+    app = build_app(compress=True)
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    event["headers"] = {"Accept-Encoding": "gzip"}
+    event["headers"]["If-None-Match"] = app(event, {})["multiValueHeaders"]["ETag"][0]
+
+    # WHEN requesting Swagger UI repeatedly with its ETag
+    result = benchmark(app, event, {})
+
+    # THEN nothing is transferred
+    assert result["statusCode"] == 304
@@ -0,0 +1,71 @@
+import pytest
+from aws_xray_sdk import global_sdk_config
+from aws_xray_sdk.core import xray_recorder
+
+from aws_lambda_powertools import Tracer
+
+METHOD_CALLS: int = 1_000
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    Tracer._reset_config()
+    sdk_enabled = global_sdk_config.sdk_enabled()
+    global_sdk_config.set_sdk_enabled(True)
+    tracer = Tracer(service="perf", disabled=False, auto_patch=False)
+    # keep subsegments in memory and don't send segments to the X-Ray daemon
+    xray_recorder.configure(streaming_threshold=METHOD_CALLS * 2)
+    monkeypatch.setattr(xray_recorder.emitter, "send_entity", lambda entity: None)
+    yield tracer
+    xray_recorder.clear_trace_entities()
+    global_sdk_config.set_sdk_enabled(sdk_enabled)
+    Tracer._reset_config()
+
+
+def _call_traced_method(tracer: Tracer, sampled: bool, count: int = METHOD_CALLS):
+    @tracer.capture_method
+    def process(item: int) -> dict:
+        return {"item": item}
+
+    xray_recorder.begin_segment("perf", sampling=int(sampled))
+    for i in range(count):
+        process(i)
+    xray_recorder.end_segment()
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("sampled", [True, False], ids=["sampled", "not_sampled"])
+@pytest.mark.benchmark(group="tracer_capture_method")
+def test_tracer_capture_method_overhead(benchmark, tracer, sampled):
+    # GIVEN a method decorated with capture_method
+    # WHEN it's called in a tight loop within a sampled and an unsampled segment
+    # THEN unsampled calls should only add the overhead of checking whether the segment is sampled
+    benchmark(_call_traced_method, tracer, sampled)
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="tracer_capture_method")
+def test_tracer_capture_method_overhead_opentelemetry(benchmark):
+    # GIVEN Tracer uses the OpenTelemetry provider exporting spans in batches
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from aws_lambda_powertools.tracing.provider.opentelemetry import OpenTelemetryProvider
+
+    Tracer._reset_config()
+    provider = OpenTelemetryProvider(service="perf", exporter=InMemorySpanExporter())
+    tracer = Tracer(service="perf", provider=provider, disabled=False, auto_patch=False)
+
+    @tracer.capture_method
+    def process(item: int) -> dict:
+        return {"item": item}
+
+    def call_traced_method(count: int = METHOD_CALLS):
+        with provider.in_subsegment(name="perf"):
+            for i in range(count):
+                process(i)
+
+    # WHEN it's called in a tight loop within a sampled span
+    # THEN we can compare its per-span cost with X-Ray SDK
+    benchmark(call_traced_method)
+    Tracer._reset_config()
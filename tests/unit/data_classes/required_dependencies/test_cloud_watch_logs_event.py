@@ -56,3 +56,22 @@ def test_cloud_watch_trigger_event_with_policy_level():
 
     event2 = CloudWatchLogsEvent(load_event("cloudWatchLogEventWithPolicyLevel.json"))
     assert parsed_event.raw_event == event2.raw_event
+
+
+def test_cloud_watch_trigger_event_iter_log_events():
+    # GIVEN a CloudWatch Logs event
+    raw_event = load_event("cloudWatchLogEventWithPolicyLevel.json")
+
+    # WHEN iterating over log events, before or after parsing logs data
+    streamed_log_events = list(CloudWatchLogsEvent(raw_event).iter_log_events())
+    parsed_event = CloudWatchLogsEvent(raw_event)
+    log_events = parsed_event.parse_logs_data().log_events
+
+    # THEN log events should be the same
+    assert [log_event.get_id for log_event in streamed_log_events] == ["eventId1", "eventId2"]
+    assert [log_event.raw_event for log_event in streamed_log_events] == [
+        log_event.raw_event for log_event in log_events
+    ]
+    assert [log_event.raw_event for log_event in parsed_event.iter_log_events()] == [
+        log_event.raw_event for log_event in log_events
+    ]
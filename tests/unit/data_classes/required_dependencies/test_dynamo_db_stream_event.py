@@ -1,5 +1,7 @@
 from decimal import Clamped, Context, Inexact, Overflow, Rounded, Underflow
 
+import pytest
+
 from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import (
     DynamoDBRecordEventName,
     DynamoDBStreamEvent,
@@ -148,3 +150,45 @@ def test_dynamodb_stream_record_keys_overrides_dict_wrapper_keys():
     data = {"Keys": {"key1": {"N": "101"}}}
     record = StreamRecord(data)
     assert record.keys != data.keys()
+
+
+def test_dynamodb_stream_record_lazy_images():
+    # GIVEN a stream record with new and old images
+    data = {
+        "NewImage": {"Id": {"N": "101"}, "Tags": {"L": [{"S": "a"}, {"N": "1.5"}]}, "Deleted": {"NULL": True}},
+        "OldImage": {"Id": {"N": "101"}},
+    }
+    record = StreamRecord(data)
+
+    # WHEN getting images deserialized on access
+    new_image = record.get_new_image()
+    old_image = record.get_old_image(native_numbers=True)
+
+    # THEN attributes should match fully deserialized images
+    assert new_image == record.new_image
+    assert len(new_image) == 3
+    assert "Deleted" in new_image and new_image["Deleted"] is None
+    assert new_image["Tags"] is new_image["Tags"]
+    assert "Missing" not in new_image
+    assert new_image.get("Missing") is None
+    assert old_image == {"Id": 101}
+    assert type(old_image["Id"]) is int
+
+
+def test_dynamodb_stream_record_lazy_image_deserializes_accessed_attributes_only():
+    # GIVEN a new image with an attribute that can't be deserialized
+    record = StreamRecord({"NewImage": {"Id": {"S": "101"}, "Broken": {"X": "unknown"}}})
+
+    # WHEN getting the image deserialized on access
+    new_image = record.get_new_image()
+
+    # THEN only accessed attributes should be deserialized
+    assert new_image["Id"] == "101"
+    assert list(new_image) == ["Id", "Broken"]
+    with pytest.raises(TypeError):
+        new_image["Broken"]
+
+
+def test_dynamodb_stream_record_lazy_image_with_no_image():
+    record = StreamRecord({})
+    assert record.get_old_image() == {}
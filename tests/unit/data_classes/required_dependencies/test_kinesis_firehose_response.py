@@ -1,3 +1,7 @@
+import json
+
+import pytest
+
 from aws_lambda_powertools.utilities.data_classes import (
     KinesisFirehoseDataTransformationRecord,
     KinesisFirehoseDataTransformationRecordMetadata,
@@ -113,3 +117,140 @@ def test_kinesis_firehose_create_response():
     assert record_02.data == base64_encode(arbitrary_data)
 
     assert record_01.metadata.partition_keys["year"] == "2023"
+
+
+def firehose_event(count: int, data: str = '{"Hello": "World"}') -> dict:
+    raw_event = load_event("kinesisFirehoseKinesisEvent.json")
+    record = raw_event["records"][0]
+    raw_event["records"] = [{**record, "recordId": f"record{i}", "data": base64_encode(data)} for i in range(count)]
+    return raw_event
+
+
+def test_kinesis_firehose_transform_record_handler():
+    # GIVEN a Kinesis Firehose Event with two records
+    raw_event = load_event("kinesisFirehoseKinesisEvent.json")
+    parsed_event = KinesisFirehoseEvent(data=raw_event)
+
+    # WHEN transforming each record
+    response = parsed_event.transform(record_handler=lambda record: record.data_as_text.upper())
+
+    # THEN outputs should be base64 encoded into the response
+    assert response == {
+        "records": [
+            {"recordId": "record1", "result": "Ok", "data": base64_encode("HELLO WORLD")},
+            {"recordId": "record2", "result": "Ok", "data": base64_encode('{"HELLO": "WORLD"}')},
+        ],
+    }
+
+
+def test_kinesis_firehose_transform_outputs():
+    # GIVEN a record handler returning each supported output type
+    outputs = [
+        {"year": 2023},
+        b"bytes",
+        None,
+        KinesisFirehoseDataTransformationRecord(record_id="record3", result="ProcessingFailed"),
+    ]
+    parsed_event = KinesisFirehoseEvent(data=firehose_event(count=len(outputs)))
+
+    def record_handler(record):
+        return outputs[int(record.record_id[-1])]
+
+    # WHEN transforming records
+    response = parsed_event.transform(record_handler=record_handler)
+
+    # THEN each output should be encoded accordingly
+    assert response["records"] == [
+        {"recordId": "record0", "result": "Ok", "data": base64_encode('{"year":2023}')},
+        {"recordId": "record1", "result": "Ok", "data": base64_encode("bytes")},
+        {"recordId": "record2", "result": "Dropped", "data": ""},
+        {"recordId": "record3", "result": "ProcessingFailed", "data": ""},
+    ]
+
+
+def test_kinesis_firehose_transform_record_handler_exception():
+    # GIVEN a record handler failing on the second record
+    parsed_event = KinesisFirehoseEvent(data=firehose_event(count=3))
+
+    def record_handler(record):
+        if record.record_id == "record1":
+            raise ValueError("invalid record")
+        return record.data_as_json
+
+    # WHEN transforming records
+    response = parsed_event.transform(record_handler=record_handler)
+
+    # THEN only the failing record should be marked as failed
+    assert [record["result"] for record in response["records"]] == ["Ok", "ProcessingFailed", "Ok"]
+
+
+def test_kinesis_firehose_transform_batch_handler_with_partition_keys():
+    # GIVEN a batch handler and dynamic partitioning keys
+    parsed_event = KinesisFirehoseEvent(data=firehose_event(count=3))
+
+    def batch_handler(records):
+        return [{"index": index, **record.data_as_json} for index, record in enumerate(records)]
+
+    # WHEN transforming records
+    response = parsed_event.transform(
+        batch_handler=batch_handler,
+        partition_keys=lambda record, output: {"index": str(output["index"])},
+    )
+
+    # THEN outputs should include partition keys metadata
+    assert response["records"][2] == {
+        "recordId": "record2",
+        "result": "Ok",
+        "data": base64_encode('{"index":2,"Hello":"World"}'),
+        "metadata": {"partitionKeys": {"index": "2"}},
+    }
+
+
+def test_kinesis_firehose_transform_batch_handler_exception():
+    # GIVEN a batch handler raising an exception
+    parsed_event = KinesisFirehoseEvent(data=firehose_event(count=3))
+
+    def batch_handler(records):
+        raise ValueError("invalid batch")
+
+    # WHEN transforming records
+    response = parsed_event.transform(batch_handler=batch_handler)
+
+    # THEN all records should be marked as failed
+    assert [record["result"] for record in response["records"]] == ["ProcessingFailed"] * 3
+
+
+def test_kinesis_firehose_transform_batch_handler_output_mismatch():
+    # GIVEN a batch handler returning fewer outputs than records
+    parsed_event = KinesisFirehoseEvent(data=firehose_event(count=3))
+
+    # WHEN transforming records
+    # THEN a ValueError should be raised
+    with pytest.raises(ValueError, match="2 outputs for 3 records"):
+        parsed_event.transform(batch_handler=lambda records: records[:2])
+
+
+def test_kinesis_firehose_transform_handlers_validation():
+    # GIVEN a Kinesis Firehose Event
+    parsed_event = KinesisFirehoseEvent(data=firehose_event(count=1))
+
+    # WHEN transforming records with both or none of the handlers
+    # THEN a ValueError should be raised
+    with pytest.raises(ValueError):
+        parsed_event.transform()
+    with pytest.raises(ValueError):
+        parsed_event.transform(record_handler=lambda record: record, batch_handler=lambda records: records)
+
+
+def test_kinesis_firehose_transform_response_size_limit():
+    # GIVEN records whose outputs exceed the response size limit
+    parsed_event = KinesisFirehoseEvent(data=firehose_event(count=10))
+    max_response_size = 3_000
+
+    # WHEN transforming records
+    response = parsed_event.transform(record_handler=lambda record: b"x" * 500, max_response_size=max_response_size)
+
+    # THEN records that don't fit should be spilled as failed, keeping the response within the limit
+    results = [record["result"] for record in response["records"]]
+    assert results == ["Ok"] * 3 + ["ProcessingFailed"] * 7
+    assert len(json.dumps(response)) <= max_response_size
@@ -5,8 +5,9 @@ from aws_lambda_powertools.utilities.data_classes import KinesisStreamEvent
 from aws_lambda_powertools.utilities.data_classes.kinesis_stream_event import (
     extract_cloudwatch_logs_from_event,
     extract_cloudwatch_logs_from_record,
+    iter_cloudwatch_log_events_from_record,
 )
-from tests.functional.utils import load_event
+from tests.functional.utils import kpl_aggregate, load_event
 
 
 def test_kinesis_stream_event():
@@ -55,3 +56,66 @@ def test_kinesis_stream_event_cloudwatch_logs_data_extraction():
     individual_logs = [extract_cloudwatch_logs_from_record(record) for record in event.records]
 
     assert len(extracted_logs) == len(individual_logs)
+
+
+def test_kinesis_stream_event_cloudwatch_logs_events_iteration():
+    # GIVEN a Kinesis event with CloudWatch Logs compressed data
+    event = KinesisStreamEvent(load_event("kinesisStreamCloudWatchLogsEvent.json"))
+
+    for record in event.records:
+        # WHEN iterating over log events as they're decompressed
+        log_events = list(iter_cloudwatch_log_events_from_record(record))
+
+        # THEN they should match log events extracted at once
+        expected = extract_cloudwatch_logs_from_record(record).log_events
+        assert [log_event.raw_event for log_event in log_events] == [log_event.raw_event for log_event in expected]
+
+
+def test_kinesis_stream_event_kpl_aggregated_records():
+    # GIVEN a Kinesis event with a KPL aggregated record and a regular record
+    raw_event = load_event("kinesisStreamEvent.json")
+    aggregated = kpl_aggregate([("pk-1", b'{"id": 1}'), ("pk-2", b'{"id": 2}')], explicit_hash_key="42")
+    raw_event["Records"][0]["kinesis"]["data"] = base64.b64encode(aggregated).decode()
+    parsed_event = KinesisStreamEvent(raw_event)
+
+    # WHEN iterating over user records
+    user_records = list(parsed_event.user_records)
+
+    # THEN aggregated user records should be expanded
+    assert len(user_records) == 3
+    first, second, regular = user_records
+    assert first.kinesis.aggregated is True
+    assert first.kinesis.data_as_json() == {"id": 1}
+    assert second.kinesis.data_as_text() == '{"id": 2}'
+    assert [first.kinesis.partition_key, second.kinesis.partition_key] == ["pk-1", "pk-2"]
+    assert [first.kinesis.sub_sequence_number, second.kinesis.sub_sequence_number] == [0, 1]
+    assert first.kinesis.explicit_hash_key == "42"
+    assert base64.b64decode(second.kinesis.data) == b'{"id": 2}'
+
+    # and share their Kinesis record fields
+    assert first.kinesis.sequence_number == raw_event["Records"][0]["kinesis"]["sequenceNumber"]
+    assert first.event_id == raw_event["Records"][0]["eventID"]
+
+    # and regular records should be kept as a single user record
+    regular_raw = raw_event["Records"][1]["kinesis"]
+    assert regular.kinesis.aggregated is False
+    assert regular.kinesis.sub_sequence_number == 0
+    assert regular.kinesis.partition_key == regular_raw["partitionKey"]
+    assert regular.kinesis.data == regular_raw["data"]
+    assert regular.kinesis.data_as_bytes() == base64.b64decode(regular_raw["data"])
+
+
+def test_kinesis_stream_user_record_as_record_dict():
+    # GIVEN a KPL aggregated user record
+    raw_event = load_event("kinesisStreamEvent.json")
+    raw_event["Records"][0]["kinesis"]["data"] = base64.b64encode(kpl_aggregate([("pk", b"payload")])).decode()
+    user_record = next(KinesisStreamEvent(raw_event).user_records)
+
+    # WHEN converting it to a Kinesis record dict
+    record = user_record.as_record_dict()
+
+    # THEN it should carry the user record data and keys
+    assert base64.b64decode(record["kinesis"]["data"]) == b"payload"
+    assert record["kinesis"]["partitionKey"] == "pk"
+    assert record["kinesis"]["subSequenceNumber"] == 0
+    assert record["eventID"] == raw_event["Records"][0]["eventID"]
@@ -0,0 +1,39 @@
+import gzip
+
+import pytest
+
+from aws_lambda_powertools.event_handler.openapi.swagger_ui.cache import CachedContent, etag_matches
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ['"abc"', 'W/"abc"', '"other", "abc"', ' "other" , W/"abc" ', "*"],
+)
+def test_etag_matches(if_none_match):
+    # GIVEN an If-None-Match header listing the current ETag, or any ETag
+    # WHEN comparing it with the current ETag
+    # THEN it should match
+    assert etag_matches(if_none_match, '"abc"')
+
+
+@pytest.mark.parametrize("if_none_match", [None, "", '"other"', '"abc-gzip"', "abc"])
+def test_etag_does_not_match(if_none_match):
+    # GIVEN an If-None-Match header without the current ETag
+    # WHEN comparing it with the current ETag
+    # THEN it should not match
+    assert not etag_matches(if_none_match, '"abc"')
+
+
+def test_cached_content_etags():
+    # GIVEN content served by the Swagger UI route
+    content = CachedContent(body="<html></html>", content_type="text/html")
+
+    # THEN ETags are strong, stable and differ per representation
+    assert content.etag == CachedContent(body="<html></html>", content_type="text/html").etag
+    assert content.etag != CachedContent(body="<html> </html>", content_type="text/html").etag
+    assert content.etag.startswith('"') and content.etag.endswith('"')
+    assert content.compressed_etag != content.etag
+
+    # THEN the compressed body is computed once
+    assert gzip.decompress(content.compressed_body).decode() == content.body
+    assert content.compressed_body is content.compressed_body
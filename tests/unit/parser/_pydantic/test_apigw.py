@@ -169,3 +169,38 @@ def test_apigw_event_authorizer_event():
 
     assert parsed_event.type == raw_event["type"]
     assert parsed_event.methodArn == raw_event["methodArn"]
+
+
+def test_apigw_event_with_envelope_single_pass():
+    # GIVEN an API Gateway event with a JSON body
+    raw_event = load_event("apiGatewayProxyEvent.json")
+    raw_event["body"] = '{"message": "Hello", "username": "Ran"}'
+
+    # WHEN parsing it without validating the envelope
+    parsed_event: MyApiGatewayBusiness = parse(
+        event=raw_event,
+        model=MyApiGatewayBusiness,
+        envelope=envelopes.ApiGatewayEnvelope,
+        validate_envelope=False,
+    )
+
+    # THEN the body should be parsed against the model
+    assert parsed_event.message == "Hello"
+    assert parsed_event.username == "Ran"
+
+
+def test_apigw_event_with_envelope_single_pass_without_body():
+    # GIVEN an API Gateway event without body
+    raw_event = load_event("apiGatewayProxyEvent.json")
+    raw_event["body"] = None
+
+    # WHEN parsing it without validating the envelope
+    parsed_event = parse(
+        event=raw_event,
+        model=MyApiGatewayBusiness,
+        envelope=envelopes.ApiGatewayEnvelope,
+        validate_envelope=False,
+    )
+
+    # THEN no data should be returned
+    assert parsed_event is None
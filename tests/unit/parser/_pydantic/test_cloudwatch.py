@@ -126,3 +126,38 @@ def test_handle_invalid_event_with_envelope():
     empty_dict = {}
     with pytest.raises(ValidationError):
         CloudWatchLogsModel(**empty_dict)
+
+
+def test_validate_event_user_model_with_envelope_lazy():
+    # GIVEN a CloudWatch Logs event with many log events
+    log_events = [
+        {
+            "id": f"eventId{i}",
+            "timestamp": 1440442987000 + i,
+            "message": json.dumps({"my_message": "hi", "user": f"{i}"}),
+        }
+        for i in range(1_000)
+    ]
+    inner_event_dict = {"messageType": "DATA_MESSAGE", "owner": "123456789123", "logEvents": log_events}
+    raw_event = {"awslogs": {"data": base64.b64encode(zlib.compress(json.dumps(inner_event_dict).encode()))}}
+
+    # WHEN parsing it lazily
+    parsed_events = parse(
+        event=raw_event,
+        model=MyCloudWatchBusiness,
+        envelope=envelopes.CloudWatchLogsEnvelope,
+        lazy=True,
+    )
+
+    # THEN log events should be decompressed and parsed as they're iterated
+    assert [log.user for log in parsed_events] == [str(i) for i in range(1_000)]
+
+
+def test_handle_invalid_event_with_envelope_lazy():
+    # GIVEN a CloudWatch Logs event whose data isn't base64 encoded
+    raw_event: Any = {"awslogs": {"data": "invalid_data!"}}
+
+    # WHEN parsing it lazily
+    # THEN a ValueError should be raised right away
+    with pytest.raises(ValueError, match="unable to decode CloudWatch Logs data"):
+        parse(event=raw_event, model=MyCloudWatchBusiness, envelope=envelopes.CloudWatchLogsEnvelope, lazy=True)
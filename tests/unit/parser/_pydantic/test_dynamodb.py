@@ -83,3 +83,27 @@ def test_validate_event_does_not_conform_with_model():
     raw_event: dict = {"hello": "s"}
     with pytest.raises(ValidationError):
         parse(event=raw_event, model=MyDynamoBusiness, envelope=envelopes.DynamoDBStreamEnvelope)
+
+
+def test_dynamo_db_stream_trigger_event_tolerant():
+    # GIVEN a DynamoDB Stream event with a record whose image doesn't conform with the model
+    raw_event = load_event("dynamoStreamEvent.json")
+    raw_event["Records"][1]["dynamodb"]["OldImage"]["Id"] = {"S": "not a number"}
+
+    # WHEN parsing it in tolerant mode
+    parsed = parse(event=raw_event, model=MyDynamoBusiness, envelope=envelopes.DynamoDBStreamEnvelope, tolerant=True)
+
+    # THEN only the malformed record should be reported using its sequence number
+    assert parsed.models[0]["NewImage"].Message == "New item!"
+    assert parsed.batch_item_failures() == [{"itemIdentifier": raw_event["Records"][1]["dynamodb"]["SequenceNumber"]}]
+
+
+def test_dynamo_db_stream_trigger_event_lazy():
+    # GIVEN a DynamoDB Stream event
+    raw_event = load_event("dynamoStreamEvent.json")
+
+    # WHEN parsing it lazily
+    records = parse(event=raw_event, model=MyDynamoBusiness, envelope=envelopes.DynamoDBStreamEnvelope, lazy=True)
+
+    # THEN it should yield the same images as parsing it eagerly
+    assert list(records) == parse(event=raw_event, model=MyDynamoBusiness, envelope=envelopes.DynamoDBStreamEnvelope)
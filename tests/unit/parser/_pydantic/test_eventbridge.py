@@ -51,3 +51,21 @@ def test_handle_invalid_event_with_eventbridge_envelope():
     empty_event = {}
     with pytest.raises(ValidationError):
         parse(event=empty_event, model=MyEventbridgeBusiness, envelope=envelopes.EventBridgeEnvelope)
+
+
+def test_handle_eventbridge_trigger_event_single_pass():
+    # GIVEN an EventBridge event missing envelope fields
+    raw_event = load_event("eventBridgeEvent.json")
+    raw_event.pop("version")
+
+    # WHEN parsing it without validating the envelope
+    parsed_event: MyEventbridgeBusiness = parse(
+        event=raw_event,
+        model=MyEventbridgeBusiness,
+        envelope=envelopes.EventBridgeEnvelope,
+        validate_envelope=False,
+    )
+
+    # THEN only the detail should be validated against the model
+    assert parsed_event.instance_id == raw_event["detail"]["instance_id"]
+    assert parsed_event.state == raw_event["detail"]["state"]
@@ -80,3 +80,30 @@ def test_kafka_msk_event():
     assert record.value == '{"key":"value"}'
     assert len(record.headers) == 1
     assert record.headers[0]["headerKey"] == b"headerValue"
+
+
+def test_kafka_event_with_envelope_tolerant():
+    # GIVEN a Kafka event with records across partitions, one of them malformed
+    raw_event = load_event("kafkaEventMsk.json")
+    valid_record = raw_event["records"]["mytopic-0"][0]
+    raw_event["records"]["mytopic-1"] = [{**valid_record, "value": "bm90IGpzb24="}, valid_record]
+
+    # WHEN parsing it in tolerant mode
+    parsed = parse(event=raw_event, model=MyLambdaKafkaBusiness, envelope=envelopes.KafkaEnvelope, tolerant=True)
+
+    # THEN records should be indexed across partitions
+    assert list(parsed.models) == [0, 2]
+    assert [error.index for error in parsed.errors] == [1]
+    assert parsed.errors[0].item_identifier is None
+
+
+def test_kafka_event_with_envelope_lazy():
+    # GIVEN a Kafka event with records across partitions
+    raw_event = load_event("kafkaEventMsk.json")
+    raw_event["records"]["mytopic-1"] = raw_event["records"]["mytopic-0"] * 2
+
+    # WHEN parsing it lazily
+    records = parse(event=raw_event, model=MyLambdaKafkaBusiness, envelope=envelopes.KafkaEnvelope, lazy=True)
+
+    # THEN it should yield records from all partitions
+    assert [record.key for record in records] == ["value"] * 3
@@ -1,3 +1,5 @@
+import base64
+
 import pytest
 
 from aws_lambda_powertools.utilities.parser import BaseModel, ValidationError, envelopes, parse
@@ -11,8 +13,9 @@ from aws_lambda_powertools.utilities.parser.models.cloudwatch import (
 from aws_lambda_powertools.utilities.parser.models.kinesis import (
     extract_cloudwatch_logs_from_event,
     extract_cloudwatch_logs_from_record,
+    iter_cloudwatch_log_events_from_record,
 )
-from tests.functional.utils import load_event
+from tests.functional.utils import kpl_aggregate, load_event
 from tests.unit.parser._pydantic.schemas import MyKinesisBusiness
 
 
@@ -105,3 +108,78 @@ def test_kinesis_stream_event_cloudwatch_logs_data_extraction_fails_with_custom_
         for record in stream_data.Records:
             record.kinesis.data = DummyModel()
             record.decompress_zlib_record_data_as_json()
+
+
+def test_kinesis_stream_event_cloudwatch_logs_events_iteration():
+    # GIVEN a KinesisDataStreamModel is instantiated with CloudWatch Logs compressed data
+    raw_event = load_event("kinesisStreamCloudWatchLogsEvent.json")
+    stream_data = KinesisDataStreamModel(**raw_event)
+
+    for record in stream_data.Records:
+        # WHEN we iterate over log events as they're decompressed
+        log_events = list(iter_cloudwatch_log_events_from_record(record))
+
+        # THEN they should match log events extracted at once
+        assert log_events == extract_cloudwatch_logs_from_record(record).logEvents
+
+
+def test_kinesis_trigger_event_tolerant():
+    # GIVEN a Kinesis event with a record that isn't base64 encoded
+    raw_event = load_event("kinesisStreamEventOneRecord.json")
+    valid_record = raw_event["Records"][0]
+    invalid_record = {**valid_record, "kinesis": {**valid_record["kinesis"], "sequenceNumber": "2", "data": "bad"}}
+    raw_event["Records"] = [valid_record, invalid_record]
+
+    # WHEN parsing it in tolerant mode
+    parsed = parse(
+        event=raw_event,
+        model=MyKinesisBusiness,
+        envelope=envelopes.KinesisDataStreamEnvelope,
+        tolerant=True,
+    )
+
+    # THEN only the malformed record should be reported using its sequence number
+    assert parsed.models[0].message == "test message"
+    assert parsed.batch_item_failures() == [{"itemIdentifier": "2"}]
+
+
+def test_kinesis_trigger_event_lazy():
+    # GIVEN a Kinesis event whose second record isn't base64 encoded
+    raw_event = load_event("kinesisStreamEventOneRecord.json")
+    valid_record = raw_event["Records"][0]
+    raw_event["Records"].append({**valid_record, "kinesis": {**valid_record["kinesis"], "data": "bad"}})
+
+    # WHEN parsing it lazily
+    records = parse(event=raw_event, model=MyKinesisBusiness, envelope=envelopes.KinesisDataStreamEnvelope, lazy=True)
+
+    # THEN the first record should be parsed before the malformed one is reached
+    assert next(records).message == "test message"
+    with pytest.raises(ValidationError):
+        next(records)
+
+
+def test_kinesis_trigger_event_kpl_aggregated_records():
+    # GIVEN a Kinesis event with a KPL aggregated record
+    raw_event = load_event("kinesisStreamEventOneRecord.json")
+    aggregated = kpl_aggregate([("pk-1", b'{"message": "first", "username": "a"}'), ("pk-2", b"second")])
+    raw_event["Records"][0]["kinesis"]["data"] = base64.b64encode(aggregated).decode()
+    parsed_event = KinesisDataStreamModel(**raw_event)
+
+    # WHEN de-aggregating records
+    user_records = parsed_event.deaggregate()
+
+    # THEN each user record should carry its own data, partition key and sub-sequence number
+    assert [record.kinesis.data for record in user_records] == [b'{"message": "first", "username": "a"}', b"second"]
+    assert [record.kinesis.partitionKey for record in user_records] == ["pk-1", "pk-2"]
+    assert [record.kinesis.subSequenceNumber for record in user_records] == [0, 1]
+    assert user_records[1].kinesis.sequenceNumber == raw_event["Records"][0]["kinesis"]["sequenceNumber"]
+
+
+def test_kinesis_trigger_event_deaggregate_regular_record():
+    # GIVEN a Kinesis event without KPL aggregated records
+    raw_event = load_event("kinesisStreamEventOneRecord.json")
+    parsed_event = KinesisDataStreamModel(**raw_event)
+
+    # WHEN de-aggregating records
+    # THEN records should be returned as is
+    assert parsed_event.deaggregate() == parsed_event.Records
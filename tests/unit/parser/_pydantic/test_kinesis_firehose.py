@@ -121,3 +121,24 @@ def test_kinesis_trigger_bad_metadata_timestamp_event():
     raw_event["records"][0]["kinesisRecordMetadata"]["approximateArrivalTimestamp"] = "-1"
     with pytest.raises(ValidationError):
         KinesisFirehoseModel(**raw_event)
+
+
+def test_firehose_trigger_event_lazy():
+    # GIVEN a Firehose event
+    raw_event = load_event("kinesisFirehoseKinesisEvent.json")
+    raw_event["records"].pop(0)  # remove first item since the payload is bytes and we want to test payload json class
+
+    # WHEN parsing it lazily
+    records = parse(
+        event=raw_event,
+        model=MyKinesisFirehoseBusiness,
+        envelope=envelopes.KinesisFirehoseEnvelope,
+        lazy=True,
+    )
+
+    # THEN it should yield the same records as parsing it eagerly
+    assert list(records) == parse(
+        event=raw_event,
+        model=MyKinesisFirehoseBusiness,
+        envelope=envelopes.KinesisFirehoseEnvelope,
+    )
@@ -116,3 +116,67 @@ def test_handle_sns_sqs_fifo_trigger_event_json_body():
     assert len(parsed_event) == 1
     assert parsed_event[0].message == "hello world"
     assert parsed_event[0].username == "lessa"
+
+
+def test_handle_sns_trigger_event_single_pass(sns_event):  # noqa: F811
+    # GIVEN an SNS event
+    # WHEN parsing it without validating the envelope
+    parsed_event = parse(
+        event=sns_event,
+        model=MySnsBusiness,
+        envelope=envelopes.SnsEnvelope,
+        validate_envelope=False,
+    )
+
+    # THEN it should match parsing the envelope and model separately
+    assert parsed_event == parse(event=sns_event, model=MySnsBusiness, envelope=envelopes.SnsEnvelope)
+
+
+def test_handle_sns_sqs_trigger_event_single_pass():
+    # GIVEN an SNS event delivered through SQS missing the UnsubscribeURL
+    raw_event = load_event("snsSqsEvent.json")
+    payload = json.loads(raw_event["Records"][0]["body"])
+    payload.pop("UnsubscribeURL")
+    raw_event["Records"][0]["body"] = json.dumps(payload)
+
+    # WHEN parsing it without validating the envelope
+    parsed_event = parse(
+        event=raw_event,
+        model=MySnsBusiness,
+        envelope=envelopes.SnsSqsEnvelope,
+        validate_envelope=False,
+    )
+
+    # THEN only the SNS message should be validated against the model
+    assert len(parsed_event) == 1
+    assert parsed_event[0].message == "hello world"
+    assert parsed_event[0].username == "lessa"
+
+
+def test_handle_sns_trigger_event_tolerant(sns_event):  # noqa: F811
+    # GIVEN an SNS event with a malformed message
+    valid_record = sns_event["Records"][0]
+    invalid_record = {**valid_record, "Sns": {**valid_record["Sns"], "MessageId": "invalid", "Message": "{}"}}
+    sns_event["Records"] = [invalid_record, valid_record]
+
+    # WHEN parsing it in tolerant mode
+    parsed = parse(event=sns_event, model=MySnsBusiness, envelope=envelopes.SnsEnvelope, tolerant=True)
+
+    # THEN only the malformed message should be reported
+    assert list(parsed.models) == [1]
+    assert parsed.batch_item_failures() == [{"itemIdentifier": "invalid"}]
+
+
+def test_handle_sns_sqs_trigger_event_tolerant():
+    # GIVEN an SNS event delivered through SQS with a malformed notification
+    raw_event = load_event("snsSqsEvent.json")
+    valid_record = raw_event["Records"][0]
+    invalid_record = {**valid_record, "messageId": "invalid", "body": "{}"}
+    raw_event["Records"] = [valid_record, invalid_record]
+
+    # WHEN parsing it in tolerant mode
+    parsed = parse(event=raw_event, model=MySnsBusiness, envelope=envelopes.SnsSqsEnvelope, tolerant=True)
+
+    # THEN only the malformed notification should be reported
+    assert parsed.models[0].message == "hello world"
+    assert parsed.batch_item_failures() == [{"itemIdentifier": "invalid"}]
@@ -1,6 +1,9 @@
+import json
+
 import pytest
 
 from aws_lambda_powertools.utilities.parser import ValidationError, envelopes, parse
+from aws_lambda_powertools.utilities.parser.exceptions import MissingItemIdentifierError
 from aws_lambda_powertools.utilities.parser.models import SqsModel
 from tests.functional.utils import load_event
 from tests.functional.validator.conftest import sqs_event  # noqa: F401
@@ -118,3 +121,115 @@ def test_sqs_dlq_trigger_event():
     assert convert_time == int(raw_record["attributes"]["SentTimestamp"])
 
     assert attributes.DeadLetterQueueSourceArn == raw_record["attributes"]["DeadLetterQueueSourceArn"]
+
+
+def test_handle_sqs_trigger_event_single_pass(sqs_event):  # noqa: F811
+    # GIVEN an SQS event
+    # WHEN parsing it without validating the envelope
+    parsed_event = parse(
+        event=sqs_event,
+        model=MySqsBusiness,
+        envelope=envelopes.SqsEnvelope,
+        validate_envelope=False,
+    )
+
+    # THEN it should match parsing the envelope and model separately
+    assert parsed_event == parse(event=sqs_event, model=MySqsBusiness, envelope=envelopes.SqsEnvelope)
+
+
+def test_handle_sqs_trigger_event_single_pass_skips_envelope_validation(sqs_event):  # noqa: F811
+    # GIVEN an SQS event with an invalid envelope field
+    sqs_event["Records"][0]["attributes"] = "invalid"
+
+    # WHEN parsing it without validating the envelope
+    parsed_event = parse(
+        event=sqs_event,
+        model=MySqsBusiness,
+        envelope=envelopes.SqsEnvelope,
+        validate_envelope=False,
+    )
+
+    # THEN only the body should be validated
+    assert parsed_event[0].message == "hello world"
+
+    with pytest.raises(ValidationError):
+        parse(event=sqs_event, model=MySqsBusiness, envelope=envelopes.SqsEnvelope)
+
+
+def test_validate_event_single_pass_does_not_conform_with_model(sqs_event):  # noqa: F811
+    # GIVEN an SQS event whose body doesn't conform with the model
+    sqs_event["Records"][0]["body"] = json.dumps({"message": "hello world"})
+
+    # WHEN parsing it without validating the envelope
+    # THEN a ValidationError should be raised
+    with pytest.raises(ValidationError):
+        parse(event=sqs_event, model=MySqsBusiness, envelope=envelopes.SqsEnvelope, validate_envelope=False)
+
+
+def test_handle_sqs_trigger_event_tolerant(sqs_event):  # noqa: F811
+    # GIVEN an SQS event with a malformed body and a malformed record
+    valid_record = sqs_event["Records"][0]
+    invalid_body = {**valid_record, "messageId": "invalid-body", "body": "Not valid json"}
+    invalid_record = {**valid_record, "messageId": "invalid-record", "attributes": "invalid"}
+    sqs_event["Records"] = [valid_record, invalid_body, invalid_record, valid_record]
+
+    # WHEN parsing it in tolerant mode
+    parsed = parse(event=sqs_event, model=MySqsBusiness, envelope=envelopes.SqsEnvelope, tolerant=True)
+
+    # THEN valid records should be parsed along with their position
+    assert list(parsed.models) == [0, 3]
+    assert parsed.models[0].message == "hello world"
+
+    # and malformed records should be reported with their error and identifier
+    assert [error.index for error in parsed.errors] == [1, 2]
+    assert parsed.errors[0].record == invalid_body
+    assert isinstance(parsed.errors[0].error, ValidationError)
+    assert parsed.batch_item_failures() == [{"itemIdentifier": "invalid-body"}, {"itemIdentifier": "invalid-record"}]
+
+
+def test_handle_sqs_trigger_event_tolerant_record_without_identifier(sqs_event):  # noqa: F811
+    # GIVEN an SQS event with a record missing its messageId
+    sqs_event["Records"][0].pop("messageId")
+
+    # WHEN parsing it in tolerant mode
+    parsed = parse(event=sqs_event, model=MySqsBusiness, envelope=envelopes.SqsEnvelope, tolerant=True)
+
+    # THEN the record should fail validation without an identifier
+    assert parsed.errors[0].item_identifier is None
+
+    # and reporting batch item failures should fail the entire batch, instead of dropping the record
+    with pytest.raises(MissingItemIdentifierError):
+        parsed.batch_item_failures()
+
+
+def test_validate_event_tolerant_without_records():
+    # GIVEN an event without records
+    raw_event: dict = {"invalid": "event"}
+
+    # WHEN parsing it in tolerant mode
+    # THEN a ValidationError should be raised as no record can be isolated
+    with pytest.raises(ValidationError):
+        parse(event=raw_event, model=MySqsBusiness, envelope=envelopes.SqsEnvelope, tolerant=True)
+
+
+def test_handle_sqs_trigger_event_lazy(sqs_event):  # noqa: F811
+    # GIVEN an SQS event whose second record is malformed
+    sqs_event["Records"].append({**sqs_event["Records"][0], "body": "Not valid json"})
+
+    # WHEN parsing it lazily
+    records = parse(event=sqs_event, model=MySqsBusiness, envelope=envelopes.SqsEnvelope, lazy=True)
+
+    # THEN records should only be validated as they're iterated
+    assert next(records).message == "hello world"
+    with pytest.raises(ValidationError):
+        next(records)
+
+
+def test_validate_event_lazy_without_records():
+    # GIVEN an event without records
+    raw_event: dict = {"invalid": "event"}
+
+    # WHEN parsing it lazily
+    # THEN a ValidationError should be raised right away
+    with pytest.raises(ValidationError):
+        parse(event=raw_event, model=MySqsBusiness, envelope=envelopes.SqsEnvelope, lazy=True)
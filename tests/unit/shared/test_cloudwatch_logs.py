@@ -0,0 +1,105 @@
+import base64
+import gzip
+import json
+import zlib
+
+import pytest
+
+from aws_lambda_powertools.shared.cloudwatch_logs import (
+    iter_decompressed_text,
+    iter_log_events,
+    iter_object_items,
+)
+from tests.functional.utils import load_event
+
+
+def logs_data(count: int = 3, **extra) -> dict:
+    return {
+        "messageType": "DATA_MESSAGE",
+        "owner": "123456789123",
+        "logGroup": "testLogGroup",
+        "logStream": "testLogStream",
+        "subscriptionFilters": ["testFilter"],
+        "logEvents": [
+            {"id": f"eventId{i}", "timestamp": 1440442987000 + i, "message": f"[ERROR] Test message {i} ✓"}
+            for i in range(count)
+        ],
+        **extra,
+    }
+
+
+def test_iter_log_events_from_cloudwatch_logs_event():
+    # GIVEN a CloudWatch Logs subscription event
+    payload = base64.b64decode(load_event("cloudWatchLogEventWithPolicyLevel.json")["awslogs"]["data"])
+
+    # WHEN iterating over its log events
+    log_events = list(iter_log_events(payload))
+
+    # THEN log events should match fully decompressed data
+    assert log_events == json.loads(zlib.decompress(payload, zlib.MAX_WBITS | 32))["logEvents"]
+
+
+@pytest.mark.parametrize("compress", [gzip.compress, zlib.compress], ids=["gzip", "zlib"])
+def test_iter_log_events_across_chunks(compress):
+    # GIVEN compressed logs data much larger than a chunk
+    data = logs_data(count=5_000)
+    payload = compress(json.dumps(data).encode())
+
+    # WHEN decompressing it in tiny chunks
+    chunks = iter_decompressed_text(payload, chunk_size=7)
+    log_events = [value for key, value in iter_object_items(chunks, stream_key="logEvents") if key == "logEvents"]
+
+    # THEN values split across chunks, including multi-byte characters, should be decoded
+    assert log_events == data["logEvents"]
+
+
+def test_iter_object_items_yields_stream_key_elements():
+    # GIVEN a JSON object split one character at a time, with whitespace
+    document = json.dumps(logs_data(count=2, policyLevel="ACCOUNT_LEVEL_POLICY"), indent=2)
+
+    # WHEN iterating over its items
+    items = list(iter_object_items(iter(document), stream_key="logEvents"))
+
+    # THEN other keys should be yielded once, and the stream key once per element
+    assert [key for key, _ in items] == [
+        "messageType",
+        "owner",
+        "logGroup",
+        "logStream",
+        "subscriptionFilters",
+        "logEvents",
+        "logEvents",
+        "policyLevel",
+    ]
+    assert items[-1] == ("policyLevel", "ACCOUNT_LEVEL_POLICY")
+
+
+@pytest.mark.parametrize("document", ["{}", '{"logEvents": []}', '{"owner": "1", "logEvents": [ ] }'])
+def test_iter_log_events_without_log_events(document):
+    # GIVEN logs data without log events
+    payload = zlib.compress(document.encode())
+
+    # WHEN iterating over its log events
+    # THEN nothing should be yielded
+    assert list(iter_log_events(payload)) == []
+
+
+def test_iter_log_events_truncated_payload():
+    # GIVEN truncated compressed logs data
+    payload = gzip.compress(json.dumps(logs_data()).encode())[:-20]
+
+    # WHEN iterating over its log events
+    # THEN a zlib error should be raised
+    with pytest.raises(zlib.error):
+        list(iter_log_events(payload))
+
+
+@pytest.mark.parametrize("document", ['{"logEvents": [{"id": 1} {"id": 2}]}', '{"owner": "1"', "[]", "{1: 2}"])
+def test_iter_log_events_invalid_json(document):
+    # GIVEN compressed data that isn't a valid JSON object
+    payload = zlib.compress(document.encode())
+
+    # WHEN iterating over its log events
+    # THEN a JSON decode error should be raised
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_log_events(payload))
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import Any, Dict, Optional
 
 import pytest
@@ -49,3 +50,78 @@ def test_deserializer_error():
 
     with pytest.raises(TypeError):
         model.data.get("Id")
+
+
+@pytest.mark.parametrize("value", [{}, {"s": "lowercase type"}])
+def test_deserializer_unsupported_type(value):
+    # GIVEN an empty or unknown DynamoDB attribute value
+    # WHEN deserializing it
+    # THEN a TypeError should be raised
+    with pytest.raises(TypeError, match="is not supported"):
+        TypeDeserializer().deserialize(value)
+
+
+@pytest.mark.parametrize(
+    "number,expected",
+    [
+        ("0", Decimal("0")),
+        ("000123", Decimal("123")),
+        ("-1.50", Decimal("-1.50")),
+        ("1E+5", Decimal("1E+5")),
+        ("1" * 40, Decimal("1" * 38)),
+    ],
+)
+def test_deserializer_numbers_as_decimal(number, expected):
+    # GIVEN a DynamoDB number
+    # WHEN deserializing it with the default deserializer
+    value = TypeDeserializer().deserialize({"N": number})
+
+    # THEN it should be a Decimal
+    assert isinstance(value, Decimal)
+    assert value == expected
+
+
+@pytest.mark.parametrize(
+    "number,expected",
+    [
+        ("0", 0),
+        ("-42", -42),
+        ("12345678901234567890123456789012345678", 12345678901234567890123456789012345678),
+        ("3.14159", 3.14159),
+        ("-0.000123", -0.000123),
+        ("1.5E+10", 1.5e10),
+        ("0.0", 0.0),
+        ("123456789012.345", 123456789012.345),
+    ],
+)
+def test_deserializer_native_numbers(number, expected):
+    # GIVEN a DynamoDB number that an int or float represents exactly
+    # WHEN deserializing it with native numbers
+    value = TypeDeserializer(native_numbers=True).deserialize({"N": number})
+
+    # THEN it should be an int or float
+    assert type(value) is type(expected)
+    assert value == expected
+
+
+@pytest.mark.parametrize("number", ["0.1234567890123456789", "1234567890.1234567", "9.9999999999999999999E+125"])
+def test_deserializer_native_numbers_fallback_to_decimal(number):
+    # GIVEN a DynamoDB number a float can't represent without loss of precision
+    # WHEN deserializing it with native numbers
+    value = TypeDeserializer(native_numbers=True).deserialize({"N": number})
+
+    # THEN it should be a Decimal
+    assert isinstance(value, Decimal)
+    assert value == Decimal(number)
+
+
+def test_deserializer_native_numbers_nested():
+    # GIVEN numbers nested in maps, lists and number sets
+    value = {"M": {"Items": {"L": [{"N": "1"}, {"M": {"Price": {"N": "9.99"}}}]}, "Sizes": {"NS": ["1", "2.5"]}}}
+
+    # WHEN deserializing them with native numbers
+    # THEN all numbers should be native types
+    assert TypeDeserializer(native_numbers=True).deserialize(value) == {
+        "Items": [1, {"Price": 9.99}],
+        "Sizes": {1, 2.5},
+    }
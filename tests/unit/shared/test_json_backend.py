@@ -0,0 +1,216 @@
+import datetime
+import decimal
+import json
+from dataclasses import dataclass
+
+import pytest
+from pydantic import BaseModel
+
+from aws_lambda_powertools.shared import constants, json_backend
+from aws_lambda_powertools.shared.json_backend import get_json_backend
+from aws_lambda_powertools.warnings import PowertoolsUserWarning
+
+
+def _backend(name: str):
+    if name != "json":
+        pytest.importorskip(name)
+    return get_json_backend(name)
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend(request):
+    return _backend(request.param)
+
+
+@pytest.fixture
+def reset_backend():
+    get_json_backend.cache_clear()
+    yield
+    get_json_backend.cache_clear()
+
+
+@dataclass
+class Order:
+    id: int
+    total: decimal.Decimal
+
+
+class Customer(BaseModel):
+    name: str
+
+
+def test_dumps_is_compact_and_escapes_non_ascii(backend):
+    # GIVEN a dict with non-ASCII characters
+    data = {"message": "スコビルデモ", "values": [1, 2.5, None, True]}
+
+    # WHEN serializing it
+    result = backend.dumps(data)
+
+    # THEN output should be the same compact JSON as json.dumps
+    assert result == json.dumps(data, separators=(",", ":"))
+    assert backend.dumps_bytes(data) == result.encode()
+
+
+def test_dumps_without_ensure_ascii(backend):
+    # GIVEN a dict with non-ASCII characters
+    data = {"message": "スコビルデモ", "values": [1, 2.5, None, True]}
+
+    # WHEN serializing it without escaping non-ASCII characters
+    result = backend.dumps(data, ensure_ascii=False)
+
+    # THEN output should be compact JSON keeping non-ASCII characters as is
+    assert result == '{"message":"スコビルデモ","values":[1,2.5,null,true]}'
+    assert backend.dumps_bytes(data, ensure_ascii=False) == result.encode()
+
+
+@pytest.mark.parametrize(
+    "backend_name,expected",
+    [("json", '{"n":NaN}'), ("orjson", '{"n":null}'), ("msgspec", '{"n":null}')],
+)
+def test_dumps_nan(backend_name, expected):
+    # GIVEN a NaN value
+    backend = _backend(backend_name)
+
+    # WHEN serializing it
+    # THEN fast backends should serialize it as null, as NaN isn't valid JSON
+    assert backend.dumps({"n": float("nan")}) == expected
+
+
+def test_dumps_encoder_types(backend):
+    # GIVEN types supported by our custom Encoder
+    data = {
+        "decimal": decimal.Decimal("8.5"),
+        "order": Order(id=1, total=decimal.Decimal("10.1")),
+        "customer": Customer(name="Lessa"),
+    }
+
+    # WHEN serializing them
+    result = json.loads(backend.dumps(data))
+
+    # THEN they should be serialized the same way as the Encoder
+    assert result == {"decimal": "8.5", "order": {"id": 1, "total": "10.1"}, "customer": {"name": "Lessa"}}
+
+
+def test_dumps_datetime_uses_default(backend):
+    # GIVEN a datetime and a custom default function
+    data = {"created": datetime.date(2024, 1, 1)}
+
+    # WHEN serializing it
+    result = json.loads(backend.dumps(data))
+
+    # THEN it should be serialized as ISO 8601
+    assert result == {"created": "2024-01-01"}
+
+
+def test_dumps_sort_keys_and_non_str_keys(backend):
+    # GIVEN a dict with unsorted keys
+    data = {"b": 1, "a": {"d": 2, "c": 3}}
+
+    # WHEN serializing with sort_keys
+    result = backend.dumps(data, sort_keys=True)
+
+    # THEN keys should be sorted at every level
+    assert result == '{"a":{"c":3,"d":2},"b":1}'
+
+
+def test_dumps_falls_back_to_stdlib(backend):
+    # GIVEN values fast backends can't serialize
+    data = {"big": 2**70, "surrogate": "\udce2"}
+
+    # WHEN serializing them
+    result = backend.dumps(data)
+
+    # THEN it should produce the same output as the standard library
+    assert result == json.dumps(data, separators=(",", ":"))
+
+
+def test_dumps_indent(backend):
+    # GIVEN a pretty printing indentation
+    # WHEN serializing
+    result = backend.dumps({"a": 1}, indent=4)
+
+    # THEN output should be indented
+    assert result == '{\n    "a":1\n}'
+
+
+def test_dumps_unsupported_type_raises_type_error(backend):
+    # GIVEN a type unknown to the default encoder
+    class CustomClass:
+        pass
+
+    # WHEN serializing it
+    # THEN a TypeError should be raised, as json.dumps would
+    with pytest.raises(TypeError):
+        backend.dumps({"val": CustomClass()})
+
+
+def test_loads(backend):
+    # GIVEN a JSON document as str and bytes
+    document = '{"message":"スコビルデモ","values":[1,2.5,null,true]}'
+
+    # WHEN deserializing it
+    # THEN it should return the same object regardless of the input type
+    expected = {"message": "スコビルデモ", "values": [1, 2.5, None, True]}
+    assert backend.loads(document) == expected
+    assert backend.loads(document.encode()) == expected
+
+
+def test_loads_invalid_document_raises_json_decode_error(backend):
+    # GIVEN an invalid JSON document
+    # WHEN deserializing it
+    # THEN it should raise the same exception as json.loads
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads("not json")
+
+
+def test_backend_from_env_var(monkeypatch, reset_backend):
+    # GIVEN POWERTOOLS_JSON_BACKEND is set to the standard library
+    monkeypatch.setenv(constants.JSON_BACKEND_ENV, "json")
+
+    # WHEN resolving the active backend
+    # THEN the standard library backend should be used
+    assert get_json_backend().name == "json"
+    assert json_backend.dumps({"a": 1}) == '{"a":1}'
+
+
+def test_backend_defaults_to_stdlib(monkeypatch, reset_backend):
+    # GIVEN orjson is installed and no backend is set
+    pytest.importorskip("orjson")
+    monkeypatch.delenv(constants.JSON_BACKEND_ENV, raising=False)
+
+    # WHEN resolving the active backend
+    # THEN the standard library backend should be used, as fast backends are opt-in
+    assert get_json_backend().name == "json"
+
+
+def test_backend_opt_in_fast_backend(monkeypatch, reset_backend):
+    # GIVEN POWERTOOLS_JSON_BACKEND is set to orjson
+    pytest.importorskip("orjson")
+    monkeypatch.setenv(constants.JSON_BACKEND_ENV, "orjson")
+
+    # WHEN resolving the active backend
+    # THEN orjson should be used
+    assert get_json_backend().name == "orjson"
+
+
+def test_backend_unknown_name_in_env_var_warns_once(monkeypatch, reset_backend):
+    # GIVEN POWERTOOLS_JSON_BACKEND is set to an unknown backend
+    monkeypatch.setenv(constants.JSON_BACKEND_ENV, "orjsn")
+
+    # WHEN serializing multiple times
+    with pytest.warns(PowertoolsUserWarning, match="Unknown JSON backend 'orjsn'") as record:
+        first = json_backend.dumps({"a": 1})
+        second = json_backend.dumps({"b": 2})
+
+    # THEN it should warn once and serialize with the standard library
+    assert len(record) == 1
+    assert (first, second) == ('{"a":1}', '{"b":2}')
+    assert get_json_backend().name == "json"
+
+
+def test_backend_unknown_name(reset_backend):
+    # GIVEN an unknown backend name
+    # WHEN resolving it
+    # THEN a ValueError should be raised
+    with pytest.raises(ValueError):
+        get_json_backend("simplejson")
@@ -0,0 +1,72 @@
+import hashlib
+
+import pytest
+
+from aws_lambda_powertools.shared.kinesis_aggregation import deaggregate, is_aggregated
+from tests.functional.utils import kpl_aggregate
+
+
+def test_deaggregate_user_records():
+    # GIVEN a KPL aggregated record with user records from two partition keys
+    data = kpl_aggregate([("pk-1", b"first"), ("pk-2", b"second"), ("pk-1", b"third")])
+
+    # WHEN de-aggregating it
+    user_records = deaggregate(data)
+
+    # THEN user records should be decoded in order with their sub-sequence number
+    assert [bytes(user_record.data) for user_record in user_records] == [b"first", b"second", b"third"]
+    assert [user_record.partition_key for user_record in user_records] == ["pk-1", "pk-2", "pk-1"]
+    assert [user_record.sub_sequence_number for user_record in user_records] == [0, 1, 2]
+    assert user_records[0].explicit_hash_key is None
+
+
+def test_deaggregate_without_copying_data():
+    # GIVEN a KPL aggregated record
+    data = kpl_aggregate([("pk", b"payload")])
+
+    # WHEN de-aggregating it
+    user_record = deaggregate(data)[0]
+
+    # THEN user record data should be a view over the aggregated record data
+    assert isinstance(user_record.data, memoryview)
+    assert user_record.data.obj is data
+
+
+def test_deaggregate_explicit_hash_key():
+    # GIVEN a KPL aggregated record with an explicit hash key
+    data = kpl_aggregate([("pk", b"payload")], explicit_hash_key="123")
+
+    # WHEN de-aggregating it
+    # THEN the explicit hash key should be set
+    assert deaggregate(data)[0].explicit_hash_key == "123"
+
+
+@pytest.mark.parametrize("data", [b"not aggregated", b"\xf3\x89\x9a\xc2", b""], ids=["plain", "magic_only", "empty"])
+def test_deaggregate_regular_record(data):
+    # GIVEN a record that isn't KPL aggregated
+    # WHEN de-aggregating it
+    # THEN it should be reported as not aggregated
+    assert is_aggregated(data) is False
+    assert deaggregate(data) is None
+
+
+def test_deaggregate_digest_mismatch():
+    # GIVEN a KPL aggregated record whose MD5 digest doesn't match
+    data = bytearray(kpl_aggregate([("pk", b"payload")]))
+    data[-1] ^= 0xFF
+
+    # WHEN de-aggregating it
+    # THEN it should be handled as a regular record
+    assert deaggregate(bytes(data)) is None
+
+
+def test_deaggregate_malformed_message():
+    # GIVEN a KPL aggregated record with a valid digest over a truncated message
+    data = kpl_aggregate([("pk", b"payload")])
+    message = data[4:-16][:-3]
+    truncated = data[:4] + message + hashlib.md5(message).digest()
+
+    # WHEN de-aggregating it
+    # THEN a ValueError should be raised
+    with pytest.raises(ValueError):
+        deaggregate(truncated)
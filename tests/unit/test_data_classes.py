@@ -19,6 +19,7 @@ from aws_lambda_powertools.utilities.data_classes.appsync.scalar_types_utils imp
 from aws_lambda_powertools.utilities.data_classes.common import (
     BaseProxyEvent,
     DictWrapper,
+    slotted_cached_property,
 )
 from aws_lambda_powertools.utilities.data_classes.event_source import event_source
 
@@ -240,6 +241,75 @@ def test_dict_wrapper_sensitive_properties_property():
     assert str(event_source) == "{'data_property': '[SENSITIVE]', 'raw_event': '[SENSITIVE]'}"
 
 
+def test_dict_wrapper_slotted_cached_property():
+    # GIVEN a slotted data class caching a nested data class, and a value that can be None
+    calls = []
+
+    class NestedDataClass(DictWrapper):
+        __slots__ = ()
+
+    class DataClassSample(DictWrapper):
+        __slots__ = ("_cached_nested", "_cached_missing")
+
+        @slotted_cached_property
+        def nested(self) -> NestedDataClass:
+            """Nested data class"""
+            calls.append("nested")
+            return NestedDataClass(self["nested"])
+
+        @slotted_cached_property
+        def missing(self) -> None:
+            calls.append("missing")
+            return self.get("missing")
+
+    data_class = DataClassSample({"nested": {"message": "foo"}})
+
+    # WHEN accessing its properties more than once
+    # THEN values should be computed once and cached
+    assert data_class.nested is data_class.nested
+    assert data_class.nested == NestedDataClass({"message": "foo"})
+    assert data_class.missing is None and data_class.missing is None
+    assert calls == ["nested", "missing"]
+
+    # THEN no instance __dict__ should be allocated, while properties are still documented and printed
+    assert not hasattr(data_class, "__dict__")
+    assert DataClassSample.nested.__doc__ == "Nested data class"
+    assert str(data_class) == "{'missing': None, 'nested': {'raw_event': '[SENSITIVE]'}, 'raw_event': '[SENSITIVE]'}"
+
+
+def test_dict_wrapper_slotted_cached_property_without_slots():
+    # GIVEN a data class subclass that doesn't declare __slots__
+    class DataClassSample(DictWrapper):
+        @slotted_cached_property
+        def message(self) -> str:
+            return self["message"]
+
+    class DataClassSubclass(DataClassSample):
+        pass
+
+    # WHEN accessing a slotted cached property
+    data_class = DataClassSubclass({"message": "foo"})
+
+    # THEN it should be cached in the instance __dict__
+    assert data_class.message == "foo"
+    assert vars(data_class) == {"_cached_message": "foo"}
+
+
+def test_dict_wrapper_slotted_cached_property_missing_slot():
+    # GIVEN a slotted data class that doesn't declare the cached property slot
+    class DataClassSample(DictWrapper):
+        __slots__ = ()
+
+        @slotted_cached_property
+        def message(self) -> str:
+            return self["message"]
+
+    # WHEN creating it
+    # THEN it should fail right away
+    with pytest.raises(AttributeError):
+        DataClassSample({"message": "foo"})
+
+
 def test_base_proxy_event_json_body():
     data = {"message": "Foo"}
     event = BaseProxyEvent({"body": json.dumps(data)})
@@ -1,3 +1,4 @@
+import datetime
 import decimal
 import json
 from dataclasses import dataclass
@@ -18,6 +19,11 @@ def test_jsonencode_decimal_nan():
     assert result == '{"val": NaN}'
 
 
+def test_jsonencode_datetime():
+    result = json.dumps({"val": datetime.datetime(2024, 1, 1, 10, 30)}, cls=Encoder)
+    assert result == '{"val": "2024-01-01T10:30:00"}'
+
+
 def test_jsonencode_calls_default():
     class CustomClass:
         pass
@@ -1,4 +1,6 @@
+import asyncio
 import contextlib
+import time
 from typing import NamedTuple
 from unittest import mock
 from unittest.mock import MagicMock
@@ -687,3 +689,166 @@ def test_ignore_endpoints_mocked_provider(mock_add_ignored: MagicMock, provider_
     tracer.ignore_endpoint(hostname="https://foo.com/")
     # THEN don't call xray add_ignored
     assert mock_add_ignored.call_count == 0
+
+
+def test_tracer_method_skips_subsegment_when_not_sampled(dummy_response, provider_stub, in_subsegment_mock):
+    # GIVEN tracer is initialized with a provider whose current trace isn't sampled
+    provider = provider_stub(in_subsegment=in_subsegment_mock.in_subsegment)
+    provider.is_sampled = lambda: False
+    tracer = Tracer(provider=provider, service="booking")
+
+    # WHEN capture_method decorator is used
+    @tracer.capture_method
+    def greeting(name, message):
+        return dummy_response
+
+    # THEN the method should be called without creating a subsegment
+    assert greeting(name="Foo", message="Bar") == dummy_response
+    assert in_subsegment_mock.in_subsegment.call_count == 0
+
+
+def test_tracer_method_sampling_rate(dummy_response, provider_stub, in_subsegment_mock):
+    # GIVEN tracer is initialized
+    provider = provider_stub(in_subsegment=in_subsegment_mock.in_subsegment)
+    tracer = Tracer(provider=provider, service="booking")
+
+    # WHEN capture_method decorator is used with 0 and 1 sampling rates
+    @tracer.capture_method(sampling_rate=0)
+    def never_traced():
+        return dummy_response
+
+    @tracer.capture_method(sampling_rate=1)
+    def always_traced():
+        return dummy_response
+
+    for _ in range(10):
+        never_traced()
+        always_traced()
+
+    # THEN only calls to the method always traced should create subsegments
+    assert in_subsegment_mock.in_subsegment.call_count == 10
+    assert in_subsegment_mock.in_subsegment.call_args == mock.call(
+        name=f"## {MODULE_PREFIX}.test_tracer_method_sampling_rate.locals.always_traced",
+    )
+
+
+def test_tracer_method_invalid_sampling_rate(provider_stub):
+    # GIVEN tracer is initialized
+    tracer = Tracer(provider=provider_stub(), service="booking")
+
+    # WHEN capture_method decorator is used with a sampling rate outside 0 and 1
+    # THEN a ValueError should be raised
+    with pytest.raises(ValueError, match="sampling_rate"):
+
+        @tracer.capture_method(sampling_rate=1.5)
+        def greeting():
+            return True
+
+
+def test_tracer_method_min_duration_skips_fast_calls(dummy_response, provider_stub, in_subsegment_mock):
+    # GIVEN tracer is initialized
+    provider = provider_stub(in_subsegment=in_subsegment_mock.in_subsegment)
+    tracer = Tracer(provider=provider, service="booking")
+
+    # WHEN capture_method decorator is used with a minimum duration longer than the method call
+    @tracer.capture_method(min_duration_ms=10_000)
+    def greeting():
+        return dummy_response
+
+    # THEN no subsegment should be created
+    assert greeting() == dummy_response
+    assert in_subsegment_mock.in_subsegment.call_count == 0
+
+
+def test_tracer_method_min_duration_records_slow_calls(dummy_response, provider_stub, in_subsegment_mock):
+    # GIVEN tracer is initialized
+    provider = provider_stub(in_subsegment=in_subsegment_mock.in_subsegment)
+    tracer = Tracer(provider=provider, service="booking")
+
+    # WHEN capture_method decorator is used on a method slower than its minimum duration
+    @tracer.capture_method(min_duration_ms=1)
+    def greeting():
+        time.sleep(0.01)
+        return dummy_response
+
+    greeting()
+
+    # THEN a subsegment should be created once the method completes, with its response as metadata
+    assert in_subsegment_mock.in_subsegment.call_count == 1
+    assert in_subsegment_mock.put_metadata.call_args == mock.call(
+        key=f"{MODULE_PREFIX}.test_tracer_method_min_duration_records_slow_calls.locals.greeting response",
+        value=dummy_response,
+        namespace="booking",
+    )
+
+
+def test_tracer_method_min_duration_records_exceptions(provider_stub, in_subsegment_mock):
+    # GIVEN tracer is initialized
+    provider = provider_stub(in_subsegment=in_subsegment_mock.in_subsegment)
+    tracer = Tracer(provider=provider, service="booking")
+    subsegment = in_subsegment_mock.in_subsegment.return_value.__enter__.return_value
+
+    # WHEN a method faster than its minimum duration raises an exception
+    @tracer.capture_method(min_duration_ms=10_000)
+    def greeting():
+        raise ValueError("test")
+
+    with pytest.raises(ValueError):
+        greeting()
+
+    # THEN a subsegment should still be created with the exception
+    assert in_subsegment_mock.in_subsegment.call_count == 1
+    assert in_subsegment_mock.put_metadata.call_args.kwargs["key"].endswith("greeting error")
+    assert isinstance(subsegment.add_exception.call_args.kwargs["exception"], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_tracer_method_min_duration_async(dummy_response, provider_stub, in_subsegment_mock):
+    # GIVEN tracer is initialized
+    provider = provider_stub(
+        in_subsegment=in_subsegment_mock.in_subsegment,
+        in_subsegment_async=in_subsegment_mock.in_subsegment,
+    )
+    tracer = Tracer(provider=provider, service="booking")
+
+    # WHEN async methods faster and slower than their minimum duration are called
+    @tracer.capture_method(min_duration_ms=1)
+    async def slow_greeting():
+        await asyncio.sleep(0.01)
+        return dummy_response
+
+    @tracer.capture_method(min_duration_ms=10_000)
+    async def fast_greeting():
+        return dummy_response
+
+    await slow_greeting()
+    await fast_greeting()
+
+    # THEN only the slower method should create a subsegment
+    assert in_subsegment_mock.in_subsegment.call_count == 1
+    assert in_subsegment_mock.in_subsegment.call_args == mock.call(
+        name=f"## {MODULE_PREFIX}.test_tracer_method_min_duration_async.locals.slow_greeting",
+    )
+
+
+def test_tracer_truncates_large_metadata(provider_stub, in_subsegment_mock):
+    # GIVEN tracer is initialized with a maximum metadata size
+    provider = provider_stub(in_subsegment=in_subsegment_mock.in_subsegment)
+    tracer = Tracer(provider=provider, service="booking", max_metadata_size=10)
+
+    # WHEN methods return responses larger and smaller than the maximum size
+    @tracer.capture_method
+    def large_response():
+        return {"items": ["a" * 100]}
+
+    @tracer.capture_method
+    def small_response():
+        return {"a": 1}
+
+    large_response()
+    small_response()
+
+    # THEN only the larger response should be truncated to its first bytes serialized as JSON
+    large_call, small_call = in_subsegment_mock.put_metadata.call_args_list
+    assert large_call.kwargs["value"] == '{"items":['
+    assert small_call.kwargs["value"] == {"a": 1}